@@ -1,5 +1,7 @@
 """Internal classes used by the gzip, lzma and bz2 modules"""
 
+import bisect
+import collections
 import io
 
 
@@ -29,6 +31,26 @@ class BaseStream(io.BufferedIOBase):
             raise io.UnsupportedOperation("The underlying file object "
                                           "does not support seeking")
 
+    def readinto(self, b):
+        """Read bytes into b, straight from the decompressed data when b is
+        larger than the buffer.
+
+        Returns the number of bytes read (0 for EOF).
+        """
+        self._check_not_closed()
+        self._check_can_read()
+        return self._buffer.readinto(b)
+
+    # Used by tarfile to save the offsets of the compressed streams in an
+    # index of an archive, and restore them when it is opened again.
+    def _get_stream_offsets(self):
+        self._check_can_read()
+        return self._buffer.raw._get_stream_offsets()
+
+    def _set_stream_offsets(self, offsets):
+        self._check_can_read()
+        self._buffer.raw._set_stream_offsets(offsets)
+
 
 class DecompressReader(io.RawIOBase):
     """Adapts the decompressor API to a RawIOBase reader API"""
@@ -56,6 +78,13 @@ class DecompressReader(io.RawIOBase):
         # trailing data to ignore
         self._trailing_error = trailing_error
 
+        # Offsets in the file and positions in the decompressed data of the
+        # compressed streams after the first one, in increasing order.
+        # seek() restarts decompressing at the closest stream before the
+        # target position instead of at the beginning of the file.
+        self._stream_offsets = []
+        self._stream_positions = []
+
     def close(self):
         self._decompressor = None
         return super().close()
@@ -80,8 +109,13 @@ class DecompressReader(io.RawIOBase):
         # return any data. In this case, try again after reading another block.
         while True:
             if self._decompressor.eof:
-                rawblock = (self._decompressor.unused_data or
-                            self._fp.read(BUFFER_SIZE))
+                rawblock = self._decompressor.unused_data
+                offset = self._tell_fp()
+                if rawblock:
+                    if offset is not None:
+                        offset -= len(rawblock)
+                else:
+                    rawblock = self._fp.read(BUFFER_SIZE)
                 if not rawblock:
                     break
                 # Continue to next stream.
@@ -92,6 +126,7 @@ class DecompressReader(io.RawIOBase):
                 except self._trailing_error:
                     # Trailing data isn't a valid compressed stream; ignore it.
                     break
+                self._add_stream(offset, self._pos)
             else:
                 if self._decompressor.needs_input:
                     rawblock = self._fp.read(BUFFER_SIZE)
@@ -112,11 +147,41 @@ class DecompressReader(io.RawIOBase):
 
     # Rewind the file to the beginning of the data stream.
     def _rewind(self):
-        self._fp.seek(0)
+        self._restart(0, 0)
+
+    # Restart decompressing at the compressed stream at offset in the file,
+    # which starts at pos in the decompressed data.
+    def _restart(self, offset, pos):
+        self._fp.seek(offset)
         self._eof = False
-        self._pos = 0
+        self._pos = pos
         self._decompressor = self._decomp_factory(**self._decomp_args)
 
+    # Return the current offset in the file, or None if it is unknown.
+    def _tell_fp(self):
+        try:
+            return self._fp.tell()
+        except (AttributeError, OSError):
+            return None
+
+    # Record the beginning of a compressed stream, unless it is already
+    # known.
+    def _add_stream(self, offset, pos):
+        if offset is None:
+            return
+        positions = self._stream_positions
+        if pos > (positions[-1] if positions else 0):
+            self._stream_offsets.append(offset)
+            positions.append(pos)
+
+    def _get_stream_offsets(self):
+        return list(zip(self._stream_offsets, self._stream_positions))
+
+    def _set_stream_offsets(self, offsets):
+        offsets = sorted((pos, offset) for offset, pos in offsets if pos > 0)
+        self._stream_positions = [pos for pos, offset in offsets]
+        self._stream_offsets = [offset for pos, offset in offsets]
+
     def seek(self, offset, whence=io.SEEK_SET):
         # Recalculate offset as an absolute file position.
         if whence == io.SEEK_SET:
@@ -132,11 +197,17 @@ class DecompressReader(io.RawIOBase):
         else:
             raise ValueError("Invalid value for whence: {}".format(whence))
 
-        # Make it so that offset is the number of bytes to skip forward.
-        if offset < self._pos:
+        # Make it so that offset is the number of bytes to skip forward,
+        # from the closest compressed stream if it is after the current
+        # position.
+        i = bisect.bisect_right(self._stream_positions, offset)
+        if i and (offset < self._pos or
+                  self._stream_positions[i - 1] > self._pos):
+            self._restart(self._stream_offsets[i - 1],
+                          self._stream_positions[i - 1])
+        elif offset < self._pos:
             self._rewind()
-        else:
-            offset -= self._pos
+        offset -= self._pos
 
         # Read and discard data until we reach the desired position.
         while offset > 0:
@@ -150,3 +221,195 @@ class DecompressReader(io.RawIOBase):
     def tell(self):
         """Return the current file position."""
         return self._pos
+
+
+class ParallelDecompressReader(DecompressReader):
+    """Adapts the decompression of independent blocks by a pool of threads
+    to a RawIOBase reader API.
+
+    Subclasses implement _iter_blocks(), which reads the compressed data
+    from the current offset of the file and yields descriptions of its
+    blocks in order, and _decompress_block(), which is called in the
+    threads of the pool and returns the decompressed data of a block.  When
+    block boundaries are guessed, _join_blocks() returns the description of
+    the block made of two consecutive ones, to try again when the first one
+    cannot be decompressed.
+    """
+
+    # Exception classes raised by _decompress_block() for invalid data.
+    _block_errors = (OSError, EOFError)
+
+    def __init__(self, fp, threads):
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(threads)
+        self._fp = fp
+        self._threads = threads
+        self._pending = collections.deque()
+        self._blocks = self._iter_blocks()
+        self._data = b""
+        self._offset = 0
+        self._eof = False
+        self._pos = 0
+        self._size = -1
+        self._stream_offsets = []
+        self._stream_positions = []
+
+    def close(self):
+        self._cancel()
+        self._executor.shutdown()
+        return super().close()
+
+    def _iter_blocks(self):
+        raise NotImplementedError
+
+    def _decompress_block(self, block):
+        raise NotImplementedError
+
+    def _join_blocks(self, block, next_block):
+        return None
+
+    def read(self, size=-1):
+        if size < 0:
+            return self.readall()
+
+        if not size or self._eof:
+            return b""
+        while self._offset >= len(self._data):
+            self._data = self._next_block()
+            self._offset = 0
+            if self._data is None:
+                self._data = b""
+                self._eof = True
+                self._size = self._pos
+                return b""
+        data = self._data[self._offset:self._offset + size]
+        self._offset += len(data)
+        self._pos += len(data)
+        return data
+
+    # Return the decompressed data of the next block, or None at the end of
+    # the file.
+    def _next_block(self):
+        self._submit()
+        if not self._pending:
+            return None
+        block, future = self._pending.popleft()
+        try:
+            return future.result()
+        except self._block_errors as exc:
+            error = exc
+        # Join the block to the next ones until the result can be
+        # decompressed.
+        while True:
+            self._submit()
+            if not self._pending:
+                raise error
+            next_block, future = self._pending.popleft()
+            future.cancel()
+            block = self._join_blocks(block, next_block)
+            if block is None:
+                raise error
+            try:
+                return self._decompress_block(block)
+            except self._block_errors:
+                pass
+
+    # Keep the threads of the pool busy, with a bounded number of blocks
+    # waiting to be read.
+    def _submit(self):
+        while len(self._pending) < 2 * self._threads:
+            block = next(self._blocks, None)
+            if block is None:
+                break
+            future = self._executor.submit(self._decompress_block, block)
+            self._pending.append((block, future))
+
+    def _cancel(self):
+        while self._pending:
+            block, future = self._pending.pop()
+            future.cancel()
+
+    def _restart(self, offset, pos):
+        self._cancel()
+        self._fp.seek(offset)
+        self._eof = False
+        self._pos = pos
+        self._data = b""
+        self._offset = 0
+        self._blocks = self._iter_blocks()
+
+
+class Codec(collections.namedtuple('Codec', 'name open magic extensions')):
+    """A registered compression format.
+
+    open(file, mode) returns a binary file object reading ('rb') or writing
+    ('wb') the data compressed in file, a file name or a file object, which
+    it does not close, like gzip.open() does.  magic is a tuple of prefixes
+    of the compressed data and extensions a tuple of file name extensions,
+    such as '.gz'.
+    """
+
+    __slots__ = ()
+
+
+# Registered codecs, by name.
+_codecs = collections.OrderedDict()
+
+
+def register_codec(name, open, *, magic=(), extensions=()):
+    """Register the compression format name, used by tarfile and shutil
+    to read and write archives compressed with it.
+
+    See Codec for the meaning of the arguments.  A codec registered with
+    the name of another one replaces it.
+    """
+    _codecs[name] = Codec(name, open, tuple(magic), tuple(extensions))
+
+
+def unregister_codec(name):
+    """Remove the compression format name from the registry."""
+    del _codecs[name]
+
+
+def get_codec(name):
+    """Return the Codec registered for the compression format name.
+
+    Raises LookupError if there is none.
+    """
+    try:
+        return _codecs[name]
+    except KeyError:
+        raise LookupError('unknown compression format %r' % (name,)) from None
+
+
+def get_codecs():
+    """Return the list of the registered Codecs."""
+    return list(_codecs.values())
+
+
+def find_codec(data):
+    """Return the Codec whose magic prefixes data, or None."""
+    for codec in _codecs.values():
+        if codec.magic and data.startswith(codec.magic):
+            return codec
+    return None
+
+
+def _open_gzip(file, mode):
+    import gzip
+    return gzip.open(file, mode)
+
+def _open_bz2(file, mode):
+    import bz2
+    return bz2.open(file, mode)
+
+def _open_xz(file, mode):
+    import lzma
+    return lzma.open(file, mode)
+
+# The modules implementing them are imported when they are used, since they
+# may not be available.
+register_codec('gz', _open_gzip, magic=[b'\x1f\x8b\x08'],
+               extensions=['.gz'])
+register_codec('bz2', _open_bz2, magic=[b'BZh'], extensions=['.bz2'])
+register_codec('xz', _open_xz, magic=[b'\xfd7zXZ\x00'], extensions=['.xz'])
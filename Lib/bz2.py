@@ -28,6 +28,169 @@ _MODE_READ     = 1
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+# Magic numbers starting the blocks of a bzip2 stream and its end, which
+# are not aligned on bytes.  A stream can be split into single-block
+# streams, decompressed in parallel, at the positions where they are found.
+_BLOCK_MAGIC = 0x314159265359
+_EOS_MAGIC = 0x177245385090
+# For each offset of the magic numbers in their first byte, the 7 bytes
+# holding them, the first and the last ones only partially.
+_BLOCK_PATTERNS = [(_BLOCK_MAGIC << 8 - shift).to_bytes(7, "big")
+                   for shift in range(8)]
+_EOS_PATTERNS = [(_EOS_MAGIC << 8 - shift).to_bytes(7, "big")
+                 for shift in range(8)]
+# Blocks hold at most 900 kB of data, which bzip2 never expands by more
+# than a few percent.
+_MAX_BLOCK_BITS = 8 * 1024 * 1024 * 8
+# Block size levels in stream headers.
+_LEVELS = b"123456789"
+# Compressed data read chunk size when searching blocks.
+_READ_SIZE = 1024 * 1024
+
+
+def _combine_crc(crc, block_crc):
+    """Return the combined CRC of a stream updated with a block's CRC."""
+    return ((crc << 1 | crc >> 31) & 0xffffffff) ^ block_crc
+
+
+def _get_bits(data, start, count):
+    """Return the count bits of data at bit offset start as an int."""
+    end = start + count
+    value = int.from_bytes(data[start // 8:(end + 7) // 8], "big")
+    return (value >> (-end % 8)) & ((1 << count) - 1)
+
+
+def _find_magic(data, patterns, start):
+    """Return the bit offset of the first magic number of patterns in data
+    at or after the bit offset start, or -1."""
+    found = -1
+    for shift, pattern in enumerate(patterns):
+        if shift:
+            # Search the 5 whole bytes, then check the partial ones.
+            needle = pattern[1:6]
+            mask = (1 << 8 - shift) - 1
+            i = max((start - shift + 7) // 8, 0) + 1
+            while True:
+                i = data.find(needle, i)
+                if i < 0 or i + 5 >= len(data):
+                    break
+                if (data[i - 1] & mask == pattern[0] and
+                    data[i + 5] >> 8 - shift == pattern[6] >> 8 - shift):
+                    pos = (i - 1) * 8 + shift
+                    if found < 0 or pos < found:
+                        found = pos
+                    break
+                i += 1
+        else:
+            i = data.find(pattern[:6], (start + 7) // 8)
+            if i >= 0 and (found < 0 or i * 8 < found):
+                found = i * 8
+    return found
+
+
+class _ParallelReader(_compression.ParallelDecompressReader):
+
+    """Decompresses the blocks of bzip2 streams in a pool of threads.
+
+    The blocks are found by searching their magic numbers, which may also
+    appear by chance in the compressed data: blocks which cannot be
+    decompressed are joined to the next ones.
+    """
+
+    def _iter_blocks(self):
+        data = bytearray()
+        eof = False
+
+        def read(size):
+            # Read until data holds size bytes or the file ends.
+            nonlocal eof
+            while len(data) < size and not eof:
+                chunk = self._fp.read(max(size - len(data), _READ_SIZE))
+                eof = not chunk
+                data.extend(chunk)
+
+        first = True
+        while True:
+            read(10)
+            if not data:
+                return
+            if data[:3] != b"BZh" or len(data) < 10 or data[3] not in _LEVELS:
+                if first:
+                    raise OSError("Invalid data stream")
+                return  # Trailing data isn't a bzip2 stream; ignore it.
+            first = False
+            start = 32  # Bit offset of the current block in data.
+            crc = 0
+            while _get_bits(data, start, 48) == _BLOCK_MAGIC:
+                pos = start + 48
+                while True:
+                    end = _find_magic(data, _BLOCK_PATTERNS, pos)
+                    eos = _find_magic(data, _EOS_PATTERNS, pos)
+                    last = eos >= 0 and (end < 0 or eos < end)
+                    if last:
+                        end = eos
+                        # The end of a stream is followed by its combined
+                        # CRC, then by another stream or the end of the
+                        # file, unless it was found by chance.
+                        following = (end + 87) // 8
+                        read(following + 4)
+                        if len(data) * 8 < end + 80:
+                            break
+                        combined = _combine_crc(
+                            crc, _get_bits(data, start + 48, 32))
+                        if (_get_bits(data, end + 48, 32) == combined or
+                            data[following:following + 3] in (b"", b"BZh")):
+                            break
+                        pos = end + 1
+                        continue
+                    if end >= 0:
+                        read((end + 80 + 7) // 8)
+                        break
+                    if eof:
+                        break
+                    pos = max(len(data) * 8 - 56, pos)
+                    read(len(data) + _READ_SIZE)
+                if end < 0 or len(data) * 8 < end + 80:
+                    raise EOFError("Compressed file ended before the "
+                                   "end-of-stream marker was reached")
+                block = (bytes(data[start // 8:(end + 7) // 8]), start % 8,
+                         end - start, last)
+                crc = _combine_crc(crc, _get_bits(data, start + 48, 32))
+                del data[:end // 8]
+                start = end % 8
+                yield block
+            if _get_bits(data, start, 48) != _EOS_MAGIC:
+                raise OSError("Invalid data stream")
+            del data[:(start + 87) // 8]
+
+    def _decompress_block(self, block):
+        # Make a stream of the block and decompress it.
+        data, start, count, last = block
+        if count < 80:
+            raise OSError("Invalid data stream")
+        bits = _get_bits(data, start, count)
+        crc = bits >> count - 80 & 0xffffffff
+        count += 80
+        stream = ((bits << 48 | _EOS_MAGIC) << 32 | crc) << -count % 8
+        decomp = BZ2Decompressor()
+        result = decomp.decompress(
+            b"BZh9" + stream.to_bytes((count + 7) // 8, "big"))
+        if not decomp.eof:
+            raise EOFError("Compressed file ended before the "
+                           "end-of-stream marker was reached")
+        return result
+
+    def _join_blocks(self, block, next_block):
+        data, start, count, last = block
+        next_data, next_start, next_count, next_last = next_block
+        if last or count + next_count > _MAX_BLOCK_BITS:
+            return None
+        bits = (_get_bits(data, start, count) << next_count |
+                _get_bits(next_data, next_start, next_count))
+        count += next_count
+        return ((bits << -count % 8).to_bytes((count + 7) // 8, "big"), 0,
+                count, next_last)
+
 
 class BZ2File(_compression.BaseStream):
 
@@ -40,7 +203,8 @@ class BZ2File(_compression.BaseStream):
     returned as bytes, and data to be written should be given as bytes.
     """
 
-    def __init__(self, filename, mode="r", buffering=None, compresslevel=9):
+    def __init__(self, filename, mode="r", buffering=None, compresslevel=9,
+                 *, threads=1):
         """Open a bzip2-compressed file.
 
         If filename is a str, bytes, or PathLike object, it gives the
@@ -58,7 +222,9 @@ class BZ2File(_compression.BaseStream):
         compression, and 9 (default) produces the most compression.
 
         If mode is 'r', the input file may be the concatenation of
-        multiple compressed streams.
+        multiple compressed streams.  threads is then the number of threads
+        decompressing the blocks of the streams, 0 meaning the number of
+        CPUs.
         """
         # This lock must be recursive, so that BufferedIOBase's
         # writelines() does not deadlock.
@@ -74,6 +240,11 @@ class BZ2File(_compression.BaseStream):
         if not (1 <= compresslevel <= 9):
             raise ValueError("compresslevel must be between 1 and 9")
 
+        if threads < 0:
+            raise ValueError("threads must be greater or equal to 0")
+        if threads == 0:
+            threads = os.cpu_count() or 1
+
         if mode in ("", "r", "rb"):
             mode = "rb"
             mode_code = _MODE_READ
@@ -103,8 +274,15 @@ class BZ2File(_compression.BaseStream):
             raise TypeError("filename must be a str, bytes, file or PathLike object")
 
         if self._mode == _MODE_READ:
-            raw = _compression.DecompressReader(self._fp,
-                BZ2Decompressor, trailing_error=OSError)
+            raw = None
+            if threads > 1:
+                try:
+                    raw = _ParallelReader(self._fp, threads)
+                except ImportError:
+                    pass
+            if raw is None:
+                raw = _compression.DecompressReader(self._fp,
+                    BZ2Decompressor, trailing_error=OSError)
             self._buffer = io.BufferedReader(raw)
         else:
             self._pos = 0
@@ -3,6 +3,7 @@
 csv.py - read/write/investigate CSV files
 """
 
+import os
 import re
 from _csv import Error, __version__, writer, reader, register_dialect, \
                  unregister_dialect, get_dialect, list_dialects, \
@@ -11,7 +12,7 @@ from _csv import Error, __version__, writer, reader, register_dialect, \
                  __doc__
 from _csv import Dialect as _Dialect
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from io import StringIO
 
 __all__ = ["QUOTE_MINIMAL", "QUOTE_ALL", "QUOTE_NONNUMERIC", "QUOTE_NONE",
@@ -19,7 +20,7 @@ __all__ = ["QUOTE_MINIMAL", "QUOTE_ALL", "QUOTE_NONNUMERIC", "QUOTE_NONE",
            "field_size_limit", "reader", "writer",
            "register_dialect", "get_dialect", "list_dialects", "Sniffer",
            "unregister_dialect", "__version__", "DictReader", "DictWriter",
-           "unix_dialect"]
+           "unix_dialect", "read_parallel"]
 
 class Dialect:
     """Describe a CSV dialect.
@@ -127,6 +128,25 @@ class DictReader:
                 d[key] = self.restval
         return d
 
+    def read_batch(self, n, converters=None):
+        """Read up to n rows and return an OrderedDict mapping each field
+        name to the list of its values, or an empty dict at the end of the
+        input.
+
+        converters maps field names to the converters of their columns, as
+        described for the read_batch() method of reader objects.  Unlike
+        iterating, the rows must have as many fields as fieldnames.
+        """
+        fieldnames = self.fieldnames
+        if fieldnames is None:
+            return OrderedDict()
+        if converters is None:
+            converters = {}
+        columns = self.reader.read_batch(
+            n, [converters.get(name) for name in fieldnames])
+        self.line_num = self.reader.line_num
+        return OrderedDict(zip(fieldnames, columns))
+
 
 class DictWriter:
     def __init__(self, f, fieldnames, restval="", extrasaction="raise",
@@ -447,3 +467,156 @@ class Sniffer:
                     hasHeader -= 1
 
         return hasHeader > 0
+
+
+# Size of the blocks read when looking for the boundaries of records.
+_BLOCK_SIZE = 1 << 20
+
+def _record_ranges(file, chunk_size, quote):
+    """Yield the (start, end) byte ranges splitting the binary file in
+    chunks of about chunk_size bytes ending with a record.
+
+    A chunk ends with a newline outside of quoted fields, which is found by
+    counting the quote characters since the start of the file: with
+    doubled quotes, a newline is in a quoted field if and only if an odd
+    number of quote characters precede it.
+    """
+    size = os.fstat(file.fileno()).st_size
+    start = pos = 0
+    in_quotes = False
+    file.seek(0)
+    while size - start > chunk_size:
+        # Count the quotes up to the nominal end of the chunk.
+        target = start + chunk_size
+        while pos < target:
+            block = file.read(min(_BLOCK_SIZE, target - pos))
+            if not block:
+                break
+            if quote and block.count(quote) % 2:
+                in_quotes = not in_quotes
+            pos += len(block)
+        # Then look for the next newline outside of quotes.
+        end = None
+        while end is None:
+            block = file.read(_BLOCK_SIZE)
+            if not block:
+                break
+            i = 0
+            while True:
+                j = block.find(b'\n', i)
+                if j < 0:
+                    if quote and block.count(quote, i) % 2:
+                        in_quotes = not in_quotes
+                    pos += len(block)
+                    break
+                if quote and block.count(quote, i, j) % 2:
+                    in_quotes = not in_quotes
+                i = j + 1
+                if not in_quotes:
+                    end = pos = pos + i
+                    file.seek(pos)
+                    break
+        if end is None or end == size:
+            break
+        yield start, end
+        start = end
+    if start < size:
+        yield start, size
+
+def _read_range(path, start, end, encoding, fmtparams, process=None):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    rows = list(reader(StringIO(data.decode(encoding), newline=''),
+                       **fmtparams))
+    if process is not None:
+        return [process(rows)]
+    return rows
+
+def read_parallel(path, dialect='excel', *, encoding=None,
+                  chunk_size=16 * 1024 * 1024, ordered=True,
+                  max_workers=None, executor=None, process=None,
+                  **fmtparams):
+    """Parse the CSV file path in parallel and yield its rows.
+
+    The file is split in chunks of about chunk_size bytes ending with a
+    record, which are parsed by reader() in the processes of a
+    concurrent.futures.ProcessPoolExecutor with max_workers processes, or
+    by executor if given, in which case max_workers only bounds the number
+    of chunks parsed ahead.  The rows are yielded in the order of the file,
+    or in the order the chunks are parsed in if ordered is false.
+
+    Sending the rows back from the processes can cost more than parsing
+    them.  If process is given, it is called in the processes with the
+    list of the rows of each chunk and its results are yielded instead of
+    the rows; it must be picklable, like a function of a module.
+
+    dialect and fmtparams are those of reader(); if dialect is None, it is
+    guessed by Sniffer from the start of the file.  The encoding must be
+    ASCII-compatible, and dialects using an escapechar are not supported,
+    as they prevent finding the ends of records without parsing.
+    """
+    if encoding is None:
+        import locale
+        encoding = locale.getpreferredencoding(False)
+    if dialect is None:
+        with open(path, encoding=encoding, errors='ignore',
+                  newline='') as file:
+            dialect = Sniffer().sniff(file.read(64 * 1024))
+    # Pass the dialect to the processes by value, as sniffed dialects cannot
+    # be pickled.
+    d = reader([], dialect, **fmtparams).dialect
+    fmtparams = {name: getattr(d, name)
+                 for name in ('delimiter', 'quotechar', 'escapechar',
+                              'doublequote', 'skipinitialspace',
+                              'lineterminator', 'quoting', 'strict')}
+    if d.escapechar is not None:
+        raise ValueError('dialects with an escapechar are not supported')
+    quote = None
+    if d.quoting != QUOTE_NONE and d.quotechar is not None:
+        quote = d.quotechar.encode(encoding)
+    if b'\n'.decode(encoding) != '\n' or (quote is not None and
+                                          len(quote) != 1):
+        raise ValueError('encoding %r is not ASCII-compatible' % encoding)
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+    ahead = 2 * (max_workers or os.cpu_count() or 1)
+    if executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers) as executor:
+            yield from _read_parallel(path, executor, encoding, chunk_size,
+                                      quote, ordered, ahead, process,
+                                      fmtparams)
+    else:
+        yield from _read_parallel(path, executor, encoding, chunk_size,
+                                  quote, ordered, ahead, process,
+                                  fmtparams)
+
+def _read_parallel(path, executor, encoding, chunk_size, quote, ordered,
+                   ahead, process, fmtparams):
+    pending = deque()
+    try:
+        with open(path, 'rb') as file:
+            for start, end in _record_ranges(file, chunk_size, quote):
+                pending.append(executor.submit(_read_range, path, start, end,
+                                               encoding, fmtparams, process))
+                # Bound the number of chunks parsed ahead of the consumer.
+                if len(pending) >= ahead:
+                    yield from _next_chunk(pending, ordered)
+        while pending:
+            yield from _next_chunk(pending, ordered)
+    finally:
+        for future in pending:
+            future.cancel()
+
+def _next_chunk(pending, ordered):
+    """Remove a future from pending, the first one if ordered or else the
+    first one to complete, and return its rows."""
+    if ordered:
+        future = pending.popleft()
+    else:
+        from concurrent.futures import wait, FIRST_COMPLETED
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        future = done.pop()
+        pending.remove(future)
+    return future.result()
@@ -185,8 +185,7 @@ class FeedParser:
         """Parse all remaining data and return the root message object."""
         self._input.close()
         self._call_parse()
-        root = self._pop_message()
-        assert not self._msgstack
+        root = self._close_part()
         # Look for final set of defects
         if root.get_content_maintype() == 'multipart' \
                and not root.is_multipart():
@@ -194,6 +193,15 @@ class FeedParser:
             self.policy.handle_defect(root, defect)
         return root
 
+    def _close_part(self):
+        # Like close(), without checking the root message: used by
+        # _LazyParser to parse the parts of a message on their own.
+        self._input.close()
+        self._call_parse()
+        root = self._pop_message()
+        assert not self._msgstack
+        return root
+
     def _new_message(self):
         if self._old_style_factory:
             msg = self._factory()
@@ -534,3 +542,242 @@ class BytesFeedParser(FeedParser):
 
     def feed(self, data):
         super().feed(data.decode('ascii', 'surrogateescape'))
+
+
+# Unlike headerRE, matches at any position of the string.
+_headerRE_at = re.compile(r'From |[\041-\071\073-\176]*:|[\t ]')
+
+
+class _LazyParser:
+    """A parser of email which only parses the headers of a message.
+
+    The offsets of the body of the message are recorded instead, and the
+    body is only split into parts when its payload is first used.  The
+    messages are the same as those built by FeedParser, down to the defects
+    found, but a message is never fed line by line: only the headers of each
+    part are, and the boundaries of the parts are searched with str.find().
+    """
+
+    def __init__(self, text, _factory=None, *, policy=compat32):
+        from email.message import Message
+        self.text = text
+        self._factory = _factory
+        self.policy = policy
+        # Only Message objects can be parsed lazily, other factories get
+        # their messages parsed right away.
+        self._lazy_class = Message
+
+    def parse(self):
+        """Return the root message object."""
+        msg = self._parse_part(0, len(self.text))
+        lazy = msg.__dict__.get('_lazy_body')
+        if lazy is not None:
+            lazy.root = True
+        return msg
+
+    def _line_end(self, pos, end):
+        mo = NLCRE.search(self.text, pos, end)
+        return mo.end() if mo else end
+
+    def _feedparser(self, headersonly=False):
+        parser = FeedParser(self._factory, policy=self.policy)
+        if headersonly:
+            parser._set_headersonly()
+        return parser
+
+    def _parse_part(self, start, end, digest=False, strip_eol=False):
+        """Return the message made of text[start:end], with its headers
+        parsed and its body left for _LazyBody to parse.
+
+        digest is true for the parts of a multipart/digest, and strip_eol
+        for those of any multipart, whose last line ending belongs to the
+        boundary following them.
+        """
+        text = self.text
+        # Find the first line which is neither a header nor a continuation
+        # line.  It is parsed with the headers, which leaves it in the
+        # payload when it isn't the empty line separating them from the body.
+        pos = start
+        while pos < end:
+            eol = self._line_end(pos, end)
+            is_header = _headerRE_at.match(text, pos, eol)
+            pos = eol
+            if not is_header:
+                break
+        parser = self._feedparser(headersonly=True)
+        parser.feed(text[start:pos])
+        msg = parser._close_part()
+        if digest:
+            msg.set_default_type('message/rfc822')
+        if (msg.get_content_type() == 'message/delivery-status' or
+                not isinstance(msg, self._lazy_class)):
+            # Parse right away the messages which cannot be parsed lazily,
+            # and delivery status, whose header blocks are small.
+            parser = self._feedparser()
+            parser.feed(text[start:end])
+            msg = parser._close_part()
+            if digest:
+                msg.set_default_type('message/rfc822')
+            if strip_eol:
+                _strip_eol(parser._last)
+            return msg
+
+        prefix = msg._payload
+        if prefix:
+            # Lines of the body were read with the headers.
+            parser = self.__class__(prefix + text[pos:end], self._factory,
+                                    policy=self.policy)
+            pos, end = 0, len(parser.text)
+        else:
+            parser = self
+        del msg._payload, msg.preamble, msg.epilogue
+        msg._lazy_body = _LazyBody(parser, pos, end, strip_eol)
+        return msg
+
+    def _find_boundaries(self, boundaryre, separator, start, end):
+        """Return the list of (start, end, match object) of the lines of
+        text[start:end] matched by boundaryre."""
+        text = self.text
+        boundaries = []
+        pos = start
+        while True:
+            i = text.find(separator, pos, end)
+            if i < 0:
+                return boundaries
+            if i == start or text[i - 1] in '\r\n':
+                eol = self._line_end(i, end)
+                mo = boundaryre.match(text, i, eol)
+                if mo:
+                    boundaries.append((i, eol, mo))
+                    pos = eol
+                    continue
+            pos = i + 1
+
+
+def _strip_eol(msg):
+    # Because of RFC 2046, the newline preceding a boundary separator
+    # belongs to the boundary, not to the payload or epilogue of the part.
+    if msg.get_content_maintype() == 'multipart':
+        epilogue = msg.epilogue
+        if epilogue == '':
+            msg.epilogue = None
+        elif epilogue is not None:
+            mo = NLCRE_eol.search(epilogue)
+            if mo:
+                msg.epilogue = epilogue[:-len(mo.group(0))]
+    else:
+        payload = msg._payload
+        if isinstance(payload, str):
+            mo = NLCRE_eol.search(payload)
+            if mo:
+                msg._payload = payload[:-len(mo.group(0))]
+
+
+class _LazyBody:
+    """The unparsed body of a message returned by _LazyParser.
+
+    It is stored as the _lazy_body attribute of the message instead of the
+    _payload, preamble and epilogue attributes, which Message.__getattr__()
+    sets by calling load() when one of them is first used.
+    """
+
+    __slots__ = ('parser', 'start', 'end', 'strip_eol', 'root')
+
+    def __init__(self, parser, start, end, strip_eol):
+        self.parser = parser
+        self.start = start
+        self.end = end
+        self.strip_eol = strip_eol
+        self.root = False
+
+    def load(self, msg):
+        """Parse the body of msg, and set its payload, preamble and epilogue
+        unless they were already set."""
+        # Parse into a blank message of the same class and copy the
+        # attributes, so that the lazy message isn't used while incomplete.
+        body = msg.__class__.__new__(msg.__class__)
+        body.__dict__.update(msg.__dict__)
+        body._payload = body.preamble = body.epilogue = None
+        self._parse(body)
+        if self.strip_eol and body.get_content_maintype() != 'message':
+            # Otherwise the last line ending is in the enclosed message.
+            _strip_eol(body)
+        if self.root and (body.get_content_maintype() == 'multipart' and
+                          not body.is_multipart()):
+            defect = errors.MultipartInvariantViolationDefect()
+            self.parser.policy.handle_defect(body, defect)
+        for name in ('_payload', 'preamble', 'epilogue'):
+            msg.__dict__.setdefault(name, getattr(body, name))
+
+    def _parse(self, msg):
+        parser = self.parser
+        text = parser.text
+        start, end = self.start, self.end
+        policy = parser.policy
+        maintype = msg.get_content_maintype()
+        if maintype == 'message':
+            # The message claims to be a message/* type, then what follows
+            # is another RFC 2822 message.
+            msg.attach(parser._parse_part(start, end,
+                                          strip_eol=self.strip_eol))
+            return
+        if maintype != 'multipart':
+            msg.set_payload(text[start:end])
+            return
+        boundary = msg.get_boundary()
+        if boundary is None:
+            defect = errors.NoBoundaryInMultipartDefect()
+            policy.handle_defect(msg, defect)
+            msg.set_payload(text[start:end])
+            return
+        # Make sure a valid content type was specified per RFC 2045:6.4.
+        if (msg.get('content-transfer-encoding', '8bit').lower()
+                not in ('7bit', '8bit', 'binary')):
+            defect = errors.InvalidMultipartContentTransferEncodingDefect()
+            policy.handle_defect(msg, defect)
+        separator = '--' + boundary
+        boundaryre = re.compile(
+            '(?P<sep>' + re.escape(separator) +
+            r')(?P<end>--)?(?P<ws>[ \t]*)(?P<linesep>\r\n|\r|\n)?$')
+        boundaries = parser._find_boundaries(boundaryre, separator,
+                                             start, end)
+        if not boundaries or boundaries[0][2].group('end'):
+            # We never saw the start boundary.  Note that as a defect and
+            # store the text before the end boundary as the payload.
+            defect = errors.StartBoundaryNotFoundDefect()
+            policy.handle_defect(msg, defect)
+            msg.set_payload(text[start:boundaries[0][0]]
+                            if boundaries else text[start:end])
+            msg.epilogue = ''
+            return
+        preamble = text[start:boundaries[0][0]]
+        if preamble:
+            # According to RFC 2046, the last newline belongs to the
+            # boundary.
+            mo = NLCRE_eol.search(preamble)
+            if mo:
+                preamble = preamble[:-len(mo.group(0))]
+            msg.preamble = preamble
+        digest = msg.get_content_type() == 'multipart/digest'
+        i = 0
+        while True:
+            # We saw a boundary separating two parts.  Consume any multiple
+            # boundary lines that may be following.
+            pos = boundaries[i][1]
+            i += 1
+            while i < len(boundaries) and boundaries[i][0] == pos:
+                pos = boundaries[i][1]
+                i += 1
+            part_end = boundaries[i][0] if i < len(boundaries) else end
+            msg.attach(parser._parse_part(pos, part_end, digest,
+                                          strip_eol=True))
+            if i == len(boundaries):
+                # We have seen the end of the input without seeing the end
+                # boundary.
+                defect = errors.CloseBoundaryNotFoundDefect()
+                policy.handle_defect(msg, defect)
+                return
+            if boundaries[i][2].group('end'):
+                # Everything after the end boundary is epilogue.
+                msg.epilogue = text[boundaries[i][1]:end]
+                return
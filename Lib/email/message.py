@@ -129,6 +129,17 @@ class Message:
         # Default content type
         self._default_type = 'text/plain'
 
+    def __getattr__(self, name):
+        # The payload, preamble and epilogue of a message returned by a
+        # parser in lazy mode are only set when one of them is first used.
+        if name in ('_payload', 'preamble', 'epilogue'):
+            lazy = self.__dict__.pop('_lazy_body', None)
+            if lazy is not None:
+                lazy.load(self)
+                return getattr(self, name)
+        raise AttributeError('%r object has no attribute %r' %
+                             (self.__class__.__name__, name))
+
     def __str__(self):
         """Return the entire formatted message as a string.
         """
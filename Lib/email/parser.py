@@ -9,7 +9,7 @@ __all__ = ['Parser', 'HeaderParser', 'BytesParser', 'BytesHeaderParser',
 
 from io import StringIO, TextIOWrapper
 
-from email.feedparser import FeedParser, BytesFeedParser
+from email.feedparser import FeedParser, BytesFeedParser, _LazyParser
 from email._policybase import compat32
 
 
@@ -39,14 +39,20 @@ class Parser:
         self._class = _class
         self.policy = policy
 
-    def parse(self, fp, headersonly=False):
+    def parse(self, fp, headersonly=False, *, lazy=False):
         """Create a message structure from the data in a file.
 
         Reads all the data from the file and returns the root of the message
         structure.  Optional headersonly is a flag specifying whether to stop
         parsing after reading the headers or not.  The default is False,
         meaning it parses the entire contents of the file.
+
+        If lazy is true, only the headers are parsed at first, and the body
+        of each part is only parsed when its payload is first used.
         """
+        if lazy and not headersonly:
+            return _LazyParser(fp.read(), self._class,
+                               policy=self.policy).parse()
         feedparser = FeedParser(self._class, policy=self.policy)
         if headersonly:
             feedparser._set_headersonly()
@@ -57,14 +63,16 @@ class Parser:
             feedparser.feed(data)
         return feedparser.close()
 
-    def parsestr(self, text, headersonly=False):
+    def parsestr(self, text, headersonly=False, *, lazy=False):
         """Create a message structure from a string.
 
         Returns the root of the message structure.  Optional headersonly is a
         flag specifying whether to stop parsing after reading the headers or
         not.  The default is False, meaning it parses the entire contents of
-        the file.
+        the file.  The lazy flag has the same meaning as for parse().
         """
+        if lazy and not headersonly:
+            return _LazyParser(text, self._class, policy=self.policy).parse()
         return self.parse(StringIO(text), headersonly=headersonly)
 
 
@@ -97,31 +105,36 @@ class BytesParser:
         """
         self.parser = Parser(*args, **kw)
 
-    def parse(self, fp, headersonly=False):
+    def parse(self, fp, headersonly=False, *, lazy=False):
         """Create a message structure from the data in a binary file.
 
         Reads all the data from the file and returns the root of the message
         structure.  Optional headersonly is a flag specifying whether to stop
         parsing after reading the headers or not.  The default is False,
         meaning it parses the entire contents of the file.
+
+        If lazy is true, only the headers are parsed at first, and the body
+        of each part is only parsed when its payload is first used.  The
+        offsets of the body of each part are recorded instead, so that its
+        lines are neither split nor checked before that.
         """
         fp = TextIOWrapper(fp, encoding='ascii', errors='surrogateescape')
         try:
-            return self.parser.parse(fp, headersonly)
+            return self.parser.parse(fp, headersonly, lazy=lazy)
         finally:
             fp.detach()
 
 
-    def parsebytes(self, text, headersonly=False):
+    def parsebytes(self, text, headersonly=False, *, lazy=False):
         """Create a message structure from a byte string.
 
         Returns the root of the message structure.  Optional headersonly is a
         flag specifying whether to stop parsing after reading the headers or
         not.  The default is False, meaning it parses the entire contents of
-        the file.
+        the file.  The lazy flag has the same meaning as for parse().
         """
         text = text.decode('ASCII', errors='surrogateescape')
-        return self.parser.parsestr(text, headersonly)
+        return self.parser.parsestr(text, headersonly, lazy=lazy)
 
 
 class BytesHeaderParser(BytesParser):
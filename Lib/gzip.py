@@ -17,6 +17,17 @@ FTEXT, FHCRC, FEXTRA, FNAME, FCOMMENT = 1, 2, 4, 8, 16
 
 READ, WRITE = 1, 2
 
+# Size of the blocks compressed in parallel (as pigz does) and of the
+# history of the data preceding them priming their compression.
+_BLOCK_SIZE = 128 * 1024
+_DICT_SIZE = 32 * 1024
+
+# Largest size of the chunks of compressed data read at once.
+READ_BUFFER_SIZE = 128 * 1024
+
+# Size of the first chunk of a member decompressed by decompress().
+_MEMBER_CHUNK_SIZE = 64 * 1024
+
 def open(filename, mode="rb", compresslevel=9,
          encoding=None, errors=None, newline=None):
     """Open a gzip-compressed file in binary or text mode.
@@ -104,9 +115,102 @@ class _PaddedFile:
         self._buffer = None
         return self.file.seek(off)
 
+    def tell(self):
+        if self._read is None:
+            return self.file.tell()
+        return self.file.tell() - (self._length - self._read)
+
     def seekable(self):
         return True  # Allows fast-forwarding even in unseekable streams
 
+class _ParallelCompressor:
+    """Compress data like zlib.compressobj() with raw deflate, in blocks
+    compressed by a pool of threads.
+
+    As with pigz, every block is compressed by its own compressor, primed
+    with the last 32 KiB of the data preceding it and ending with a
+    Z_SYNC_FLUSH, so that the blocks make one deflate stream.
+    """
+
+    def __init__(self, level, threads):
+        from concurrent.futures import ThreadPoolExecutor
+        self._level = level
+        self._executor = ThreadPoolExecutor(threads)
+        self._max_pending = 2 * threads
+        self._pending = []
+        self._buffer = bytearray()
+        self._zdict = b''
+
+    def _compress_block(self, data, zdict, mode):
+        if zdict:
+            compress = zlib.compressobj(self._level, zlib.DEFLATED,
+                                        -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+                                        0, zdict)
+        else:
+            compress = zlib.compressobj(self._level, zlib.DEFLATED,
+                                        -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+                                        0)
+        return compress.compress(data) + compress.flush(mode)
+
+    def _submit(self, data, mode):
+        self._pending.append(self._executor.submit(
+            self._compress_block, data, self._zdict, mode))
+        if mode == zlib.Z_FULL_FLUSH:
+            self._zdict = b''
+        elif len(data) >= _DICT_SIZE:
+            self._zdict = data[-_DICT_SIZE:]
+        else:
+            self._zdict = (self._zdict + data)[-_DICT_SIZE:]
+
+    def _collect(self, wait=False):
+        # Return the compressed blocks which are done, in order, waiting
+        # for all of them if wait is true, or else for enough of them to
+        # bound the memory used.
+        pending = self._pending
+        chunks = []
+        while pending and (wait or pending[0].done() or
+                           len(pending) > self._max_pending):
+            chunks.append(pending.pop(0).result())
+        return b''.join(chunks)
+
+    def compress(self, data):
+        buffer = self._buffer
+        chunks = []
+        with memoryview(data) as view, view.cast('B') as view:
+            pos = 0
+            while len(buffer) + len(view) - pos >= _BLOCK_SIZE:
+                # Collect the blocks done after submitting each block, so
+                # that a large write does not queue all its blocks at once.
+                if buffer:
+                    end = pos + _BLOCK_SIZE - len(buffer)
+                    buffer += view[pos:end]
+                    block = bytes(buffer)
+                    buffer.clear()
+                else:
+                    end = pos + _BLOCK_SIZE
+                    block = bytes(view[pos:end])
+                pos = end
+                self._submit(block, zlib.Z_SYNC_FLUSH)
+                chunks.append(self._collect())
+            buffer += view[pos:]
+        chunks.append(self._collect())
+        return b''.join(chunks)
+
+    def flush(self, mode=zlib.Z_FINISH):
+        if mode == zlib.Z_NO_FLUSH:
+            return self._collect()
+        if self._buffer or mode == zlib.Z_FINISH:
+            self._submit(bytes(self._buffer), mode)
+            self._buffer.clear()
+        elif mode == zlib.Z_FULL_FLUSH:
+            self._zdict = b''
+        try:
+            return self._collect(wait=True)
+        finally:
+            if mode == zlib.Z_FINISH:
+                self._executor.shutdown()
+
+
 class GzipFile(_compression.BaseStream):
     """The GzipFile class simulates most of the methods of a file object with
     the exception of the truncate() method.
@@ -121,7 +225,7 @@ class GzipFile(_compression.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=9, fileobj=None, mtime=None):
+                 compresslevel=9, fileobj=None, mtime=None, *, threads=1):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -153,6 +257,10 @@ class GzipFile(_compression.BaseStream):
         to the last modification time field in the stream when compressing.
         If omitted or None, the current time is used.
 
+        The threads argument is the number of threads compressing the data
+        when writing, 0 meaning the number of CPUs.  With more than one,
+        the data is compressed in blocks of 128 KiB, like pigz does.
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
@@ -177,13 +285,25 @@ class GzipFile(_compression.BaseStream):
             self.name = filename
 
         elif mode.startswith(('w', 'a', 'x')):
+            if threads < 0:
+                raise ValueError('threads must be greater or equal to 0')
+            if threads == 0:
+                threads = os.cpu_count() or 1
             self.mode = WRITE
             self._init_write(filename)
-            self.compress = zlib.compressobj(compresslevel,
-                                             zlib.DEFLATED,
-                                             -zlib.MAX_WBITS,
-                                             zlib.DEF_MEM_LEVEL,
-                                             0)
+            self.compress = None
+            if threads > 1:
+                try:
+                    self.compress = _ParallelCompressor(compresslevel,
+                                                        threads)
+                except ImportError:
+                    pass
+            if self.compress is None:
+                self.compress = zlib.compressobj(compresslevel,
+                                                 zlib.DEFLATED,
+                                                 -zlib.MAX_WBITS,
+                                                 zlib.DEF_MEM_LEVEL,
+                                                 0)
             self._write_mtime = mtime
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
@@ -373,6 +493,67 @@ class GzipFile(_compression.BaseStream):
         self._check_not_closed()
         return self._buffer.readline(size)
 
+    def __next__(self):
+        # Read the lines from the buffered reader directly rather than
+        # through readline().
+        line = self._buffer.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+
+def _read_exact(fp, n):
+    '''Read exactly *n* bytes from `fp`
+
+    This method is required because fp may be unbuffered,
+    i.e. return short reads.
+    '''
+    data = fp.read(n)
+    while len(data) < n:
+        b = fp.read(n - len(data))
+        if not b:
+            raise EOFError("Compressed file ended before the "
+                           "end-of-stream marker was reached")
+        data += b
+    return data
+
+
+def _read_gzip_header(fp):
+    '''Read a gzip header from `fp` and progress to the end of the header.
+
+    Returns last mtime if header was present or None otherwise.
+    '''
+    magic = fp.read(2)
+    if magic == b'':
+        return None
+
+    if magic != b'\037\213':
+        raise OSError('Not a gzipped file (%r)' % magic)
+
+    (method, flag, last_mtime) = struct.unpack("<BBIxx", _read_exact(fp, 8))
+    if method != 8:
+        raise OSError('Unknown compression method')
+
+    if flag & FEXTRA:
+        # Read & discard the extra field, if present
+        extra_len, = struct.unpack("<H", _read_exact(fp, 2))
+        _read_exact(fp, extra_len)
+    if flag & FNAME:
+        # Read and discard a null-terminated string containing the filename
+        while True:
+            s = fp.read(1)
+            if not s or s==b'\000':
+                break
+    if flag & FCOMMENT:
+        # Read and discard a null-terminated string containing a comment
+        while True:
+            s = fp.read(1)
+            if not s or s==b'\000':
+                break
+    if flag & FHCRC:
+        _read_exact(fp, 2)     # Read & discard the 16-bit header CRC
+    return last_mtime
+
 
 class _GzipReader(_compression.DecompressReader):
     def __init__(self, fp):
@@ -387,60 +568,38 @@ class _GzipReader(_compression.DecompressReader):
         self._stream_size = 0  # Decompressed size of unconcatenated stream
 
     def _read_exact(self, n):
-        '''Read exactly *n* bytes from `self._fp`
-
-        This method is required because self._fp may be unbuffered,
-        i.e. return short reads.
-        '''
-
-        data = self._fp.read(n)
-        while len(data) < n:
-            b = self._fp.read(n - len(data))
-            if not b:
-                raise EOFError("Compressed file ended before the "
-                               "end-of-stream marker was reached")
-            data += b
-        return data
+        return _read_exact(self._fp, n)
 
     def _read_gzip_header(self):
-        magic = self._fp.read(2)
-        if magic == b'':
+        last_mtime = _read_gzip_header(self._fp)
+        if last_mtime is None:
             return False
-
-        if magic != b'\037\213':
-            raise OSError('Not a gzipped file (%r)' % magic)
-
-        (method, flag,
-         self._last_mtime) = struct.unpack("<BBIxx", self._read_exact(8))
-        if method != 8:
-            raise OSError('Unknown compression method')
-
-        if flag & FEXTRA:
-            # Read & discard the extra field, if present
-            extra_len, = struct.unpack("<H", self._read_exact(2))
-            self._read_exact(extra_len)
-        if flag & FNAME:
-            # Read and discard a null-terminated string containing the filename
-            while True:
-                s = self._fp.read(1)
-                if not s or s==b'\000':
-                    break
-        if flag & FCOMMENT:
-            # Read and discard a null-terminated string containing a comment
-            while True:
-                s = self._fp.read(1)
-                if not s or s==b'\000':
-                    break
-        if flag & FHCRC:
-            self._read_exact(2)     # Read & discard the 16-bit header CRC
+        self._last_mtime = last_mtime
         return True
 
     def read(self, size=-1):
         if size < 0:
             return self.readall()
-        # size=0 is special because decompress(max_length=0) is not supported
+        # size=0 is special because decompress(max_length=0) does not limit
+        # the size of the output
         if not size:
             return b""
+        return self._read(size)
+
+    def readall(self):
+        # Decompress whole chunks of compressed data at once, rather than
+        # as much data as fits in a buffer of io.DEFAULT_BUFFER_SIZE.
+        chunks = []
+        while True:
+            data = self._read(0)
+            if not data:
+                break
+            chunks.append(data)
+        return b"".join(chunks)
+
+    def _read(self, size):
+        # Return at most size bytes, or the whole output of the next chunk
+        # of compressed data if size is 0.
 
         # For certain input data, a single
         # call to decompress() may not return
@@ -459,14 +618,21 @@ class _GzipReader(_compression.DecompressReader):
             if self._new_member:
                 # If the _new_member flag is set, we have to
                 # jump to the next member, if there is one.
+                self._add_stream(self._tell_fp(), self._pos)
                 self._init_read()
                 if not self._read_gzip_header():
                     self._size = self._pos
                     return b""
                 self._new_member = False
 
-            # Read a chunk of data from the file
-            buf = self._fp.read(io.DEFAULT_BUFFER_SIZE)
+            # Read a chunk of data from the file.  Reading more than the
+            # output is likely to hold would make copies of the input left
+            # as the unconsumed_tail.
+            if size:
+                buf = self._fp.read(max(min(size, READ_BUFFER_SIZE),
+                                        io.DEFAULT_BUFFER_SIZE))
+            else:
+                buf = self._fp.read(READ_BUFFER_SIZE)
 
             uncompress = self._decompressor.decompress(buf, size)
             if self._decompressor.unconsumed_tail != b"":
@@ -511,16 +677,19 @@ class _GzipReader(_compression.DecompressReader):
         if c:
             self._fp.prepend(c)
 
-    def _rewind(self):
-        super()._rewind()
+    def _restart(self, offset, pos):
+        super()._restart(offset, pos)
         self._new_member = True
 
-def compress(data, compresslevel=9):
+def compress(data, compresslevel=9, *, threads=1):
     """Compress data in one shot and return the compressed string.
     Optional argument is the compression level, in range of 0-9.
+    threads is the number of threads compressing the data, as for
+    GzipFile.
     """
     buf = io.BytesIO()
-    with GzipFile(fileobj=buf, mode='wb', compresslevel=compresslevel) as f:
+    with GzipFile(fileobj=buf, mode='wb', compresslevel=compresslevel,
+                  threads=threads) as f:
         f.write(data)
     return buf.getvalue()
 
@@ -528,8 +697,50 @@ def decompress(data):
     """Decompress a gzip compressed string in one shot.
     Return the decompressed string.
     """
-    with GzipFile(fileobj=io.BytesIO(data)) as f:
-        return f.read()
+    # Decompress the members from the input in place, instead of going
+    # through the chunks read by a GzipFile.
+    decompressed_members = []
+    fp = io.BytesIO(data)
+    pos = 0
+    with memoryview(data) as view:
+        # The input following the end of a member is copied to unused_data.
+        # Members are decompressed with a single call as long as the input
+        # copied in total stays below its size, then in growing chunks:
+        # decompressing many members would take quadratic time otherwise.
+        budget = len(view)
+        while True:
+            fp.seek(pos)
+            if _read_gzip_header(fp) is None:
+                return b"".join(decompressed_members)
+            pos = fp.tell()
+            do = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+            chunks = []
+            if len(view) - pos <= budget:
+                size = len(view) - pos
+            else:
+                size = _MEMBER_CHUNK_SIZE
+            while not do.eof and pos < len(view):
+                chunk = view[pos:pos + size]
+                chunks.append(do.decompress(chunk))
+                pos += len(chunk) - len(do.unused_data)
+                budget -= len(do.unused_data)
+                size *= 2
+            trailer = view[pos:pos + 8]
+            if not do.eof or len(trailer) < 8:
+                raise EOFError("Compressed file ended before the "
+                               "end-of-stream marker was reached")
+            pos += 8
+            decompressed = b"".join(chunks)
+            crc32, isize = struct.unpack("<II", trailer)
+            if crc32 != zlib.crc32(decompressed):
+                raise OSError("CRC check failed %s != %s" %
+                              (hex(crc32), hex(zlib.crc32(decompressed))))
+            elif isize != (len(decompressed) & 0xffffffff):
+                raise OSError("Incorrect length of data produced")
+            decompressed_members.append(decompressed)
+            # Gzip files can be padded with zeroes and still have archives.
+            while pos < len(view) and not view[pos]:
+                pos += 1
 
 
 def _test():
@@ -770,10 +770,19 @@ class FrozenImporter:
 
     @classmethod
     def find_spec(cls, fullname, path=None, target=None):
-        if _imp.is_frozen(fullname):
-            return spec_from_loader(fullname, cls, origin='frozen')
-        else:
+        if not _imp.is_frozen(fullname):
             return None
+        spec = spec_from_loader(fullname, cls, origin='frozen')
+        # Standard library modules frozen at build time keep the location
+        # of their source, e.g. for the submodules of a frozen package which
+        # are not frozen themselves to be found.
+        filename = _imp._frozen_stdlib_filename(fullname)
+        if filename is not None:
+            spec.loader_state = filename
+            if spec.submodule_search_locations is not None:
+                spec.submodule_search_locations.append(
+                    filename.rpartition('/')[0])
+        return spec
 
     @classmethod
     def find_module(cls, fullname, path=None):
@@ -794,6 +803,8 @@ class FrozenImporter:
         if not _imp.is_frozen(name):
             raise ImportError('{!r} is not a frozen module'.format(name),
                               name=name)
+        if module.__spec__.loader_state is not None:
+            module.__file__ = module.__spec__.loader_state
         code = _call_with_frames_removed(_imp.get_frozen_object, name)
         exec(code, module.__dict__)
 
@@ -0,0 +1,306 @@
+"""Import modules from a code bundle.
+
+A code bundle is a single file holding the marshalled code objects of many
+modules, indexed by a hash table of their names.  The file is memory-mapped
+when it is first used: finding a module is a hash table lookup and loading it
+unmarshals its code straight from the shared pages, instead of listing
+directories and opening, reading and validating a source or bytecode file
+for every module.
+
+A bundle is created by create_bundle() and used by adding its path to
+sys.path once the path hook has been installed by install().  Unlike
+bytecode files, a bundle is never checked against the source files it was
+compiled from and must be recreated when they change.
+"""
+from . import abc
+from ._bootstrap_external import MAGIC_NUMBER
+from ._bootstrap_external import spec_from_file_location
+
+import binascii
+import marshal
+import mmap
+import os
+import stat
+import struct
+import sys
+
+__all__ = ['BundleFinder', 'BundleLoader', 'create_bundle', 'install']
+
+# Bump the last byte whenever the layout of the file changes.
+_BUNDLE_MAGIC = b'PYBNDL\x00\x01'
+
+# The file starts with a header, followed by a hash table of slots indexing
+# the records, followed by the records themselves.
+#
+#   header: bundle magic, importlib MAGIC_NUMBER, number of modules,
+#           number of slots (a power of two)
+#   slot:   CRC-32 of the module name, flags (0 for an empty slot), offset
+#           of the record
+#   record: length of the module name, of the source path relative to the
+#           bundle and of the marshalled code, followed by the three of them
+_HEADER = struct.Struct('<8s4sII4x')
+_SLOT = struct.Struct('<IIQ')
+_RECORD = struct.Struct('<HHI')
+
+_FLAG_USED = 1
+_FLAG_PACKAGE = 2
+
+# Opened bundles, by path.
+_bundles = {}
+
+
+def _hash(name):
+    return binascii.crc32(name)
+
+
+class _Bundle:
+
+    """A memory-mapped code bundle."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ImportError('not a code bundle: {!r}'.format(path),
+                                  path=path)
+            magic, pyc_magic, self.count, self.size = _HEADER.unpack(header)
+            if magic != _BUNDLE_MAGIC:
+                raise ImportError('not a code bundle: {!r}'.format(path),
+                                  path=path)
+            if pyc_magic != MAGIC_NUMBER:
+                raise ImportError('code bundle {!r} was created by another '
+                                  'Python version'.format(path), path=path)
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        # The hash table must have a power of two slots, at least one of
+        # them empty, and fit in the file.
+        if (self.size < 1 or self.size & (self.size - 1) or
+                self.count >= self.size or
+                len(self._map) < _HEADER.size + self.size * _SLOT.size):
+            self._map.close()
+            raise ImportError('code bundle {!r} is corrupted'.format(path),
+                              path=path)
+        self._view = memoryview(self._map)
+
+    def lookup(self, fullname):
+        """Return (is_package, relative source path, marshalled code) for
+        the module fullname, or None if it is not in the bundle."""
+        name = fullname.encode('utf-8', 'surrogateescape')
+        h = _hash(name)
+        mask = self.size - 1
+        i = h & mask
+        for _ in range(self.size):
+            slot_hash, flags, offset = _SLOT.unpack_from(
+                self._map, _HEADER.size + i * _SLOT.size)
+            if not flags:
+                return None
+            if slot_hash == h:
+                name_len, origin_len, code_len = _RECORD.unpack_from(
+                    self._map, offset)
+                start = offset + _RECORD.size
+                if self._view[start:start + name_len] == name:
+                    start += name_len
+                    origin = bytes(self._view[start:start + origin_len])
+                    start += origin_len
+                    return (bool(flags & _FLAG_PACKAGE),
+                            origin.decode('utf-8', 'surrogateescape'),
+                            self._view[start:start + code_len])
+            i = (i + 1) & mask
+        return None
+
+
+def _get_bundle(path):
+    """Return the (bundle, prefix) pair for a path inside a bundle, where
+    prefix is the directory of the package within the bundle, as it appears
+    in the package's __path__."""
+    archive = path
+    prefix = ''
+    while True:
+        try:
+            return _bundles[archive], prefix
+        except KeyError:
+            pass
+        try:
+            st = os.stat(archive)
+        except (OSError, ValueError):
+            head, tail = os.path.split(archive)
+            if head == archive or not tail:
+                raise ImportError('not a code bundle: {!r}'.format(path),
+                                  path=path)
+            prefix = os.path.join(tail, prefix) if prefix else tail
+            archive = head
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            raise ImportError('not a code bundle: {!r}'.format(path),
+                              path=path)
+        bundle = _bundles[archive] = _Bundle(archive)
+        return bundle, prefix
+
+
+class BundleLoader(abc.InspectLoader):
+
+    """Loader for the modules of a code bundle."""
+
+    def __init__(self, bundle):
+        self._bundle = bundle
+
+    def _lookup(self, fullname):
+        entry = self._bundle.lookup(fullname)
+        if entry is None:
+            raise ImportError('{!r} is not in code bundle {!r}'.format(
+                              fullname, self._bundle.path), name=fullname)
+        return entry
+
+    def is_package(self, fullname):
+        """Return whether the module is a package."""
+        return self._lookup(fullname)[0]
+
+    def get_filename(self, fullname):
+        """Return the path of the source file of the module within the
+        bundle, which __file__ is set to."""
+        return os.path.join(self._bundle.path, self._lookup(fullname)[1])
+
+    def get_code(self, fullname):
+        """Return the code object of the module, unmarshalled from the
+        bundle."""
+        return marshal.loads(self._lookup(fullname)[2])
+
+    def get_source(self, fullname):
+        """Return None, as bundles do not hold source code."""
+        self._lookup(fullname)
+        return None
+
+
+class BundleFinder:
+
+    """Path entry finder for the modules of a code bundle.
+
+    The path entry is either the path of the bundle or, for the __path__ of
+    a package in the bundle, the path of the bundle followed by the directory
+    of the package.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._bundle, self._prefix = _get_bundle(path)
+        self._loader = BundleLoader(self._bundle)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.path)
+
+    def find_spec(self, fullname, target=None):
+        """Return the spec of the module if this path entry holds it."""
+        tail = fullname.rpartition('.')[2]
+        if os.path.join(self._prefix, tail) != os.path.join(
+                *fullname.split('.')):
+            return None
+        entry = self._bundle.lookup(fullname)
+        if entry is None:
+            return None
+        is_package, origin, _ = entry
+        origin = os.path.join(self._bundle.path, origin)
+        if is_package:
+            locations = [os.path.join(self._bundle.path,
+                                      *fullname.split('.'))]
+        else:
+            locations = None
+        return spec_from_file_location(fullname, origin, loader=self._loader,
+                                       submodule_search_locations=locations)
+
+    def invalidate_caches(self):
+        """Do nothing: bundles are not expected to change."""
+
+
+def install():
+    """Install the path hook for code bundles in sys.path_hooks."""
+    if BundleFinder not in sys.path_hooks:
+        sys.path_hooks.insert(0, BundleFinder)
+        # Path entries already found not to be handled by any other hook
+        # may be bundles.
+        for path, finder in list(sys.path_importer_cache.items()):
+            if finder is None:
+                del sys.path_importer_cache[path]
+
+
+def _iter_modules(root, package=None):
+    """Yield the (module name, source path, is_package) triples of the
+    modules in the directory root, recursing into packages."""
+    try:
+        names = sorted(os.listdir(root))
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(root, name)
+        if name == '__pycache__':
+            continue
+        if os.path.isdir(path):
+            init = os.path.join(path, '__init__.py')
+            if name.isidentifier() and os.path.isfile(init):
+                fullname = package + '.' + name if package else name
+                yield fullname, init, True
+                yield from _iter_modules(path, fullname)
+        elif name.endswith('.py') and name != '__init__.py':
+            stem = name[:-3]
+            if stem.isidentifier():
+                fullname = package + '.' + stem if package else stem
+                yield fullname, path, False
+
+
+def create_bundle(target, paths, *, optimize=-1):
+    """Compile the modules and packages found in the directories of paths
+    and write them to the code bundle target.
+
+    The directories are searched like sys.path: when a module is found in
+    several of them, the first one is used.  Namespace packages are not
+    supported.  The optimize argument is passed to compile().  Returns the
+    number of modules written.
+    """
+    modules = {}
+    for root in paths:
+        for fullname, path, is_package in _iter_modules(root):
+            if fullname not in modules:
+                modules[fullname] = (os.path.relpath(path, root), path,
+                                     is_package)
+
+    size = 8
+    while size < 2 * len(modules):
+        size *= 2
+    slots = [(0, 0, 0)] * size
+    records = []
+    offset = _HEADER.size + size * _SLOT.size
+    for fullname, (origin, path, is_package) in modules.items():
+        with open(path, 'rb') as file:
+            source = file.read()
+        code = compile(source, os.path.join(target, origin), 'exec',
+                       dont_inherit=True, optimize=optimize)
+        name = fullname.encode('utf-8', 'surrogateescape')
+        origin = origin.encode('utf-8', 'surrogateescape')
+        data = marshal.dumps(code)
+        h = _hash(name)
+        i = h & (size - 1)
+        while slots[i][1]:
+            i = (i + 1) & (size - 1)
+        flags = _FLAG_USED | (_FLAG_PACKAGE if is_package else 0)
+        slots[i] = (h, flags, offset)
+        records.append(_RECORD.pack(len(name), len(origin), len(data)))
+        records.extend((name, origin, data))
+        offset += _RECORD.size + len(name) + len(origin) + len(data)
+
+    # Write a new file rather than overwriting the bundle, which may be
+    # mapped by running processes.
+    tmp = '{}.{}.tmp'.format(target, os.getpid())
+    try:
+        with open(tmp, 'wb') as file:
+            file.write(_HEADER.pack(_BUNDLE_MAGIC, MAGIC_NUMBER,
+                                    len(modules), size))
+            for slot in slots:
+                file.write(_SLOT.pack(*slot))
+            file.writelines(records)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return len(modules)
@@ -1,5 +1,7 @@
 """Utility code for constructing importers, etc."""
 from . import abc
+from . import _bootstrap
+from . import _bootstrap_external
 from ._bootstrap import module_from_spec
 from ._bootstrap import _resolve_name
 from ._bootstrap import spec_from_loader
@@ -286,3 +288,96 @@ class LazyLoader(abc.Loader):
         loader_state['__class__'] = module.__class__
         module.__spec__.loader_state = loader_state
         module.__class__ = _LazyModule
+
+
+# Modules which are known to rely on side effects at import time and so must
+# never be made lazy by enable_lazy_imports().
+_LAZY_IMPORTS_DENY = frozenset({
+    '__main__', 'antigravity', 'encodings', 'readline', 'rlcompleter',
+    'site', 'sitecustomize', 'this', 'usercustomize',
+})
+
+
+def _matches_any(name, prefixes):
+    """Return True if name is one of the prefixes or a submodule of one."""
+    while name:
+        if name in prefixes:
+            return True
+        name = name.rpartition('.')[0]
+    return False
+
+
+class _LazyImportFinder:
+
+    """A meta path finder which makes the modules found by the other finders
+    on sys.meta_path lazy.
+
+    Only modules loaded by a source or sourceless file loader are made lazy;
+    built-in and extension modules are cheap to create or cannot have their
+    execution deferred, so their specs are returned unchanged.
+
+    """
+
+    def __init__(self, allow=None, deny=()):
+        self.allow = None if allow is None else frozenset(allow)
+        self.deny = _LAZY_IMPORTS_DENY.union(deny)
+
+    def is_lazy(self, name):
+        """Return True if the module called name may be imported lazily."""
+        if _matches_any(name, self.deny):
+            return False
+        return self.allow is None or _matches_any(name, self.allow)
+
+    def find_spec(self, name, path, target=None):
+        if not self.is_lazy(name):
+            return None
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                spec = _bootstrap._find_spec_legacy(finder, name, path)
+            else:
+                spec = find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if isinstance(spec.loader, (_bootstrap_external.SourceFileLoader,
+                                    _bootstrap_external.SourcelessFileLoader)):
+            spec.loader = LazyLoader(spec.loader)
+        return spec
+
+
+def enable_lazy_imports(*, allow=None, deny=()):
+    """Make subsequent imports of pure Python modules lazy.
+
+    A module imported while lazy imports are enabled is bound to a module
+    object whose code is only executed when one of its attributes is first
+    accessed (see LazyLoader).  If allow is not None, only the modules it
+    names (and their submodules) are made lazy.  The modules named in deny,
+    along with their submodules, are always imported eagerly; this is meant
+    for modules which have side effects at import time.
+
+    Calling this function again replaces the previous allow and deny lists.
+
+    """
+    disable_lazy_imports()
+    sys.meta_path.insert(0, _LazyImportFinder(allow, deny))
+
+
+def disable_lazy_imports():
+    """Stop making imports lazy.
+
+    Modules which were already imported lazily are left untouched and are
+    still loaded on first attribute access.
+
+    """
+    sys.meta_path[:] = [finder for finder in sys.meta_path
+                        if not isinstance(finder, _LazyImportFinder)]
+
+
+def lazy_imports_enabled():
+    """Return True if enable_lazy_imports() is in effect."""
+    return any(isinstance(finder, _LazyImportFinder)
+               for finder in sys.meta_path)
@@ -97,13 +97,13 @@ Using json.tool from the shell to validate and pretty-print::
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
+    'dump', 'dumps', 'load', 'loads', 'iterparse', 'dump_lines', 'load_lines',
     'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, _relocated_error
 from .encoder import JSONEncoder
 import codecs
 
@@ -166,17 +166,21 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
+            default=default, sort_keys=sort_keys, **kw)
+    if type(encoder).iterencode is JSONEncoder.iterencode:
+        # Stream the output of the C encoder in large chunks.
+        encoder._iterencode_to(obj, fp.write)
+        return
     # could accelerate with writelines in some versions of Python, at
     # a debuggability cost
-    for chunk in iterable:
+    for chunk in encoder.iterencode(obj):
         fp.write(chunk)
 
 
@@ -238,9 +242,63 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         **kw).encode(obj)
 
 
+def dump_lines(iterable, fp, *, skipkeys=False, ensure_ascii=True,
+        check_circular=True, allow_nan=True, cls=None, separators=None,
+        default=None, sort_keys=False, **kw):
+    """Serialize each object of ``iterable`` as a line of JSON to ``fp`` (a
+    ``.write()``-supporting file-like object), in the newline-delimited JSON
+    (JSON Lines) format.
+
+    The arguments have the same meaning as in ``dump()``.  There is no
+    ``indent`` argument since each object must be serialized on a single
+    line.
+
+    """
+    if 'indent' in kw:
+        raise TypeError("dump_lines() got an unexpected keyword argument "
+                        "'indent'")
+    # cached encoder
+    if (not skipkeys and ensure_ascii and
+        check_circular and allow_nan and
+        cls is None and separators is None and
+        default is None and not sort_keys and not kw):
+        encode = _default_encoder.encode
+    else:
+        if cls is None:
+            cls = JSONEncoder
+        encode = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+            check_circular=check_circular, allow_nan=allow_nan,
+            separators=separators, default=default, sort_keys=sort_keys,
+            **kw).encode
+    write = fp.write
+    for obj in iterable:
+        write(encode(obj) + '\n')
+
+
 _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
 
+def _get_decoder(cls, object_hook, parse_float, parse_int, parse_constant,
+                 object_pairs_hook, kw):
+    if (cls is None and object_hook is None and
+            parse_int is None and parse_float is None and
+            parse_constant is None and object_pairs_hook is None and not kw):
+        return _default_decoder
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    return cls(**kw)
+
+
 def detect_encoding(b):
     bstartswith = b.startswith
     if bstartswith((codecs.BOM_UTF32_BE, codecs.BOM_UTF32_LE)):
@@ -299,6 +357,48 @@ def load(fp, *, cls=None, object_hook=None, parse_float=None,
         parse_constant=parse_constant, object_pairs_hook=object_pairs_hook, **kw)
 
 
+def iterparse(fp, *, chunk_size=65536, cls=None, object_hook=None,
+        parse_float=None, parse_int=None, parse_constant=None,
+        object_pairs_hook=None, **kw):
+    """Incrementally parse the JSON document read from ``fp`` (a
+    ``.read()``-supporting file-like object) and yield a ``(prefix, event,
+    value)`` tuple for each token of the document, without keeping the
+    document in memory.  See ``JSONDecoder.iterparse()``.
+
+    ``fp`` is read ``chunk_size`` characters or bytes at a time.  The other
+    arguments have the same meaning as in ``load()``.
+
+    """
+    decoder = _get_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, kw)
+    return decoder.iterparse(fp, chunk_size)
+
+
+def load_lines(fp, *, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
+    """Deserialize each line of ``fp`` (an iterable of ``str``, ``bytes`` or
+    ``bytearray`` lines, such as a file object) containing newline-delimited
+    JSON (JSON Lines), and yield the resulting Python objects.  Blank lines
+    are skipped.
+
+    The arguments have the same meaning as in ``load()``.
+
+    """
+    decode = _get_decoder(cls, object_hook, parse_float, parse_int,
+                          parse_constant, object_pairs_hook, kw).decode
+    offset = 0
+    for lineno, line in enumerate(fp):
+        if not isinstance(line, str):
+            line = line.decode('utf-8', 'surrogatepass')
+        if line and not line.isspace():
+            try:
+                yield decode(line)
+            except JSONDecodeError as err:
+                raise _relocated_error(err.msg, line, err.pos,
+                                       offset, lineno, 0) from None
+        offset += len(line)
+
+
 def loads(s, *, encoding=None, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
     """Deserialize ``s`` (a ``str``, ``bytes`` or ``bytearray`` instance
@@ -348,20 +448,5 @@ def loads(s, *, encoding=None, cls=None, object_hook=None, parse_float=None,
                             'not {!r}'.format(s.__class__.__name__))
         s = s.decode(detect_encoding(s), 'surrogatepass')
 
-    if (cls is None and object_hook is None and
-            parse_int is None and parse_float is None and
-            parse_constant is None and object_pairs_hook is None and not kw):
-        return _default_decoder.decode(s)
-    if cls is None:
-        cls = JSONDecoder
-    if object_hook is not None:
-        kw['object_hook'] = object_hook
-    if object_pairs_hook is not None:
-        kw['object_pairs_hook'] = object_pairs_hook
-    if parse_float is not None:
-        kw['parse_float'] = parse_float
-    if parse_int is not None:
-        kw['parse_int'] = parse_int
-    if parse_constant is not None:
-        kw['parse_constant'] = parse_constant
-    return cls(**kw).decode(s)
+    return _get_decoder(cls, object_hook, parse_float, parse_int,
+                        parse_constant, object_pairs_hook, kw).decode(s)
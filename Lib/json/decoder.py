@@ -1,5 +1,6 @@
 """Implementation of JSONDecoder
 """
+import codecs
 import re
 
 from json import scanner
@@ -43,6 +44,20 @@ class JSONDecodeError(ValueError):
         return self.__class__, (self.msg, self.doc, self.pos)
 
 
+def _relocated_error(msg, doc, pos, offset, lines, column):
+    """Return a JSONDecodeError for the position pos of doc, which is the
+    part of a larger document starting at the index offset, after lines
+    newlines and column characters after the last one."""
+    err = JSONDecodeError(msg, doc, pos)
+    if err.lineno == 1:
+        err.colno += column
+    err.lineno += lines
+    err.pos += offset
+    err.args = ('%s: line %d column %d (char %d)' %
+                (msg, err.lineno, err.colno, err.pos),)
+    return err
+
+
 _CONSTANTS = {
     '-Infinity': NegInf,
     'Infinity': PosInf,
@@ -130,6 +145,7 @@ scanstring = c_scanstring or py_scanstring
 
 WHITESPACE = re.compile(r'[ \t\n\r]*', FLAGS)
 WHITESPACE_STR = ' \t\n\r'
+ITEM_END = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*', FLAGS)
 
 
 def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
@@ -250,6 +266,115 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
     return values, end
 
 
+class _Stream(object):
+    """The text of a JSON document read from a file in chunks.
+
+    buf holds the text which has been read but not consumed yet, starting at
+    pos; text before pos is discarded when more text is read.
+    """
+
+    def __init__(self, fp, chunk_size):
+        self._read = fp.read
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self._decoder = None
+        self._started = False
+        # Position of buf in the document, for error messages
+        self._offset = 0
+        self._lines = 0
+        self._column = 0
+
+    def fill(self):
+        """Read more text, discarding the consumed text.  Return False if the
+        end of the file had already been reached."""
+        if self.eof:
+            return False
+        # Read at least as much as is buffered so that scanning a large
+        # value again after each read takes linear time overall.
+        data = self._read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not data:
+            self.eof = True
+        if not self._started:
+            self._started = True
+            if isinstance(data, (bytes, bytearray)):
+                from json import detect_encoding
+                self._decoder = codecs.getincrementaldecoder(
+                    detect_encoding(data))('surrogatepass')
+        if self._decoder is not None:
+            data = self._decoder.decode(data, self.eof)
+        elif not isinstance(data, str):
+            raise TypeError('the JSON file must be read as str, bytes or '
+                            'bytearray, not {!r}'.format(
+                                data.__class__.__name__))
+        if self.pos:
+            consumed = self.buf[:self.pos]
+            self._offset += self.pos
+            newlines = consumed.count('\n')
+            if newlines:
+                self._lines += newlines
+                self._column = len(consumed) - consumed.rfind('\n') - 1
+            else:
+                self._column += len(consumed)
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        if self._offset == 0 and not self.buf and data.startswith('\ufeff'):
+            raise JSONDecodeError(
+                "Unexpected UTF-8 BOM (decode using utf-8-sig)", data, 0)
+        self.buf += data
+        return True
+
+    def error(self, msg, pos):
+        """Return a JSONDecodeError for the position pos of buf."""
+        return _relocated_error(msg, self.buf, pos, self._offset,
+                                self._lines, self._column)
+
+    def skip(self, _w=WHITESPACE.match):
+        """Skip whitespace, reading more text if needed."""
+        while True:
+            self.pos = _w(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.fill():
+                return
+
+    def peek(self):
+        """Return the next character, or '' at the end of the document."""
+        return self.buf[self.pos:self.pos + 1]
+
+    def _retry(self, msg, pos):
+        # An error near the end of buf, or an unterminated string, may be
+        # due to a value truncated at the end of the text read so far.
+        if pos >= len(self.buf) - 10 or msg.startswith('Unterminated string'):
+            return self.fill()
+        return False
+
+    def value(self, scan_once):
+        """Decode the value at pos with scan_once and consume it."""
+        while True:
+            try:
+                value, end = scan_once(self.buf, self.pos)
+            except StopIteration as err:
+                if self._retry('', err.value):
+                    continue
+                raise self.error("Expecting value", err.value) from None
+            except JSONDecodeError as err:
+                if self._retry(err.msg, err.pos):
+                    continue
+                raise self.error(err.msg, err.pos) from None
+            # A number near the end of buf may continue in the next chunk,
+            # as in "1.5" or "1e+5" truncated after the "." or the "+".
+            if end + 2 >= len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def expect_end(self):
+        """Raise an error if there is more than whitespace left."""
+        self.skip()
+        if self.pos != len(self.buf):
+            raise self.error("Extra data", self.pos)
+
+
 class JSONDecoder(object):
     """Simple JSON <http://json.org> decoder
 
@@ -282,7 +407,7 @@ class JSONDecoder(object):
 
     def __init__(self, *, object_hook=None, parse_float=None,
             parse_int=None, parse_constant=None, strict=True,
-            object_pairs_hook=None):
+            object_pairs_hook=None, compact=False):
         """``object_hook``, if specified, will be called with the result
         of every JSON object decoded and its return value will be used in
         place of the given ``dict``.  This can be used to provide custom
@@ -317,6 +442,13 @@ class JSONDecoder(object):
         this context are those with character codes in the 0-31 range,
         including ``'\\t'`` (tab), ``'\\n'``, ``'\\r'`` and ``'\\0'``.
 
+        If ``compact`` is true, the decoded values take less memory, at
+        the cost of some bookkeeping: equal numbers of a document are decoded
+        once, and with the C accelerator, the dicts of objects having the
+        same keys in the same order as the previous object starting with the
+        same key share a single table of keys, like the ``__dict__`` of
+        instances.
+
         """
         self.object_hook = object_hook
         self.parse_float = parse_float or float
@@ -328,6 +460,7 @@ class JSONDecoder(object):
         self.parse_array = JSONArray
         self.parse_string = scanstring
         self.memo = {}
+        self.compact = compact
         self.scan_once = scanner.make_scanner(self)
 
 
@@ -356,3 +489,144 @@ class JSONDecoder(object):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+    def iterdecode(self, fp, chunk_size=65536, _m=ITEM_END.match):
+        """Incrementally decode the JSON document read from ``fp`` (a
+        ``.read()``-supporting file-like object returning ``str``,
+        ``bytes`` or ``bytearray``), ``chunk_size`` characters or bytes at
+        a time.
+
+        If the document is an array, yield its items one at a time, so that
+        the whole document never has to be in memory.  Otherwise, yield the
+        Python representation of the document.
+
+        """
+        stream = _Stream(fp, chunk_size)
+        stream.skip()
+        if stream.peek() != '[':
+            value = stream.value(self.scan_once)
+            stream.expect_end()
+            yield value
+            return
+        stream.pos += 1
+        stream.skip()
+        if stream.peek() == ']':
+            stream.pos += 1
+        else:
+            scan_once = self.scan_once
+            while True:
+                yield stream.value(scan_once)
+                # Fast path for the delimiter and whitespace after an item,
+                # when the next item has been read already.
+                m = _m(stream.buf, stream.pos)
+                if m is not None and m.end() < len(stream.buf):
+                    stream.pos = m.end()
+                    if m.group(1) == ']':
+                        break
+                    continue
+                stream.skip()
+                nextchar = stream.peek()
+                stream.pos += 1
+                if nextchar == ']':
+                    break
+                elif nextchar != ',':
+                    raise stream.error("Expecting ',' delimiter",
+                                       stream.pos - 1)
+                stream.skip()
+        stream.expect_end()
+
+    def iterparse(self, fp, chunk_size=65536):
+        """Incrementally parse the JSON document read from ``fp`` (a
+        ``.read()``-supporting file-like object returning ``str``,
+        ``bytes`` or ``bytearray``), ``chunk_size`` characters or bytes at
+        a time, and yield ``(prefix, event, value)`` tuples.
+
+        ``event`` is one of ``'start_map'``, ``'map_key'``, ``'end_map'``,
+        ``'start_array'``, ``'end_array'``, ``'string'``, ``'number'``,
+        ``'boolean'`` and ``'null'``.  ``value`` is the key for
+        ``'map_key'``, the decoded value for the scalar events and ``None``
+        otherwise.  ``prefix`` is the path of the value in the document: the
+        keys and ``'item'`` for array items, joined with dots.
+
+        """
+        stream = _Stream(fp, chunk_size)
+        scan_once = self.scan_once
+        # For each open container, whether it is an object, and its prefix
+        containers = []
+        prefix = ''
+
+        def key():
+            # Parse the key of an object member and return its prefix.
+            stream.skip()
+            if stream.peek() != '"':
+                raise stream.error(
+                    "Expecting property name enclosed in double quotes",
+                    stream.pos)
+            k = stream.value(scan_once)
+            stream.skip()
+            if stream.peek() != ':':
+                raise stream.error("Expecting ':' delimiter", stream.pos)
+            stream.pos += 1
+            stream.skip()
+            parent = containers[-1][1]
+            return k, parent + '.' + k if parent else k
+
+        stream.skip()
+        while True:
+            nextchar = stream.peek()
+            if nextchar == '{':
+                stream.pos += 1
+                yield prefix, 'start_map', None
+                stream.skip()
+                if stream.peek() != '}':
+                    containers.append((True, prefix))
+                    k, prefix = key()
+                    yield containers[-1][1], 'map_key', k
+                    continue
+                stream.pos += 1
+                yield prefix, 'end_map', None
+            elif nextchar == '[':
+                stream.pos += 1
+                yield prefix, 'start_array', None
+                stream.skip()
+                if stream.peek() != ']':
+                    containers.append((False, prefix))
+                    prefix = prefix + '.item' if prefix else 'item'
+                    continue
+                stream.pos += 1
+                yield prefix, 'end_array', None
+            else:
+                value = stream.value(scan_once)
+                if value is None:
+                    event = 'null'
+                elif value is True or value is False:
+                    event = 'boolean'
+                elif isinstance(value, str):
+                    event = 'string'
+                else:
+                    event = 'number'
+                yield prefix, event, value
+
+            # Close the containers ended by the value.
+            while containers:
+                is_object, prefix = containers[-1]
+                stream.skip()
+                nextchar = stream.peek()
+                stream.pos += 1
+                if nextchar == ',':
+                    if is_object:
+                        k, prefix = key()
+                        yield containers[-1][1], 'map_key', k
+                    else:
+                        stream.skip()
+                        prefix = prefix + '.item' if prefix else 'item'
+                    break
+                elif nextchar == ('}' if is_object else ']'):
+                    containers.pop()
+                    yield prefix, 'end_map' if is_object else 'end_array', None
+                else:
+                    raise stream.error("Expecting ',' delimiter",
+                                       stream.pos - 1)
+            else:
+                stream.expect_end()
+                return
@@ -24,6 +24,7 @@ def py_make_scanner(context):
     object_hook = context.object_hook
     object_pairs_hook = context.object_pairs_hook
     memo = context.memo
+    numbers = {} if getattr(context, 'compact', False) else None
 
     def _scan_once(string, idx):
         try:
@@ -50,9 +51,16 @@ def py_make_scanner(context):
             integer, frac, exp = m.groups()
             if frac or exp:
                 res = parse_float(integer + (frac or '') + (exp or ''))
+                default = parse_float is float
             else:
                 res = parse_int(integer)
-            return res, m.end()
+                default = parse_int is int
+            end = m.end()
+            # With compact, the first distinct short numbers are decoded once
+            if (numbers is not None and default and end - idx <= 16 and
+                    len(numbers) < 4096):
+                res = numbers.setdefault(string[idx:end], res)
+            return res, end
         elif nextchar == 'N' and string[idx:idx + 3] == 'NaN':
             return parse_constant('NaN'), idx + 3
         elif nextchar == 'I' and string[idx:idx + 8] == 'Infinity':
@@ -67,7 +75,9 @@ def py_make_scanner(context):
             return _scan_once(string, idx)
         finally:
             memo.clear()
+            if numbers is not None:
+                numbers.clear()
 
-    return _scan_once
+    return scan_once
 
 make_scanner = c_make_scanner or py_make_scanner
@@ -21,9 +21,11 @@ __all__ = [
     "open", "compress", "decompress", "is_check_supported",
 ]
 
+from binascii import crc32 as _crc32
 import builtins
 import io
 import os
+import struct
 from _lzma import *
 from _lzma import _encode_filter_properties, _decode_filter_properties
 import _compression
@@ -34,6 +36,137 @@ _MODE_READ     = 1
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+# The header and the footer of an .xz stream.  The footer follows the
+# index of the blocks of the stream, which is found from its end.
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+_XZ_HEADER = struct.Struct("<6s2sI")
+_XZ_FOOTER = struct.Struct("<II2s2s")
+
+
+def _decode_vli(data, pos):
+    """Decode the variable-length integer of an .xz index at pos in data
+    and return it with the position following it."""
+    value = 0
+    for i in range(9):
+        byte = data[pos + i]
+        value |= (byte & 0x7f) << 7 * i
+        if not byte & 0x80:
+            return value, pos + i + 1
+    raise ValueError("Invalid variable-length integer")
+
+
+def _encode_vli(value):
+    result = bytearray()
+    while value >= 0x80:
+        result.append(value & 0x7f | 0x80)
+        value >>= 7
+    result.append(value)
+    return result
+
+
+def _read_xz_blocks(fp):
+    """Return the list of the (offset, size, unpadded size, uncompressed
+    size, stream flags) of the blocks of the .xz streams from the current
+    offset of fp to its end, or None if their indexes cannot be read."""
+    if not fp.seekable():
+        return None
+    base = fp.tell()
+    try:
+        blocks = []
+        end = fp.seek(0, io.SEEK_END)
+        while end > base:
+            fp.seek(max(end - _XZ_FOOTER.size, base))
+            footer = fp.read(_XZ_FOOTER.size)
+            if len(footer) < _XZ_FOOTER.size:
+                return None
+            crc, backward_size, flags, magic = _XZ_FOOTER.unpack(footer)
+            if magic != b"YZ" or crc != _crc32(footer[4:10]):
+                return None
+            index_size = (backward_size + 1) * 4
+            index_offset = end - _XZ_FOOTER.size - index_size
+            if index_offset < base:
+                return None
+            fp.seek(index_offset)
+            index = fp.read(index_size)
+            if (index[0] != 0 or
+                _crc32(index[:-4]) != int.from_bytes(index[-4:], "little")):
+                return None
+            count, pos = _decode_vli(index, 1)
+            records = []
+            for i in range(count):
+                unpadded_size, pos = _decode_vli(index, pos)
+                uncompressed_size, pos = _decode_vli(index, pos)
+                records.append((unpadded_size, uncompressed_size))
+            offset = (index_offset - _XZ_HEADER.size -
+                      sum(-(-size // 4) * 4 for size, _ in records))
+            if offset < base:
+                return None
+            end = offset
+            fp.seek(offset)
+            header = fp.read(_XZ_HEADER.size)
+            if _XZ_HEADER.unpack(header) != (_XZ_MAGIC, flags, _crc32(flags)):
+                return None
+            offset += _XZ_HEADER.size
+            stream_blocks = []
+            for unpadded_size, uncompressed_size in records:
+                size = -(-unpadded_size // 4) * 4
+                stream_blocks.append((offset, size, unpadded_size,
+                                      uncompressed_size, flags))
+                offset += size
+            blocks[:0] = stream_blocks
+        return blocks
+    except (IndexError, ValueError, struct.error):
+        return None
+    finally:
+        fp.seek(base)
+
+
+class _ParallelReader(_compression.ParallelDecompressReader):
+
+    """Decompresses the blocks of .xz streams in a pool of threads.
+
+    The blocks are found with the indexes at the end of the streams, which
+    hold their sizes.  Each block is decompressed as a stream of its own,
+    so that its integrity check is verified.
+    """
+
+    _block_errors = (LZMAError, EOFError)
+
+    def __init__(self, fp, threads, blocks):
+        self._xz_blocks = blocks
+        super().__init__(fp, threads)
+
+    def _iter_blocks(self):
+        pos = self._fp.tell()
+        for offset, size, unpadded_size, uncompressed_size, flags in \
+                self._xz_blocks:
+            if offset >= pos:
+                self._fp.seek(offset)
+                data = self._fp.read(size)
+                if len(data) < size:
+                    raise EOFError("Compressed file ended before the "
+                                   "end-of-stream marker was reached")
+                yield data, unpadded_size, uncompressed_size, flags
+
+    def _decompress_block(self, block):
+        data, unpadded_size, uncompressed_size, flags = block
+        index = b"\0\1" + _encode_vli(unpadded_size) + \
+                _encode_vli(uncompressed_size)
+        index += bytes(-len(index) % 4)
+        index += _crc32(index).to_bytes(4, "little")
+        footer = (len(index) // 4 - 1).to_bytes(4, "little") + flags
+        decomp = LZMADecompressor(FORMAT_XZ)
+        result = decomp.decompress(b"".join([
+            _XZ_HEADER.pack(_XZ_MAGIC, flags, _crc32(flags)),
+            data,
+            index,
+            _XZ_FOOTER.pack(_crc32(footer), len(index) // 4 - 1, flags,
+                            b"YZ"),
+        ]))
+        if not decomp.eof or len(result) != uncompressed_size:
+            raise LZMAError("Corrupt input data")
+        return result
+
 
 class LZMAFile(_compression.BaseStream):
 
@@ -47,7 +180,8 @@ class LZMAFile(_compression.BaseStream):
     """
 
     def __init__(self, filename=None, mode="r", *,
-                 format=None, check=-1, preset=None, filters=None):
+                 format=None, check=-1, preset=None, filters=None,
+                 threads=1):
         """Open an LZMA-compressed file in binary mode.
 
         filename can be either an actual file name (given as a str,
@@ -89,6 +223,10 @@ class LZMAFile(_compression.BaseStream):
         filters (if provided) should be a sequence of dicts. Each dict
         should have an entry for "id" indicating ID of the filter, plus
         additional entries for options to the filter.
+
+        threads is the number of threads compressing the data, or
+        decompressing the blocks of .xz files which have several ones, 0
+        meaning the number of CPUs.
         """
         self._fp = None
         self._closefp = False
@@ -103,13 +241,18 @@ class LZMAFile(_compression.BaseStream):
                                  "level when opening a file for reading")
             if format is None:
                 format = FORMAT_AUTO
+            if threads < 0:
+                raise ValueError("threads must be greater or equal to 0")
+            if threads == 0:
+                threads = os.cpu_count() or 1
             mode_code = _MODE_READ
         elif mode in ("w", "wb", "a", "ab", "x", "xb"):
             if format is None:
                 format = FORMAT_XZ
             mode_code = _MODE_WRITE
             self._compressor = LZMACompressor(format=format, check=check,
-                                              preset=preset, filters=filters)
+                                              preset=preset, filters=filters,
+                                              threads=threads)
             self._pos = 0
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
@@ -127,8 +270,18 @@ class LZMAFile(_compression.BaseStream):
             raise TypeError("filename must be a str, bytes, file or PathLike object")
 
         if self._mode == _MODE_READ:
-            raw = _compression.DecompressReader(self._fp, LZMADecompressor,
-                trailing_error=LZMAError, format=format, filters=filters)
+            raw = None
+            if threads > 1 and format in (FORMAT_AUTO, FORMAT_XZ):
+                blocks = _read_xz_blocks(self._fp)
+                if blocks is not None and len(blocks) > 1:
+                    try:
+                        raw = _ParallelReader(self._fp, threads, blocks)
+                    except ImportError:
+                        pass
+            if raw is None:
+                raw = _compression.DecompressReader(self._fp,
+                    LZMADecompressor, trailing_error=LZMAError,
+                    format=format, filters=filters)
             self._buffer = io.BufferedReader(raw)
 
     def close(self):
@@ -307,15 +460,17 @@ def open(filename, mode="rb", *,
         return binary_file
 
 
-def compress(data, format=FORMAT_XZ, check=-1, preset=None, filters=None):
+def compress(data, format=FORMAT_XZ, check=-1, preset=None, filters=None,
+             *, threads=1):
     """Compress a block of data.
 
     Refer to LZMACompressor's docstring for a description of the
-    optional arguments *format*, *check*, *preset* and *filters*.
+    optional arguments *format*, *check*, *preset*, *filters* and
+    *threads*.
 
     For incremental compression, use an LZMACompressor instead.
     """
-    comp = LZMACompressor(format, check, preset, filters)
+    comp = LZMACompressor(format, check, preset, filters, threads=threads)
     return comp.compress(data) + comp.flush()
 
 
@@ -22,6 +22,10 @@ try:
     import fcntl
 except ImportError:
     fcntl = None
+try:
+    import mmap
+except ImportError:
+    mmap = None
 
 __all__ = ['Mailbox', 'Maildir', 'mbox', 'MH', 'Babyl', 'MMDF',
            'Message', 'MaildirMessage', 'mboxMessage', 'MHMessage',
@@ -30,6 +34,9 @@ __all__ = ['Mailbox', 'Maildir', 'mbox', 'MH', 'Babyl', 'MMDF',
 
 linesep = os.linesep.encode('ascii')
 
+# Bump whenever the layout of the table of contents cache of mbox changes.
+_TOC_CACHE_VERSION = 1
+
 class Mailbox:
     """A group of messages in a particular place."""
 
@@ -781,6 +788,22 @@ class _mboxMMDF(_singlefileMailbox):
         msg.set_from(from_line[5:].decode('ascii'))
         return msg
 
+    def get_headers(self, key):
+        """Return a Message representation holding only the headers, or
+        raise a KeyError. The body of the message is not read."""
+        start, stop = self._lookup(key)
+        self._file.seek(start)
+        from_line = self._file.readline().replace(linesep, b'')
+        lines = []
+        while self._file.tell() < stop:
+            line = self._file.readline(stop - self._file.tell())
+            if not line.rstrip(b'\r\n'):
+                break
+            lines.append(line)
+        msg = self._message_factory(b''.join(lines).replace(linesep, b'\n'))
+        msg.set_from(from_line[5:].decode('ascii'))
+        return msg
+
     def get_string(self, key, from_=False):
         """Return a string representation or raise a KeyError."""
         return email.message_from_bytes(
@@ -841,9 +864,10 @@ class mbox(_mboxMMDF):
     # _post_message_hooks outputs an empty line between messages.
     _append_newline = True
 
-    def __init__(self, path, factory=None, create=True):
+    def __init__(self, path, factory=None, create=True, *, toc_cache=None):
         """Initialize an mbox mailbox."""
         self._message_factory = mboxMessage
+        self._toc_cache = toc_cache
         _mboxMMDF.__init__(self, path, factory, create)
 
     def _post_message_hook(self, f):
@@ -852,36 +876,103 @@ class mbox(_mboxMMDF):
 
     def _generate_toc(self):
         """Generate key-to-(start, stop) table of contents."""
-        starts, stops = [], []
-        last_was_empty = False
-        self._file.seek(0)
-        while True:
-            line_pos = self._file.tell()
-            line = self._file.readline()
-            if line.startswith(b'From '):
-                if len(stops) < len(starts):
-                    if last_was_empty:
-                        stops.append(line_pos - len(linesep))
-                    else:
-                        # The last line before the "From " line wasn't
-                        # blank, but we consider it a start of a
-                        # message anyway.
-                        stops.append(line_pos)
-                starts.append(line_pos)
-                last_was_empty = False
-            elif not line:
-                if last_was_empty:
-                    stops.append(line_pos - len(linesep))
-                else:
-                    stops.append(line_pos)
-                break
-            elif line == linesep:
-                last_was_empty = True
-            else:
-                last_was_empty = False
-        self._toc = dict(enumerate(zip(starts, stops)))
+        st = os.fstat(self._file.fileno())
+        toc = None
+        if self._toc_cache is not None:
+            toc = self._load_toc_cache(st)
+        if toc is None:
+            data = None
+            if mmap is not None:
+                try:
+                    data = mmap.mmap(self._file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # Empty files and some special files cannot be mapped.
+                    pass
+            if data is None:
+                self._file.seek(0)
+                data = self._file.read()
+            try:
+                toc = self._scan_toc(data)
+                length = len(data)
+            finally:
+                if mmap is not None and isinstance(data, mmap.mmap):
+                    data.close()
+            if self._toc_cache is not None and length == st.st_size:
+                self._save_toc_cache(st, toc)
+        else:
+            length = st.st_size
+        self._toc = dict(enumerate(toc))
         self._next_key = len(self._toc)
-        self._file_length = self._file.tell()
+        self._file_length = length
+
+    @staticmethod
+    def _scan_toc(data):
+        """Return the list of (start, stop) offsets of the messages in data,
+        the contents of the mailbox file."""
+        starts = []
+        if data[:5] == b'From ':
+            starts.append(0)
+        pos = data.find(b'\nFrom ')
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = data.find(b'\nFrom ', pos + 1)
+
+        def stop_before(pos):
+            # A message ends before the empty line preceding the "From "
+            # line or the end of the file, if any.  When the last line
+            # isn't blank, we consider the message ends there anyway.
+            empty = pos - len(linesep)
+            if (empty >= 0 and data[empty:pos] == linesep and
+                    (empty == 0 or data[empty - 1:empty] == b'\n')):
+                return empty
+            return pos
+
+        stops = [stop_before(pos) for pos in starts[1:]]
+        if starts:
+            stops.append(stop_before(len(data)))
+        return list(zip(starts, stops))
+
+    def _load_toc_cache(self, st):
+        """Return the table of contents read from the cache file, or None
+        if it cannot be read or the mailbox was modified since it was
+        written."""
+        import json
+
+        try:
+            with open(self._toc_cache, encoding='ascii') as f:
+                cache = json.load(f)
+            if (cache['version'] != _TOC_CACHE_VERSION or
+                    cache['size'] != st.st_size or
+                    cache['mtime'] != st.st_mtime_ns):
+                return None
+            return [(int(start), int(stop))
+                    for start, stop in zip(cache['starts'], cache['stops'])]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_toc_cache(self, st, toc):
+        """Write the table of contents to the cache file, ignoring errors."""
+        import json
+
+        cache = {
+            'version': _TOC_CACHE_VERSION,
+            'size': st.st_size,
+            'mtime': st.st_mtime_ns,
+            'starts': [start for start, stop in toc],
+            'stops': [stop for start, stop in toc],
+        }
+        # Replace the cache atomically, other processes may be reading it.
+        tmp = '%s.%s.tmp' % (self._toc_cache, os.getpid())
+        try:
+            with open(tmp, 'w', encoding='ascii') as f:
+                json.dump(cache, f, separators=(',', ':'))
+            os.replace(tmp, self._toc_cache)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
 
 
 class MMDF(_mboxMMDF):
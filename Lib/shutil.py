@@ -10,6 +10,7 @@ import stat
 import fnmatch
 import collections
 import errno
+import _compression
 
 try:
     import zlib
@@ -592,12 +593,34 @@ def _get_uid(name):
         return result[2]
     return None
 
+# Compression formats of tar archives handled by the tarfile module itself.
+# The others registered in the _compression module are available as the
+# "<name>tar" archive formats.
+_BUILTIN_CODECS = ('gz', 'bz2', 'xz')
+
+def _get_codec(name):
+    """Return the Codec registered in _compression for the compression
+    format name, or None if there is none or if it is a built-in one."""
+    if name not in _BUILTIN_CODECS:
+        try:
+            return _compression.get_codec(name)
+        except LookupError:
+            pass
+    return None
+
+def _codec_tar_formats():
+    """Return the list of the ("<name>tar", codec) pairs of the compression
+    formats registered in _compression, other than the built-in ones."""
+    return [(codec.name + 'tar', codec) for codec in _compression.get_codecs()
+            if codec.name not in _BUILTIN_CODECS]
+
 def _make_tarball(base_name, base_dir, compress="gzip", verbose=0, dry_run=0,
                   owner=None, group=None, logger=None):
     """Create a (possibly compressed) tar file from all the files under
     'base_dir'.
 
-    'compress' must be "gzip" (the default), "bzip2", "xz", or None.
+    'compress' must be "gzip" (the default), "bzip2", "xz", the name of
+    another compression format registered in _compression, or None.
 
     'owner' and 'group' can be used to define an owner and a group for the
     archive that is being built. If not provided, the current owner and group
@@ -608,6 +631,7 @@ def _make_tarball(base_name, base_dir, compress="gzip", verbose=0, dry_run=0,
 
     Returns the output filename.
     """
+    codec = None
     if compress is None:
         tar_compression = ''
     elif _ZLIB_SUPPORTED and compress == 'gzip':
@@ -617,12 +641,18 @@ def _make_tarball(base_name, base_dir, compress="gzip", verbose=0, dry_run=0,
     elif _LZMA_SUPPORTED and compress == 'xz':
         tar_compression = 'xz'
     else:
-        raise ValueError("bad value for 'compress', or compression format not "
-                         "supported : {0}".format(compress))
+        codec = _get_codec(compress)
+        if codec is None:
+            raise ValueError("bad value for 'compress', or compression format "
+                             "not supported : {0}".format(compress))
+        tar_compression = codec.name
 
     import tarfile  # late import for breaking circular dependency
 
-    compress_ext = '.' + tar_compression if compress else ''
+    if codec is not None and codec.extensions:
+        compress_ext = codec.extensions[0]
+    else:
+        compress_ext = '.' + tar_compression if compress else ''
     archive_name = base_name + '.tar' + compress_ext
     archive_dir = os.path.dirname(archive_name)
 
@@ -725,6 +755,9 @@ def get_archive_formats():
     """
     formats = [(name, registry[2]) for name, registry in
                _ARCHIVE_FORMATS.items()]
+    for name, codec in _codec_tar_formats():
+        if name not in _ARCHIVE_FORMATS:
+            formats.append((name, "{0}'ed tar-file".format(codec.name)))
     formats.sort()
     return formats
 
@@ -786,7 +819,10 @@ def make_archive(base_name, format, root_dir=None, base_dir=None, verbose=0,
     try:
         format_info = _ARCHIVE_FORMATS[format]
     except KeyError:
-        raise ValueError("unknown archive format '%s'" % format)
+        codec = dict(_codec_tar_formats()).get(format)
+        if codec is None:
+            raise ValueError("unknown archive format '%s'" % format)
+        format_info = (_make_tarball, [('compress', codec.name)], '')
 
     func = format_info[0]
     for arg, val in format_info[1]:
@@ -815,6 +851,10 @@ def get_unpack_formats():
     """
     formats = [(name, info[0], info[3]) for name, info in
                _UNPACK_FORMATS.items()]
+    for name, codec in _codec_tar_formats():
+        if name not in _UNPACK_FORMATS:
+            info = _get_unpack_format(name)
+            formats.append((name, info[0], info[3]))
     formats.sort()
     return formats
 
@@ -902,12 +942,16 @@ def _unpack_zipfile(filename, extract_dir):
     finally:
         zip.close()
 
-def _unpack_tarfile(filename, extract_dir):
+def _unpack_tarfile(filename, extract_dir, compression=None):
     """Unpack tar/tar.gz/tar.bz2/tar.xz `filename` to `extract_dir`
+
+    `compression` is the name of a compression format registered in
+    _compression, which is otherwise detected.
     """
     import tarfile  # late import for breaking circular dependency
     try:
-        tarobj = tarfile.open(filename)
+        tarobj = tarfile.open(filename,
+                              'r:' + compression if compression else 'r')
     except tarfile.TarError:
         raise ReadError(
             "%s is not a compressed or uncompressed tar file" % filename)
@@ -933,11 +977,28 @@ if _LZMA_SUPPORTED:
     _UNPACK_FORMATS['xztar'] = (['.tar.xz', '.txz'], _unpack_tarfile, [],
                                 "xz'ed tar-file")
 
+def _get_unpack_format(format):
+    """Return the (extensions, function, extra_args, description) of the
+    unpack format, or None."""
+    try:
+        return _UNPACK_FORMATS[format]
+    except KeyError:
+        pass
+    codec = dict(_codec_tar_formats()).get(format)
+    if codec is None:
+        return None
+    return (['.tar' + ext for ext in codec.extensions], _unpack_tarfile,
+            [('compression', codec.name)], "{0}'ed tar-file".format(codec.name))
+
 def _find_unpack_format(filename):
     for name, info in _UNPACK_FORMATS.items():
         for extension in info[0]:
             if filename.endswith(extension):
                 return name
+    for name, codec in _codec_tar_formats():
+        for extension in codec.extensions:
+            if filename.endswith('.tar' + extension):
+                return name
     return None
 
 def unpack_archive(filename, extract_dir=None, format=None):
@@ -959,9 +1020,8 @@ def unpack_archive(filename, extract_dir=None, format=None):
         extract_dir = os.getcwd()
 
     if format is not None:
-        try:
-            format_info = _UNPACK_FORMATS[format]
-        except KeyError:
+        format_info = _get_unpack_format(format)
+        if format_info is None:
             raise ValueError("Unknown unpack format '{0}'".format(format))
 
         func = format_info[1]
@@ -972,8 +1032,9 @@ def unpack_archive(filename, extract_dir=None, format=None):
         if format is None:
             raise ReadError("Unknown archive format '{0}'".format(filename))
 
-        func = _UNPACK_FORMATS[format][1]
-        kwargs = dict(_UNPACK_FORMATS[format][2])
+        format_info = _get_unpack_format(format)
+        func = format_info[1]
+        kwargs = dict(format_info[2])
         func(filename, extract_dir, **kwargs)
 
 
@@ -58,6 +58,11 @@ Note that bletch is omitted because it doesn't exist; bar precedes foo
 because bar.pth comes alphabetically before foo.pth; and spam is
 omitted because it is not mentioned in either path configuration file.
 
+The contents of the path configuration files of a site directory are
+cached in its __pycache__ subdirectory.  The cache is used as long as the
+modification time of the directory and of each of the files is unchanged,
+which saves listing the directory and reading every file at startup.
+
 The readline module is also automatically configured to enable
 completion for systems that support it.  This can be overridden in
 sitecustomize, usercustomize or PYTHONSTARTUP.  Starting Python in
@@ -72,6 +77,7 @@ ImportError exception, it is silently ignored.
 import sys
 import os
 import builtins
+import marshal
 import _sitebuiltins
 
 # Prefixes for site-packages; add additional prefixes like /usr/local here
@@ -86,6 +92,24 @@ ENABLE_USER_SITE = None
 USER_SITE = None
 USER_BASE = None
 
+# Reports the time spent in each step of main() when Python is started with
+# the -X importtime option or PYTHONPROFILEIMPORTTIME is set.
+_step_timer = None
+
+# Bump this whenever the format of the .pth files cache changes.
+_PTH_CACHE_VERSION = 1
+
+# The .pth files cache is not written if the site directory or one of the
+# files was modified less than this many seconds ago, since a later change
+# could leave the modification time unchanged on file systems with a coarse
+# timestamp resolution.
+_PTH_CACHE_RACY_DELAY = 2
+
+# The cached contents of the .pth files of the site directories being
+# processed by addsitedir(), as (modification time, size, lines) by path, or
+# None once a file was found to have been modified since it was cached.
+_pth_cache = {}
+
 
 def makepath(*paths):
     dir = os.path.join(*paths)
@@ -155,37 +179,159 @@ def addpackage(sitedir, name, known_paths):
     else:
         reset = False
     fullname = os.path.join(sitedir, name)
-    try:
-        f = open(fullname, "r")
-    except OSError:
-        return
-    with f:
-        for n, line in enumerate(f):
-            if line.startswith("#"):
-                continue
-            try:
-                if line.startswith(("import ", "import\t")):
-                    exec(line)
-                    continue
-                line = line.rstrip()
-                dir, dircase = makepath(sitedir, line)
-                if not dircase in known_paths and os.path.exists(dir):
-                    sys.path.append(dir)
-                    known_paths.add(dircase)
-            except Exception:
-                print("Error processing line {:d} of {}:\n".format(n+1, fullname),
-                      file=sys.stderr)
-                import traceback
-                for record in traceback.format_exception(*sys.exc_info()):
-                    for line in record.splitlines():
-                        print('  '+line, file=sys.stderr)
-                print("\nRemainder of file ignored", file=sys.stderr)
-                break
+    lines = _cachedpth(fullname)
+    if lines is None:
+        try:
+            f = open(fullname, "r")
+        except OSError:
+            return
+        with f:
+            lines = _readpth(f)
+    _processpth(sitedir, name, lines, known_paths)
     if reset:
         known_paths = None
     return known_paths
 
 
+def _readpth(f):
+    """Return the (line number, line) pairs of the .pth file f which are not
+    comments."""
+    return [(n, line) for n, line in enumerate(f) if not line.startswith("#")]
+
+
+def _processpth(sitedir, name, lines, known_paths):
+    """Add the directories or execute the imports of the lines returned by
+    _readpth() for the .pth file name in sitedir."""
+    for n, line in lines:
+        try:
+            if line.startswith(("import ", "import\t")):
+                exec(line)
+                continue
+            line = line.rstrip()
+            dir, dircase = makepath(sitedir, line)
+            if not dircase in known_paths and os.path.exists(dir):
+                sys.path.append(dir)
+                known_paths.add(dircase)
+        except Exception:
+            fullname = os.path.join(sitedir, name)
+            print("Error processing line {:d} of {}:\n".format(n+1, fullname),
+                  file=sys.stderr)
+            import traceback
+            for record in traceback.format_exception(*sys.exc_info()):
+                for line in record.splitlines():
+                    print('  '+line, file=sys.stderr)
+            print("\nRemainder of file ignored", file=sys.stderr)
+            break
+
+
+def _pthcachepath(sitedir):
+    """Return the path of the cache of the .pth files of sitedir, or None if
+    caching is not supported."""
+    cache_tag = sys.implementation.cache_tag
+    if cache_tag is None:
+        return None
+    return os.path.join(sitedir, '__pycache__', 'pth.%s.cache' % cache_tag)
+
+
+def _loadpthcache(sitedir, cache_path):
+    """Return the (name, modification time, size, lines) entries of the .pth
+    files of sitedir from the cache, or None if the cache is missing or if
+    files were added to or removed from sitedir since it was written."""
+    try:
+        with open(cache_path, 'rb') as f:
+            version, mtime, entries = marshal.loads(f.read())
+        if (version != _PTH_CACHE_VERSION or
+                mtime != os.stat(sitedir).st_mtime_ns):
+            return None
+        return [(name, file_mtime, size, lines)
+                for name, file_mtime, size, lines in entries]
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _cachedpth(fullname):
+    """Return the lines of the .pth file fullname from the cache loaded by
+    addsitedir(), or None if the file was modified since it was cached."""
+    entry = _pth_cache.get(fullname)
+    if entry is None:
+        return None
+    mtime, size, lines = entry
+    try:
+        st = os.stat(fullname)
+    except OSError:
+        st = None
+    if st is None or (st.st_mtime_ns, st.st_size) != (mtime, size):
+        _pth_cache[fullname] = None
+        return None
+    return lines
+
+
+def _listpthfiles(sitedir):
+    """Return the names of the .pth files of sitedir, sorted, and whether
+    they were found in the cache, whose entries are then added to _pth_cache.
+
+    The cache is validated against the modification time of sitedir, which
+    changes when files are added, removed or renamed.  OSError is raised if
+    sitedir cannot be listed.
+    """
+    cache_path = _pthcachepath(sitedir)
+    if cache_path is not None:
+        entries = _loadpthcache(sitedir, cache_path)
+        if entries is not None:
+            for name, mtime, size, lines in entries:
+                _pth_cache[os.path.join(sitedir, name)] = (mtime, size, lines)
+            return [entry[0] for entry in entries], True
+    names = sorted(name for name in os.listdir(sitedir)
+                   if name.endswith(".pth"))
+    return names, False
+
+
+def _updatepthcache(sitedir):
+    """Write the cache of the .pth files of sitedir, unless the directory or
+    the files were modified too recently or cannot be read."""
+    cache_path = _pthcachepath(sitedir)
+    if cache_path is None or sys.dont_write_bytecode:
+        return
+    # Create __pycache__ before looking at the modification time of
+    # sitedir, which its creation changes.
+    try:
+        os.mkdir(os.path.dirname(cache_path))
+    except OSError:
+        pass
+    try:
+        mtime = os.stat(sitedir).st_mtime_ns
+        names = sorted(name for name in os.listdir(sitedir)
+                       if name.endswith(".pth"))
+        entries = []
+        for name in names:
+            with open(os.path.join(sitedir, name), "r") as f:
+                st = os.fstat(f.fileno())
+                entries.append((name, st.st_mtime_ns, st.st_size,
+                                _readpth(f)))
+    except OSError:
+        return
+    from time import time
+    racy = (time() - _PTH_CACHE_RACY_DELAY) * 1e9
+    if mtime < racy and all(entry[1] < racy for entry in entries):
+        _writepthcache(cache_path, mtime, entries)
+
+
+def _writepthcache(cache_path, mtime, entries):
+    """Atomically write the cache of the .pth files of a site directory,
+    ignoring errors such as the directory not being writable."""
+    data = marshal.dumps((_PTH_CACHE_VERSION, mtime, entries))
+    tmp_path = '{}.{}'.format(cache_path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
 def addsitedir(sitedir, known_paths=None):
     """Add 'sitedir' argument to sys.path if missing and handle .pth files in
     'sitedir'"""
@@ -199,12 +345,22 @@ def addsitedir(sitedir, known_paths=None):
         sys.path.append(sitedir)        # Add path component
         known_paths.add(sitedircase)
     try:
-        names = os.listdir(sitedir)
+        names, cached = _listpthfiles(sitedir)
     except OSError:
         return
-    names = [name for name in names if name.endswith(".pth")]
-    for name in sorted(names):
-        addpackage(sitedir, name, known_paths)
+    try:
+        for name in names:
+            addpackage(sitedir, name, known_paths)
+    finally:
+        for name in names:
+            if _pth_cache.pop(os.path.join(sitedir, name), None) is None:
+                cached = False
+    # Only the directories which have .pth files get a cache.
+    if names and not cached:
+        _updatepthcache(sitedir)
+    if _step_timer is not None:
+        _step_timer.step('addsitedir {} ({} .pth files)'.format(
+            sitedir, len(names)))
     if reset:
         known_paths = None
     return known_paths
@@ -244,8 +400,20 @@ def getuserbase():
     global USER_BASE
     if USER_BASE is not None:
         return USER_BASE
-    from sysconfig import get_config_var
-    USER_BASE = get_config_var('userbase')
+    if sys.platform == 'darwin':
+        from sysconfig import get_config_var
+        USER_BASE = get_config_var('userbase')
+        return USER_BASE
+    # Avoid importing sysconfig at startup; this must be kept in sync with
+    # sysconfig._getuserbase().
+    env_base = os.environ.get("PYTHONUSERBASE", None)
+    if env_base:
+        USER_BASE = env_base
+    elif os.name == "nt":
+        base = os.environ.get("APPDATA") or "~"
+        USER_BASE = os.path.expanduser(os.path.join(base, "Python"))
+    else:
+        USER_BASE = os.path.expanduser(os.path.join("~", ".local"))
     return USER_BASE
 
 def getusersitepackages():
@@ -260,15 +428,21 @@ def getusersitepackages():
     if USER_SITE is not None:
         return USER_SITE
 
-    from sysconfig import get_path
-
     if sys.platform == 'darwin':
-        from sysconfig import get_config_var
+        from sysconfig import get_config_var, get_path
         if get_config_var('PYTHONFRAMEWORK'):
             USER_SITE = get_path('purelib', 'osx_framework_user')
-            return USER_SITE
+        else:
+            USER_SITE = get_path('purelib', 'posix_user')
+        return USER_SITE
 
-    USER_SITE = get_path('purelib', '%s_user' % os.name)
+    # The 'purelib' paths of the nt_user and posix_user sysconfig schemes.
+    if os.name == 'nt':
+        version = 'Python%d%d' % sys.version_info[:2]
+    else:
+        version = os.path.join('lib', 'python%d.%d' % sys.version_info[:2])
+    USER_SITE = os.path.normpath(os.path.join(user_base, version,
+                                              'site-packages'))
     return USER_SITE
 
 def addusersitepackages(known_paths):
@@ -434,29 +608,33 @@ def venv(known_paths):
     site_prefix = os.path.dirname(exe_dir)
     sys._home = None
     conf_basename = 'pyvenv.cfg'
-    candidate_confs = [
-        conffile for conffile in (
-            os.path.join(exe_dir, conf_basename),
-            os.path.join(site_prefix, conf_basename)
-            )
-        if os.path.isfile(conffile)
-        ]
-
-    if candidate_confs:
-        virtual_conf = candidate_confs[0]
+    # Try to open the candidate files directly rather than checking whether
+    # they exist first, to save a system call per candidate at startup.
+    for conffile in (os.path.join(exe_dir, conf_basename),
+                     os.path.join(site_prefix, conf_basename)):
+        try:
+            # Issue 25185: Use UTF-8, as that's what the venv module uses
+            # when writing the file.
+            f = open(conffile, encoding='utf-8')
+        except OSError:
+            continue
+        with f:
+            virtual_conf_lines = f.readlines()
+        break
+    else:
+        virtual_conf_lines = None
+
+    if virtual_conf_lines is not None:
         system_site = "true"
-        # Issue 25185: Use UTF-8, as that's what the venv module uses when
-        # writing the file.
-        with open(virtual_conf, encoding='utf-8') as f:
-            for line in f:
-                if '=' in line:
-                    key, _, value = line.partition('=')
-                    key = key.strip().lower()
-                    value = value.strip()
-                    if key == 'include-system-site-packages':
-                        system_site = value.lower()
-                    elif key == 'home':
-                        sys._home = value
+        for line in virtual_conf_lines:
+            if '=' in line:
+                key, _, value = line.partition('=')
+                key = key.strip().lower()
+                value = value.strip()
+                if key == 'include-system-site-packages':
+                    system_site = value.lower()
+                elif key == 'home':
+                    sys._home = value
 
         sys.prefix = sys.exec_prefix = site_prefix
 
@@ -520,23 +698,71 @@ def main():
     This function is called automatically when this module is imported,
     unless the python interpreter was started with the -S flag.
     """
-    global ENABLE_USER_SITE
+    global ENABLE_USER_SITE, _step_timer
 
+    if sys._xoptions.get('importtime') or (
+            not sys.flags.ignore_environment and
+            os.environ.get('PYTHONPROFILEIMPORTTIME')):
+        _step_timer = _StepTimer()
+        timer = _step_timer
+    else:
+        timer = _NullStepTimer()
     abs_paths()
     known_paths = removeduppaths()
+    timer.step('abs_paths, removeduppaths')
     known_paths = venv(known_paths)
+    timer.step('venv')
     if ENABLE_USER_SITE is None:
         ENABLE_USER_SITE = check_enableusersite()
     known_paths = addusersitepackages(known_paths)
+    timer.step('addusersitepackages')
     known_paths = addsitepackages(known_paths)
+    timer.step('addsitepackages')
     setquit()
     setcopyright()
     sethelper()
     if not sys.flags.isolated:
         enablerlcompleter()
+    timer.step('builtins')
     execsitecustomize()
+    timer.step('sitecustomize')
     if ENABLE_USER_SITE:
         execusercustomize()
+        timer.step('usercustomize')
+    timer.total()
+    _step_timer = None
+
+
+class _StepTimer:
+    """Print the time spent in each step of main() to stderr, in the same
+    layout as the -X importtime report."""
+
+    def __init__(self):
+        from time import perf_counter
+        self._clock = perf_counter
+        self._start = self._last = perf_counter()
+        print('site time:   self [us] | step', file=sys.stderr)
+
+    def _report(self, start, name):
+        self._last = self._clock()
+        print('site time: {:>11} | {}'.format(
+            int((self._last - start) * 1e6), name), file=sys.stderr)
+
+    def step(self, name):
+        """Report the time elapsed since the previous step."""
+        self._report(self._last, name)
+
+    def total(self):
+        """Report the time elapsed since the timer was created."""
+        self._report(self._start, 'total')
+
+
+class _NullStepTimer:
+    def step(self, name):
+        pass
+
+    def total(self):
+        pass
 
 # Prevent extending of sys.path when python was started with -S and
 # site is imported later.
@@ -0,0 +1,225 @@
+# A pool of connections shared by the threads of a program.
+
+import collections
+import contextlib
+from time import monotonic as _time
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
+
+from _sqlite3 import connect, OperationalError, ProgrammingError
+
+
+class PoolStats(collections.namedtuple('PoolStats', [
+        'size', 'idle', 'created', 'reused',
+        'statement_hits', 'statement_misses'])):
+    """Statistics of a ConnectionPool.
+
+    size and idle are the numbers of connections opened by the pool and of
+    those not in use.  created and reused count the connections handed out
+    which had to be opened and those which were taken from the idle ones.
+    statement_hits and statement_misses count the statements found in the
+    statement caches of the connections and those which had to be compiled.
+    """
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """The part of the connections handed out which were reused."""
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    @property
+    def statement_hit_rate(self):
+        """The part of the statements found in the statement caches."""
+        total = self.statement_hits + self.statement_misses
+        return self.statement_hits / total if total else 0.0
+
+
+class ConnectionPool:
+    """A pool of connections to an SQLite database, shared by threads.
+
+    Connections are opened on demand, up to max_connections of them, by
+    calling connect() with database and the keyword arguments given, except
+    check_same_thread which is always false: a pooled connection is used by
+    one thread at a time, but not always by the same one.  If setup is
+    given, it is called with each new connection, to execute pragmas or
+    register functions for example.
+
+    A released connection stays open with its statement cache and its
+    settings, and is handed out again before the others, which were used
+    less recently.
+    """
+
+    def __init__(self, database, max_connections=5, *, setup=None,
+                 **kwargs):
+        if max_connections < 1:
+            raise ValueError('max_connections must be at least 1')
+        kwargs['check_same_thread'] = False
+        self._database = database
+        self._max_connections = max_connections
+        self._setup = setup
+        self._kwargs = kwargs
+        self._cond = threading.Condition()
+        self._idle = []
+        self._connections = set()
+        self._in_use = set()
+        self._size = 0
+        self._closed = False
+        self._created = 0
+        self._reused = 0
+        # Counts of the statement caches of the connections already closed.
+        self._statement_hits = 0
+        self._statement_misses = 0
+
+    def __repr__(self):
+        return '<{}.{} database={!r} size={} max_connections={}>'.format(
+            self.__class__.__module__, self.__class__.__qualname__,
+            self._database, self._size, self._max_connections)
+
+    def acquire(self, timeout=None):
+        """Return a connection of the pool.
+
+        If all max_connections connections are in use, wait for one to be
+        released, for at most timeout seconds if timeout is not None, after
+        which OperationalError is raised.
+        """
+        with self._cond:
+            endtime = None
+            while True:
+                if self._closed:
+                    raise ProgrammingError('Cannot operate on a closed pool.')
+                if self._idle:
+                    self._reused += 1
+                    cx = self._idle.pop()
+                    self._in_use.add(cx)
+                    return cx
+                if self._size < self._max_connections:
+                    self._size += 1
+                    break
+                if timeout is None:
+                    self._cond.wait()
+                else:
+                    if endtime is None:
+                        endtime = _time() + timeout
+                    remaining = endtime - _time()
+                    if remaining <= 0:
+                        raise OperationalError(
+                            'timed out waiting for a connection')
+                    self._cond.wait(remaining)
+
+        # Connect outside of the lock, which other threads may need.
+        cx = None
+        try:
+            cx = connect(self._database, **self._kwargs)
+            if self._setup is not None:
+                self._setup(cx)
+        except BaseException:
+            if cx is not None:
+                cx.close()
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._created += 1
+            self._connections.add(cx)
+            self._in_use.add(cx)
+        return cx
+
+    def release(self, cx):
+        """Return a connection acquired from the pool to it.
+
+        A transaction left open is rolled back.  A connection which has been
+        closed is forgotten, and the connections released after the pool has
+        been closed are closed.  ValueError is raised if the connection is
+        not in use.
+        """
+        with self._cond:
+            if cx not in self._connections:
+                raise ValueError('connection does not belong to this pool')
+            if cx not in self._in_use:
+                raise ValueError('connection has already been released')
+            self._in_use.remove(cx)
+        try:
+            if cx.in_transaction:
+                cx.rollback()
+        except ProgrammingError:
+            # The connection has been closed.
+            self._discard(cx)
+            return
+        except BaseException:
+            self._discard(cx)
+            raise
+        with self._cond:
+            if not self._closed:
+                self._idle.append(cx)
+                self._cond.notify()
+                return
+        self._discard(cx)
+
+    def _discard(self, cx):
+        with self._cond:
+            self._count_statements(cx)
+            self._connections.discard(cx)
+            self._size -= 1
+            self._cond.notify()
+        cx.close()
+
+    def _count_statements(self, cx):
+        try:
+            hits, misses, _, _ = cx._statement_cache_info()
+        except ProgrammingError:
+            pass
+        else:
+            self._statement_hits += hits
+            self._statement_misses += misses
+
+    @contextlib.contextmanager
+    def connection(self, timeout=None):
+        """Return a context manager which acquires a connection and
+        releases it on exit, after committing the pending transaction, or
+        rolling it back if an exception was raised."""
+        cx = self.acquire(timeout)
+        try:
+            with cx:
+                yield cx
+        finally:
+            self.release(cx)
+
+    def close(self):
+        """Close the idle connections of the pool, and the others when they
+        are released.  The pool cannot be used anymore."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for cx in idle:
+                self._count_statements(cx)
+                self._connections.discard(cx)
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for cx in idle:
+            cx.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def stats(self):
+        """Return a PoolStats tuple of statistics of the pool."""
+        with self._cond:
+            hits = self._statement_hits
+            misses = self._statement_misses
+            for cx in self._connections:
+                try:
+                    cx_hits, cx_misses, _, _ = cx._statement_cache_info()
+                except ProgrammingError:
+                    continue
+                hits += cx_hits
+                misses += cx_misses
+            return PoolStats(self._size, len(self._idle), self._created,
+                             self._reused, hits, misses)
@@ -347,6 +347,20 @@ class CursorTests(unittest.TestCase):
     def CheckExecuteManySequence(self):
         self.cu.executemany("insert into test(income) values (?)", [(x,) for x in range(100, 110)])
 
+    def CheckExecuteManyDictMapping(self):
+        class D(dict):
+            def __missing__(self, key):
+                return 7
+
+        self.cu.executemany("insert into test(name, income) values (:name, :income)",
+                            [{"name": "a", "income": 1}, D(name="b"),
+                             {"income": 3, "name": "c", "extra": None}])
+        self.cu.execute("select name, income from test where income is not null order by name")
+        self.assertEqual(self.cu.fetchall(), [("a", 1), ("b", 7), ("c", 3)])
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.cu.executemany("insert into test(name, income) values (:name, :income)",
+                                [{"name": "d", "income": 4}, {"name": "e"}])
+
     def CheckExecuteManyIterator(self):
         class MyIter:
             def __init__(self):
@@ -441,6 +455,25 @@ class CursorTests(unittest.TestCase):
         res = self.cu.fetchall()
         self.assertEqual(res, [])
 
+    def CheckFetchallManyRows(self):
+        self.cu.executemany("insert into test(name, income) values (?, ?)",
+                            [("n%d" % i, i) for i in range(1000)])
+        self.cu.execute("select income from test where income is not null")
+        self.assertEqual(self.cu.fetchmany(300), [(i,) for i in range(300)])
+        self.assertEqual(self.cu.fetchone(), (300,))
+        self.assertEqual(self.cu.fetchall(), [(i,) for i in range(301, 1000)])
+        self.assertEqual(self.cu.fetchmany(10), [])
+
+    def CheckFetchallRowFactoryClosesCursor(self):
+        self.cu.executemany("insert into test(name) values (?)", [("a",), ("b",)])
+        def factory(cursor, row):
+            cursor.close()
+            return row
+        self.cu.row_factory = factory
+        self.cu.execute("select name from test")
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.cu.fetchall()
+
     def CheckSetinputsizes(self):
         self.cu.setinputsizes([3, 4, 5])
 
@@ -735,6 +768,123 @@ class ExtensionTests(unittest.TestCase):
         result = con.execute("select foo from test").fetchone()[0]
         self.assertEqual(result, 5, "Basic test of Connection.executescript")
 
+class BlobTests(unittest.TestCase):
+    def setUp(self):
+        self.cx = sqlite.connect(":memory:")
+        self.cx.execute("create table test(id integer primary key, blob_col blob)")
+        self.blob_data = b"a" * 50 + b"b" * 50
+        self.cx.execute("insert into test(blob_col) values (?)", (self.blob_data,))
+        self.blob = self.cx.blobopen("test", "blob_col", 1)
+
+    def tearDown(self):
+        self.blob.close()
+        self.cx.close()
+
+    def CheckLength(self):
+        self.assertEqual(len(self.blob), 100)
+
+    def CheckTell(self):
+        self.assertEqual(self.blob.tell(), 0)
+
+    def CheckSeek(self):
+        self.blob.seek(10)
+        self.assertEqual(self.blob.tell(), 10)
+        self.blob.seek(10, 1)
+        self.assertEqual(self.blob.tell(), 20)
+        self.blob.seek(-10, 2)
+        self.assertEqual(self.blob.tell(), 90)
+        self.blob.seek(0, 2)
+        self.assertEqual(self.blob.tell(), 100)
+
+    def CheckSeekErrors(self):
+        with self.assertRaises(ValueError):
+            self.blob.seek(1000)
+        with self.assertRaises(ValueError):
+            self.blob.seek(-10)
+        with self.assertRaises(ValueError):
+            self.blob.seek(10, -1)
+        self.assertEqual(self.blob.tell(), 0)
+
+    def CheckRead(self):
+        self.assertEqual(self.blob.read(), self.blob_data)
+        self.assertEqual(self.blob.read(), b"")
+
+    def CheckReadChunks(self):
+        self.assertEqual(self.blob.read(10), b"a" * 10)
+        self.assertEqual(self.blob.tell(), 10)
+        self.blob.seek(45)
+        self.assertEqual(self.blob.read(10), b"a" * 5 + b"b" * 5)
+        self.assertEqual(self.blob.read(1000), b"b" * 45)
+        self.assertEqual(self.blob.tell(), 100)
+
+    def CheckWrite(self):
+        self.blob.write(b"x" * 10)
+        self.assertEqual(self.blob.tell(), 10)
+        self.blob.seek(-10, 2)
+        self.blob.write(bytearray(b"y" * 10))
+        data = self.cx.execute("select blob_col from test").fetchone()[0]
+        self.assertEqual(data, b"x" * 10 + self.blob_data[10:90] + b"y" * 10)
+
+    def CheckWriteErrors(self):
+        with self.assertRaises(ValueError):
+            self.blob.write(b"x" * 101)
+        with self.assertRaises(TypeError):
+            self.blob.write("abc")
+        self.assertEqual(self.blob.tell(), 0)
+
+    def CheckReadOnly(self):
+        with self.cx.blobopen("test", "blob_col", 1, readonly=True) as blob:
+            self.assertEqual(blob.read(5), b"a" * 5)
+            with self.assertRaises(sqlite.OperationalError):
+                blob.write(b"x")
+
+    def CheckOpenErrors(self):
+        with self.assertRaises(sqlite.OperationalError):
+            self.cx.blobopen("test", "blob_col", 2)
+        with self.assertRaises(sqlite.OperationalError):
+            self.cx.blobopen("test", "missing", 1)
+        with self.assertRaises(sqlite.OperationalError):
+            self.cx.blobopen("missing", "blob_col", 1)
+        with self.assertRaises(sqlite.OperationalError):
+            self.cx.blobopen("test", "blob_col", 1, name="missing")
+        with self.assertRaises(TypeError):
+            self.cx.blobopen("test", "blob_col", 1, True)
+
+    def CheckRowChanged(self):
+        self.cx.execute("update test set blob_col = ? where id = 1", (b"z",))
+        with self.assertRaises(sqlite.OperationalError):
+            self.blob.read()
+
+    def CheckClose(self):
+        self.blob.close()
+        self.blob.close()
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.blob.read()
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.blob.write(b"x")
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.blob.seek(0)
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.blob.tell()
+        with self.assertRaises(sqlite.ProgrammingError):
+            len(self.blob)
+
+    def CheckCloseConnection(self):
+        # Closing the connection closes its blobs.
+        self.cx.close()
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.blob.read()
+
+    def CheckContextManager(self):
+        with self.cx.blobopen("test", "blob_col", 1) as blob:
+            self.assertEqual(blob.read(), self.blob_data)
+        with self.assertRaises(sqlite.ProgrammingError):
+            blob.read()
+
+    def CheckNotInstantiable(self):
+        with self.assertRaises(TypeError):
+            sqlite.Blob()
+
 class ClosedConTests(unittest.TestCase):
     def CheckClosedConCursor(self):
         con = sqlite.connect(":memory:")
@@ -921,13 +1071,14 @@ def suite():
     thread_suite = unittest.makeSuite(ThreadTests, "Check")
     constructor_suite = unittest.makeSuite(ConstructorTests, "Check")
     ext_suite = unittest.makeSuite(ExtensionTests, "Check")
+    blob_suite = unittest.makeSuite(BlobTests, "Check")
     closed_con_suite = unittest.makeSuite(ClosedConTests, "Check")
     closed_cur_suite = unittest.makeSuite(ClosedCurTests, "Check")
     on_conflict_suite = unittest.makeSuite(SqliteOnConflictTests, "Check")
     return unittest.TestSuite((
         module_suite, connection_suite, cursor_suite, thread_suite,
-        constructor_suite, ext_suite, closed_con_suite, closed_cur_suite,
-        on_conflict_suite,
+        constructor_suite, ext_suite, blob_suite, closed_con_suite,
+        closed_cur_suite, on_conflict_suite,
     ))
 
 def test():
@@ -0,0 +1,196 @@
+import unittest
+import sqlite3 as sqlite
+try:
+    import threading
+except ImportError:
+    threading = None
+
+from test.support import TESTFN, unlink
+
+
+class ConnectionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(unlink, TESTFN)
+        with sqlite.connect(TESTFN) as cx:
+            cx.execute("create table test(x)")
+        cx.close()
+        self.pool = sqlite.ConnectionPool(TESTFN, 2)
+        self.addCleanup(self.pool.close)
+
+    def count(self):
+        with self.pool.connection() as cx:
+            return cx.execute("select count(*) from test").fetchone()[0]
+
+    def CheckReuse(self):
+        cx1 = self.pool.acquire()
+        cx2 = self.pool.acquire()
+        self.assertIsNot(cx1, cx2)
+        self.pool.release(cx1)
+        self.pool.release(cx2)
+        # The connection released last is handed out first.
+        self.assertIs(self.pool.acquire(), cx2)
+        self.assertIs(self.pool.acquire(), cx1)
+        stats = self.pool.stats()
+        self.assertEqual((stats.size, stats.idle), (2, 0))
+        self.assertEqual((stats.created, stats.reused), (2, 2))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def CheckConnectArguments(self):
+        pool = sqlite.ConnectionPool(TESTFN, isolation_level=None,
+                                     check_same_thread=True)
+        with pool.connection() as cx:
+            self.assertIsNone(cx.isolation_level)
+        pool.close()
+
+    def CheckSetup(self):
+        calls = []
+        def setup(cx):
+            calls.append(cx)
+            cx.create_function("double", 1, lambda x: 2 * x)
+        pool = sqlite.ConnectionPool(TESTFN, setup=setup)
+        for i in range(3):
+            with pool.connection() as cx:
+                self.assertEqual(cx.execute("select double(?)", (i,)).fetchone(), (2 * i,))
+        self.assertEqual(calls, [cx])
+        pool.close()
+
+    def CheckSetupError(self):
+        def setup(cx):
+            raise ZeroDivisionError
+        pool = sqlite.ConnectionPool(TESTFN, 1, setup=setup)
+        for i in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                pool.acquire(timeout=0)
+        self.assertEqual(pool.stats().size, 0)
+
+    def CheckCommit(self):
+        with self.pool.connection() as cx:
+            cx.execute("insert into test values (1)")
+        self.assertEqual(self.count(), 1)
+
+    def CheckRollback(self):
+        with self.assertRaises(ZeroDivisionError):
+            with self.pool.connection() as cx:
+                cx.execute("insert into test values (1)")
+                1/0
+        self.assertEqual(self.count(), 0)
+
+    def CheckReleaseRollsBack(self):
+        cx = self.pool.acquire()
+        cx.execute("insert into test values (1)")
+        self.assertTrue(cx.in_transaction)
+        self.pool.release(cx)
+        self.assertFalse(cx.in_transaction)
+        self.assertEqual(self.count(), 0)
+
+    def CheckReleaseClosed(self):
+        cx = self.pool.acquire()
+        cx.close()
+        self.pool.release(cx)
+        self.assertEqual(self.pool.stats().size, 0)
+        self.assertIsNot(self.pool.acquire(), cx)
+
+    def CheckReleaseForeign(self):
+        cx = sqlite.connect(":memory:")
+        with self.assertRaises(ValueError):
+            self.pool.release(cx)
+        cx.close()
+
+    def CheckReleaseTwice(self):
+        cx = self.pool.acquire()
+        self.pool.release(cx)
+        with self.assertRaises(ValueError):
+            self.pool.release(cx)
+        cx1 = self.pool.acquire()
+        cx2 = self.pool.acquire()
+        self.assertIsNot(cx1, cx2)
+        self.assertEqual(self.pool.stats().reused, 1)
+        # A connection can be released again once it has been reacquired.
+        self.pool.release(cx1)
+        self.pool.release(cx2)
+
+    def CheckTimeout(self):
+        cx1 = self.pool.acquire()
+        cx2 = self.pool.acquire()
+        with self.assertRaises(sqlite.OperationalError):
+            self.pool.acquire(timeout=0)
+        with self.assertRaises(sqlite.OperationalError):
+            self.pool.acquire(timeout=0.01)
+        self.pool.release(cx1)
+        self.assertIs(self.pool.acquire(timeout=0), cx1)
+
+    def CheckClose(self):
+        cx1 = self.pool.acquire()
+        cx2 = self.pool.acquire()
+        self.pool.release(cx2)
+        self.pool.close()
+        with self.assertRaises(sqlite.ProgrammingError):
+            cx2.execute("select 1")
+        # Connections in use are closed when they are released.
+        cx1.execute("select 1")
+        self.pool.release(cx1)
+        with self.assertRaises(sqlite.ProgrammingError):
+            cx1.execute("select 1")
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.pool.acquire()
+        self.assertEqual(self.pool.stats().size, 0)
+
+    def CheckStatementStats(self):
+        for i in range(4):
+            with self.pool.connection() as cx:
+                cx.execute("select * from test")
+        stats = self.pool.stats()
+        self.assertEqual(stats.statement_misses, 1)
+        self.assertEqual(stats.statement_hits, 3)
+        self.assertEqual(stats.statement_hit_rate, 0.75)
+        # The counts of closed connections are kept.
+        self.pool.close()
+        stats = self.pool.stats()
+        self.assertEqual((stats.statement_hits, stats.statement_misses), (3, 1))
+
+    def CheckInvalidSize(self):
+        with self.assertRaises(ValueError):
+            sqlite.ConnectionPool(TESTFN, 0)
+
+    @unittest.skipUnless(threading, 'This test requires threading.')
+    def CheckThreads(self):
+        errors = []
+        def run(n):
+            try:
+                for i in range(20):
+                    with self.pool.connection() as cx:
+                        cx.execute("insert into test values (?)", (n,))
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.count(), 100)
+        stats = self.pool.stats()
+        self.assertLessEqual(stats.size, 2)
+        self.assertEqual(stats.created + stats.reused, 101)
+
+    @unittest.skipUnless(threading, 'This test requires threading.')
+    def CheckWaitForRelease(self):
+        cx1 = self.pool.acquire()
+        cx2 = self.pool.acquire()
+        result = []
+        t = threading.Thread(target=lambda: result.append(self.pool.acquire()))
+        t.start()
+        self.pool.release(cx2)
+        t.join()
+        self.assertEqual(result, [cx2])
+
+
+def suite():
+    return unittest.makeSuite(ConnectionPoolTests, "Check")
+
+def test():
+    runner = unittest.TextTestRunner()
+    runner.run(suite())
+
+if __name__ == "__main__":
+    test()
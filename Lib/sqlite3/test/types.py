@@ -337,6 +337,18 @@ class ObjectAdaptationTests(unittest.TestCase):
         val = self.cur.fetchone()[0]
         self.assertEqual(type(val), float)
 
+    def CheckBytesCasterIsUsed(self):
+        # bytes are bound without looking for an adapter, unless one was
+        # registered.
+        self.cur.execute("select ?", (b"abc",))
+        self.assertEqual(self.cur.fetchone()[0], b"abc")
+        sqlite.register_adapter(bytes, bytes.hex)
+        try:
+            self.cur.execute("select ?", (b"abc",))
+            self.assertEqual(self.cur.fetchone()[0], "616263")
+        finally:
+            del sqlite.adapters[(bytes, sqlite.PrepareProtocol)]
+
 @unittest.skipUnless(zlib, "requires zlib")
 class BinaryConverterTests(unittest.TestCase):
     def convert(s):
@@ -48,6 +48,7 @@ import time
 import struct
 import copy
 import re
+import _compression
 
 try:
     import pwd
@@ -145,6 +146,12 @@ PAX_NUMBER_FIELDS = {
     "size": int
 }
 
+# The attributes of the members saved in an index by TarFile.save_index().
+_INDEX_VERSION = 1
+_INDEX_FIELDS = ("name", "mode", "uid", "gid", "size", "mtime", "chksum",
+                 "type", "linkname", "uname", "gname", "devmajor", "devminor",
+                 "offset", "offset_data", "pax_headers", "sparse")
+
 #---------------------------------------------------------
 # initialization
 #---------------------------------------------------------
@@ -361,6 +368,7 @@ class _Stream:
         self.mode     = mode
         self.comptype = comptype
         self.fileobj  = fileobj
+        self.rawfileobj = None
         self.bufsize  = bufsize
         self.buf      = b""
         self.pos      = 0
@@ -405,11 +413,20 @@ class _Stream:
                     self.cmp = lzma.LZMACompressor()
 
             elif comptype != "tar":
-                raise CompressionError("unknown compression type %r" % comptype)
+                # A compression format registered in _compression, whose
+                # file object is read and written as an uncompressed stream.
+                try:
+                    codec = _compression.get_codec(comptype)
+                except LookupError:
+                    raise CompressionError("unknown compression type %r"
+                                           % comptype) from None
+                self.rawfileobj = fileobj
+                self.fileobj = codec.open(fileobj, mode + "b")
+                self.comptype = "tar"
 
         except:
             if not self._extfileobj:
-                self.fileobj.close()
+                fileobj.close()
             self.closed = True
             raise
 
@@ -469,8 +486,12 @@ class _Stream:
                     self.fileobj.write(struct.pack("<L", self.crc))
                     self.fileobj.write(struct.pack("<L", self.pos & 0xffffFFFF))
         finally:
-            if not self._extfileobj:
-                self.fileobj.close()
+            try:
+                if self.rawfileobj is not None:
+                    self.fileobj.close()
+            finally:
+                if not self._extfileobj:
+                    (self.rawfileobj or self.fileobj).close()
 
     def _init_read_gz(self):
         """Initialize for reading a gzip compressed fileobj.
@@ -596,8 +617,10 @@ class _StreamProxy(object):
             return "bz2"
         elif self.buf.startswith((b"\x5d\x00\x00\x80", b"\xfd7zXZ")):
             return "xz"
-        else:
-            return "tar"
+        codec = _compression.find_codec(self.buf)
+        if codec is not None:
+            return codec.name
+        return "tar"
 
     def close(self):
         self.fileobj.close()
@@ -729,16 +752,21 @@ class TarInfo(object):
        usually created internally.
     """
 
-    __slots__ = ("name", "mode", "uid", "gid", "size", "mtime",
+    __slots__ = ("_name", "mode", "uid", "gid", "size", "mtime",
                  "chksum", "type", "linkname", "uname", "gname",
                  "devmajor", "devminor",
                  "offset", "offset_data", "pax_headers", "sparse",
-                 "tarfile", "_sparse_structs", "_link_target")
+                 "tarfile", "_sparse_structs", "_link_target", "_indexed")
+
+    # Number of times an indexed member has been renamed, see
+    # TarFile._index_members().
+    _renames = 0
 
     def __init__(self, name=""):
         """Construct a TarInfo object. name is the optional name
            of the member.
         """
+        self._indexed = False   # flag if indexed by name by a TarFile
         self.name = name        # member name
         self.mode = 0o644       # file permissions
         self.uid = 0            # user id
@@ -759,6 +787,14 @@ class TarInfo(object):
         self.sparse = None      # sparse member information
         self.pax_headers = {}   # pax header information
 
+    def _getname(self):
+        return self._name
+    def _setname(self, name):
+        if getattr(self, "_indexed", False):
+            TarInfo._renames += 1
+        self._name = name
+    name = property(_getname, _setname)
+
     # In pax headers the "name" and "linkname" field are called
     # "path" and "linkpath".
     def _getpath(self):
@@ -1408,7 +1444,7 @@ class TarFile(object):
     def __init__(self, name=None, mode="r", fileobj=None, format=None,
             tarinfo=None, dereference=None, ignore_zeros=None, encoding=None,
             errors="surrogateescape", pax_headers=None, debug=None,
-            errorlevel=None, copybufsize=None):
+            errorlevel=None, copybufsize=None, index=None):
         """Open an (uncompressed) tar archive `name'. `mode' is either 'r' to
            read from an existing archive, 'a' to append data to an existing
            file or 'w' to create a new file overwriting an existing one. `mode'
@@ -1416,10 +1452,15 @@ class TarFile(object):
            If `fileobj' is given, it is used for reading or writing data. If it
            can be determined, `mode' is overridden by `fileobj's mode.
            `fileobj' is not closed, when TarFile is closed.
+           If `index' is given, it is the name of an index written by
+           save_index(), or a text file object to read it from, and the
+           members are read from the index instead of from the archive.
         """
         modes = {"r": "rb", "a": "r+b", "w": "wb", "x": "xb"}
         if mode not in modes:
             raise ValueError("mode must be 'r', 'a', 'w' or 'x'")
+        if index is not None and mode != "r":
+            raise ValueError("an index can only be used for reading")
         self.mode = mode
         self._mode = modes[mode]
 
@@ -1468,6 +1509,8 @@ class TarFile(object):
         self.closed = False
         self.members = []       # list of members as TarInfo objects
         self._loaded = False    # flag if all members have been read
+        self._name_indexes = {} # indexes of the members by name,
+                                # see _index_members()
         self.offset = self.fileobj.tell()
                                 # current position in the archive file
         self.inodes = {}        # dictionary caching the inodes of
@@ -1477,6 +1520,8 @@ class TarFile(object):
             if self.mode == "r":
                 self.firstmember = None
                 self.firstmember = self.next()
+                if index is not None:
+                    self._load_index(index)
 
             if self.mode == "a":
                 # Move to the end of the archive,
@@ -1551,6 +1596,9 @@ class TarFile(object):
            'w|gz'       open a gzip compressed stream for writing
            'w|bz2'      open a bzip2 compressed stream for writing
            'w|xz'       open an lzma compressed stream for writing
+
+           The other compression formats registered in the _compression
+           module can be used like 'gz', by their names.
         """
 
         if not name and not fileobj:
@@ -1560,12 +1608,20 @@ class TarFile(object):
             # Find out which *open() is appropriate for opening the file.
             def not_compressed(comptype):
                 return cls.OPEN_METH[comptype] == 'taropen'
-            for comptype in sorted(cls.OPEN_METH, key=not_compressed):
-                func = getattr(cls, cls.OPEN_METH[comptype])
+            funcs = [(getattr(cls, cls.OPEN_METH[comptype]), {})
+                     for comptype in sorted(cls.OPEN_METH,
+                                            key=not_compressed)]
+            # The other registered formats are recognized by their magic,
+            # before trying an uncompressed archive.
+            funcs[-1:-1] = [(cls.codecopen, {"codec": codec})
+                            for codec in _compression.get_codecs()
+                            if codec.name not in cls.OPEN_METH and
+                               codec.magic]
+            for func, codec_kwargs in funcs:
                 if fileobj is not None:
                     saved_pos = fileobj.tell()
                 try:
-                    return func(name, "r", fileobj, **kwargs)
+                    return func(name, "r", fileobj, **codec_kwargs, **kwargs)
                 except (ReadError, CompressionError):
                     if fileobj is not None:
                         fileobj.seek(saved_pos)
@@ -1582,7 +1638,8 @@ class TarFile(object):
             if comptype in cls.OPEN_METH:
                 func = getattr(cls, cls.OPEN_METH[comptype])
             else:
-                raise CompressionError("unknown compression type %r" % comptype)
+                func = cls.codecopen
+                kwargs["codec"] = comptype
             return func(name, filemode, fileobj, **kwargs)
 
         elif "|" in mode:
@@ -1706,6 +1763,49 @@ class TarFile(object):
         t._extfileobj = False
         return t
 
+    @classmethod
+    def codecopen(cls, name, mode="r", fileobj=None, *, codec, **kwargs):
+        """Open tar archive name compressed with codec, the name of a
+           compression format registered in the _compression module or its
+           Codec, for reading or writing.  Appending is not allowed.
+        """
+        if mode not in ("r", "w", "x"):
+            raise ValueError("mode must be 'r', 'w' or 'x'")
+
+        if isinstance(codec, str):
+            try:
+                codec = _compression.get_codec(codec)
+            except LookupError:
+                raise CompressionError("unknown compression type %r"
+                                       % codec) from None
+
+        if mode == "r" and codec.magic:
+            size = max(map(len, codec.magic))
+            if fileobj is not None:
+                saved_pos = fileobj.tell()
+                data = fileobj.read(size)
+                fileobj.seek(saved_pos)
+            else:
+                with bltn_open(name, "rb") as f:
+                    data = f.read(size)
+            if not data.startswith(codec.magic):
+                raise ReadError("not a %s file" % codec.name)
+
+        fileobj = codec.open(fileobj if fileobj is not None else name,
+                             mode + "b")
+        try:
+            t = cls.taropen(name, mode, fileobj, **kwargs)
+        except (OSError, EOFError):
+            fileobj.close()
+            if mode == 'r':
+                raise ReadError("not a %s file" % codec.name)
+            raise
+        except:
+            fileobj.close()
+            raise
+        t._extfileobj = False
+        return t
+
     # All *open() methods are registered here.
     OPEN_METH = {
         "tar": "taropen",   # uncompressed tar
@@ -1759,6 +1859,35 @@ class TarFile(object):
                                 # scan the whole archive.
         return self.members
 
+    def save_index(self, file):
+        """Write an index of the archive to `file', a file name or a text
+           file object. It holds the members of the archive and the offsets
+           of the compressed streams it is made of. When the archive is
+           opened again with this index, the members are read from it, and
+           extractfile() starts decompressing at the closest compressed
+           stream before the member instead of at the beginning of the
+           archive.
+        """
+        import json
+
+        self._check("r")
+        members = self.getmembers()
+        if hasattr(self.fileobj, "_get_stream_offsets"):
+            streams = self.fileobj._get_stream_offsets()
+        else:
+            streams = []
+        index = {
+            "version": _INDEX_VERSION,
+            "size": self._archive_size(),
+            "streams": streams,
+            "members": [self._index_fields(tarinfo) for tarinfo in members],
+        }
+        if hasattr(file, "write"):
+            json.dump(index, file, separators=(",", ":"))
+        else:
+            with bltn_open(file, "w", encoding="ascii") as f:
+                json.dump(index, f, separators=(",", ":"))
+
     def getnames(self):
         """Return the members of the archive as a list of their names. It has
            the same order as the list returned by getmembers().
@@ -2321,21 +2450,37 @@ class TarFile(object):
         # Ensure that all members have been loaded.
         members = self.getmembers()
 
-        # Limit the member search list up to tarinfo.
-        if tarinfo is not None:
-            members = members[:members.index(tarinfo)]
-
         if normalize:
             name = os.path.normpath(name)
 
-        for member in reversed(members):
+        index = self._index_members(members, normalize)
+        for member in reversed(index.get(name, ())):
+            if tarinfo is None or member.offset < tarinfo.offset:
+                return member
+
+    def _index_members(self, members, normalize):
+        """Return a dictionary mapping the names of the members, normalized
+           if normalize is true, to the lists of members with that name, in
+           archive order. The index is updated with the members added to
+           the list since the last call, and rebuilt if the list has been
+           replaced or shortened, or if an indexed member has been renamed.
+        """
+        index, indexed, count, renames = self._name_indexes.get(normalize,
+                                                (None, None, 0, None))
+        if (indexed is not members or count > len(members) or
+                renames != TarInfo._renames):
+            index = {}
+            count = 0
+        for member in members[count:]:
+            member._indexed = True
             if normalize:
                 member_name = os.path.normpath(member.name)
             else:
                 member_name = member.name
-
-            if name == member_name:
-                return member
+            index.setdefault(member_name, []).append(member)
+        self._name_indexes[normalize] = (index, members, len(members),
+                                         TarInfo._renames)
+        return index
 
     def _load(self):
         """Read through the entire archive file and look for readable
@@ -2347,6 +2492,65 @@ class TarFile(object):
                 break
         self._loaded = True
 
+    def _archive_size(self):
+        """Return the size of the archive file, or None if it is unknown.
+        """
+        try:
+            return os.path.getsize(self.name)
+        except (TypeError, ValueError, OSError):
+            return None
+
+    def _index_fields(self, tarinfo):
+        """Return the list of the attributes of tarinfo saved in an index.
+        """
+        fields = [getattr(tarinfo, field) for field in _INDEX_FIELDS]
+        fields[_INDEX_FIELDS.index("type")] = tarinfo.type.decode("latin-1")
+        return fields
+
+    def _load_index(self, index):
+        """Replace the members by those of an index written by save_index().
+        """
+        import json
+
+        if hasattr(index, "read"):
+            data = json.load(index)
+        else:
+            with bltn_open(index, encoding="ascii") as f:
+                data = json.load(f)
+        try:
+            if data["version"] != _INDEX_VERSION:
+                raise ReadError("unsupported index version")
+            size = data["size"]
+            streams = [(offset, pos) for offset, pos in data["streams"]]
+            members = []
+            for fields in data["members"]:
+                if len(fields) != len(_INDEX_FIELDS):
+                    raise ValueError("wrong number of fields")
+                tarinfo = self.tarinfo()
+                for field, value in zip(_INDEX_FIELDS, fields):
+                    setattr(tarinfo, field, value)
+                tarinfo.type = tarinfo.type.encode("latin-1")
+                if tarinfo.sparse is not None:
+                    tarinfo.sparse = [tuple(block) for block in tarinfo.sparse]
+                members.append(tarinfo)
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ReadError("invalid index") from e
+
+        # Check that the index was made for this archive.
+        first = self.firstmember
+        if (size is not None and
+            self._archive_size() not in (None, size) or
+            (first is None) != (not members) or
+            first is not None and (first.name, first.offset) !=
+                                  (members[0].name, members[0].offset)):
+            raise ReadError("index does not match the archive")
+
+        self.firstmember = None
+        self.members = members
+        self._loaded = True
+        if streams and hasattr(self.fileobj, "_set_stream_offsets"):
+            self.fileobj._set_stream_offsets(streams)
+
     def _check(self, mode=None):
         """Check if TarFile is still open, and if the operation's mode
            corresponds to TarFile's mode.
@@ -2520,6 +2724,9 @@ def main():
             '.tbz2': 'bz2',
             '.tb2': 'bz2',
         }
+        for codec in _compression.get_codecs():
+            for extension in codec.extensions:
+                compressions.setdefault(extension, codec.name)
         tar_mode = 'w:' + compressions[ext] if ext in compressions else 'w'
         tar_files = args.create
 
@@ -511,6 +511,48 @@ class BZ2FileTest(BaseTest):
         with module.BZ2File(self.filename, "rb") as f:
             self.assertEqual(f.read(), b"abc")
 
+    @unittest.skipUnless(threading, 'Threading required for this test.')
+    def testReadThreads(self):
+        data = self.BIG_DATA + self.DATA + self.EMPTY_DATA + self.BIG_DATA
+        text = self.BIG_TEXT + self.TEXT + self.BIG_TEXT
+        for threads in (0, 2, 3):
+            with BZ2File(BytesIO(data), threads=threads) as bz2f:
+                self.assertEqual(bz2f.read(), text)
+        with BZ2File(BytesIO(data + b'trailing'), threads=2) as bz2f:
+            self.assertEqual(bz2f.read(), text)
+        with BZ2File(BytesIO(self.EMPTY_DATA), threads=2) as bz2f:
+            self.assertEqual(bz2f.read(), b'')
+        with BZ2File(BytesIO(data), threads=2) as bz2f:
+            bz2f.seek(len(text) - 10)
+            self.assertEqual(bz2f.read(), text[-10:])
+            bz2f.seek(5)
+            self.assertEqual(bz2f.read(5), text[5:10])
+        self.assertRaises(ValueError, BZ2File, BytesIO(data), threads=-1)
+
+    @unittest.skipUnless(threading, 'Threading required for this test.')
+    def testReadThreadsBadData(self):
+        with BZ2File(BytesIO(self.BAD_DATA), threads=2) as bz2f:
+            self.assertRaises(OSError, bz2f.read)
+        with BZ2File(BytesIO(self.BIG_DATA[:-10]), threads=2) as bz2f:
+            self.assertRaises(EOFError, bz2f.read)
+        data = bytearray(self.BIG_DATA)
+        data[len(data) // 4] ^= 1
+        with BZ2File(BytesIO(data), threads=2) as bz2f:
+            self.assertRaises(OSError, bz2f.read)
+
+    @unittest.skipUnless(threading, 'Threading required for this test.')
+    def testReadThreadsFalseBoundaries(self):
+        # The magic numbers of blocks can appear by chance in compressed
+        # data: blocks which cannot be decompressed are joined to the
+        # next ones.
+        class Reader(bz2._ParallelReader):
+            def _iter_blocks(self):
+                for data, start, count, last in super()._iter_blocks():
+                    yield data, start, count // 3, False
+                    yield data, start + count // 3, count - count // 3, last
+        with Reader(BytesIO(self.BIG_DATA + self.DATA), 2) as raw:
+            self.assertEqual(raw.readall(), self.BIG_TEXT + self.TEXT)
+
     def testMixedIterationAndReads(self):
         self.createTempFile()
         linelen = len(self.TEXT_LINES[0])
@@ -100,6 +100,28 @@ class CmdLineTest(unittest.TestCase):
         else:
             self.assertEqual(err, b'')
 
+    def test_importtime(self):
+        def check(err):
+            lines = err.decode('ascii').splitlines()
+            self.assertEqual(lines[0], 'import time: self [us] | '
+                                       'cumulative | imported package')
+            self.assertRegex(err.decode('ascii'),
+                             r'(?m)^import time: +\d+ \| +\d+ \|   '
+                             r'json\.decoder$')
+            self.assertRegex(err.decode('ascii'),
+                             r'(?m)^import time: +\d+ \| +\d+ \| json$')
+
+        code = 'import json'
+        rc, out, err = assert_python_ok('-S', '-X', 'importtime', '-c', code)
+        check(err)
+        rc, out, err = assert_python_ok('-S', '-c', code,
+                                        PYTHONPROFILEIMPORTTIME='1')
+        check(err)
+        # -E ignores the environment variable
+        rc, out, err = assert_python_ok('-E', '-S', '-c', code,
+                                        PYTHONPROFILEIMPORTTIME='1')
+        self.assertEqual(err, b'')
+
     def test_run_module(self):
         # Test expected operation of the '-m' switch
         # Switch needs an argument
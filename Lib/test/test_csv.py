@@ -2,6 +2,7 @@
 # csv package unit tests
 
 import copy
+import os
 import sys
 import unittest
 from io import StringIO
@@ -312,6 +313,81 @@ class Test_Csv(unittest.TestCase):
         self.assertRaises(StopIteration, next, r)
         self.assertEqual(r.line_num, 3)
 
+    def test_read_batch(self):
+        r = csv.reader(['a,b', '1,"x,y"', '', '2,z\r\n', '3,"multi\n', 'line"'])
+        self.assertEqual(r.read_batch(1), [['a'], ['b']])
+        self.assertEqual(r.line_num, 1)
+        self.assertEqual(r.read_batch(2), [['1', '2'], ['x,y', 'z']])
+        self.assertEqual(r.read_batch(0), [])
+        self.assertEqual(r.read_batch(10), [['3'], ['multi\nline']])
+        self.assertEqual(r.line_num, 6)
+        self.assertEqual(r.read_batch(10), [])
+        self.assertRaises(StopIteration, next, r)
+        self.assertRaises(ValueError, r.read_batch, -1)
+
+    def test_read_batch_converters(self):
+        r = csv.reader(['1,2.5,x,1', ' -7 ,1e3,y,2', '1_000,inf,z,3'])
+        self.assertEqual(r.read_batch(10, [int, float, None, lambda x: x * 2]),
+                         [[1, -7, 1000], [2.5, 1000.0, float('inf')],
+                          ['x', 'y', 'z'], ['11', '22', '33']])
+        r = csv.reader(['1,2', '3,x'])
+        with self.assertRaisesRegex(ValueError, "'x'"):
+            r.read_batch(10, [int, int])
+        r = csv.reader(['1,"2"'], quoting=csv.QUOTE_NONNUMERIC)
+        self.assertEqual(r.read_batch(10), [[1.0], ['2']])
+        self.assertRaises(TypeError, csv.reader([]).read_batch, 1, [1])
+        self.assertRaises(TypeError, csv.reader([]).read_batch, 1, 1)
+
+    def test_read_batch_arrays(self):
+        import array
+        r = csv.reader(['1,2.5,-128,18446744073709551615,x',
+                        '-9223372036854775808, 3 ,127,0,y'])
+        ints, floats, bytes_, unsigned, strings = r.read_batch(
+            10, ['q', 'd', 'b', 'Q', None])
+        self.assertEqual(ints, array.array('q', [1, -9223372036854775808]))
+        self.assertEqual(floats, array.array('d', [2.5, 3.0]))
+        self.assertEqual(bytes_, array.array('b', [-128, 127]))
+        self.assertEqual(unsigned,
+                         array.array('Q', [18446744073709551615, 0]))
+        self.assertEqual(strings, ['x', 'y'])
+        r = csv.reader(['1.5'])
+        self.assertEqual(r.read_batch(1, ['f']), [array.array('f', [1.5])])
+        for typecode, field in [('b', '128'), ('B', '-1'), ('h', '32768'),
+                                ('q', '9223372036854775808')]:
+            with self.assertRaises(OverflowError):
+                csv.reader([field]).read_batch(1, [typecode])
+        self.assertRaises(ValueError, csv.reader(['x']).read_batch, 1, ['q'])
+        self.assertRaises(ValueError, csv.reader(['x']).read_batch, 1, ['d'])
+        self.assertRaises(ValueError, csv.reader([]).read_batch, 1, ['u'])
+
+    def test_read_batch_field_count(self):
+        r = csv.reader(['1,2', '3'])
+        with self.assertRaisesRegex(csv.Error, 'line 2 has 1 fields'):
+            r.read_batch(10)
+        r = csv.reader(['1,2', '3,4,5'])
+        with self.assertRaisesRegex(csv.Error, 'line 2 has 3 fields'):
+            r.read_batch(10)
+        r = csv.reader(['1,2,3'])
+        with self.assertRaisesRegex(csv.Error, 'expected 2'):
+            r.read_batch(10, [None, None])
+
+    def test_read_batch_converters_mutated(self):
+        # The converters are used after being removed from their list.
+        class Converter:
+            def __call__(self, field):
+                converters.clear()
+                return field * 2
+        converters = [Converter()]
+        r = csv.reader(['1', '2', '3'])
+        self.assertEqual(r.read_batch(1000, converters), [['11', '22', '33']])
+
+    def test_read_batch_reentrant(self):
+        def converter(field):
+            next(r)
+        r = csv.reader(['1', '2'])
+        self.assertRaises(RuntimeError, r.read_batch, 1, [converter])
+        self.assertEqual(next(r), ['2'])
+
     def test_roundtrip_quoteed_newlines(self):
         with TemporaryFile("w+", newline='') as fileobj:
             writer = csv.writer(fileobj)
@@ -746,6 +822,15 @@ class TestDictFields(unittest.TestCase):
         self.assertEqual(next(reader), {"1": '1', "2": '2', "3": 'abc',
                                          "4": '4', "5": '5', "6": '6'})
 
+    def test_read_dict_batch(self):
+        reader = csv.DictReader(["f1,f2", "1,a", "", "2,b", "3,c"])
+        self.assertEqual(reader.read_batch(2, {"f1": int}),
+                         {"f1": [1, 2], "f2": ["a", "b"]})
+        self.assertEqual(reader.line_num, 4)
+        self.assertEqual(next(reader), {"f1": "3", "f2": "c"})
+        self.assertEqual(reader.read_batch(2), {})
+        self.assertEqual(csv.DictReader([]).read_batch(2), {})
+
     def test_read_semi_sep(self):
         reader = csv.DictReader(["1;2;abc;4;5;6\r\n"],
                                 fieldnames="1 2 3 4 5 6".split(),
@@ -753,6 +838,88 @@ class TestDictFields(unittest.TestCase):
         self.assertEqual(next(reader), {"1": '1', "2": '2', "3": 'abc',
                                          "4": '4', "5": '5', "6": '6'})
 
+class TestReadParallel(unittest.TestCase):
+    rows = [[str(i), ['a', 'b,c', 'multi\nline "q"\r\n', ''][i % 4],
+             '%d.5' % i] for i in range(500)]
+
+    def setUp(self):
+        self.addCleanup(support.unlink, support.TESTFN)
+        with open(support.TESTFN, 'w', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerows(self.rows)
+        self.size = os.path.getsize(support.TESTFN)
+
+    def read_parallel(self, *args, **kwargs):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(2) as executor:
+            return list(csv.read_parallel(support.TESTFN, *args,
+                                          encoding='utf-8',
+                                          executor=executor, **kwargs))
+
+    def test_record_ranges(self):
+        with open(support.TESTFN, 'rb') as f:
+            for chunk_size in (1, 10, 100, self.size - 1, self.size):
+                ranges = list(csv._record_ranges(f, chunk_size, b'"'))
+                self.assertEqual(ranges[0][0], 0)
+                self.assertEqual(ranges[-1][1], self.size)
+                for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+                    self.assertEqual(end, next_start)
+                rows = []
+                for start, end in ranges:
+                    rows.extend(csv._read_range(support.TESTFN, start, end,
+                                                'utf-8', {}))
+                self.assertEqual(rows, self.rows)
+            self.assertEqual(len(list(csv._record_ranges(f, 1, b'"'))),
+                             len(self.rows))
+            # Without quoting, every newline ends a record.
+            f.seek(0)
+            newlines = f.read().count(b'\n')
+            self.assertEqual(len(list(csv._record_ranges(f, 1, None))),
+                             newlines)
+
+    def test_ordered(self):
+        for chunk_size in (10, 1000, self.size):
+            self.assertEqual(self.read_parallel(chunk_size=chunk_size),
+                             self.rows)
+        self.assertEqual(self.read_parallel(chunk_size=10, max_workers=1),
+                         self.rows)
+
+    def test_process(self):
+        counts = self.read_parallel(chunk_size=1000, process=len)
+        self.assertGreater(len(counts), 1)
+        self.assertEqual(sum(counts), len(self.rows))
+
+    def test_unordered(self):
+        rows = self.read_parallel(chunk_size=10, ordered=False)
+        self.assertEqual(sorted(rows, key=lambda row: int(row[0])),
+                         self.rows)
+
+    def test_dialect(self):
+        with open(support.TESTFN, 'w', encoding='utf-8') as f:
+            f.write('a;b\n1;2\n"3;4";5\n')
+        self.assertEqual(self.read_parallel(None, chunk_size=1),
+                         [['a', 'b'], ['1', '2'], ['3;4', '5']])
+        self.assertEqual(self.read_parallel(delimiter=';', chunk_size=1),
+                         [['a', 'b'], ['1', '2'], ['3;4', '5']])
+        self.assertEqual(self.read_parallel('excel-tab'),
+                         [['a;b'], ['1;2'], ['3;4;5']])
+        with self.assertRaises(ValueError):
+            self.read_parallel(escapechar='\\')
+        with self.assertRaises(ValueError):
+            list(csv.read_parallel(support.TESTFN, encoding='utf-16'))
+        with self.assertRaises(ValueError):
+            self.read_parallel(chunk_size=0)
+
+    def test_processes(self):
+        support.import_module('multiprocessing.synchronize')
+        rows = list(csv.read_parallel(support.TESTFN, encoding='utf-8',
+                                      chunk_size=1000, max_workers=2))
+        self.assertEqual(rows, self.rows)
+        counts = csv.read_parallel(support.TESTFN, encoding='utf-8',
+                                   chunk_size=1000, max_workers=2,
+                                   process=len)
+        self.assertEqual(sum(counts), len(self.rows))
+
+
 class TestArrayWrites(unittest.TestCase):
     def test_int_write(self):
         import array
@@ -1,9 +1,13 @@
+import copy
 import io
+import os
+import pickle
 import email
+import email.parser
 import unittest
 from email.message import Message, EmailMessage
 from email.policy import default
-from test.test_email import TestEmailBase
+from test.test_email import TestEmailBase, openfile
 
 
 class TestCustomMessage(TestEmailBase):
@@ -106,5 +110,98 @@ class TestBytesParser(TestParserBase, TestEmailBase):
     parsers = (message_from_bytes, message_from_binary_file)
 
 
+class TestLazyParser(TestEmailBase):
+
+    def dump(self, msg):
+        payload = msg._payload
+        if isinstance(payload, list):
+            payload = [self.dump(part) for part in payload]
+        return (type(msg), msg._unixfrom, msg._headers, msg._default_type,
+                [(type(defect), str(defect)) for defect in msg.defects],
+                msg.preamble, msg.epilogue, payload)
+
+    def assertSameMessage(self, data, **kw):
+        eager = email.parser.BytesParser(**kw).parsebytes(data)
+        lazy = email.parser.BytesParser(**kw).parsebytes(data, lazy=True)
+        self.assertEqual(self.dump(lazy), self.dump(eager))
+
+    def test_same_as_parser(self):
+        data_dir = os.path.join(os.path.dirname(__file__), 'data')
+        for name in sorted(os.listdir(data_dir)):
+            if not name.startswith('msg_'):
+                continue
+            with self.subTest(name=name):
+                with openfile(name, 'rb') as fp:
+                    data = fp.read()
+                self.assertSameMessage(data)
+                self.assertSameMessage(data, policy=default)
+
+    def test_defects(self):
+        for data in (
+                b'Content-Type: multipart/mixed; boundary="b"\n\n'
+                b'--b\n\nno close boundary\n',
+                b'Content-Type: multipart/mixed; boundary="b"\n\n'
+                b'no start boundary\n--b--\nepilogue\n',
+                b'Content-Type: multipart/mixed\n\nno boundary\n',
+                b'Content-Type: multipart/mixed; boundary="b"\n'
+                b'Content-Transfer-Encoding: base64\n\n--b\n--b--\n',
+                b'Subject: no separator\nbody\n',
+                b'Subject: x\nFrom nowhere\n\nbody\n',
+                b'Content-Type: multipart/mixed; boundary="b"\n\n'
+                b'--b\nContent-Type: multipart/digest; boundary="c"\n\n'
+                b'--c\n\n--b\n--b--\n',
+                b'Content-Type: message/rfc822\n\nSubject: inner\r\n\r\n',
+                b'Content-Type: multipart/mixed; boundary="b"\r\n\r\n'
+                b'--b\r\nContent-Type: message/delivery-status\r\n\r\n'
+                b'A: b\r\n\r\nC: d\r\n--b--'):
+            with self.subTest(data=data):
+                self.assertSameMessage(data)
+
+    def test_body_parsed_on_demand(self):
+        with openfile('msg_02.txt', 'rb') as fp:
+            msg = email.parser.BytesParser().parse(fp, lazy=True)
+        self.assertEqual(msg['subject'], 'Ppp digest, Vol 1 #2 - 5 msgs')
+        self.assertNotIn('_payload', msg.__dict__)
+        self.assertTrue(msg.is_multipart())
+        self.assertIn('_payload', msg.__dict__)
+        part = msg.get_payload(1)
+        self.assertEqual(part['content-description'],
+                         "Today's Topics (5 msgs)")
+        self.assertNotIn('_payload', part.__dict__)
+        self.assertTrue(part.get_payload().startswith("Today's Topics:\n"))
+        with self.assertRaises(AttributeError):
+            msg.missing
+
+    def test_payload_set_before_parsing(self):
+        msg = email.parser.Parser().parsestr(
+            'Content-Type: multipart/mixed; boundary="b"\n\n'
+            'preamble\n--b\n\npart\n--b--\n', lazy=True)
+        msg.set_payload('replaced')
+        self.assertEqual(msg.preamble, 'preamble')
+        self.assertEqual(msg.get_payload(), 'replaced')
+
+    def test_copy_and_pickle(self):
+        with openfile('msg_02.txt', 'rb') as fp:
+            data = fp.read()
+        eager = email.message_from_bytes(data)
+        for copy_func in (copy.copy, copy.deepcopy,
+                          lambda msg: pickle.loads(pickle.dumps(msg))):
+            msg = email.parser.BytesParser().parsebytes(data, lazy=True)
+            self.assertEqual(copy_func(msg).as_string(), eager.as_string())
+            self.assertEqual(msg.as_string(), eager.as_string())
+
+    def test_other_factory(self):
+        # Messages which aren't Message instances are parsed right away.
+        class OtherMessage:
+            def __init__(self):
+                self.msg = Message()
+            def __getattr__(self, name):
+                return getattr(self.msg, name)
+        msg = email.parser.Parser(OtherMessage).parsestr(
+            'Subject: x\n\nbody\n', lazy=True)
+        self.assertIsInstance(msg, OtherMessage)
+        self.assertEqual(msg.get_payload(), 'body\n')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,6 +9,11 @@ import pathlib
 import io
 import struct
 import array
+import zlib
+try:
+    import threading
+except ImportError:
+    threading = None
 gzip = support.import_module('gzip')
 
 data1 = b"""  int length=DEFAULTALLOC, err = Z_OK;
@@ -226,6 +231,19 @@ class TestGzip(BaseTest):
                 self.assertTrue(len(L) <= line_length)
                 line_length = (line_length + 1) % 50
 
+    def test_iteration(self):
+        lines = [b'line %d ' % i + b'x' * i + b'\n' for i in range(200)] * 20
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            f.writelines(lines)
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            self.assertIs(iter(f), f)
+            self.assertEqual(f.readline(), lines[0])
+            self.assertEqual(next(f), lines[1])
+            self.assertEqual(list(f), lines[2:])
+            self.assertRaises(StopIteration, next, f)
+        with self.assertRaises(ValueError):
+            iter(f)
+
     def test_readlines(self):
         self.test_write()
         # Try .readlines()
@@ -467,6 +485,61 @@ class TestGzip(BaseTest):
                 with gzip.GzipFile(fileobj=io.BytesIO(datac), mode="rb") as f:
                     self.assertEqual(f.read(), data)
 
+    @unittest.skipUnless(threading, 'requires threading')
+    def test_compress_threads(self):
+        data = b''.join(data1 * (i % 7) + data2 * (i % 3)
+                        for i in range(2000))
+        data += os.urandom(200000)
+        self.assertGreater(len(data), 4 * gzip._BLOCK_SIZE)
+        for threads in (0, 2, 4):
+            datac = gzip.compress(data, 6, threads=threads)
+            self.assertEqual(gzip.decompress(datac), data)
+            # One gzip member holding one deflate stream.
+            d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self.assertEqual(d.decompress(datac), data)
+            self.assertTrue(d.eof)
+            self.assertEqual(d.unused_data, b'')
+        self.assertEqual(gzip.decompress(gzip.compress(b'', threads=2)), b'')
+        with self.assertRaises(ValueError):
+            gzip.compress(data1, threads=-1)
+
+    @unittest.skipUnless(threading, 'requires threading')
+    def test_write_threads(self):
+        data = data1 * 5000
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb', threads=3) as f:
+            for i in range(0, len(data), 10000):
+                f.write(data[i:i + 10000])
+                if i % 70000 == 0:
+                    # Everything written is available after a flush.
+                    f.flush()
+                    d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    self.assertEqual(d.decompress(buf.getvalue()),
+                                     data[:i + 10000])
+                if i == 150000:
+                    f.flush(zlib.Z_FULL_FLUSH)
+            f.write(memoryview(data2))
+        self.assertEqual(gzip.decompress(buf.getvalue()), data + data2)
+
+    @unittest.skipUnless(threading, 'requires threading')
+    def test_write_threads_pending(self):
+        # A large write does not submit all its blocks at once.
+        data = os.urandom(20 * gzip._BLOCK_SIZE + 1000)
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb', threads=2) as f:
+            compressor = f.compress
+            submit = compressor._submit
+            pending = []
+            def _submit(*args):
+                submit(*args)
+                pending.append(len(compressor._pending))
+            compressor._submit = _submit
+            f.write(b'x' * 1000)
+            f.write(data)
+        self.assertEqual(len(pending), 21)
+        self.assertLessEqual(max(pending), 5)
+        self.assertEqual(gzip.decompress(buf.getvalue()), b'x' * 1000 + data)
+
     def test_decompress(self):
         for data in (data1, data2):
             buf = io.BytesIO()
@@ -477,6 +550,52 @@ class TestGzip(BaseTest):
             datac = gzip.compress(data)
             self.assertEqual(gzip.decompress(datac), data)
 
+    def test_decompress_members(self):
+        data = data1 * 5000 + data2 * 5000
+        member1 = gzip.compress(data, 1)
+        member2 = gzip.compress(data2)
+        datac = member1 + member2 + b'\0' * 10 + member1
+        self.assertEqual(gzip.decompress(datac), data + data2 + data)
+        self.assertEqual(gzip.decompress(b''), b'')
+        with self.assertRaises(OSError):
+            gzip.decompress(member2 + b'garbage')
+        with self.assertRaises(EOFError):
+            gzip.decompress(member1[:-1])
+        with self.assertRaises(EOFError):
+            gzip.decompress(member1[:len(member1) // 2])
+        corrupted = bytearray(member2)
+        corrupted[-8] ^= 1
+        with self.assertRaisesRegex(OSError, 'CRC check failed'):
+            gzip.decompress(corrupted)
+        corrupted = bytearray(member2)
+        corrupted[-4] ^= 1
+        with self.assertRaisesRegex(OSError, 'Incorrect length'):
+            gzip.decompress(corrupted)
+
+    def test_decompress_many_members(self):
+        # Each member is found from where the previous one ends, without
+        # copying the rest of the input.
+        members = [gzip.compress(b'member %d\n' % i) for i in range(20000)]
+        data = b''.join(b'member %d\n' % i for i in range(20000))
+        self.assertEqual(gzip.decompress(b''.join(members)), data)
+        self.assertEqual(gzip.decompress(bytearray(b''.join(members))), data)
+
+    def test_read_all_chunks(self):
+        # Large reads decompress whole chunks of compressed data at once.
+        data = bytes(range(256)) * 4000 + data1 * 20000
+        datac = gzip.compress(data)
+        with gzip.GzipFile(fileobj=io.BytesIO(datac * 2)) as f:
+            self.assertEqual(f.read(), data * 2)
+        with gzip.GzipFile(fileobj=io.BytesIO(datac)) as f:
+            buf = bytearray(len(data) + 1)
+            n = 0
+            while True:
+                k = f.readinto(memoryview(buf)[n:])
+                if not k:
+                    break
+                n += k
+            self.assertEqual(buf[:n], data)
+
     def test_read_truncated(self):
         data = data1*50
         # Drop the CRC (4 bytes) and file size (4 bytes).
@@ -3,7 +3,9 @@ from .. import util
 
 machinery = util.import_importlib('importlib.machinery')
 
+import sysconfig
 import unittest
+from test.support.script_helper import assert_python_ok
 
 
 class FindSpecTests(abc.FinderTests):
@@ -80,5 +82,35 @@ class FinderTests(abc.FinderTests):
  ) = util.test_both(FinderTests, machinery=machinery)
 
 
+class FrozenStdlibTests(unittest.TestCase):
+
+    """Test the standard library modules frozen by --with-frozen-stdlib."""
+
+    code = ('import _imp, encodings, os; '
+            'print(_imp.is_frozen("os"), _imp._frozen_stdlib_filename("os")); '
+            'print(os.__file__, encodings.__path__); '
+            'import encodings.cp437; print(encodings.cp437.__file__)')
+
+    def run_python(self, *args):
+        rc, out, err = assert_python_ok(*args, '-c', self.code)
+        return out.decode('ascii').splitlines()
+
+    def test_off(self):
+        frozen, filename, _ = self.run_python('-X', 'frozen_modules=off')
+        self.assertEqual(frozen.split(), ['False', 'None'])
+
+    @unittest.skipUnless(sysconfig.get_config_var('Py_FROZEN_STDLIB'),
+                         'requires --with-frozen-stdlib')
+    def test_on(self):
+        frozen, location, submodule = self.run_python('-X', 'frozen_modules=on')
+        is_frozen, filename = frozen.split()
+        self.assertEqual(is_frozen, 'True')
+        self.assertTrue(filename.endswith('/os.py'), filename)
+        libdir = filename.rpartition('/')[0]
+        self.assertEqual(location,
+                         '{} {!r}'.format(filename, [libdir + '/encodings']))
+        self.assertTrue(submodule.startswith(libdir + '/encodings/cp437.py'))
+
+
 if __name__ == '__main__':
     unittest.main()
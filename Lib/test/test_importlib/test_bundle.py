@@ -0,0 +1,160 @@
+import importlib
+from importlib import bundle
+import os
+import struct
+import sys
+import unittest
+
+from test import support
+
+
+class BundleTests(unittest.TestCase):
+
+    modules = {
+        'mod.py': 'attr = "mod"\n',
+        'pkg/__init__.py': 'from . import sub\n',
+        'pkg/sub.py': 'attr = "pkg.sub"\n',
+        'pkg/inner/__init__.py': '',
+        'pkg/inner/deep.py': 'from .. import sub\nattr = sub.attr\n',
+        'pkg/__pycache__/ignored.py': '',
+        'not-a-package/ignored.py': '',
+        'ns/ignored.py': '',
+    }
+
+    def setUp(self):
+        self.dir = os.path.abspath(support.TESTFN)
+        self.addCleanup(support.rmtree, self.dir)
+        self.src = os.path.join(self.dir, 'src')
+        for name, source in self.modules.items():
+            path = os.path.join(self.src, *name.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as file:
+                file.write(source)
+        self.path = os.path.join(self.dir, 'code.bundle')
+
+        self.addCleanup(sys.path_hooks.__setitem__, slice(None),
+                        sys.path_hooks[:])
+        self.addCleanup(sys.path.__setitem__, slice(None), sys.path[:])
+        self.addCleanup(bundle._bundles.pop, self.path, None)
+        self.addCleanup(self.clear_path_importer_cache)
+        for name in ('mod', 'pkg', 'pkg.sub', 'pkg.inner', 'pkg.inner.deep'):
+            self.addCleanup(support.forget, name)
+
+    def clear_path_importer_cache(self):
+        for path in list(sys.path_importer_cache):
+            if path.startswith(self.dir):
+                del sys.path_importer_cache[path]
+
+    def create_and_install(self):
+        count = bundle.create_bundle(self.path, [self.src])
+        bundle.install()
+        sys.path.insert(0, self.path)
+        importlib.invalidate_caches()
+        return count
+
+    def test_create(self):
+        self.assertEqual(self.create_and_install(), 5)
+        with open(self.path, 'rb') as file:
+            self.assertEqual(file.read(8), bundle._BUNDLE_MAGIC)
+
+    def test_import(self):
+        self.create_and_install()
+        mod = importlib.import_module('mod')
+        self.assertEqual(mod.attr, 'mod')
+        self.assertIsInstance(mod.__loader__, bundle.BundleLoader)
+        self.assertEqual(mod.__file__, os.path.join(self.path, 'mod.py'))
+        self.assertIsNone(mod.__loader__.get_source('mod'))
+        self.assertFalse(mod.__loader__.is_package('mod'))
+
+    def test_package(self):
+        self.create_and_install()
+        deep = importlib.import_module('pkg.inner.deep')
+        pkg = sys.modules['pkg']
+        self.assertEqual(deep.attr, 'pkg.sub')
+        self.assertEqual(pkg.__path__, [os.path.join(self.path, 'pkg')])
+        self.assertEqual(pkg.__file__,
+                         os.path.join(self.path, 'pkg', '__init__.py'))
+        self.assertTrue(pkg.__loader__.is_package('pkg'))
+        self.assertIsInstance(sys.path_importer_cache[pkg.__path__[0]],
+                              bundle.BundleFinder)
+
+    def test_not_found(self):
+        self.create_and_install()
+        finder = bundle.BundleFinder(self.path)
+        self.assertIsNone(finder.find_spec('missing'))
+        # Submodules are only found on the __path__ of their package.
+        self.assertIsNone(finder.find_spec('pkg.sub'))
+        self.assertIsNone(finder.find_spec('ignored'))
+        self.assertIsNone(finder.find_spec('ns'))
+        with self.assertRaises(ImportError):
+            finder._loader.get_code('missing')
+
+    def test_first_path_wins(self):
+        other = os.path.join(self.dir, 'other')
+        os.mkdir(other)
+        with open(os.path.join(other, 'mod.py'), 'w') as file:
+            file.write('attr = "other"\n')
+        bundle.create_bundle(self.path, [other, self.src])
+        finder = bundle.BundleFinder(self.path)
+        self.assertEqual(finder.find_spec('pkg').name, 'pkg')
+        code = finder._loader.get_code('mod')
+        namespace = {}
+        exec(code, namespace)
+        self.assertEqual(namespace['attr'], 'other')
+
+    def test_not_a_bundle(self):
+        with self.assertRaises(ImportError):
+            bundle.BundleFinder(self.dir)
+        with self.assertRaises(ImportError):
+            bundle.BundleFinder(os.path.join(self.dir, 'missing'))
+        with open(self.path, 'wb') as file:
+            file.write(b'PK\x03\x04' + bytes(100))
+        with self.assertRaises(ImportError):
+            bundle.BundleFinder(self.path)
+        with open(self.path, 'wb'):
+            pass
+        with self.assertRaises(ImportError):
+            bundle.BundleFinder(self.path)
+
+    def test_other_python_version(self):
+        bundle.create_bundle(self.path, [self.src])
+        with open(self.path, 'r+b') as file:
+            file.seek(8)
+            file.write(b'\0\0\0\0')
+        with self.assertRaisesRegex(ImportError, 'another Python version'):
+            bundle.BundleFinder(self.path)
+
+    def test_corrupted(self):
+        bundle.create_bundle(self.path, [self.src])
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        count, size = struct.unpack_from('<II', data, 12)
+        for count, size, length in [(count, 1 << 20, len(data)),
+                                    (count, size - 1, len(data)),
+                                    (count, 0, len(data)),
+                                    (size, size, len(data)),
+                                    (count, size, 24 + size * 16 - 1)]:
+            with self.subTest(count=count, size=size, length=length):
+                with open(self.path, 'wb') as file:
+                    file.write(data[:12] + struct.pack('<II', count, size) +
+                               data[20:length])
+                with self.assertRaisesRegex(ImportError, 'corrupted'):
+                    bundle.BundleFinder(self.path)
+
+    def test_many_modules(self):
+        many = os.path.join(self.dir, 'many')
+        os.mkdir(many)
+        for i in range(100):
+            with open(os.path.join(many, 'm%d.py' % i), 'w') as file:
+                file.write('value = %d\n' % i)
+        self.assertEqual(bundle.create_bundle(self.path, [many]), 100)
+        finder = bundle.BundleFinder(self.path)
+        for i in range(100):
+            namespace = {}
+            exec(finder._loader.get_code('m%d' % i), namespace)
+            self.assertEqual(namespace['value'], i)
+        self.assertIsNone(finder.find_spec('m100'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,8 @@ import sys
 import types
 import unittest
 
+from test import support
+
 from . import util as test_util
 
 
@@ -141,5 +143,73 @@ class LazyLoaderTests(unittest.TestCase):
             module.__name__
 
 
+class LazyImportsTests(unittest.TestCase):
+
+    module_name = 'lazy_imports_test'
+    source_code = 'import sys; sys.lazy_imports_test_executed = True; attr = 42'
+
+    def setUp(self):
+        self.addCleanup(util.disable_lazy_imports)
+        self.addCleanup(vars(sys).pop, 'lazy_imports_test_executed', None)
+
+    def import_module(self, **kwargs):
+        with test_util.temp_module(self.module_name, self.source_code):
+            util.enable_lazy_imports(**kwargs)
+            try:
+                module = importlib.import_module(self.module_name)
+            finally:
+                util.disable_lazy_imports()
+            executed = hasattr(sys, 'lazy_imports_test_executed')
+            # Force the load while the source file still exists.
+            self.assertEqual(module.attr, 42)
+        return executed
+
+    def test_enable_disable(self):
+        self.assertFalse(util.lazy_imports_enabled())
+        util.enable_lazy_imports()
+        self.assertTrue(util.lazy_imports_enabled())
+        util.enable_lazy_imports()
+        self.assertEqual(sum(isinstance(finder, util._LazyImportFinder)
+                             for finder in sys.meta_path), 1)
+        util.disable_lazy_imports()
+        self.assertFalse(util.lazy_imports_enabled())
+
+    def test_lazy(self):
+        self.assertFalse(self.import_module())
+
+    def test_reimport_stays_lazy(self):
+        with test_util.temp_module(self.module_name, self.source_code):
+            util.enable_lazy_imports()
+            module = importlib.import_module(self.module_name)
+            self.assertIs(__import__(self.module_name), module)
+            self.assertFalse(hasattr(sys, 'lazy_imports_test_executed'))
+            self.assertEqual(module.attr, 42)
+            self.assertTrue(sys.lazy_imports_test_executed)
+
+    def test_deny(self):
+        self.assertTrue(self.import_module(deny=[self.module_name]))
+
+    def test_allow(self):
+        self.assertTrue(self.import_module(allow=['some_other_module']))
+        vars(sys).pop('lazy_imports_test_executed')
+        self.assertFalse(self.import_module(allow=[self.module_name]))
+
+    def test_is_lazy(self):
+        finder = util._LazyImportFinder(allow=['pkg'], deny=['pkg.sub'])
+        self.assertTrue(finder.is_lazy('pkg'))
+        self.assertTrue(finder.is_lazy('pkg.other'))
+        self.assertFalse(finder.is_lazy('pkg.sub'))
+        self.assertFalse(finder.is_lazy('pkg.sub.mod'))
+        self.assertFalse(finder.is_lazy('pkgs'))
+        self.assertFalse(finder.is_lazy('encodings.utf_8'))
+
+    def test_extension_not_lazy(self):
+        support.import_module('_testcapi')
+        finder = util._LazyImportFinder()
+        spec = finder.find_spec('_testcapi', None)
+        self.assertIsNotNone(spec)
+        self.assertNotIsInstance(spec.loader, util.LazyLoader)
+
+
 if __name__ == '__main__':
     unittest.main()
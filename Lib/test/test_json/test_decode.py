@@ -60,6 +60,31 @@ class TestDecode:
         self.check_keys_reuse(s, self.loads)
         self.check_keys_reuse(s, self.json.decoder.JSONDecoder().decode)
 
+    def test_compact(self):
+        s = ('[{"id": 1000, "price": 1.5, "tags": [{"n": 1.5}]},'
+             ' {"id": 1000, "price": 1.5, "tags": []},'
+             ' {"price": 2.5, "id": 1001},'
+             ' {"id": 1002, "price": 1.5, "extra": null}, {}]')
+        rval = self.loads(s, compact=True)
+        self.assertEqual(rval, self.loads(s))
+        self.assertEqual([list(d) for d in rval],
+                         [['id', 'price', 'tags'], ['id', 'price', 'tags'],
+                          ['price', 'id'], ['id', 'price', 'extra'], []])
+        self.assertIs(rval[0]['id'], rval[1]['id'])
+        self.assertIs(rval[0]['price'], rval[3]['price'])
+        self.assertIs(rval[0]['tags'][0]['n'], rval[1]['price'])
+        self.assertEqual(self.loads('[1.5, 1.5]', compact=True,
+                                    parse_float=decimal.Decimal),
+                         [decimal.Decimal('1.5')] * 2)
+        # The decoded dicts are independent
+        rval[1]['new'] = 1
+        del rval[0]['id']
+        rval[3].clear()
+        self.assertEqual(rval[:4], [{'price': 1.5, 'tags': [{'n': 1.5}]},
+                                    {'id': 1000, 'price': 1.5, 'tags': [],
+                                     'new': 1},
+                                    {'price': 2.5, 'id': 1001}, {}])
+
     def test_extra_data(self):
         s = '[1, 2, 3]5'
         msg = 'Extra data'
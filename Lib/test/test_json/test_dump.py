@@ -9,6 +9,35 @@ class TestDump:
         self.json.dump({}, sio)
         self.assertEqual(sio.getvalue(), '{}')
 
+    def test_dump_chunks(self):
+        obj = [{'key': i, 'value': 'x' * (i % 10)} for i in range(10000)]
+        chunks = []
+        class File:
+            write = chunks.append
+        self.json.dump(obj, File())
+        self.assertEqual(''.join(chunks), self.dumps(obj))
+        chunks.clear()
+        self.json.dump(obj, File(), indent=1)
+        self.assertEqual(''.join(chunks), self.dumps(obj, indent=1))
+
+    def test_dump_write_error(self):
+        class File:
+            written = 0
+            def write(self, chunk):
+                self.written += len(chunk)
+                if self.written > 1000:
+                    raise OSError
+        with self.assertRaises(OSError):
+            self.json.dump(list(range(10000)), File())
+
+    def test_dump_iterencode_override(self):
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield 'overridden'
+        sio = StringIO()
+        self.json.dump([1], sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), 'overridden')
+
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
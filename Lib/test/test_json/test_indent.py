@@ -62,6 +62,34 @@ class TestIndent:
         # indent=None is more compact
         check(None, '{"3": 1}')
 
+    def test_indent_nested(self):
+        h = {'a': [1, [2, [3, []]], {'b': {'c': {}}}], 'd': 'e'}
+        expect = textwrap.dedent("""\
+        {
+          "a": [
+            1,
+            [
+              2,
+              [
+                3,
+                []
+              ]
+            ],
+            {
+              "b": {
+                "c": {}
+              }
+            }
+          ],
+          "d": "e"
+        }""")
+        self.assertEqual(self.dumps(h, indent=2), expect)
+        self.assertEqual(self.dumps(h, indent=' ' * 2), expect)
+        self.assertEqual(self.dumps(h, indent=-1), expect.replace('  ', ''))
+        sio = StringIO()
+        self.json.dump(h, sio, indent=2)
+        self.assertEqual(sio.getvalue(), expect)
+
 
 class TestPyIndent(TestIndent, PyTest): pass
 class TestCIndent(TestIndent, CTest): pass
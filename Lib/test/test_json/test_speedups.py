@@ -1,3 +1,4 @@
+import sys
 from test.test_json import CTest
 
 
@@ -17,6 +18,14 @@ class TestDecode(CTest):
     def test_make_scanner(self):
         self.assertRaises(AttributeError, self.json.scanner.c_make_scanner, 1)
 
+    def test_compact_shared_keys(self):
+        s = self.dumps([{'key%d' % k: i for k in range(20)}
+                        for i in range(3)])
+        rval = self.loads(s)
+        compact = self.loads(s, compact=True)
+        self.assertEqual(compact, rval)
+        self.assertLess(sys.getsizeof(compact[2]), sys.getsizeof(rval[2]))
+
     def test_make_encoder(self):
         self.assertRaises(TypeError, self.json.encoder.c_make_encoder,
             (True, False),
@@ -0,0 +1,169 @@
+from decimal import Decimal
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+DOCUMENT = ('{"a": [1, {"b": 2.5e+10, "c": null}, "x\\u00e9", true, []],'
+            ' "d": {}, "e": -Infinity}')
+
+EVENTS = [
+    ('', 'start_map', None),
+    ('', 'map_key', 'a'),
+    ('a', 'start_array', None),
+    ('a.item', 'number', 1),
+    ('a.item', 'start_map', None),
+    ('a.item', 'map_key', 'b'),
+    ('a.item.b', 'number', 2.5e10),
+    ('a.item', 'map_key', 'c'),
+    ('a.item.c', 'null', None),
+    ('a.item', 'end_map', None),
+    ('a.item', 'string', 'x\xe9'),
+    ('a.item', 'boolean', True),
+    ('a.item', 'start_array', None),
+    ('a.item', 'end_array', None),
+    ('a', 'end_array', None),
+    ('', 'map_key', 'd'),
+    ('d', 'start_map', None),
+    ('d', 'end_map', None),
+    ('', 'map_key', 'e'),
+    ('e', 'number', float('-inf')),
+    ('', 'end_map', None),
+]
+
+INVALID = [
+    '', ' ', '[1, 2', '[1,]', '[1 2]', '[1] x', '"abc', '[1.x]',
+    '{"a" 1}', '{"a": 1,}', '{1: 2}', '\n\n  [1, 2,\n tru]', '﻿[]',
+]
+
+
+class TestIterdecode:
+    def iterdecode(self, s, chunk_size):
+        return list(self.json.JSONDecoder().iterdecode(StringIO(s),
+                                                        chunk_size))
+
+    def test_array(self):
+        doc = self.dumps([{'k': i, 's': 'v' * (i % 7), 'f': i / 3}
+                          for i in range(200)])
+        for chunk_size in (1, 2, 5, 64, 100000):
+            self.assertEqual(self.iterdecode(doc, chunk_size),
+                             self.loads(doc))
+        self.assertEqual(self.iterdecode(' [ ] ', 1), [])
+        self.assertEqual(self.iterdecode('[[1, 2], [3]]', 1), [[1, 2], [3]])
+
+    def test_not_array(self):
+        for doc in ('1234', ' 1.5e+10 ', '"abc"', '{"a": [1]}', 'null'):
+            for chunk_size in (1, 3, 100):
+                self.assertEqual(self.iterdecode(doc, chunk_size),
+                                 [self.loads(doc)])
+
+    def test_bytes(self):
+        doc = DOCUMENT.encode('utf-16')
+        result = list(self.json.JSONDecoder().iterdecode(BytesIO(doc), 3))
+        self.assertEqual(result, [self.loads(DOCUMENT)])
+
+    def test_incremental(self):
+        # Items are decoded before the end of the document is read.
+        items = []
+        def read(size):
+            items.append(None)
+            return '[1, 2, 3' if len(items) == 1 else ''
+        file = StringIO()
+        file.read = read
+        iterator = self.json.JSONDecoder().iterdecode(file, 100)
+        self.assertEqual(next(iterator), 1)
+        self.assertEqual(next(iterator), 2)
+        with self.assertRaises(self.JSONDecodeError):
+            list(iterator)
+
+    def test_invalid(self):
+        for doc in INVALID:
+            with self.assertRaises(self.JSONDecodeError) as expected:
+                self.loads(doc)
+            for chunk_size in (1, 4, 100):
+                with self.subTest(doc=doc, chunk_size=chunk_size):
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        self.iterdecode(doc, chunk_size)
+                    self.assertEqual(str(cm.exception),
+                                     str(expected.exception))
+                    self.assertEqual(cm.exception.lineno,
+                                     expected.exception.lineno)
+                    self.assertEqual(cm.exception.colno,
+                                     expected.exception.colno)
+                    self.assertEqual(cm.exception.pos,
+                                     expected.exception.pos)
+
+
+class TestIterparse:
+    def test_events(self):
+        for chunk_size in (1, 2, 3, 7, 1000):
+            self.assertEqual(list(self.json.iterparse(
+                StringIO(DOCUMENT), chunk_size=chunk_size)), EVENTS)
+        self.assertEqual(list(self.json.iterparse(
+            BytesIO(DOCUMENT.encode()), chunk_size=5)), EVENTS)
+
+    def test_scalar(self):
+        self.assertEqual(list(self.json.iterparse(StringIO(' "x" '))),
+                         [('', 'string', 'x')])
+        self.assertEqual(list(self.json.iterparse(StringIO('[]'))),
+                         [('', 'start_array', None), ('', 'end_array', None)])
+
+    def test_parse_float(self):
+        events = list(self.json.iterparse(StringIO('[1.5, 2]'),
+                                          parse_float=Decimal))
+        self.assertEqual(events[1], ('item', 'number', Decimal('1.5')))
+        self.assertIs(type(events[1][2]), Decimal)
+
+    def test_invalid(self):
+        for doc in INVALID:
+            with self.assertRaises(self.JSONDecodeError) as expected:
+                self.loads(doc)
+            for chunk_size in (1, 100):
+                with self.subTest(doc=doc, chunk_size=chunk_size):
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        list(self.json.iterparse(StringIO(doc),
+                                                 chunk_size=chunk_size))
+                    self.assertEqual(str(cm.exception),
+                                     str(expected.exception))
+
+
+class TestLines:
+    def test_roundtrip(self):
+        objs = [1, 'x', {'a': [1, 2], 'b': None}, [], {}]
+        file = StringIO()
+        self.json.dump_lines(objs, file)
+        self.assertEqual(file.getvalue(),
+                         '1\n"x"\n{"a": [1, 2], "b": null}\n[]\n{}\n')
+        file.seek(0)
+        self.assertEqual(list(self.json.load_lines(file)), objs)
+
+    def test_dump_lines_arguments(self):
+        file = StringIO()
+        self.json.dump_lines([{'b': 1, 'a': 2}], file, sort_keys=True,
+                             separators=(',', ':'))
+        self.assertEqual(file.getvalue(), '{"a":2,"b":1}\n')
+        with self.assertRaises(TypeError):
+            self.json.dump_lines([1], file, indent=2)
+
+    def test_load_lines(self):
+        lines = [b'{"a": 1}\n', b'\n', b'  \n', b'[1.5]\r\n', b'"\xc3\xa9"']
+        self.assertEqual(list(self.json.load_lines(lines)),
+                         [{'a': 1}, [1.5], '\xe9'])
+        self.assertEqual(list(self.json.load_lines(['1.5'],
+                                                   parse_float=Decimal)),
+                         [Decimal('1.5')])
+
+    def test_load_lines_error(self):
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            list(self.json.load_lines(StringIO('1\n2\n{"a" 1}\n')))
+        self.assertEqual(cm.exception.msg, "Expecting ':' delimiter")
+        self.assertEqual(cm.exception.lineno, 3)
+        self.assertEqual(cm.exception.colno, 6)
+        self.assertEqual(cm.exception.pos, 9)
+
+
+class TestPyIterdecode(TestIterdecode, PyTest): pass
+class TestCIterdecode(TestIterdecode, CTest): pass
+class TestPyIterparse(TestIterparse, PyTest): pass
+class TestCIterparse(TestIterparse, CTest): pass
+class TestPyLines(TestLines, PyTest): pass
+class TestCLines(TestLines, CTest): pass
@@ -29,6 +29,10 @@ class CompressorDecompressorTestCase(unittest.TestCase):
         # Can't specify a preset and a custom filter chain at the same time.
         with self.assertRaises(ValueError):
             LZMACompressor(preset=7, filters=[{"id": lzma.FILTER_LZMA2}])
+        self.assertRaises(ValueError, LZMACompressor, threads=-1)
+        # Only FORMAT_XZ supports several threads.
+        with self.assertRaises(ValueError):
+            LZMACompressor(lzma.FORMAT_ALONE, threads=2)
 
         self.assertRaises(TypeError, LZMADecompressor, ())
         self.assertRaises(TypeError, LZMADecompressor, memlimit=b"qw")
@@ -277,6 +281,16 @@ class CompressorDecompressorTestCase(unittest.TestCase):
         lzd = LZMADecompressor()
         self._test_decompressor(lzd, cdata, lzma.CHECK_CRC64)
 
+    def test_roundtrip_xz_threads(self):
+        for threads in (0, 2):
+            lzc = LZMACompressor(threads=threads)
+            cdata = lzc.compress(INPUT) + lzc.flush()
+            lzd = LZMADecompressor()
+            self._test_decompressor(lzd, cdata, lzma.CHECK_CRC64)
+        lzc = LZMACompressor(filters=FILTERS_RAW_1, threads=2)
+        cdata = lzc.compress(INPUT) + lzc.flush()
+        self.assertEqual(lzma.decompress(cdata), INPUT)
+
     def test_roundtrip_alone(self):
         lzc = LZMACompressor(lzma.FORMAT_ALONE)
         cdata = lzc.compress(INPUT) + lzc.flush()
@@ -892,6 +906,41 @@ class FileTestCase(unittest.TestCase):
         with LZMAFile(BytesIO(COMPRESSED_BOGUS)) as f:
             self.assertRaises(LZMAError, f.read)
 
+    def test_read_threads(self):
+        # The streams are decompressed in parallel.
+        for threads in (0, 2, 3):
+            with LZMAFile(BytesIO(COMPRESSED_XZ * 3), threads=threads) as f:
+                self.assertEqual(f.read(), INPUT * 3)
+        # So are the blocks of a stream compressed by several threads.
+        data = b"".join(b"%d\n" % i for i in range(400000))
+        compressed = lzma.compress(data, preset=0, threads=2)
+        self.assertGreater(len(lzma._read_xz_blocks(BytesIO(compressed))), 1)
+        with LZMAFile(BytesIO(compressed + COMPRESSED_XZ), threads=2) as f:
+            self.assertIsInstance(f._buffer.raw, lzma._ParallelReader)
+            self.assertEqual(f.read(), data + INPUT)
+            f.seek(len(data) - 10)
+            self.assertEqual(f.read(20), data[-10:] + INPUT[:10])
+            f.seek(5)
+            self.assertEqual(f.read(5), data[5:10])
+        # Other files are decompressed sequentially.
+        for compressed in (COMPRESSED_XZ, COMPRESSED_ALONE,
+                           COMPRESSED_XZ * 2 + b"trailing"):
+            with LZMAFile(BytesIO(compressed), threads=2) as f:
+                self.assertIsInstance(f._buffer.raw,
+                                      _compression.DecompressReader)
+                self.assertNotIsInstance(f._buffer.raw, lzma._ParallelReader)
+        with LZMAFile(BytesIO(COMPRESSED_XZ * 2 + b"trailing"),
+                      threads=2) as f:
+            self.assertEqual(f.read(), INPUT * 2)
+        with self.assertRaises(ValueError):
+            LZMAFile(BytesIO(COMPRESSED_XZ), threads=-1)
+
+    def test_read_threads_bad_data(self):
+        compressed = bytearray(COMPRESSED_XZ * 3)
+        compressed[len(COMPRESSED_XZ) + 100] ^= 1
+        with LZMAFile(BytesIO(compressed), threads=2) as f:
+            self.assertRaises(LZMAError, f.read)
+
     def test_read1(self):
         with LZMAFile(BytesIO(COMPRESSED_XZ)) as f:
             blocks = []
@@ -10,6 +10,7 @@ import io
 import tempfile
 from test import support
 import unittest
+from unittest import mock
 import textwrap
 import mailbox
 import glob
@@ -1034,6 +1035,16 @@ class _TestMboxMMDF(_TestSingleFile):
             self.assertEqual(contents, f.read())
         self._box = self._factory(self._path)
 
+    def test_get_headers(self):
+        key = self._box.add(_sample_message)
+        self._box.add(self._template % 0)
+        msg = self._box.get_headers(key)
+        self.assertIsInstance(msg, self._box._message_factory)
+        self.assertEqual(msg.items(), self._box.get_message(key).items())
+        self.assertEqual(msg.get_from(), self._box.get_message(key).get_from())
+        self.assertEqual(msg.get_payload(), '')
+        self.assertRaises(KeyError, self._box.get_headers, 1234)
+
     @unittest.skipUnless(hasattr(os, 'fork'), "Test needs fork().")
     @unittest.skipUnless(hasattr(socket, 'socketpair'), "Test needs socketpair().")
     def test_lock_conflict(self):
@@ -1133,6 +1144,80 @@ class TestMbox(_TestMboxMMDF, unittest.TestCase):
             data = f.read()
             self.assertEqual(data[-3:], '0\n\n')
 
+    def test_message_boundaries(self):
+        # Messages start at "From " lines and end before the preceding
+        # empty line, if any.
+        self._box.close()
+        with open(self._path, 'wb') as f:
+            f.write(b'junk\nFrom a\n\nFrom b\nbody\nFrom c\n\n\n'
+                    b'From d\nFrom x\n>From y\nlast'.replace(
+                        b'\n', os.linesep.encode()))
+        self._box = self._factory(self._path)
+        self.assertEqual([self._box.get_bytes(key, True)
+                          for key in self._box.iterkeys()],
+                         [b'From a\n', b'From b\nbody\n', b'From c\n\n',
+                          b'From d\n', b'From x\n>From y\nlast'])
+
+    def test_without_mmap(self):
+        # The mailbox is read when the mmap module is not available.
+        values = [self._template % i for i in range(3)]
+        for value in values:
+            self._box.add(value)
+        self._box.close()
+        with support.swap_attr(mailbox, 'mmap', None):
+            self._box = mailbox.mbox(self._path)
+            self.assertEqual([self._box.get_string(key) for key in range(3)],
+                             values)
+
+    def test_toc_cache(self):
+        values = [self._template % i for i in range(3)]
+        for value in values:
+            self._box.add(value)
+        self._box.close()
+        cache = self._path + '.toc'
+        self.addCleanup(support.unlink, cache)
+        self._box = mailbox.mbox(self._path, toc_cache=cache)
+        self.assertEqual(len(self._box), 3)
+        toc = self._box._toc
+        self._box.close()
+        self.assertTrue(os.path.exists(cache))
+
+        # The cache is used instead of scanning the mailbox.
+        self._box = mailbox.mbox(self._path, toc_cache=cache)
+        with mock.patch.object(mailbox.mbox, '_scan_toc',
+                               side_effect=AssertionError):
+            self.assertEqual(len(self._box), 3)
+        self.assertEqual(self._box._toc, toc)
+        self.assertEqual([self._box.get_string(key) for key in range(3)],
+                         values)
+
+        # The cache is updated when the mailbox is modified.
+        self._box.add(self._template % 3)
+        self._box.close()
+        self._box = mailbox.mbox(self._path, toc_cache=cache)
+        self.assertEqual(len(self._box), 4)
+        self._box.close()
+        self._box = mailbox.mbox(self._path, toc_cache=cache)
+        with mock.patch.object(mailbox.mbox, '_scan_toc',
+                               side_effect=AssertionError):
+            self.assertEqual(len(self._box), 4)
+
+    def test_toc_cache_invalid(self):
+        self._box.add(self._template % 0)
+        self._box.close()
+        cache = self._path + '.toc'
+        self.addCleanup(support.unlink, cache)
+        for data in ('', 'garbage', '[]', '{"version": 1}',
+                     '{"version": 1, "size": 0, "mtime": 0, '
+                     '"starts": [0], "stops": [10]}'):
+            with self.subTest(data=data):
+                with open(cache, 'w') as f:
+                    f.write(data)
+                self._box = mailbox.mbox(self._path, toc_cache=cache)
+                self.assertEqual(self._box.get_string(0),
+                                 self._template % 0)
+                self._box.close()
+
 
 class TestMMDF(_TestMboxMMDF, unittest.TestCase):
 
@@ -1264,6 +1264,21 @@ class TestShutil(unittest.TestCase):
     def test_unpack_archive_zip(self):
         self.check_unpack_archive('zip')
 
+    @support.requires_zlib
+    def test_unpack_archive_codec(self):
+        # The compression formats registered in _compression are used as
+        # "<name>tar" formats.
+        import _compression
+        import gzip
+        _compression.register_codec('gz2', gzip.open,
+                                    magic=[b'\x1f\x8b\x08'],
+                                    extensions=['.gz2'])
+        self.addCleanup(_compression.unregister_codec, 'gz2')
+        self.assertIn(('gz2tar', "gz2'ed tar-file"), get_archive_formats())
+        self.assertIn(('gz2tar', ['.tar.gz2'], "gz2'ed tar-file"),
+                      get_unpack_formats())
+        self.check_unpack_archive('gz2tar')
+
     def test_unpack_registry(self):
 
         formats = get_unpack_formats()
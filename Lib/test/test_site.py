@@ -8,6 +8,7 @@ import unittest
 import test.support
 from test.support import captured_stderr, TESTFN, EnvironmentVarGuard
 import builtins
+import marshal
 import os
 import sys
 import re
@@ -17,6 +18,7 @@ import urllib.error
 import shutil
 import subprocess
 import sysconfig
+import time
 from copy import copy
 
 # These tests are not particularly useful if Python was invoked with -S.
@@ -57,8 +59,10 @@ class HelperFunctionsTests(unittest.TestCase):
         site.USER_SITE = self.old_site
         site.PREFIXES = self.old_prefixes
         sysconfig._CONFIG_VARS = self.original_vars
-        sysconfig._CONFIG_VARS.clear()
-        sysconfig._CONFIG_VARS.update(self.old_vars)
+        # site does not compute the configuration variables at startup
+        if sysconfig._CONFIG_VARS is not None:
+            sysconfig._CONFIG_VARS.clear()
+            sysconfig._CONFIG_VARS.update(self.old_vars)
 
     def test_makepath(self):
         # Test makepath() have an absolute path for its first return value
@@ -230,6 +234,22 @@ class HelperFunctionsTests(unittest.TestCase):
         self.assertEqual(site.USER_SITE, user_site)
         self.assertTrue(user_site.startswith(site.USER_BASE), user_site)
 
+    def test_getusersitepackages_sysconfig(self):
+        # site computes the user site-packages directory without importing
+        # sysconfig; check that both agree.
+        site.USER_SITE = None
+        site.USER_BASE = None
+        sysconfig._CONFIG_VARS = None
+        with EnvironmentVarGuard() as environ:
+            environ['PYTHONUSERBASE'] = os.path.abspath('xoxo')
+            self.assertEqual(site.getuserbase(),
+                             sysconfig.get_config_var('userbase'))
+            if sys.platform == 'darwin':
+                return
+            self.assertEqual(site.getusersitepackages(),
+                             sysconfig.get_path('purelib',
+                                                '%s_user' % os.name))
+
     def test_getsitepackages(self):
         site.PREFIXES = ['xoxo']
         dirs = site.getsitepackages()
@@ -313,6 +333,166 @@ class PthFile(object):
             os.rmdir(self.good_dir_path)
         if os.path.exists(self.bad_dir_path):
             os.rmdir(self.bad_dir_path)
+        cache_path = site._pthcachepath(self.base_dir)
+        if cache_path is not None:
+            test.support.unlink(cache_path)
+            try:
+                os.rmdir(os.path.dirname(cache_path))
+            except OSError:
+                pass
+
+@unittest.skipIf(sys.implementation.cache_tag is None,
+                 'requires sys.implementation.cache_tag to not be None')
+class PthCacheTests(unittest.TestCase):
+    """Test the cache of the .pth files of a site directory."""
+
+    def setUp(self):
+        self.sys_path = sys.path[:]
+        self.sitedir = os.path.realpath(test.support.TESTFN)
+        os.mkdir(self.sitedir)
+        self.addCleanup(test.support.rmtree, self.sitedir)
+        self.cache_path = site._pthcachepath(self.sitedir)
+        os.mkdir(os.path.dirname(self.cache_path))
+        self.mtime = int(time.time()) - 100
+
+    def tearDown(self):
+        sys.path[:] = self.sys_path
+
+    def make_pth(self, name, *dirs):
+        for dir in dirs:
+            os.makedirs(os.path.join(self.sitedir, dir), exist_ok=True)
+        with open(os.path.join(self.sitedir, name), 'w') as f:
+            f.write('# comment\n')
+            for dir in dirs:
+                f.write(dir + '\n')
+        # The cache is not written for files modified too recently, whose
+        # modification time could be the same after a later change.
+        self.mtime += 1
+        for name in os.listdir(self.sitedir) + ['']:
+            os.utime(os.path.join(self.sitedir, name),
+                     (self.mtime, self.mtime))
+
+    def addsitedir(self):
+        sys.path[:] = self.sys_path
+        site.addsitedir(self.sitedir, set())
+        return sys.path[len(self.sys_path):]
+
+    def expected(self, *dirs):
+        return [self.sitedir] + [os.path.join(self.sitedir, dir)
+                                 for dir in dirs]
+
+    def test_cache_written(self):
+        self.make_pth('a.pth', 'spam')
+        with test.support.swap_attr(sys, 'dont_write_bytecode', False):
+            self.assertEqual(self.addsitedir(), self.expected('spam'))
+        self.assertTrue(os.path.exists(self.cache_path))
+        with open(self.cache_path, 'rb') as f:
+            version, mtime, entries = marshal.loads(f.read())
+        self.assertEqual(version, site._PTH_CACHE_VERSION)
+        self.assertEqual(mtime, os.stat(self.sitedir).st_mtime_ns)
+        self.assertEqual([entry[0] for entry in entries], ['a.pth'])
+        self.assertEqual(entries[0][3], [(1, 'spam\n')])
+
+    def test_cache_used(self):
+        os.mkdir(os.path.join(self.sitedir, 'eggs'))
+        self.make_pth('a.pth', 'spam')
+        with test.support.swap_attr(sys, 'dont_write_bytecode', False):
+            self.addsitedir()
+        # Rewrite the cache with different contents but the same metadata;
+        # a valid cache is used without reading the .pth files.
+        with open(self.cache_path, 'rb') as f:
+            version, mtime, entries = marshal.loads(f.read())
+        entries[0] = entries[0][:3] + ([(1, 'eggs\n')],)
+        with open(self.cache_path, 'wb') as f:
+            f.write(marshal.dumps((version, mtime, entries)))
+        self.assertEqual(self.addsitedir(), self.expected('eggs'))
+
+    def test_cache_invalidated(self):
+        self.make_pth('a.pth', 'spam')
+        with test.support.swap_attr(sys, 'dont_write_bytecode', False):
+            self.addsitedir()
+            # Adding a file.
+            self.make_pth('b.pth', 'eggs')
+            self.assertEqual(self.addsitedir(),
+                             self.expected('spam', 'eggs'))
+            # Changing the contents of a file.
+            self.make_pth('b.pth', 'eggs', 'ham')
+            self.assertEqual(self.addsitedir(),
+                             self.expected('spam', 'eggs', 'ham'))
+            # Removing a file.
+            os.unlink(os.path.join(self.sitedir, 'a.pth'))
+            self.assertEqual(self.addsitedir(),
+                             self.expected('eggs', 'ham'))
+
+    def test_corrupted_cache(self):
+        self.make_pth('a.pth', 'spam')
+        with test.support.swap_attr(sys, 'dont_write_bytecode', False):
+            self.addsitedir()
+            with open(self.cache_path, 'wb') as f:
+                f.write(b'garbage')
+            self.assertEqual(self.addsitedir(), self.expected('spam'))
+
+    def test_recently_modified(self):
+        self.make_pth('a.pth', 'spam')
+        os.utime(self.sitedir)
+        with test.support.swap_attr(sys, 'dont_write_bytecode', False):
+            self.assertEqual(self.addsitedir(), self.expected('spam'))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_dont_write_bytecode(self):
+        self.make_pth('a.pth', 'spam')
+        with test.support.swap_attr(sys, 'dont_write_bytecode', True):
+            self.assertEqual(self.addsitedir(), self.expected('spam'))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_no_pth_files(self):
+        # No cache, nor __pycache__ directory, is created for a site
+        # directory without .pth files.
+        os.rmdir(os.path.dirname(self.cache_path))
+        with test.support.swap_attr(sys, 'dont_write_bytecode', False):
+            self.assertEqual(self.addsitedir(), self.expected())
+        self.assertEqual(os.listdir(self.sitedir), [])
+
+    def test_modified_file_rewrites_cache(self):
+        self.make_pth('a.pth', 'spam')
+        with test.support.swap_attr(sys, 'dont_write_bytecode', False):
+            self.addsitedir()
+            # Change the contents of the file without changing the
+            # modification time of the directory.
+            mtime = os.stat(self.sitedir).st_mtime_ns
+            os.makedirs(os.path.join(self.sitedir, 'eggs'))
+            with open(os.path.join(self.sitedir, 'a.pth'), 'w') as f:
+                f.write('eggs\n')
+            os.utime(os.path.join(self.sitedir, 'a.pth'),
+                     (self.mtime + 1, self.mtime + 1))
+            os.utime(self.sitedir, ns=(mtime, mtime))
+            self.assertEqual(self.addsitedir(), self.expected('eggs'))
+        with open(self.cache_path, 'rb') as f:
+            version, mtime, entries = marshal.loads(f.read())
+        self.assertEqual(entries[0][3], [(0, 'eggs\n')])
+
+    def test_addpackage_called(self):
+        # Each .pth file is processed in order by addpackage(), whether the
+        # cache is used or not.
+        self.make_pth('a.pth', 'spam')
+        self.make_pth('b.pth', 'eggs')
+        addpackage = site.addpackage
+        calls = []
+        def record(sitedir, name, known_paths):
+            calls.append((name, sys.path[len(self.sys_path):]))
+            return addpackage(sitedir, name, known_paths)
+        with test.support.swap_attr(sys, 'dont_write_bytecode', False), \
+             test.support.swap_attr(site, 'addpackage', record):
+            for i in range(2):
+                self.assertEqual(self.addsitedir(),
+                                 self.expected('spam', 'eggs'))
+                self.assertTrue(os.path.exists(self.cache_path))
+                self.assertEqual(calls, [
+                    ('a.pth', self.expected()),
+                    ('b.pth', self.expected('spam')),
+                ])
+                del calls[:]
+
 
 class ImportSideEffectTests(unittest.TestCase):
     """Test side-effects from importing 'site'."""
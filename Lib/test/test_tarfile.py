@@ -1,6 +1,7 @@
 import sys
 import os
 import io
+import json
 from hashlib import md5
 from contextlib import contextmanager
 from random import Random
@@ -8,6 +9,7 @@ from random import Random
 import unittest
 import unittest.mock
 import tarfile
+import _compression
 
 from test import support
 from test.support import script_helper
@@ -854,6 +856,84 @@ class MemberReadTest(ReadTest, unittest.TestCase):
         self._test_member(tarinfo, size=7011, chksum=md5_regtype)
 
 
+class GetMemberTest(unittest.TestCase):
+
+    def make_tar(self):
+        fobj = io.BytesIO()
+        with tarfile.open(fileobj=fobj, mode="w") as tar:
+            for name, data in (("a", b"1"), ("dir/b", b"2"), ("a", b"3")):
+                t = tarfile.TarInfo(name)
+                t.size = len(data)
+                tar.addfile(t, io.BytesIO(data))
+            t = tarfile.TarInfo("link")
+            t.type = tarfile.LNKTYPE
+            t.linkname = "./dir/../a"
+            tar.addfile(t)
+            t = tarfile.TarInfo("a")
+            tar.addfile(t)
+            t = tarfile.TarInfo("dir/sym")
+            t.type = tarfile.SYMTYPE
+            t.linkname = "b"
+            tar.addfile(t)
+        fobj.seek(0)
+        tar = tarfile.open(fileobj=fobj)
+        self.addCleanup(tar.close)
+        return tar
+
+    def test_last_occurrence(self):
+        tar = self.make_tar()
+        members = tar.getmembers()
+        self.assertIs(tar.getmember("a"), members[4])
+        self.assertIs(tar.getmember("dir/b"), members[1])
+        self.assertRaises(KeyError, tar.getmember, "b")
+        self.assertRaises(KeyError, tar.getmember, "./a")
+
+    def test_link_target(self):
+        # A hard link refers to the last member before it.
+        tar = self.make_tar()
+        with tar.extractfile("link") as f:
+            self.assertEqual(f.read(), b"3")
+        with tar.extractfile("dir/sym") as f:
+            self.assertEqual(f.read(), b"2")
+
+    def test_incremental(self):
+        tar = self.make_tar()
+        self.assertIs(tar.getmember("link"), tar.members[3])
+        self.assertEqual(len(tar.members), 6)
+
+    def test_changed_members(self):
+        tar = self.make_tar()
+        members = tar.getmembers()
+        self.assertIs(tar.getmember("dir/b"), members[1])
+        members[1].name = "c"
+        self.assertIs(tar.getmember("c"), members[1])
+        self.assertRaises(KeyError, tar.getmember, "dir/b")
+        tar.members = members[:2]
+        self.assertIs(tar.getmember("a"), members[0])
+        del tar.members[1:]
+        self.assertRaises(KeyError, tar.getmember, "c")
+
+    def test_renamed_link_target(self):
+        tar = self.make_tar()
+        with tar.extractfile("dir/sym") as f:
+            self.assertEqual(f.read(), b"2")
+        tar.getmember("dir/b").path = "dir/c"
+        tar.getmember("dir/sym").linkname = "c"
+        with tar.extractfile("dir/sym") as f:
+            self.assertEqual(f.read(), b"2")
+
+    def test_miss_without_scan(self):
+        # Unless a member has been renamed, a missing name is not searched
+        # for by looking at the names of all the members.
+        tar = self.make_tar()
+        self.assertRaises(KeyError, tar.getmember, "b")
+        def getname(tarinfo):
+            self.fail("the name of a member was looked at")
+        with support.swap_attr(tarfile.TarInfo, "name", property(getname)):
+            self.assertRaises(KeyError, tar.getmember, "b")
+            self.assertRaises(KeyError, tar.getmember, "dir/c")
+
+
 class LongnameTest:
 
     def test_read_longname(self):
@@ -2375,6 +2455,159 @@ class Bz2PartialReadTest(Bz2Test, unittest.TestCase):
         self._test_partial_input("r:bz2")
 
 
+class IndexTest(TarTest, unittest.TestCase):
+    # The archive is made of several compressed streams, which the index
+    # allows to start decompressing from.
+
+    def setUp(self):
+        with open(tarname, "rb") as fobj:
+            data = fobj.read()
+        self.chunks = []
+        support.unlink(tmpname)
+        for i in range(0, len(data), 10 * tarfile.RECORDSIZE):
+            with self.open(tmpname, "ab") as fobj:
+                fobj.write(data[i:i + 10 * tarfile.RECORDSIZE])
+            self.chunks.append(os.path.getsize(tmpname))
+        self.addCleanup(support.unlink, tmpname)
+
+    def save_index(self):
+        index = io.StringIO()
+        with tarfile.open(tmpname, "r:" + self.suffix,
+                          encoding="iso8859-1") as tar:
+            tar.save_index(index)
+        index.seek(0)
+        return index
+
+    def test_index(self):
+        index = self.save_index()
+        with tarfile.open(tmpname, "r:" + self.suffix,
+                          encoding="iso8859-1") as tar, \
+             tarfile.open(tmpname, "r:" + self.suffix,
+                          encoding="iso8859-1", index=index) as indexed:
+            self.assertTrue(indexed._loaded)
+            members = tar.getmembers()
+            self.assertEqual(len(indexed.getmembers()), len(members))
+            for tarinfo in reversed(members):
+                other = indexed.getmember(tarinfo.name)
+                for name in tarfile._INDEX_FIELDS:
+                    self.assertEqual(getattr(other, name),
+                                     getattr(tarinfo, name), name)
+                if tarinfo.isreg():
+                    with indexed.extractfile(other) as f:
+                        data = f.read()
+                    with tar.extractfile(tarinfo) as f:
+                        self.assertEqual(data, f.read())
+
+    def test_index_file(self):
+        indexname = tmpname + ".idx"
+        self.addCleanup(support.unlink, indexname)
+        with tarfile.open(tmpname, encoding="iso8859-1") as tar:
+            tar.save_index(indexname)
+            names = tar.getnames()
+        with tarfile.open(tmpname, encoding="iso8859-1",
+                          index=indexname) as tar:
+            self.assertEqual(tar.getnames(), names)
+            with tar.extractfile("ustar/regtype") as f:
+                self.assertEqual(md5sum(f.read()), md5_regtype)
+
+    def test_streams(self):
+        index = self.save_index()
+        streams = json.load(index)["streams"]
+        if self.suffix:
+            self.assertEqual([offset for offset, pos in streams],
+                             self.chunks[:-1])
+        else:
+            self.assertEqual(streams, [])
+
+    def test_mismatch(self):
+        if self.suffix:
+            self.skipTest("compressed archive")
+        index = self.save_index()
+        with open(tmpname, "ab") as fobj:
+            fobj.write(bytes(tarfile.RECORDSIZE))
+        with self.assertRaisesRegex(tarfile.ReadError, "does not match"):
+            tarfile.open(tmpname, "r:", index=index)
+        with self.assertRaisesRegex(tarfile.ReadError, "invalid index"):
+            tarfile.open(tmpname, "r:", index=io.StringIO('{"version": 1}'))
+        with self.assertRaises(ValueError):
+            tarfile.open(tmpname, "a", index=index)
+
+    def test_seek_to_stream(self):
+        if not self.suffix:
+            self.skipTest("uncompressed archive")
+        index = self.save_index()
+        # Corrupt the second stream: the members after it can still be
+        # extracted, as decompression starts after it.
+        with open(tmpname, "r+b") as fobj:
+            fobj.seek(self.chunks[0] + 1)
+            fobj.write(b"\0" * 10)
+        with tarfile.open(tmpname, "r:" + self.suffix, encoding="iso8859-1",
+                          index=index) as tar:
+            tarinfo = tar.getmembers()[-1]
+            self.assertGreater(tarinfo.offset_data,
+                               2 * 10 * tarfile.RECORDSIZE)
+            with tar.extractfile(tarinfo) as f:
+                self.assertEqual(len(f.read()), tarinfo.size)
+
+class GzipIndexTest(GzipTest, IndexTest):
+    pass
+
+class Bz2IndexTest(Bz2Test, IndexTest):
+    pass
+
+class LzmaIndexTest(LzmaTest, IndexTest):
+    pass
+
+
+@unittest.skipUnless(gzip, "gzip not available")
+class CodecTest(unittest.TestCase):
+    # A compression format registered in _compression, here gzip under
+    # another name.
+
+    def setUp(self):
+        _compression.register_codec("gz2", gzip.open, magic=[b"\x1f\x8b\x08"],
+                                    extensions=[".gz2"])
+        self.addCleanup(_compression.unregister_codec, "gz2")
+        self.addCleanup(support.unlink, tmpname)
+
+    def test_write_read(self):
+        for write_mode in ("w:gz2", "x:gz2", "w|gz2"):
+            support.unlink(tmpname)
+            with tarfile.open(tmpname, write_mode) as tar:
+                tar.add(tarname, arcname="foo")
+            with gzip.open(tmpname) as fobj:
+                self.assertEqual(tarfile.open(fileobj=fobj).getnames(),
+                                 ["foo"])
+            for read_mode in ("r:gz2", "r|gz2"):
+                with tarfile.open(tmpname, read_mode) as tar:
+                    self.assertEqual(tar.getnames(), ["foo"])
+                with open(tmpname, "rb") as fobj:
+                    with tarfile.open(fileobj=fobj, mode=read_mode) as tar:
+                        self.assertEqual(tar.getnames(), ["foo"])
+
+    def test_detect(self):
+        # Registered formats are detected by their magic.
+        class TarFile(tarfile.TarFile):
+            OPEN_METH = {"tar": "taropen"}
+        with tarfile.open(tarname) as tar:
+            names = tar.getnames()
+        with TarFile.open(gzipname) as tar:
+            self.assertIsInstance(tar.fileobj, gzip.GzipFile)
+            self.assertEqual(tar.getnames(), names)
+        with TarFile.open(tarname) as tar:
+            self.assertIsInstance(tar.fileobj, io.BufferedReader)
+
+    def test_errors(self):
+        with self.assertRaises(tarfile.ReadError):
+            tarfile.open(tarname, "r:gz2")
+        with self.assertRaises(tarfile.CompressionError):
+            tarfile.open(tmpname, "w:unknown")
+        with self.assertRaises(tarfile.CompressionError):
+            tarfile.open(tmpname, "w|unknown")
+        with self.assertRaises(ValueError):
+            tarfile.open(gzipname, "a:gz2")
+
+
 def root_is_uid_gid_0():
     try:
         import pwd, grp
@@ -352,6 +352,12 @@ class ElementTreeTest(unittest.TestCase):
         for i in range(600): ET.ElementTree(elem).find('./'+str(i))
         self.assertLess(len(ElementPath._cache), 500)
 
+        # The most recently used paths are kept.
+        compiled = ElementPath.compile('./recent')
+        for i in range(600):
+            ET.ElementTree(elem).find('./'+str(i))
+            self.assertIs(ElementPath.compile('./recent'), compiled)
+
     def test_copy(self):
         # Test copy handling (etc).
 
@@ -617,6 +623,64 @@ class ElementTreeTest(unittest.TestCase):
                     'junk after document element: line 1, column 12')
             del cm, it
 
+    def test_iterparse_tag(self):
+        # Elements with the given tags are reported and released.
+        iterparse = ET.iterparse
+
+        source = io.StringIO(
+            "<feed><title>t</title>" +
+            "".join("<item id='%d'><name>%d</name></item>\n" % (i, i)
+                    for i in range(100)) +
+            "</feed>")
+        context = iterparse(source, tag='item')
+        refs = []
+        for action, elem in context:
+            self.assertEqual(action, 'end')
+            self.assertEqual(elem.tag, 'item')
+            self.assertEqual(elem.get('id'), str(len(refs)))
+            self.assertEqual(elem.findtext('name'), str(len(refs)))
+            self.assertEqual(elem.tail, '\n')
+            refs.append(weakref.ref(elem))
+        del elem
+        gc_collect()
+        self.assertEqual(len(refs), 100)
+        self.assertEqual([ref for ref in refs if ref() is not None], [])
+        self.assertEqual(summarize_list(context.root), ['title'])
+
+        source = io.StringIO(
+            "<root><a><b/><c/></a><b><a/></b><d/></root>")
+        context = iterparse(source, ("start", "end"), tag=['a', 'b'])
+        self.assertEqual([(action, elem.tag) for action, elem in context], [
+                ('start', 'a'),
+                ('start', 'b'),
+                ('end', 'b'),
+                ('end', 'a'),
+                ('start', 'b'),
+                ('start', 'a'),
+                ('end', 'a'),
+                ('end', 'b'),
+            ])
+        self.assertEqual(summarize_list(context.root), ['d'])
+
+        # The root element is not released.
+        context = iterparse(io.StringIO("<a><a/></a>"), tag='a')
+        elems = [elem for action, elem in context]
+        self.assertEqual(len(elems), 2)
+        self.assertIs(elems[1], context.root)
+        self.assertEqual(len(context.root), 0)
+
+        context = iterparse(SIMPLE_NS_XMLFILE, ("start-ns", "end"),
+                            tag='{namespace}element')
+        self.assertEqual([(action, elem.tag) if action == "end"
+                                             else (action, elem)
+                          for action, elem in context], [
+                ('start-ns', ('', 'namespace')),
+                ('end', '{namespace}element'),
+                ('end', '{namespace}element'),
+            ])
+        self.assertEqual(summarize_list(context.root),
+                         ['{namespace}empty-element'])
+
     def test_writefile(self):
         elem = ET.Element("tag")
         elem.text = "text"
@@ -1164,6 +1228,22 @@ class XMLPullParserTest(unittest.TestCase):
         self.assert_event_tags(parser, [('start', 'foo'), ('end', 'foo')])
 
 
+    def test_events_tag(self):
+        parser = ET.XMLPullParser(events=('start', 'end'), tag='element')
+        self._feed(parser, "<root>\n")
+        self.assert_event_tags(parser, [])
+        self._feed(parser, "<element>text<element/></element>")
+        self.assert_event_tags(parser, [
+            ('start', 'element'),
+            ('start', 'element'),
+            ('end', 'element'),
+            ('end', 'element'),
+            ])
+        self._feed(parser, "<empty-element/></root>")
+        self.assert_event_tags(parser, [])
+        root = parser._close_and_return_root()
+        self.assertEqual(summarize_list(root), ['empty-element'])
+
     def test_unknown_event(self):
         with self.assertRaises(ValueError):
             ET.XMLPullParser(events=('start', 'end', 'bogus'))
@@ -2106,6 +2186,69 @@ class ElementFindTest(unittest.TestCase):
         with self.assertRaisesRegex(SyntaxError, 'cannot use absolute path'):
             e.findall('/tag')
 
+    def test_compile(self):
+        from xml.etree import ElementPath
+        e = ET.XML(SAMPLE_XML)
+        path = ElementPath.compile('.//tag[@class="b"]')
+        self.assertIs(ElementPath.compile(path), path)
+        self.assertEqual(path.path, './/tag[@class="b"]')
+        self.assertEqual(summarize_list(path.findall(e)), ['tag'] * 2)
+        self.assertEqual(summarize_list(path.iterfind(e)), ['tag'] * 2)
+        self.assertIs(path.find(e), e[1])
+        self.assertEqual(path.findtext(e[2]), 'subtext')
+        self.assertEqual(path.findtext(e[0], 'default'), 'default')
+        self.assertIs(e.find(path), e[1])
+        self.assertEqual(summarize_list(e.findall(path)), ['tag'] * 2)
+        self.assertEqual(summarize_list(e.iterfind(path)), ['tag'] * 2)
+        self.assertEqual(e.findtext(path), '')
+        self.assertIs(ET.ElementTree(e).find(path), e[1])
+        self.assertIs(ElementPath.compile('.').find(e), e)
+        self.assertIs(ElementPath.compile('./tag/.').find(e), e[0])
+        with self.assertRaises(ValueError):
+            e.find(path, {'x': 'X'})
+        with self.assertRaisesRegex(SyntaxError, 'cannot use absolute path'):
+            ElementPath.compile('/tag')
+
+        e = ET.XML(SAMPLE_XML_NS)
+        path = ElementPath.compile('.//ns:tag', {'ns': 'http://effbot.org/ns'})
+        self.assertEqual(len(path.findall(e)), 3)
+        self.assertEqual(len(e.findall(path)), 3)
+
+    def test_attribute_index(self):
+        e = ET.XML(SAMPLE_XML)
+        e[2] = ET.XML(SAMPLE_SECTION)
+        e.set('class', 'b')
+        tree = ET.ElementTree(e)
+        paths = ['.//tag[@class="b"]', './/*[@class="b"]',
+                 './/tag[@class="b"][@id]', './/tag[@class="b"]/..',
+                 './/tag[@class="c"]', './/*[@id="inner"]',
+                 'section/tag', './/tag']
+        expected = [tree.findall(path) for path in paths]
+        tree.create_index('class')
+        tree.create_index('id')
+        for path, elems in zip(paths, expected):
+            with self.subTest(path=path):
+                self.assertEqual(tree.findall(path), elems)
+                self.assertEqual(list(tree.iterfind(path)), elems)
+                self.assertIs(tree.find(path), elems[0] if elems else None)
+        self.assertEqual(tree.findtext('.//tag[@id="inner"]'), 'subtext')
+        self.assertEqual(tree.findtext('.//tag[@id="x"]', 'default'),
+                         'default')
+
+        # The index is used instead of iterating over the tree.
+        found = tree.findall('.//tag[@class="a"]')
+        e.remove(found[0])
+        self.assertEqual(tree.findall('.//tag[@class="a"]'), found)
+        tree.create_index('class')
+        self.assertEqual(tree.findall('.//tag[@class="a"]'), [])
+        tree.drop_index('class')
+        self.assertEqual(tree.findall('.//tag[@class="b"]'), expected[0])
+        with self.assertRaises(KeyError):
+            tree.drop_index('class')
+        tree._setroot(ET.XML('<root><tag id="inner"/></root>'))
+        self.assertEqual(summarize_list(tree.findall('.//tag[@id="inner"]')),
+                         ['tag'])
+
     def test_find_through_ElementTree(self):
         e = ET.XML(SAMPLE_XML)
         self.assertEqual(ET.ElementTree(e).find('tag').tag, 'tag')
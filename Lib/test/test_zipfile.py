@@ -7,6 +7,10 @@ import time
 import struct
 import zipfile
 import unittest
+try:
+    import threading
+except ImportError:
+    threading = None
 
 
 from tempfile import TemporaryFile
@@ -950,6 +954,40 @@ class ExtractTests(unittest.TestCase):
         # remove the test file subdirectories
         rmtree(os.path.join(os.getcwd(), 'ziptest2dir'))
 
+    @unittest.skipUnless(threading, 'requires threading')
+    def test_extract_all_workers(self):
+        with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            zipfp.writestr('ziptest2dir/', '')
+            for fpath, fdata in SMALL_TEST_DATA:
+                zipfp.writestr(fpath, fdata)
+            for i in range(20):
+                zipfp.writestr('ziptest2dir/many/%d' % i, str(i) * 1000)
+            with check_warnings(('', UserWarning)):
+                zipfp.writestr('_ziptest1', 'duplicate')
+
+        for workers in (0, 4):
+            with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                zipfp.extractall(TESTFNDIR, workers=workers)
+            self.check_file(os.path.join(TESTFNDIR, '_ziptest1'),
+                            b'duplicate')
+            for fpath, fdata in SMALL_TEST_DATA[1:]:
+                self.check_file(os.path.join(TESTFNDIR, fpath),
+                                fdata.encode())
+            for i in range(20):
+                self.check_file(os.path.join(TESTFNDIR, 'ziptest2dir',
+                                             'many', str(i)),
+                                str(i).encode() * 1000)
+            rmtree(TESTFNDIR)
+
+        with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+            zipfp.extractall(TESTFNDIR, ['_ziptest1'], workers=2)
+            self.assertEqual(os.listdir(TESTFNDIR), ['_ziptest1'])
+            with self.assertRaises(KeyError):
+                zipfp.extractall(TESTFNDIR, ['missing'], workers=2)
+            with self.assertRaises(ValueError):
+                zipfp.extractall(TESTFNDIR, workers=-1)
+        rmtree(TESTFNDIR)
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -1492,6 +1530,75 @@ class OtherTests(unittest.TestCase):
         unlink(TESTFN2)
 
 
+class LazyTests(unittest.TestCase):
+    def make_test_archive(self, f):
+        with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            for i in range(50):
+                zipfp.writestr('dir%d/member%d' % (i % 3, i), b'data%d' % i)
+            zipfp.writestr('caf\xe9', b'utf-8')
+            zinfo = zipfile.ZipInfo()
+            zinfo.filename = 'null\0byte'
+            zipfp.writestr(zinfo, b'null')
+            with check_warnings(('', UserWarning)):
+                zipfp.writestr('dir1/member1', b'duplicate')
+
+    def test_read(self):
+        for f in get_files(self):
+            self.make_test_archive(f)
+            with zipfile.ZipFile(f, "r") as zipfp:
+                expected = zipfp.infolist()
+            with zipfile.ZipFile(f, "r", lazy=True) as zipfp:
+                self.assertEqual(zipfp.read('dir2/member5'), b'data5')
+                self.assertEqual(zipfp.read('dir1/member1'), b'duplicate')
+                self.assertEqual(zipfp.read('caf\xe9'), b'utf-8')
+                self.assertEqual(zipfp.read('null'), b'null')
+                self.assertRaises(KeyError, zipfp.getinfo, 'dir2/member6')
+                self.assertRaises(KeyError, zipfp.getinfo, 'null\0byte')
+                zinfo = zipfp.getinfo('dir0/member3')
+                self.assertIs(zipfp.getinfo('dir0/member3'), zinfo)
+                self.assertEqual(zinfo.header_offset,
+                                 expected[3].header_offset)
+                # All the entries are decoded by infolist().
+                infolist = zipfp.infolist()
+                self.assertEqual([x.filename for x in infolist],
+                                 [x.filename for x in expected])
+                self.assertIs(infolist[3], zinfo)
+                self.assertIs(zipfp.getinfo('dir0/member3'), zinfo)
+                self.assertEqual(zipfp.read('dir1/member1'), b'duplicate')
+
+    def test_closed(self):
+        self.make_test_archive(TESTFN2)
+        zipfp = zipfile.ZipFile(TESTFN2, "r", lazy=True)
+        zipfp.getinfo('dir0/member0')
+        zipfp.close()
+        self.assertRaises(ValueError, zipfp.getinfo, 'dir0/member0')
+        self.assertRaises(ValueError, zipfp.namelist)
+        # Once all the entries are decoded, they are kept.
+        with zipfile.ZipFile(TESTFN2, "r", lazy=True) as zipfp:
+            names = zipfp.namelist()
+        self.assertEqual(zipfp.namelist(), names)
+
+    def test_bad_central_directory(self):
+        self.make_test_archive(TESTFN2)
+        with open(TESTFN2, 'r+b') as f:
+            with zipfile.ZipFile(f) as zipfp:
+                f.seek(zipfp.start_dir)
+            f.write(b'XXXX')
+        # The central directory is only checked when it is used.
+        with zipfile.ZipFile(TESTFN2, "r", lazy=True) as zipfp:
+            self.assertRaises(zipfile.BadZipFile, zipfp.getinfo,
+                              'dir0/member0')
+            self.assertRaises(zipfile.BadZipFile, zipfp.namelist)
+
+    def test_mode(self):
+        with self.assertRaises(ValueError):
+            zipfile.ZipFile(TESTFN2, "w", lazy=True)
+        self.assertFalse(os.path.exists(TESTFN2))
+
+    def tearDown(self):
+        unlink(TESTFN2)
+
+
 class AbstractBadCrcTests:
     def test_testzip_with_bad_crc(self):
         """Tests that files with bad CRCs return their name from testzip."""
@@ -1934,6 +2041,52 @@ class TestsWithMultipleOpens(unittest.TestCase):
             self.assertEqual(data1, self.data1)
             self.assertEqual(data2, self.data2)
 
+    @unittest.skipUnless(threading, 'requires threading')
+    def test_threads(self):
+        # Members can be read by several threads at the same time.
+        for f in get_files(self):
+            self.make_test_archive(f)
+            with zipfile.ZipFile(f, mode="r") as zipf:
+                results = []
+                def read(name):
+                    with zipf.open(name) as zopen:
+                        data = b''
+                        while True:
+                            chunk = zopen.read(100)
+                            if not chunk:
+                                break
+                            data += chunk
+                    results.append((name, data))
+                threads = [threading.Thread(target=read, args=(name,))
+                           for name in ['ones', 'twos'] * 4]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+            expected = {'ones': self.data1, 'twos': self.data2}
+            self.assertEqual(len(results), len(threads))
+            for name, data in results:
+                self.assertEqual(data, expected[name])
+
+    @unittest.skipUnless(hasattr(os, 'pread'), 'requires os.pread()')
+    def test_positional_reads(self):
+        self.make_test_archive(TESTFN2)
+        with zipfile.ZipFile(TESTFN2, mode="r") as zipf:
+            with zipf.open('ones') as zopen1:
+                self.assertIsNotNone(zopen1._fileobj._fd)
+                zipf.fp.seek(0)
+                self.assertEqual(zopen1.read(), self.data1)
+                # The position of the shared file is left alone.
+                self.assertEqual(zipf.fp.tell(), 0)
+        with zipfile.ZipFile(TESTFN2, mode="a") as zipf:
+            with zipf.open('ones') as zopen1:
+                self.assertIsNone(zopen1._fileobj._fd)
+        with io.BytesIO() as f:
+            self.make_test_archive(f)
+            with zipfile.ZipFile(f, mode="r") as zipf:
+                with zipf.open('ones') as zopen1:
+                    self.assertIsNone(zopen1._fileobj._fd)
+
     def test_many_opens(self):
         # Verify that read() and open() promptly close the file descriptor,
         # and don't rely on the garbage collector to free resources.
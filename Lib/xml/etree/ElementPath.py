@@ -129,6 +129,8 @@ def prepare_descendant(next, token):
             for e in elem.iter(tag):
                 if e is not elem:
                     yield e
+    # used to answer the path from an attribute index
+    select.descendant_tag = tag
     return select
 
 def prepare_parent(next, token):
@@ -179,6 +181,8 @@ def prepare_predicate(next, token):
             for elem in result:
                 if elem.get(key) == value:
                     yield elem
+        # used to answer the path from an attribute index
+        select.attribute_equals = key, value
         return select
     if signature == "-" and not re.match(r"\-?\d+$", predicate[0]):
         # [tag]
@@ -242,6 +246,7 @@ ops = {
     }
 
 _cache = {}
+_MAXCACHE = 100
 
 class _SelectorContext:
     parent_map = None
@@ -251,45 +256,127 @@ class _SelectorContext:
 # --------------------------------------------------------------------
 
 ##
-# Generate all matching objects.
+# Compiled path expression, as returned by compile().
 
-def iterfind(elem, path, namespaces=None):
-    # compile selector pattern
-    cache_key = (path, None if namespaces is None
-                            else tuple(sorted(namespaces.items())))
+class CompiledPath:
+
+    def __init__(self, path, namespaces, selector):
+        self.path = path
+        self.namespaces = namespaces
+        self._selector = selector
+        # .//tag[@key='value'] selects the same elements as looking the
+        # value up in an index of the key attribute and keeping the
+        # descendants with that tag
+        self._indexed = None
+        if (selector is not None and len(selector) >= 2 and
+            hasattr(selector[0], "descendant_tag") and
+            hasattr(selector[1], "attribute_equals")):
+            key, value = selector[1].attribute_equals
+            self._indexed = key, value, selector[0].descendant_tag
+
+    def __repr__(self):
+        return "<%s %r>" % (self.__class__.__name__, self.path)
+
+    def _select(self, elem, indexes=None):
+        selector = self._selector
+        if selector is None:
+            return iter(())
+        context = _SelectorContext(elem)
+        indexed = self._indexed
+        if indexes and indexed is not None and indexed[0] in indexes:
+            key, value, tag = indexed
+            result = [e for e in indexes[key].get(value, ())
+                      if e is not elem and (tag == "*" or e.tag == tag)]
+            selector = selector[2:]
+        else:
+            result = [elem]
+        for select in selector:
+            result = select(context, result)
+        return iter(result)
+
+    def iterfind(self, elem):
+        return self._select(elem)
+
+    def find(self, elem):
+        return next(self._select(elem), None)
+
+    def findall(self, elem):
+        return list(self._select(elem))
+
+    def findtext(self, elem, default=None):
+        try:
+            elem = next(self._select(elem))
+            return elem.text or ""
+        except StopIteration:
+            return default
+
+def _compile(path, namespaces):
     if path[-1:] == "/":
         path = path + "*" # implicit all (FIXME: keep this?)
+    if path[:1] == "/":
+        raise SyntaxError("cannot use absolute path on element")
+    next = iter(xpath_tokenizer(path, namespaces)).__next__
     try:
-        selector = _cache[cache_key]
-    except KeyError:
-        if len(_cache) > 100:
-            _cache.clear()
-        if path[:1] == "/":
-            raise SyntaxError("cannot use absolute path on element")
-        next = iter(xpath_tokenizer(path, namespaces)).__next__
+        token = next()
+    except StopIteration:
+        return None
+    selector = []
+    while 1:
+        try:
+            select = ops[token[0]](next, token)
+        except StopIteration:
+            raise SyntaxError("invalid path")
+        # "." selects the current elements again
+        if token[0] != ".":
+            selector.append(select)
         try:
             token = next()
+            if token[0] == "/":
+                token = next()
         except StopIteration:
-            return
-        selector = []
-        while 1:
-            try:
-                selector.append(ops[token[0]](next, token))
-            except StopIteration:
-                raise SyntaxError("invalid path")
+            break
+    return selector
+
+##
+# Compile a path expression into a reusable object.  The compiled paths
+# are kept in a cache of the most recently used ones.
+
+def compile(path, namespaces=None):
+    if isinstance(path, CompiledPath):
+        if namespaces is not None:
+            raise ValueError(
+                "cannot process namespaces argument with a compiled path")
+        return path
+    cache_key = (path, None if namespaces is None
+                            else tuple(sorted(namespaces.items())))
+    try:
+        # move the path to the end of the cache, as the most recent one
+        compiled = _cache.pop(cache_key)
+    except KeyError:
+        compiled = CompiledPath(path, namespaces,
+                                _compile(path, namespaces))
+        if len(_cache) >= _MAXCACHE:
+            # drop the least recently used path
             try:
-                token = next()
-                if token[0] == "/":
-                    token = next()
-            except StopIteration:
-                break
-        _cache[cache_key] = selector
-    # execute selector pattern
-    result = [elem]
-    context = _SelectorContext(elem)
-    for select in selector:
-        result = select(context, result)
-    return result
+                del _cache[next(iter(_cache))]
+            except (StopIteration, RuntimeError, KeyError):
+                pass
+    _cache[cache_key] = compiled
+    return compiled
+
+##
+# Generate all matching objects.
+
+def iterfind(elem, path, namespaces=None):
+    return compile(path, namespaces)._select(elem)
+
+##
+# Generate all matching objects, looking the attribute values up in the
+# indexes (a mapping from attribute names to mappings from values to lists
+# of elements in document order) where the path allows it.
+
+def _iterfind_indexed(elem, path, namespaces, indexes):
+    return compile(path, namespaces)._select(elem, indexes)
 
 ##
 # Find first matching object.
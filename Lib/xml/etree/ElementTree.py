@@ -553,6 +553,7 @@ class ElementTree:
     def __init__(self, element=None, file=None):
         # assert element is None or iselement(element)
         self._root = element # first node
+        self._indexes = {}
         if file:
             self.parse(file)
 
@@ -569,6 +570,7 @@ class ElementTree:
         """
         # assert iselement(element)
         self._root = element
+        self._indexes = {}
 
     def parse(self, source, parser=None):
         """Load external XML document into element tree.
@@ -581,6 +583,7 @@ class ElementTree:
         Returns the root element of the given source document.
 
         """
+        self._indexes = {}
         close_source = False
         if not hasattr(source, "read"):
             source = open(source, "rb")
@@ -641,7 +644,7 @@ class ElementTree:
 
         """
         # assert self._root is not None
-        if path[:1] == "/":
+        if not isinstance(path, ElementPath.CompiledPath) and path[:1] == "/":
             path = "." + path
             warnings.warn(
                 "This search is broken in 1.3 and earlier, and will be "
@@ -649,6 +652,9 @@ class ElementTree:
                 "behaviour, change it to %r" % path,
                 FutureWarning, stacklevel=2
                 )
+        if self._indexes:
+            return next(ElementPath._iterfind_indexed(
+                self._root, path, namespaces, self._indexes), None)
         return self._root.find(path, namespaces)
 
     def findtext(self, path, default=None, namespaces=None):
@@ -663,7 +669,7 @@ class ElementTree:
 
         """
         # assert self._root is not None
-        if path[:1] == "/":
+        if not isinstance(path, ElementPath.CompiledPath) and path[:1] == "/":
             path = "." + path
             warnings.warn(
                 "This search is broken in 1.3 and earlier, and will be "
@@ -671,6 +677,12 @@ class ElementTree:
                 "behaviour, change it to %r" % path,
                 FutureWarning, stacklevel=2
                 )
+        if self._indexes:
+            elem = next(ElementPath._iterfind_indexed(
+                self._root, path, namespaces, self._indexes), None)
+            if elem is None:
+                return default
+            return elem.text or ""
         return self._root.findtext(path, default, namespaces)
 
     def findall(self, path, namespaces=None):
@@ -685,7 +697,7 @@ class ElementTree:
 
         """
         # assert self._root is not None
-        if path[:1] == "/":
+        if not isinstance(path, ElementPath.CompiledPath) and path[:1] == "/":
             path = "." + path
             warnings.warn(
                 "This search is broken in 1.3 and earlier, and will be "
@@ -693,6 +705,9 @@ class ElementTree:
                 "behaviour, change it to %r" % path,
                 FutureWarning, stacklevel=2
                 )
+        if self._indexes:
+            return list(ElementPath._iterfind_indexed(
+                self._root, path, namespaces, self._indexes))
         return self._root.findall(path, namespaces)
 
     def iterfind(self, path, namespaces=None):
@@ -707,7 +722,7 @@ class ElementTree:
 
         """
         # assert self._root is not None
-        if path[:1] == "/":
+        if not isinstance(path, ElementPath.CompiledPath) and path[:1] == "/":
             path = "." + path
             warnings.warn(
                 "This search is broken in 1.3 and earlier, and will be "
@@ -715,8 +730,33 @@ class ElementTree:
                 "behaviour, change it to %r" % path,
                 FutureWarning, stacklevel=2
                 )
+        if self._indexes:
+            return ElementPath._iterfind_indexed(
+                self._root, path, namespaces, self._indexes)
         return self._root.iterfind(path, namespaces)
 
+    def create_index(self, key):
+        """Index the elements of the tree by the value of attribute *key*.
+
+        The find methods of the tree then look up the elements selected by
+        paths starting with .//tag[@key='value'] in the index rather than
+        iterating over the whole tree.
+
+        The index is a snapshot of the tree: it must be created again after
+        the tree has been modified.
+
+        """
+        index = {}
+        for elem in self._root.iter():
+            value = elem.get(key)
+            if value is not None:
+                index.setdefault(value, []).append(elem)
+        self._indexes[key] = index
+
+    def drop_index(self, key):
+        """Remove the index of attribute *key* created by create_index()."""
+        del self._indexes[key]
+
     def write(self, file_or_filename,
               encoding=None,
               xml_declaration=None,
@@ -1197,7 +1237,7 @@ def parse(source, parser=None):
     return tree
 
 
-def iterparse(source, events=None, parser=None):
+def iterparse(source, events=None, parser=None, *, tag=None):
     """Incrementally parse XML document into ElementTree.
 
     This class also reports what's going on to the user based on the
@@ -1209,12 +1249,18 @@ def iterparse(source, events=None, parser=None):
     *source* is a filename or file object containing XML data, *events* is
     a list of events to report back, *parser* is an optional parser instance.
 
+    *tag* is an optional tag or iterable of tags.  If given, the "start" and
+    "end" events are only reported for the elements with these tags, which
+    are removed from their parent when they end, so that the tree does not
+    grow with the document: a reported element is freed once it is no
+    longer used.
+
     Returns an iterator providing (event, elem) pairs.
 
     """
     # Use the internal, undocumented _parser argument for now; When the
     # parser argument of iterparse is removed, this can be killed.
-    pullparser = XMLPullParser(events=events, _parser=parser)
+    pullparser = XMLPullParser(events=events, tag=tag, _parser=parser)
     def iterator():
         try:
             while True:
@@ -1247,7 +1293,7 @@ def iterparse(source, events=None, parser=None):
 
 class XMLPullParser:
 
-    def __init__(self, events=None, *, _parser=None):
+    def __init__(self, events=None, *, tag=None, _parser=None):
         # The _parser argument is for internal use only and must not be relied
         # upon in user code. It will be removed in a future release.
         # See http://bugs.python.org/issue17741 for more details.
@@ -1257,7 +1303,13 @@ class XMLPullParser:
         # wire up the parser for event reporting
         if events is None:
             events = ("end",)
-        self._parser._setevents(self._events_queue, events)
+        if tag is None:
+            self._parser._setevents(self._events_queue, events)
+        else:
+            if isinstance(tag, str):
+                tag = (tag,)
+            self._parser._setevents(self._events_queue, events,
+                                    frozenset(tag))
 
     def feed(self, data):
         """Feed encoded data to parser."""
@@ -1485,24 +1537,30 @@ class XMLParser:
         except AttributeError:
             pass # unknown
 
-    def _setevents(self, events_queue, events_to_report):
+    def _setevents(self, events_queue, events_to_report, tags=None):
         # Internal API for XMLPullParser
         # events_to_report: a list of events to report during parsing (same as
         # the *events* of XMLPullParser's constructor.
         # events_queue: a list of actual parsing events that will be populated
         # by the underlying parser.
+        # tags: an optional set of tags; the "start" and "end" events are then
+        # only reported for the elements with these tags, which are removed
+        # from their parent when they end.
         #
         parser = self._parser
         append = events_queue.append
+        start_event = end_event = None
         for event_name in events_to_report:
             if event_name == "start":
                 parser.ordered_attributes = 1
                 parser.specified_attributes = 1
+                start_event = event_name
                 def handler(tag, attrib_in, event=event_name, append=append,
                             start=self._start):
                     append((event, start(tag, attrib_in)))
                 parser.StartElementHandler = handler
             elif event_name == "end":
+                end_event = event_name
                 def handler(tag, event=event_name, append=append,
                             end=self._end):
                     append((event, end(tag)))
@@ -1517,6 +1575,29 @@ class XMLParser:
                 parser.EndNamespaceDeclHandler = handler
             else:
                 raise ValueError("unknown event %r" % event_name)
+        if tags is not None:
+            # the stack of the open elements, to find the parent of an
+            # element when it ends
+            stack = []
+            def handler(tag, attrib_in, event=start_event, append=append,
+                        start=self._start, push=stack.append):
+                elem = start(tag, attrib_in)
+                push(elem)
+                if event is not None and elem.tag in tags:
+                    append((event, elem))
+            parser.StartElementHandler = handler
+            def handler(tag, event=end_event, append=append, end=self._end,
+                        pop=stack.pop):
+                elem = end(tag)
+                pop()
+                if elem.tag in tags:
+                    if event is not None:
+                        append((event, elem))
+                    if stack:
+                        parent = stack[-1]
+                        if len(parent) and parent[-1] is elem:
+                            del parent[-1]
+            parser.EndElementHandler = handler
 
     def _raiseerror(self, value):
         err = ParseError(value)
@@ -12,6 +12,12 @@ import stat
 import shutil
 import struct
 import binascii
+from array import array
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
 
 try:
     import threading
@@ -100,6 +106,9 @@ _ECD_LOCATION = 9
 structCentralDir = "<4s4B4HL2L5H2L"
 stringCentralDir = b"PK\001\002"
 sizeCentralDir = struct.calcsize(structCentralDir)
+_CentralDir = struct.Struct(structCentralDir)
+# The signature and the lengths of the variable fields of an entry.
+_CentralDirLengths = struct.Struct("<4s24x3H")
 
 # indexes of entries in the central directory structure
 _CD_SIGNATURE = 0
@@ -291,6 +300,20 @@ def _EndRecData(fpin):
     return None
 
 
+def _normalize_filename(filename):
+    # Terminate the file name at the first null byte.  Null bytes in file
+    # names are used as tricks by viruses in archives.
+    null_byte = filename.find(chr(0))
+    if null_byte >= 0:
+        filename = filename[0:null_byte]
+    # This is used to ensure paths in generated ZIP files always use
+    # forward slashes as the directory separator, as required by the
+    # ZIP format specification.
+    if os.sep != "/" and os.sep in filename:
+        filename = filename.replace(os.sep, "/")
+    return filename
+
+
 class ZipInfo (object):
     """Class with attributes describing each file in the ZIP archive."""
 
@@ -318,19 +341,7 @@ class ZipInfo (object):
 
     def __init__(self, filename="NoName", date_time=(1980,1,1,0,0,0)):
         self.orig_filename = filename   # Original file name in archive
-
-        # Terminate the file name at the first null byte.  Null bytes in file
-        # names are used as tricks by viruses in archives.
-        null_byte = filename.find(chr(0))
-        if null_byte >= 0:
-            filename = filename[0:null_byte]
-        # This is used to ensure paths in generated ZIP files always use
-        # forward slashes as the directory separator, as required by the
-        # ZIP format specification.
-        if os.sep != "/" and os.sep in filename:
-            filename = filename.replace(os.sep, "/")
-
-        self.filename = filename        # Normalized file name
+        self.filename = _normalize_filename(filename) # Normalized file name
         self.date_time = date_time      # year, month, day, hour, min, sec
 
         if date_time[0] < 1980:
@@ -686,14 +697,24 @@ def _get_decompressor(compress_type):
 
 
 class _SharedFile:
-    def __init__(self, file, pos, close, lock, writing):
+    def __init__(self, file, pos, close, lock, writing, fd=None):
         self._file = file
         self._pos = pos
         self._close = close
         self._lock = lock
         self._writing = writing
+        self._fd = fd
 
     def read(self, n=-1):
+        if self._fd is not None:
+            # Positional reads leave the position of the shared file alone
+            # and need no lock, so that several members can be read by
+            # different threads at the same time.
+            if n is None or n < 0:
+                n = max(os.fstat(self._fd).st_size - self._pos, 0)
+            data = os.pread(self._fd, n, self._pos)
+            self._pos += len(data)
+            return data
         with self._lock:
             if self._writing():
                 raise ValueError("Can't read from the ZIP file while there "
@@ -1033,7 +1054,8 @@ class _ZipWriteFile(io.BufferedIOBase):
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
 
-    z = ZipFile(file, mode="r", compression=ZIP_STORED, allowZip64=True)
+    z = ZipFile(file, mode="r", compression=ZIP_STORED, allowZip64=True,
+                lazy=False)
 
     file: Either the path to the file, or a file-like object.
           If it is a path, the file will be opened and closed by ZipFile.
@@ -1044,17 +1066,27 @@ class ZipFile:
     allowZip64: if True ZipFile will create files with ZIP64 extensions when
                 needed, otherwise it will raise an exception when this would
                 be necessary.
+    lazy: if True, mode must be 'r' and the central directory is only read
+          when members are accessed: getinfo() and open() decode the entry
+          of a single member, while namelist() and infolist() decode all
+          of them.
 
     """
 
     fp = None                   # Set here since __del__ checks it
     _windows_illegal_name_trans_table = None
+    # Central directory of a lazy archive (a memory map of the file or the
+    # bytes of the directory), until all its entries have been decoded.
+    _cd = None
 
-    def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True):
+    def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
+                 *, lazy=False):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
             raise ValueError("ZipFile requires mode 'r', 'w', 'x', or 'a'")
+        if lazy and mode != 'r':
+            raise ValueError("lazy requires mode 'r'")
 
         _check_compression(compression)
 
@@ -1093,10 +1125,12 @@ class ZipFile:
         self._lock = threading.RLock()
         self._seekable = True
         self._writing = False
+        self._fd = None
 
         try:
             if mode == 'r':
-                self._RealGetContents()
+                self._fd = self._get_pread_fd()
+                self._RealGetContents(lazy)
             elif mode in ('w', 'x'):
                 # set the modified flag so central directory gets written
                 # even if no files are added to the archive
@@ -1156,7 +1190,46 @@ class ZipFile:
         result.append('>')
         return ''.join(result)
 
-    def _RealGetContents(self):
+    def _get_pread_fd(self):
+        """Return the file descriptor of the archive if the members can be
+        read with os.pread(), or None."""
+        if not hasattr(os, 'pread'):
+            return None
+        # Other file objects may not map their positions to the ones of
+        # the file descriptor.
+        if not isinstance(self.fp, (io.FileIO, io.BufferedReader,
+                                    io.BufferedRandom)):
+            return None
+        try:
+            fd = self.fp.fileno()
+            os.pread(fd, 0, 0)
+        except (AttributeError, OSError, ValueError):
+            return None
+        return fd
+
+    @property
+    def filelist(self):
+        """List of ZipInfo instances for archive."""
+        if self._cd is not None:
+            self._load_infos()
+        return self._filelist
+
+    @filelist.setter
+    def filelist(self, value):
+        self._filelist = value
+
+    @property
+    def NameToInfo(self):
+        """Find file info given name."""
+        if self._cd is not None:
+            self._load_infos()
+        return self._NameToInfo
+
+    @NameToInfo.setter
+    def NameToInfo(self, value):
+        self._NameToInfo = value
+
+    def _RealGetContents(self, lazy=False):
         """Read in the table of contents for the ZIP file."""
         fp = self.fp
         try:
@@ -1183,57 +1256,202 @@ class ZipFile:
             print("given, inferred, offset", offset_cd, inferred, self._start_disk)
         # self.start_dir:  Position of start of central directory
         self.start_dir = offset_cd + self._start_disk
-        fp.seek(self.start_dir, 0)
-        data = fp.read(size_cd)
-        fp = io.BytesIO(data)
-        total = 0
-        while total < size_cd:
-            centdir = fp.read(sizeCentralDir)
-            if len(centdir) != sizeCentralDir:
-                raise BadZipFile("Truncated central directory")
-            centdir = struct.unpack(structCentralDir, centdir)
-            if centdir[_CD_SIGNATURE] != stringCentralDir:
-                raise BadZipFile("Bad magic number for central directory")
-            if self.debug > 2:
-                print(centdir)
-            filename = fp.read(centdir[_CD_FILENAME_LENGTH])
-            flags = centdir[5]
-            if flags & 0x800:
-                # UTF-8 file names extension
-                filename = filename.decode('utf-8')
+        data = None
+        if lazy and mmap is not None and self._fd is not None and size_cd:
+            # Map the file rather than reading a directory which may be
+            # larger than the members that will be used.
+            try:
+                data = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
             else:
-                # Historical ZIP filename encoding
-                filename = filename.decode('cp437')
-            # Create ZipInfo instance to store file information
-            x = ZipInfo(filename)
-            x.extra = fp.read(centdir[_CD_EXTRA_FIELD_LENGTH])
-            x.comment = fp.read(centdir[_CD_COMMENT_LENGTH])
-            x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
-            (x.create_version, x.create_system, x.extract_version, x.reserved,
-             x.flag_bits, x.compress_type, t, d,
-             x.CRC, x.compress_size, x.file_size) = centdir[1:12]
-            if x.extract_version > MAX_EXTRACT_VERSION:
-                raise NotImplementedError("zip file version %.1f" %
-                                          (x.extract_version / 10))
-            x.volume, x.internal_attr, x.external_attr = centdir[15:18]
-            # Convert date/time code to (year, month, day, hour, min, sec)
-            x._raw_time = t
-            x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
-                            t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
-
-            x._decodeExtra()
-            x.header_offset = x.header_offset + self._start_disk
-            self.filelist.append(x)
-            self.NameToInfo[x.filename] = x
-
-            # update total bytes read from central directory
-            total = (total + sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
-                     + centdir[_CD_EXTRA_FIELD_LENGTH]
-                     + centdir[_CD_COMMENT_LENGTH])
-
+                pos = self.start_dir
+                if len(data) < pos + size_cd:
+                    data.close()
+                    raise BadZipFile("Truncated central directory")
+        if data is None:
+            fp.seek(self.start_dir, 0)
+            data = fp.read(size_cd)
+            pos = 0
+        if lazy:
+            self._cd = data
+            self._cd_start = pos
+            self._cd_end = pos + size_cd
+            self._cd_offsets = self._cd_table = None
+            self._cd_infos = {}
+            return
+        self._read_centdir(data, pos, pos + size_cd)
+
+    def _read_centdir(self, data, pos, end):
+        """Decode the entries of the central directory at data[pos:end]."""
+        filelist = []
+        name_to_info = {}
+        while pos < end:
+            x, pos = self._decode_centdir(data, pos, end)
+            filelist.append(x)
+            name_to_info[x.filename] = x
             if self.debug > 2:
-                print("total", total)
+                print("total", pos)
+        self._filelist = filelist
+        self._NameToInfo = name_to_info
+
+    def _decode_centdir(self, data, pos, end):
+        """Return the ZipInfo of the central directory entry at data[pos]
+        and the position of the next entry."""
+        if end - pos < sizeCentralDir:
+            raise BadZipFile("Truncated central directory")
+        centdir = _CentralDir.unpack_from(data, pos)
+        if centdir[_CD_SIGNATURE] != stringCentralDir:
+            raise BadZipFile("Bad magic number for central directory")
+        if self.debug > 2:
+            print(centdir)
+        pos += sizeCentralDir
+        filename = data[pos:min(pos + centdir[_CD_FILENAME_LENGTH], end)]
+        pos += centdir[_CD_FILENAME_LENGTH]
+        flags = centdir[5]
+        if flags & 0x800:
+            # UTF-8 file names extension
+            filename = filename.decode('utf-8')
+        else:
+            # Historical ZIP filename encoding
+            filename = filename.decode('cp437')
+        # Create ZipInfo instance to store file information
+        x = ZipInfo(filename)
+        x.extra = data[pos:min(pos + centdir[_CD_EXTRA_FIELD_LENGTH], end)]
+        pos += centdir[_CD_EXTRA_FIELD_LENGTH]
+        x.comment = data[pos:min(pos + centdir[_CD_COMMENT_LENGTH], end)]
+        pos += centdir[_CD_COMMENT_LENGTH]
+        x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
+        (x.create_version, x.create_system, x.extract_version, x.reserved,
+         x.flag_bits, x.compress_type, t, d,
+         x.CRC, x.compress_size, x.file_size) = centdir[1:12]
+        if x.extract_version > MAX_EXTRACT_VERSION:
+            raise NotImplementedError("zip file version %.1f" %
+                                      (x.extract_version / 10))
+        x.volume, x.internal_attr, x.external_attr = centdir[15:18]
+        # Convert date/time code to (year, month, day, hour, min, sec)
+        x._raw_time = t
+        x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
+                        t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
+
+        x._decodeExtra()
+        x.header_offset = x.header_offset + self._start_disk
+        return x, pos
+
+    def _check_centdir(self):
+        if self.fp is None:
+            raise ValueError(
+                "Attempt to use ZIP archive that was already closed")
 
+    def _load_infos(self):
+        """Decode all the entries of the central directory of a lazy
+        archive, keeping the ZipInfo instances already returned."""
+        with self._lock:
+            data = self._cd
+            if data is None:
+                return
+            self._check_centdir()
+            self._read_centdir(data, self._cd_start, self._cd_end)
+            infos = self._cd_infos
+            if infos:
+                filelist = self._filelist
+                for i, pos in enumerate(self._cd_offsets):
+                    x = infos.get(pos)
+                    if x is not None:
+                        filelist[i] = x
+                self._NameToInfo = {x.filename: x for x in filelist}
+            self._cd = None
+            self._cd_offsets = self._cd_table = self._cd_infos = None
+            if mmap is not None and isinstance(data, mmap.mmap):
+                data.close()
+
+    def _build_centdir_index(self):
+        # A hash table of the positions of the entries, by file name, takes
+        # a few bytes by entry instead of the ZipInfo instances and their
+        # dictionary.
+        # The entries are hashed by their encoded file name, unless it is
+        # changed by its normalization.
+        data = self._cd
+        pos = self._cd_start
+        end = self._cd_end
+        unpack = _CentralDirLengths.unpack_from
+        sep = os.sep.encode() if os.sep != "/" else b"\0"
+        offsets = array('Q')
+        hashes = array('q')
+        while pos < end:
+            if end - pos < sizeCentralDir:
+                raise BadZipFile("Truncated central directory")
+            signature, name_len, extra_len, comment_len = unpack(data, pos)
+            if signature != stringCentralDir:
+                raise BadZipFile("Bad magic number for central directory")
+            offsets.append(pos)
+            start = pos + sizeCentralDir
+            filename = data[start:min(start + name_len, end)]
+            if b"\0" in filename or sep in filename:
+                filename = self._centdir_filename(data, pos, end)
+                filename = filename.encode('utf-8')
+            hashes.append(hash(filename))
+            pos = start + name_len + extra_len + comment_len
+
+        size = 8
+        while size < 2 * len(offsets):
+            size *= 2
+        mask = size - 1
+        table = array('Q', bytes(8 * size))
+        for index, h in enumerate(hashes, 1):
+            i = h & mask
+            while table[i]:
+                i = (i + 1) & mask
+            table[i] = index
+        self._cd_offsets = offsets
+        self._cd_table = table
+
+    def _centdir_filename(self, data, pos, end):
+        """Return the normalized file name of the central directory entry
+        at data[pos]."""
+        centdir = _CentralDir.unpack_from(data, pos)
+        start = pos + sizeCentralDir
+        filename = data[start:min(start + centdir[_CD_FILENAME_LENGTH], end)]
+        filename = filename.decode('utf-8' if centdir[5] & 0x800 else 'cp437')
+        return _normalize_filename(filename)
+
+    def _lookup_centdir(self, name):
+        """Return the ZipInfo of the member name of a lazy archive, or
+        None."""
+        with self._lock:
+            data = self._cd
+            if data is None:
+                return self._NameToInfo.get(name)
+            self._check_centdir()
+            if self._cd_table is None:
+                self._build_centdir_index()
+            end = self._cd_end
+            offsets = self._cd_offsets
+            table = self._cd_table
+            mask = len(table) - 1
+            keys = set()
+            for encoding in ('utf-8', 'cp437'):
+                try:
+                    keys.add(name.encode(encoding))
+                except UnicodeEncodeError:
+                    pass
+            found = -1
+            for key in keys:
+                i = hash(key) & mask
+                while table[i]:
+                    pos = offsets[table[i] - 1]
+                    # The last entry of a name wins.
+                    if (pos > found and
+                        self._centdir_filename(data, pos, end) == name):
+                        found = pos
+                    i = (i + 1) & mask
+            if found < 0:
+                return None
+            x = self._cd_infos.get(found)
+            if x is None:
+                x = self._decode_centdir(data, found, end)[0]
+                self._cd_infos[found] = x
+            return x
 
     def namelist(self):
         """Return a list of file names in the archive."""
@@ -1268,7 +1486,10 @@ class ZipFile:
 
     def getinfo(self, name):
         """Return the instance of ZipInfo given 'name'."""
-        info = self.NameToInfo.get(name)
+        if self._cd is not None:
+            info = self._lookup_centdir(name)
+        else:
+            info = self.NameToInfo.get(name)
         if info is None:
             raise KeyError(
                 'There is no item named %r in the archive' % name)
@@ -1353,9 +1574,11 @@ class ZipFile:
                     "Close the writing handle before trying to read.")
 
         # Open for reading:
-        self._fileRefCnt += 1
+        with self._lock:
+            self._fileRefCnt += 1
         zef_file = _SharedFile(self.fp, zinfo.header_offset,
-                               self._fpclose, self._lock, lambda: self._writing)
+                               self._fpclose, self._lock, lambda: self._writing,
+                               self._fd)
         try:
             # Skip the file header:
             fheader = zef_file.read(sizeFileHeader)
@@ -1477,17 +1700,48 @@ class ZipFile:
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, workers=1):
         """Extract all members from the archive to the current working
            directory. `path' specifies a different directory to extract to.
            `members' is optional and must be a subset of the list returned
-           by namelist().
+           by namelist(). `workers' is the number of threads extracting
+           members in parallel, 0 meaning the number of CPUs.
         """
+        if workers < 0:
+            raise ValueError('workers must be greater or equal to 0')
         if members is None:
             members = self.namelist()
 
+        if workers != 1:
+            try:
+                from concurrent.futures import ThreadPoolExecutor
+            except ImportError:
+                workers = 1
+        if workers == 1:
+            for zipinfo in members:
+                self.extract(zipinfo, path, pwd)
+            return
+
+        if path is None:
+            path = os.getcwd()
+        # Only the last occurrence of a name is extracted, as it would
+        # overwrite the others.
+        infos = {}
         for zipinfo in members:
-            self.extract(zipinfo, path, pwd)
+            if not isinstance(zipinfo, ZipInfo):
+                zipinfo = self.getinfo(zipinfo)
+            infos[zipinfo.filename] = zipinfo
+        with ThreadPoolExecutor(workers or os.cpu_count() or 1) as executor:
+            futures = [executor.submit(self._extract_member, zipinfo, path,
+                                       pwd)
+                       for zipinfo in infos.values()]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
@@ -1530,11 +1784,12 @@ class ZipFile:
         # Create all upper directories if necessary.
         upperdirs = os.path.dirname(targetpath)
         if upperdirs and not os.path.exists(upperdirs):
-            os.makedirs(upperdirs)
+            # Another thread of extractall() may create them as well.
+            os.makedirs(upperdirs, exist_ok=True)
 
         if member.is_dir():
             if not os.path.isdir(targetpath):
-                os.mkdir(targetpath)
+                os.makedirs(targetpath, exist_ok=True)
             return targetpath
 
         with self.open(member, pwd=pwd) as source, \
@@ -1669,6 +1924,8 @@ class ZipFile:
             fp = self.fp
             self.fp = None
             self._fpclose(fp)
+            if mmap is not None and isinstance(self._cd, mmap.mmap):
+                self._cd.close()
 
     def _write_end_record(self):
         for zinfo in self.filelist:         # write central directory
@@ -1771,10 +2028,11 @@ class ZipFile:
         self.fp.flush()
 
     def _fpclose(self, fp):
-        assert self._fileRefCnt > 0
-        self._fileRefCnt -= 1
-        if not self._fileRefCnt and not self._filePassed:
-            fp.close()
+        with self._lock:
+            assert self._fileRefCnt > 0
+            self._fileRefCnt -= 1
+            if not self._fileRefCnt and not self._filePassed:
+                fp.close()
 
 
 class PyZipFile(ZipFile):
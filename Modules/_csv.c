@@ -101,6 +101,7 @@ typedef struct {
     Py_ssize_t field_len;       /* length of current field */
     int numeric_field;          /* treat field as numeric */
     unsigned long line_num;     /* Source-file line number */
+    struct _Batch *batch;       /* columns filled by read_batch() */
 } ReaderObj;
 
 static PyTypeObject Reader_Type;
@@ -523,11 +524,36 @@ _call_dialect(PyObject *dialect_inst, PyObject *kwargs)
 /*
  * READER
  */
+
+/* A column of read_batch(): a list of the (converted) fields, or the raw
+   items of an array of numbers. */
+typedef struct {
+    PyObject *list;             /* list of values, NULL for arrays */
+    PyObject *converter;        /* callable or None */
+    char typecode;              /* array typecode, 0 for lists */
+    char *data;                 /* array items */
+    Py_ssize_t data_len;        /* length of the items */
+    Py_ssize_t data_size;       /* size of the allocated buffer */
+} BatchColumn;
+
+typedef struct _Batch {
+    BatchColumn *columns;
+    Py_ssize_t ncolumns;        /* number of columns */
+    Py_ssize_t allocated;       /* size of the columns buffer */
+    int fixed;                  /* number of columns given by converters */
+    Py_ssize_t rows;            /* number of records read */
+    Py_ssize_t index;           /* index of the field in the record */
+} Batch;
+
+static int batch_save_field(ReaderObj *self);
+
 static int
 parse_save_field(ReaderObj *self)
 {
     PyObject *field;
 
+    if (self->batch != NULL)
+        return batch_save_field(self);
     field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
                                       (void *) self->field, self->field_len);
     if (field == NULL)
@@ -783,18 +809,17 @@ parse_reset(ReaderObj *self)
     return 0;
 }
 
-static PyObject *
-Reader_iternext(ReaderObj *self)
+/* Parse the next record of the input.  Return 1 if a record was read, 0 at
+   the end of the input and -1 on error. */
+static int
+parse_record(ReaderObj *self)
 {
-    PyObject *fields = NULL;
     Py_UCS4 c;
     Py_ssize_t pos, linelen;
     unsigned int kind;
     void *data;
     PyObject *lineobj;
 
-    if (parse_reset(self) < 0)
-        return NULL;
     do {
         lineobj = PyIter_Next(self->input_iter);
         if (lineobj == NULL) {
@@ -807,7 +832,7 @@ Reader_iternext(ReaderObj *self)
                 else if (parse_save_field(self) >= 0)
                     break;
             }
-            return NULL;
+            return PyErr_Occurred() ? -1 : 0;
         }
         if (!PyUnicode_Check(lineobj)) {
             PyErr_Format(_csvstate_global->error_obj,
@@ -817,11 +842,11 @@ Reader_iternext(ReaderObj *self)
                          lineobj->ob_type->tp_name
                 );
             Py_DECREF(lineobj);
-            return NULL;
+            return -1;
         }
         if (PyUnicode_READY(lineobj) == -1) {
             Py_DECREF(lineobj);
-            return NULL;
+            return -1;
         }
         ++self->line_num;
         kind = PyUnicode_KIND(lineobj);
@@ -834,25 +859,477 @@ Reader_iternext(ReaderObj *self)
                 Py_DECREF(lineobj);
                 PyErr_Format(_csvstate_global->error_obj,
                              "line contains NULL byte");
-                goto err;
+                return -1;
             }
             if (parse_process_char(self, c) < 0) {
                 Py_DECREF(lineobj);
-                goto err;
+                return -1;
             }
             pos++;
         }
         Py_DECREF(lineobj);
         if (parse_process_char(self, 0) < 0)
-            goto err;
+            return -1;
     } while (self->state != START_RECORD);
+    return 1;
+}
+
+static int
+reader_check_batch(ReaderObj *self)
+{
+    if (self->batch != NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "reader used during read_batch()");
+        return -1;
+    }
+    return 0;
+}
 
+static PyObject *
+Reader_iternext(ReaderObj *self)
+{
+    PyObject *fields;
+
+    if (reader_check_batch(self) < 0)
+        return NULL;
+    if (parse_reset(self) < 0)
+        return NULL;
+    if (parse_record(self) <= 0)
+        return NULL;
     fields = self->fields;
     self->fields = NULL;
-err:
     return fields;
 }
 
+#define NUMBER_BUFSIZE 64
+
+/* Copy the current field to buf as a NUL-terminated string if it is short,
+   non-empty and only made of ASCII characters other than underscores,
+   which the fast conversions of numbers below do not handle.  Return 1 if
+   it was copied. */
+static int
+batch_ascii_field(ReaderObj *self, char *buf)
+{
+    Py_ssize_t i;
+
+    if (self->field_len == 0 || self->field_len >= NUMBER_BUFSIZE)
+        return 0;
+    for (i = 0; i < self->field_len; i++) {
+        if (self->field[i] >= 128 || self->field[i] == '_')
+            return 0;
+        buf[i] = (char)self->field[i];
+    }
+    buf[i] = '\0';
+    return 1;
+}
+
+/* Convert the current field with converter, which is int and float using
+   the ASCII representation of the field if it can, without creating a
+   string. */
+static PyObject *
+batch_convert_field(ReaderObj *self, PyObject *converter, int numeric)
+{
+    PyObject *field, *res;
+
+    if (converter == (PyObject *)&PyLong_Type ||
+            converter == (PyObject *)&PyFloat_Type) {
+        char buf[NUMBER_BUFSIZE];
+
+        if (batch_ascii_field(self, buf)) {
+            if (converter == (PyObject *)&PyFloat_Type) {
+                double x = PyOS_string_to_double(buf, NULL, NULL);
+                if (x != -1.0 || !PyErr_Occurred())
+                    return PyFloat_FromDouble(x);
+            }
+            else {
+                char *end;
+                res = PyLong_FromString(buf, &end, 10);
+                if (res != NULL && *end == '\0')
+                    return res;
+                Py_XDECREF(res);
+            }
+            /* let the converter report the error */
+            PyErr_Clear();
+        }
+    }
+    field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                      (void *) self->field, self->field_len);
+    if (field == NULL)
+        return NULL;
+    if (converter != Py_None)
+        res = PyObject_CallFunctionObjArgs(converter, field, NULL);
+    else if (numeric)
+        res = PyNumber_Float(field);
+    else
+        return field;
+    Py_DECREF(field);
+    return res;
+}
+
+/* Parse the decimal integer in buf as int() would.  Return 1 and set *px
+   to it, or return 0 if buf is not a decimal integer fitting in a long
+   long. */
+static int
+batch_parse_longlong(const char *buf, long long *px)
+{
+    const char *p = buf;
+    unsigned long long x = 0;
+    int negative = 0;
+
+    while (Py_ISSPACE(*p))
+        p++;
+    if (*p == '-' || *p == '+')
+        negative = (*p++ == '-');
+    if (!Py_ISDIGIT(*p))
+        return 0;
+    for (; Py_ISDIGIT(*p); p++) {
+        if (x > ((unsigned long long)LLONG_MAX + 1 - (*p - '0')) / 10)
+            return 0;
+        x = x * 10 + (*p - '0');
+    }
+    while (Py_ISSPACE(*p))
+        p++;
+    if (*p || (!negative && x > LLONG_MAX))
+        return 0;
+    *px = negative && x ? -(long long)(x - 1) - 1 : (long long)x;
+    return 1;
+}
+
+/* Append the current field to the array items of column. */
+static int
+batch_append_item(ReaderObj *self, BatchColumn *column)
+{
+    PyObject *value;
+    char item[sizeof(double) > sizeof(long long) ?
+              sizeof(double) : sizeof(long long)];
+    size_t itemsize;
+    long long x = 0;
+    unsigned long long u = 0;
+    int overflow = 0;
+    int parsed = 0;
+    char buf[NUMBER_BUFSIZE];
+
+    if (column->typecode == 'f' || column->typecode == 'd') {
+        double d = -1.0;
+        if (batch_ascii_field(self, buf)) {
+            d = PyOS_string_to_double(buf, NULL, NULL);
+            parsed = !(d == -1.0 && PyErr_Occurred());
+            if (!parsed)
+                PyErr_Clear();
+        }
+        if (!parsed) {
+            /* let float() convert the field or report the error */
+            value = batch_convert_field(self, (PyObject *)&PyFloat_Type, 0);
+            if (value == NULL)
+                return -1;
+            d = PyFloat_AsDouble(value);
+            Py_DECREF(value);
+            if (d == -1.0 && PyErr_Occurred())
+                return -1;
+        }
+        if (column->typecode == 'f') {
+            float f = (float)d;
+            itemsize = sizeof(f);
+            memcpy(item, &f, itemsize);
+        }
+        else {
+            itemsize = sizeof(d);
+            memcpy(item, &d, itemsize);
+        }
+    }
+    else {
+        if (!Py_ISUPPER(column->typecode) && batch_ascii_field(self, buf))
+            parsed = batch_parse_longlong(buf, &x);
+        if (!parsed) {
+            /* let int() convert the field or report the error */
+            value = batch_convert_field(self, (PyObject *)&PyLong_Type, 0);
+            if (value == NULL)
+                return -1;
+            if (Py_ISUPPER(column->typecode)) {
+                u = PyLong_AsUnsignedLongLong(value);
+                overflow = (u == (unsigned long long)-1 && PyErr_Occurred());
+            }
+            else {
+                x = PyLong_AsLongLong(value);
+                overflow = (x == -1 && PyErr_Occurred());
+            }
+            Py_DECREF(value);
+            if (overflow && !PyErr_ExceptionMatches(PyExc_OverflowError))
+                return -1;
+        }
+        switch (column->typecode) {
+#define STORE(code, type, src, cond) \
+        case code: { \
+            type v = (type)src; \
+            overflow = overflow || !(cond); \
+            itemsize = sizeof(v); \
+            memcpy(item, &v, itemsize); \
+            break; \
+        }
+        STORE('b', signed char, x, x >= SCHAR_MIN && x <= SCHAR_MAX)
+        STORE('B', unsigned char, u, u <= UCHAR_MAX)
+        STORE('h', short, x, x >= SHRT_MIN && x <= SHRT_MAX)
+        STORE('H', unsigned short, u, u <= USHRT_MAX)
+        STORE('i', int, x, x >= INT_MIN && x <= INT_MAX)
+        STORE('I', unsigned int, u, u <= UINT_MAX)
+        STORE('l', long, x, x >= LONG_MIN && x <= LONG_MAX)
+        STORE('L', unsigned long, u, u <= ULONG_MAX)
+        STORE('q', long long, x, 1)
+        STORE('Q', unsigned long long, u, 1)
+#undef STORE
+        default:
+            PyErr_BadInternalCall();
+            return -1;
+        }
+        if (overflow) {
+            PyErr_Clear();
+            PyErr_Format(PyExc_OverflowError,
+                         "field out of range for array typecode '%c'",
+                         column->typecode);
+            return -1;
+        }
+    }
+
+    if (column->data_len + (Py_ssize_t)itemsize > column->data_size) {
+        Py_ssize_t size = column->data_size ? column->data_size * 2 : 1024;
+        char *data = PyMem_Realloc(column->data, size);
+        if (data == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        column->data = data;
+        column->data_size = size;
+    }
+    memcpy(column->data + column->data_len, item, itemsize);
+    column->data_len += itemsize;
+    return 0;
+}
+
+static int
+batch_add_column(Batch *batch, PyObject *converter, char typecode)
+{
+    BatchColumn *column;
+
+    if (batch->ncolumns == batch->allocated) {
+        Py_ssize_t allocated = batch->allocated ? batch->allocated * 2 : 16;
+        column = PyMem_Resize(batch->columns, BatchColumn, allocated);
+        if (column == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        batch->columns = column;
+        batch->allocated = allocated;
+    }
+    column = &batch->columns[batch->ncolumns];
+    column->list = NULL;
+    column->typecode = typecode;
+    column->data = NULL;
+    column->data_len = column->data_size = 0;
+    if (!typecode) {
+        column->list = PyList_New(0);
+        if (column->list == NULL)
+            return -1;
+    }
+    /* the converters may be removed from their sequence while reading */
+    Py_INCREF(converter);
+    column->converter = converter;
+    batch->ncolumns++;
+    return 0;
+}
+
+static int
+batch_save_field(ReaderObj *self)
+{
+    Batch *batch = self->batch;
+    BatchColumn *column;
+    PyObject *value;
+    int numeric = self->numeric_field;
+    int rv;
+
+    self->numeric_field = 0;
+    if (batch->index == batch->ncolumns && !batch->fixed &&
+            batch->rows == 0) {
+        /* the first record gives the number of columns */
+        if (batch_add_column(batch, Py_None, 0) < 0)
+            return -1;
+    }
+    if (batch->index >= batch->ncolumns) {
+        /* too many fields, reported at the end of the record */
+        batch->index++;
+        self->field_len = 0;
+        return 0;
+    }
+    column = &batch->columns[batch->index++];
+    if (column->typecode) {
+        rv = batch_append_item(self, column);
+        self->field_len = 0;
+        return rv;
+    }
+    value = batch_convert_field(self, column->converter, numeric);
+    self->field_len = 0;
+    if (value == NULL)
+        return -1;
+    rv = PyList_Append(column->list, value);
+    Py_DECREF(value);
+    return rv;
+}
+
+static void
+batch_clear(Batch *batch)
+{
+    Py_ssize_t i;
+
+    for (i = 0; i < batch->ncolumns; i++) {
+        Py_XDECREF(batch->columns[i].list);
+        Py_DECREF(batch->columns[i].converter);
+        PyMem_Free(batch->columns[i].data);
+    }
+    PyMem_Free(batch->columns);
+}
+
+static PyObject *
+batch_read(ReaderObj *self, Batch *batch, Py_ssize_t n, PyObject *converters)
+{
+    PyObject *result, *array_type = NULL;
+    Py_ssize_t i;
+    int rv;
+
+    if (converters != Py_None) {
+        PyObject *seq = PySequence_Fast(converters,
+                                        "converters must be a sequence");
+        if (seq == NULL)
+            return NULL;
+        batch->fixed = 1;
+        for (i = 0; i < PySequence_Fast_GET_SIZE(seq); i++) {
+            PyObject *converter = PySequence_Fast_GET_ITEM(seq, i);
+            char typecode = 0;
+            if (PyUnicode_Check(converter)) {
+                if (PyUnicode_GET_LENGTH(converter) == 1)
+                    typecode = (char)PyUnicode_READ_CHAR(converter, 0);
+                if (!typecode || !strchr("bBhHiIlLqQfd", typecode)) {
+                    PyErr_Format(PyExc_ValueError,
+                                 "bad array typecode %R", converter);
+                    Py_DECREF(seq);
+                    return NULL;
+                }
+            }
+            else if (converter != Py_None && !PyCallable_Check(converter)) {
+                PyErr_Format(PyExc_TypeError,
+                             "converters must be None, callables or "
+                             "array typecodes, not %.200s",
+                             Py_TYPE(converter)->tp_name);
+                Py_DECREF(seq);
+                return NULL;
+            }
+            if (batch_add_column(batch, converter, typecode) < 0) {
+                Py_DECREF(seq);
+                return NULL;
+            }
+        }
+        Py_DECREF(seq);
+    }
+
+    while (batch->rows < n) {
+        self->field_len = 0;
+        self->state = START_RECORD;
+        self->numeric_field = 0;
+        batch->index = 0;
+        rv = parse_record(self);
+        if (rv < 0)
+            return NULL;
+        if (rv == 0)
+            break;
+        if (batch->index == 0)
+            /* skip empty records */
+            continue;
+        if (batch->index != batch->ncolumns) {
+            PyErr_Format(_csvstate_global->error_obj,
+                         "record on line %lu has %zd fields, expected %zd",
+                         self->line_num, batch->index, batch->ncolumns);
+            return NULL;
+        }
+        batch->rows++;
+    }
+    if (batch->rows == 0)
+        return PyList_New(0);
+
+    result = PyList_New(batch->ncolumns);
+    if (result == NULL)
+        return NULL;
+    for (i = 0; i < batch->ncolumns; i++) {
+        BatchColumn *column = &batch->columns[i];
+        PyObject *value;
+        if (column->typecode) {
+            if (array_type == NULL) {
+                PyObject *module = PyImport_ImportModule("array");
+                if (module == NULL)
+                    goto error;
+                array_type = PyObject_GetAttrString(module, "array");
+                Py_DECREF(module);
+                if (array_type == NULL)
+                    goto error;
+            }
+            PyObject *items = PyBytes_FromStringAndSize(column->data,
+                                                        column->data_len);
+            if (items == NULL)
+                goto error;
+            value = PyObject_CallFunction(array_type, "CO",
+                                          column->typecode, items);
+            Py_DECREF(items);
+            if (value == NULL)
+                goto error;
+        }
+        else {
+            value = column->list;
+            column->list = NULL;
+        }
+        PyList_SET_ITEM(result, i, value);
+    }
+    Py_XDECREF(array_type);
+    return result;
+
+error:
+    Py_XDECREF(array_type);
+    Py_DECREF(result);
+    return NULL;
+}
+
+PyDoc_STRVAR(Reader_read_batch_doc,
+"read_batch(n, converters=None) -> list of columns\n"
+"\n"
+"Read up to n records and return the list of their columns, each column\n"
+"being the list of the fields at its position.  The first record gives\n"
+"the number of columns, unless converters is a sequence giving, for each\n"
+"column, None to keep the fields as strings, a callable converting them,\n"
+"such as int or float, or an array typecode for a column of numbers\n"
+"stored in an array.array.  Empty records are skipped.  Return an empty\n"
+"list at the end of the input.");
+
+static PyObject *
+Reader_read_batch(ReaderObj *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"n", "converters", NULL};
+    Py_ssize_t n;
+    PyObject *converters = Py_None;
+    PyObject *result;
+    Batch batch = {NULL, 0, 0, 0, 0, 0};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "n|O:read_batch", kwlist,
+                                     &n, &converters))
+        return NULL;
+    if (n < 0) {
+        PyErr_SetString(PyExc_ValueError, "n must be non-negative");
+        return NULL;
+    }
+    if (reader_check_batch(self) < 0)
+        return NULL;
+    self->batch = &batch;
+    result = batch_read(self, &batch, n, converters);
+    self->batch = NULL;
+    batch_clear(&batch);
+    return result;
+}
+
 static void
 Reader_dealloc(ReaderObj *self)
 {
@@ -891,6 +1368,8 @@ PyDoc_STRVAR(Reader_Type_doc,
 );
 
 static struct PyMethodDef Reader_methods[] = {
+    { "read_batch", (PyCFunction)Reader_read_batch,
+        METH_VARARGS | METH_KEYWORDS, Reader_read_batch_doc},
     { NULL, NULL }
 };
 #define R_OFF(x) offsetof(ReaderObj, x)
@@ -953,6 +1432,7 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     self->field = NULL;
     self->field_size = 0;
     self->line_num = 0;
+    self->batch = NULL;
 
     if (parse_reset(self) < 0) {
         Py_DECREF(self);
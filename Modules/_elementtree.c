@@ -2299,6 +2299,8 @@ typedef struct {
     PyObject *end_event_obj;
     PyObject *start_ns_event_obj;
     PyObject *end_ns_event_obj;
+    PyObject *tags; /* set of the tags of the elements to report and release,
+                       or NULL to report all elements */
 } TreeBuilderObject;
 
 #define TreeBuilder_CheckExact(op) (Py_TYPE(op) == &TreeBuilder_Type)
@@ -2332,6 +2334,7 @@ treebuilder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         t->events_append = NULL;
         t->start_event_obj = t->end_event_obj = NULL;
         t->start_ns_event_obj = t->end_ns_event_obj = NULL;
+        t->tags = NULL;
     }
     return (PyObject *)t;
 }
@@ -2371,6 +2374,7 @@ treebuilder_gc_traverse(TreeBuilderObject *self, visitproc visit, void *arg)
 static int
 treebuilder_gc_clear(TreeBuilderObject *self)
 {
+    Py_CLEAR(self->tags);
     Py_CLEAR(self->end_ns_event_obj);
     Py_CLEAR(self->start_ns_event_obj);
     Py_CLEAR(self->end_event_obj);
@@ -2451,6 +2455,60 @@ treebuilder_add_subelement(PyObject *element, PyObject *child)
     }
 }
 
+/* Remove child from element if it is its last subelement, which is where
+   the tree builder added it.  Return -1 on error. */
+static int
+treebuilder_release_subelement(PyObject *element, PyObject *child)
+{
+    if (Element_CheckExact(element)) {
+        ElementObjectExtra *extra = ((ElementObject *) element)->extra;
+        if (extra && extra->length > 0 &&
+            extra->children[extra->length - 1] == child) {
+            extra->length--;
+            Py_DECREF(child);
+        }
+        return 0;
+    }
+    else {
+        Py_ssize_t length;
+        PyObject *last;
+        int res = 0;
+        length = PySequence_Size(element);
+        if (length < 0)
+            return -1;
+        if (length == 0)
+            return 0;
+        last = PySequence_GetItem(element, length - 1);
+        if (last == NULL)
+            return -1;
+        if (last == child)
+            res = PySequence_DelItem(element, length - 1);
+        Py_DECREF(last);
+        return res;
+    }
+}
+
+/* Return 1 if the events of the element are reported, 0 if not, -1 on
+   error. */
+LOCAL(int)
+treebuilder_reports_element(TreeBuilderObject *self, PyObject *node)
+{
+    _Py_IDENTIFIER(tag);
+    PyObject *tag;
+    int res;
+
+    if (self->tags == NULL)
+        return 1;
+    if (Element_CheckExact(node))
+        return PySet_Contains(self->tags, ((ElementObject *) node)->tag);
+    tag = _PyObject_GetAttrId(node, &PyId_tag);
+    if (tag == NULL)
+        return -1;
+    res = PySet_Contains(self->tags, tag);
+    Py_DECREF(tag);
+    return res;
+}
+
 LOCAL(int)
 treebuilder_append_event(TreeBuilderObject *self, PyObject *action,
                          PyObject *node)
@@ -2542,8 +2600,14 @@ treebuilder_handle_start(TreeBuilderObject* self, PyObject* tag,
     Py_INCREF(node);
     Py_SETREF(self->last, node);
 
-    if (treebuilder_append_event(self, self->start_event_obj, node) < 0)
-        goto error;
+    if (self->start_event_obj) {
+        int reported = treebuilder_reports_element(self, node);
+        if (reported < 0)
+            goto error;
+        if (reported &&
+            treebuilder_append_event(self, self->start_event_obj, node) < 0)
+            goto error;
+    }
 
     return node;
 
@@ -2620,7 +2684,23 @@ treebuilder_handle_end(TreeBuilderObject* self, PyObject* tag)
     Py_INCREF(self->this);
     Py_DECREF(item);
 
-    if (treebuilder_append_event(self, self->end_event_obj, self->last) < 0)
+    if (self->tags) {
+        int reported = treebuilder_reports_element(self, self->last);
+        if (reported < 0)
+            return NULL;
+        if (reported) {
+            if (treebuilder_append_event(self, self->end_event_obj,
+                                         self->last) < 0)
+                return NULL;
+            /* The element is complete: release it from the tree, so that
+               it is freed once the events have been consumed. */
+            if (self->this != Py_None &&
+                treebuilder_release_subelement(self->this, self->last) < 0)
+                return NULL;
+        }
+    }
+    else if (treebuilder_append_event(self, self->end_event_obj,
+                                      self->last) < 0)
         return NULL;
 
     Py_INCREF(self->last);
@@ -3573,6 +3653,7 @@ _elementtree.XMLParser._setevents
 
     events_queue: object
     events_to_report: object = None
+    tags: object = None
     /
 
 [clinic start generated code]*/
@@ -3580,8 +3661,9 @@ _elementtree.XMLParser._setevents
 static PyObject *
 _elementtree_XMLParser__setevents_impl(XMLParserObject *self,
                                        PyObject *events_queue,
-                                       PyObject *events_to_report)
-/*[clinic end generated code: output=1440092922b13ed1 input=abf90830a1c3b0fc]*/
+                                       PyObject *events_to_report,
+                                       PyObject *tags)
+/*[clinic end generated code: output=14cdba2ebaa199d1 input=7e6cbe3e0f9154ce]*/
 {
     /* activate element event reporting */
     Py_ssize_t i;
@@ -3599,6 +3681,18 @@ _elementtree_XMLParser__setevents_impl(XMLParserObject *self,
 
     target = (TreeBuilderObject*) self->target;
 
+    if (tags == Py_None) {
+        Py_CLEAR(target->tags);
+    }
+    else if (PyAnySet_Check(tags)) {
+        Py_INCREF(tags);
+        Py_XSETREF(target->tags, tags);
+    }
+    else {
+        PyErr_SetString(PyExc_TypeError, "tags must be a set");
+        return NULL;
+    }
+
     events_append = PyObject_GetAttrString(events_queue, "append");
     if (events_append == NULL)
         return NULL;
@@ -25,6 +25,11 @@ typedef struct _PyScannerObject {
     PyObject *parse_int;
     PyObject *parse_constant;
     PyObject *memo;
+    /* With compact, the last decoded object starting with each key, whose
+       keys table is shared by the next ones, and the numbers decoded from
+       each string of digits; NULL otherwise. */
+    PyObject *layouts;
+    PyObject *numbers;
 } PyScannerObject;
 
 static PyMemberDef scanner_members[] = {
@@ -51,6 +56,14 @@ typedef struct _PyEncoderObject {
     int allow_nan;
 } PyEncoderObject;
 
+/* Accumulator of the chunks of an encoded document.  When write is not NULL,
+   the chunks are joined in large blocks which are passed to it as soon as
+   they are complete, instead of being kept until the end. */
+typedef struct {
+    _PyAccu acc;
+    PyObject *write;
+} JSONAccu;
+
 static PyMemberDef encoder_members[] = {
     {"markers", T_OBJECT, offsetof(PyEncoderObject, markers), READONLY, "markers"},
     {"default", T_OBJECT, offsetof(PyEncoderObject, defaultfn), READONLY, "default"},
@@ -104,11 +117,15 @@ encoder_dealloc(PyObject *self);
 static int
 encoder_clear(PyObject *self);
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc, PyObject *seq, Py_ssize_t indent_level);
+json_accu_write(JSONAccu *acc);
+static int
+json_accu_accumulate(JSONAccu *acc, PyObject *unicode);
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc, PyObject *obj, Py_ssize_t indent_level);
+encoder_listencode_list(PyEncoderObject *s, JSONAccu *acc, PyObject *seq, Py_ssize_t indent_level);
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc, PyObject *dct, Py_ssize_t indent_level);
+encoder_listencode_obj(PyEncoderObject *s, JSONAccu *acc, PyObject *obj, Py_ssize_t indent_level);
+static int
+encoder_listencode_dict(PyEncoderObject *s, JSONAccu *acc, PyObject *dct, Py_ssize_t indent_level);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -118,6 +135,10 @@ encoder_encode_string(PyEncoderObject *s, PyObject *obj);
 static PyObject *
 encoder_encode_float(PyEncoderObject *s, PyObject *obj);
 
+/* Maximum number of distinct numbers decoded once with compact, so that
+   documents with few repeated numbers are not slowed down */
+#define MAX_NUMBERS 4096
+
 #define S_CHAR(c) (c >= ' ' && c <= '~' && c != '\\' && c != '"')
 #define IS_WHITESPACE(c) (((c) == ' ') || ((c) == '\t') || ((c) == '\n') || ((c) == '\r'))
 
@@ -676,6 +697,8 @@ scanner_traverse(PyObject *self, visitproc visit, void *arg)
     Py_VISIT(s->parse_float);
     Py_VISIT(s->parse_int);
     Py_VISIT(s->parse_constant);
+    Py_VISIT(s->layouts);
+    Py_VISIT(s->numbers);
     return 0;
 }
 
@@ -692,6 +715,8 @@ scanner_clear(PyObject *self)
     Py_CLEAR(s->parse_int);
     Py_CLEAR(s->parse_constant);
     Py_CLEAR(s->memo);
+    Py_CLEAR(s->layouts);
+    Py_CLEAR(s->numbers);
     return 0;
 }
 
@@ -710,6 +735,7 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     PyObject *val = NULL;
     PyObject *rval = NULL;
     PyObject *key = NULL;
+    PyObject *first_key = NULL;
     int strict = PyObject_IsTrue(s->strict);
     int has_pairs_hook = (s->object_pairs_hook != Py_None);
     Py_ssize_t next_idx;
@@ -724,12 +750,17 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     kind = PyUnicode_KIND(pystr);
     end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
 
-    if (has_pairs_hook)
+    /* with layouts, the dict is created once its first key is known */
+    if (has_pairs_hook) {
         rval = PyList_New(0);
-    else
+        if (rval == NULL)
+            return NULL;
+    }
+    else if (s->layouts == NULL) {
         rval = PyDict_New();
-    if (rval == NULL)
-        return NULL;
+        if (rval == NULL)
+            return NULL;
+    }
 
     /* skip whitespace after { */
     while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind,str, idx))) idx++;
@@ -757,6 +788,18 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
                 if (PyDict_SetItem(s->memo, key, key) < 0)
                     goto bail;
             }
+            if (rval == NULL) {
+                /* share the keys of the last object with the same first key */
+                PyObject *model = PyDict_GetItem(s->layouts, key);
+                if (model != NULL)
+                    rval = _PyDict_NewSharingKeys(model);
+                else
+                    rval = PyDict_New();
+                if (rval == NULL)
+                    goto bail;
+                Py_INCREF(key);
+                first_key = key;
+            }
             idx = next_idx;
 
             /* skip whitespace between key and : delimiter, read :, skip whitespace */
@@ -810,6 +853,20 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
         }
     }
 
+    if (rval == NULL) {
+        rval = PyDict_New();
+        if (rval == NULL)
+            goto bail;
+    }
+    else if (first_key != NULL) {
+        /* the next objects share the keys of this one unless it already
+           shares the keys of another one */
+        if (!_PyDict_HasSplitTable((PyDictObject *)rval) &&
+                PyDict_SetItem(s->layouts, first_key, rval) < 0)
+            goto bail;
+        Py_CLEAR(first_key);
+    }
+
     *next_idx_ptr = idx + 1;
 
     if (has_pairs_hook) {
@@ -827,6 +884,7 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     return rval;
 bail:
     Py_XDECREF(key);
+    Py_XDECREF(first_key);
     Py_XDECREF(val);
     Py_XDECREF(rval);
     return NULL;
@@ -1040,10 +1098,26 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
         for (i = 0; i < n; i++) {
             buf[i] = (char) PyUnicode_READ(kind, str, i + start);
         }
+        /* with compact, the first MAX_NUMBERS distinct short numbers are
+           decoded once */
+        if (s->numbers != NULL && n <= 16) {
+            rval = PyDict_GetItem(s->numbers, numstr);
+            if (rval != NULL) {
+                Py_INCREF(rval);
+                Py_DECREF(numstr);
+                *next_idx_ptr = idx;
+                return rval;
+            }
+        }
         if (is_float)
             rval = PyFloat_FromString(numstr);
         else
             rval = PyLong_FromString(buf, NULL, 10);
+        if (rval != NULL && s->numbers != NULL && n <= 16 &&
+                PyDict_GET_SIZE(s->numbers) < MAX_NUMBERS &&
+                PyDict_SetItem(s->numbers, numstr, rval) < 0) {
+            Py_CLEAR(rval);
+        }
     }
     Py_DECREF(numstr);
     *next_idx_ptr = idx;
@@ -1191,6 +1265,10 @@ scanner_call(PyObject *self, PyObject *args, PyObject *kwds)
         return NULL;
     }
     PyDict_Clear(s->memo);
+    if (s->layouts != NULL) {
+        PyDict_Clear(s->layouts);
+        PyDict_Clear(s->numbers);
+    }
     if (rval == NULL)
         return NULL;
     return _build_rval_index_tuple(rval, next_idx);
@@ -1208,6 +1286,8 @@ scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         s->parse_float = NULL;
         s->parse_int = NULL;
         s->parse_constant = NULL;
+        s->layouts = NULL;
+        s->numbers = NULL;
     }
     return (PyObject *)s;
 }
@@ -1217,6 +1297,8 @@ scanner_init(PyObject *self, PyObject *args, PyObject *kwds)
 {
     /* Initialize Scanner object */
     PyObject *ctx;
+    PyObject *compact;
+    int is_compact;
     static char *kwlist[] = {"context", NULL};
     PyScannerObject *s;
 
@@ -1251,6 +1333,30 @@ scanner_init(PyObject *self, PyObject *args, PyObject *kwds)
     s->parse_constant = PyObject_GetAttrString(ctx, "parse_constant");
     if (s->parse_constant == NULL)
         goto bail;
+    /* compact is optional, for the contexts predating it */
+    compact = PyObject_GetAttrString(ctx, "compact");
+    if (compact == NULL) {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError))
+            goto bail;
+        PyErr_Clear();
+        is_compact = 0;
+    }
+    else {
+        is_compact = PyObject_IsTrue(compact);
+        Py_DECREF(compact);
+        if (is_compact < 0)
+            goto bail;
+    }
+    Py_CLEAR(s->layouts);
+    Py_CLEAR(s->numbers);
+    if (is_compact) {
+        s->layouts = PyDict_New();
+        if (s->layouts == NULL)
+            goto bail;
+        s->numbers = PyDict_New();
+        if (s->numbers == NULL)
+            goto bail;
+    }
 
     return 0;
 
@@ -1353,6 +1459,12 @@ encoder_init(PyObject *self, PyObject *args, PyObject *kwds)
                      "not %.200s", Py_TYPE(markers)->tp_name);
         return -1;
     }
+    if (indent != Py_None && !PyUnicode_Check(indent)) {
+        PyErr_Format(PyExc_TypeError,
+                     "make_encoder() argument 4 must be str or None, "
+                     "not %.200s", Py_TYPE(indent)->tp_name);
+        return -1;
+    }
 
     s->markers = markers;
     s->defaultfn = defaultfn;
@@ -1386,25 +1498,37 @@ encoder_init(PyObject *self, PyObject *args, PyObject *kwds)
 static PyObject *
 encoder_call(PyObject *self, PyObject *args, PyObject *kwds)
 {
-    /* Python callable interface to encode_listencode_obj */
-    static char *kwlist[] = {"obj", "_current_indent_level", NULL};
-    PyObject *obj;
+    /* Python callable interface to encode_listencode_obj.  Return the list
+       of the chunks of the encoded document or, if _write is given, pass
+       them to _write() in large blocks and return None. */
+    static char *kwlist[] = {"obj", "_current_indent_level", "_write", NULL};
+    PyObject *obj, *write = Py_None, *chunks;
     Py_ssize_t indent_level;
     PyEncoderObject *s;
-    _PyAccu acc;
+    JSONAccu acc;
 
     assert(PyEncoder_Check(self));
     s = (PyEncoderObject *)self;
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
-        &obj, &indent_level))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|O:_iterencode", kwlist,
+        &obj, &indent_level, &write))
         return NULL;
-    if (_PyAccu_Init(&acc))
+    if (_PyAccu_Init(&acc.acc))
         return NULL;
+    acc.write = write == Py_None ? NULL : write;
     if (encoder_listencode_obj(s, &acc, obj, indent_level)) {
-        _PyAccu_Destroy(&acc);
+        _PyAccu_Destroy(&acc.acc);
         return NULL;
     }
-    return _PyAccu_FinishAsList(&acc);
+    chunks = _PyAccu_FinishAsList(&acc.acc);
+    if (chunks == NULL || acc.write == NULL)
+        return chunks;
+    acc.acc.large = chunks;
+    if (json_accu_write(&acc)) {
+        Py_DECREF(chunks);
+        return NULL;
+    }
+    Py_DECREF(chunks);
+    Py_RETURN_NONE;
 }
 
 static PyObject *
@@ -1477,17 +1601,114 @@ encoder_encode_string(PyEncoderObject *s, PyObject *obj)
         return PyObject_CallFunctionObjArgs(s->encoder, obj, NULL);
 }
 
+static PyObject *
+encoder_newline_indent(PyEncoderObject *s, Py_ssize_t indent_level)
+{
+    /* Return '\n' + s->indent * indent_level */
+    PyObject *newline, *indent, *res;
+
+    indent = PySequence_Repeat(s->indent, indent_level);
+    if (indent == NULL)
+        return NULL;
+    newline = PyUnicode_FromStringAndSize("\n", 1);
+    if (newline == NULL) {
+        Py_DECREF(indent);
+        return NULL;
+    }
+    res = PyUnicode_Concat(newline, indent);
+    Py_DECREF(newline);
+    Py_DECREF(indent);
+    return res;
+}
+
 static int
-_steal_accumulate(_PyAccu *acc, PyObject *stolen)
+encoder_accumulate_indent(PyEncoderObject *s, JSONAccu *acc,
+                          PyObject **separator, Py_ssize_t indent_level)
+{
+    /* With an indent, accumulate the newline and the indentation of a
+       container level and set *separator to the item separator followed by
+       them; otherwise set *separator to the item separator. */
+    PyObject *newline_indent;
+
+    if (s->indent == Py_None) {
+        Py_INCREF(s->item_separator);
+        *separator = s->item_separator;
+        return 0;
+    }
+    newline_indent = encoder_newline_indent(s, indent_level);
+    if (newline_indent == NULL)
+        return -1;
+    *separator = PyUnicode_Concat(s->item_separator, newline_indent);
+    if (*separator == NULL || json_accu_accumulate(acc, newline_indent)) {
+        Py_DECREF(newline_indent);
+        return -1;
+    }
+    Py_DECREF(newline_indent);
+    return 0;
+}
+
+static int
+encoder_accumulate_dedent(PyEncoderObject *s, JSONAccu *acc,
+                          Py_ssize_t indent_level)
+{
+    /* With an indent, accumulate the newline and the indentation before the
+       end of a container. */
+    PyObject *newline_indent;
+    int rv;
+
+    if (s->indent == Py_None)
+        return 0;
+    newline_indent = encoder_newline_indent(s, indent_level);
+    if (newline_indent == NULL)
+        return -1;
+    rv = json_accu_accumulate(acc, newline_indent);
+    Py_DECREF(newline_indent);
+    return rv;
+}
+
+static int
+json_accu_write(JSONAccu *acc)
+{
+    /* Pass the joined blocks accumulated so far to write() */
+    PyObject *large = acc->acc.large;
+    Py_ssize_t i;
+
+    if (acc->write == NULL || large == NULL)
+        return 0;
+    for (i = 0; i < PyList_GET_SIZE(large); i++) {
+        PyObject *res = PyObject_CallFunctionObjArgs(
+            acc->write, PyList_GET_ITEM(large, i), NULL);
+        if (res == NULL)
+            return -1;
+        Py_DECREF(res);
+    }
+    return PyList_SetSlice(large, 0, PyList_GET_SIZE(large), NULL);
+}
+
+static int
+json_accu_accumulate(JSONAccu *acc, PyObject *unicode)
+{
+    if (_PyAccu_Accumulate(&acc->acc, unicode))
+        return -1;
+    /* _PyAccu_Accumulate() joins the pending chunks in a block of the large
+       list once there are enough of them. */
+    if (acc->write != NULL && acc->acc.large != NULL &&
+            PyList_GET_SIZE(acc->acc.large))
+        return json_accu_write(acc);
+    return 0;
+}
+
+static int
+_steal_accumulate(JSONAccu *acc, PyObject *stolen)
 {
     /* Append stolen and then decrement its reference count */
-    int rval = _PyAccu_Accumulate(acc, stolen);
+    int rval = json_accu_accumulate(acc, stolen);
     Py_DECREF(stolen);
     return rval;
 }
 
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_obj(PyEncoderObject *s, JSONAccu *acc,
                        PyObject *obj, Py_ssize_t indent_level)
 {
     /* Encode Python object obj to a JSON term */
@@ -1583,7 +1804,7 @@ encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
 }
 
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_dict(PyEncoderObject *s, JSONAccu *acc,
                         PyObject *dct, Py_ssize_t indent_level)
 {
     /* Encode Python dict dct a JSON term */
@@ -1595,6 +1816,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
     PyObject *it = NULL;
     PyObject *items;
     PyObject *item = NULL;
+    PyObject *separator = NULL;
     int skipkeys;
     int sortkeys;
     Py_ssize_t idx;
@@ -1607,7 +1829,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
             return -1;
     }
     if (PyDict_GET_SIZE(dct) == 0)  /* Fast path */
-        return _PyAccu_Accumulate(acc, empty_dict);
+        return json_accu_accumulate(acc, empty_dict);
 
     if (s->markers != Py_None) {
         int has_key;
@@ -1625,18 +1847,13 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         }
     }
 
-    if (_PyAccu_Accumulate(acc, open_dict))
+    if (json_accu_accumulate(acc, open_dict))
         goto bail;
 
-    if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
+    if (s->indent != Py_None)
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
-    }
+    if (encoder_accumulate_indent(s, acc, &separator, indent_level))
+        goto bail;
 
     items = PyMapping_Items(dct);
     if (items == NULL)
@@ -1692,7 +1909,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         }
 
         if (idx) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (json_accu_accumulate(acc, separator))
                 goto bail;
         }
 
@@ -1700,12 +1917,12 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         Py_CLEAR(kstr);
         if (encoded == NULL)
             goto bail;
-        if (_PyAccu_Accumulate(acc, encoded)) {
+        if (json_accu_accumulate(acc, encoded)) {
             Py_DECREF(encoded);
             goto bail;
         }
         Py_DECREF(encoded);
-        if (_PyAccu_Accumulate(acc, s->key_separator))
+        if (json_accu_accumulate(acc, s->key_separator))
             goto bail;
 
         value = PyTuple_GET_ITEM(item, 1);
@@ -1723,14 +1940,13 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
             goto bail;
         Py_CLEAR(ident);
     }
-    /* TODO DOES NOT RUN; dead code
-    if (s->indent != Py_None) {
+    if (s->indent != Py_None)
         indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
-    if (_PyAccu_Accumulate(acc, close_dict))
+    if (encoder_accumulate_dedent(s, acc, indent_level))
         goto bail;
+    if (json_accu_accumulate(acc, close_dict))
+        goto bail;
+    Py_DECREF(separator);
     return 0;
 
 bail:
@@ -1738,12 +1954,13 @@ bail:
     Py_XDECREF(item);
     Py_XDECREF(kstr);
     Py_XDECREF(ident);
+    Py_XDECREF(separator);
     return -1;
 }
 
 
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_list(PyEncoderObject *s, JSONAccu *acc,
                         PyObject *seq, Py_ssize_t indent_level)
 {
     /* Encode Python list seq to a JSON term */
@@ -1752,6 +1969,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
     static PyObject *empty_array = NULL;
     PyObject *ident = NULL;
     PyObject *s_fast = NULL;
+    PyObject *separator = NULL;
     Py_ssize_t i;
 
     if (open_array == NULL || close_array == NULL || empty_array == NULL) {
@@ -1767,7 +1985,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         return -1;
     if (PySequence_Fast_GET_SIZE(s_fast) == 0) {
         Py_DECREF(s_fast);
-        return _PyAccu_Accumulate(acc, empty_array);
+        return json_accu_accumulate(acc, empty_array);
     }
 
     if (s->markers != Py_None) {
@@ -1786,21 +2004,16 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         }
     }
 
-    if (_PyAccu_Accumulate(acc, open_array))
+    if (json_accu_accumulate(acc, open_array))
         goto bail;
-    if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
+    if (s->indent != Py_None)
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
-    }
+    if (encoder_accumulate_indent(s, acc, &separator, indent_level))
+        goto bail;
     for (i = 0; i < PySequence_Fast_GET_SIZE(s_fast); i++) {
         PyObject *obj = PySequence_Fast_GET_ITEM(s_fast, i);
         if (i) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (json_accu_accumulate(acc, separator))
                 goto bail;
         }
         if (encoder_listencode_obj(s, acc, obj, indent_level))
@@ -1812,19 +2025,19 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         Py_CLEAR(ident);
     }
 
-    /* TODO: DOES NOT RUN
-    if (s->indent != Py_None) {
+    if (s->indent != Py_None)
         indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
-    if (_PyAccu_Accumulate(acc, close_array))
+    if (encoder_accumulate_dedent(s, acc, indent_level))
+        goto bail;
+    if (json_accu_accumulate(acc, close_array))
         goto bail;
+    Py_DECREF(separator);
     Py_DECREF(s_fast);
     return 0;
 
 bail:
     Py_XDECREF(ident);
+    Py_XDECREF(separator);
     Py_DECREF(s_fast);
     return -1;
 }
@@ -610,12 +610,46 @@ Compressor_getstate(Compressor *self, PyObject *noargs)
     return NULL;
 }
 
+/* liblzma 5.2 and later can compress the blocks of an .xz stream in
+   several threads. */
+#if LZMA_VERSION >= 50020002
+#define HAVE_LZMA_ENCODER_MT 1
+#endif
+
 static int
 Compressor_init_xz(lzma_stream *lzs, int check, uint32_t preset,
-                   PyObject *filterspecs)
+                   PyObject *filterspecs, uint32_t threads)
 {
     lzma_ret lzret;
 
+#ifdef HAVE_LZMA_ENCODER_MT
+    if (threads != 1) {
+        lzma_mt mt;
+        lzma_filter filters[LZMA_FILTERS_MAX + 1];
+
+        memset(&mt, 0, sizeof(mt));
+        if (threads == 0) {
+            threads = lzma_cputhreads();
+            if (threads == 0)
+                threads = 1;
+        }
+        mt.threads = threads;
+        mt.preset = preset;
+        mt.check = check;
+        if (filterspecs != Py_None) {
+            if (parse_filter_chain_spec(filters, filterspecs) == -1)
+                return -1;
+            mt.filters = filters;
+        }
+        lzret = lzma_stream_encoder_mt(lzs, &mt);
+        if (filterspecs != Py_None)
+            free_filter_chain(filters);
+        if (catch_lzma_error(lzret))
+            return -1;
+        else
+            return 0;
+    }
+#endif
     if (filterspecs == Py_None) {
         lzret = lzma_easy_encoder(lzs, preset, check);
     } else {
@@ -709,6 +743,11 @@ _lzma.LZMACompressor.__init__
         have an entry for "id" indicating the ID of the filter, plus
         additional entries for options to the filter.
 
+    *
+    threads: int = 1
+        The number of threads compressing the data, 0 meaning the number
+        of CPUs.  Only supported by FORMAT_XZ.
+
 Create a compressor object for compressing data incrementally.
 
 The settings used by the compressor can be specified either as a
@@ -723,18 +762,33 @@ For one-shot compression, use the compress() function instead.
 static int
 Compressor_init(Compressor *self, PyObject *args, PyObject *kwargs)
 {
-    static char *arg_names[] = {"format", "check", "preset", "filters", NULL};
+    static char *arg_names[] = {"format", "check", "preset", "filters",
+                                "threads", NULL};
     int format = FORMAT_XZ;
     int check = -1;
     uint32_t preset = LZMA_PRESET_DEFAULT;
     PyObject *preset_obj = Py_None;
     PyObject *filterspecs = Py_None;
+    int threads = 1;
 
     if (!PyArg_ParseTupleAndKeywords(args, kwargs,
-                                     "|iiOO:LZMACompressor", arg_names,
+                                     "|iiOO$i:LZMACompressor", arg_names,
                                      &format, &check, &preset_obj,
-                                     &filterspecs))
+                                     &filterspecs, &threads))
+        return -1;
+
+    if (threads < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "threads must be greater or equal to 0");
         return -1;
+    }
+
+    if (format != FORMAT_XZ && threads != 1) {
+        PyErr_SetString(PyExc_ValueError,
+                        "Multithreaded compression is only supported by "
+                        "FORMAT_XZ");
+        return -1;
+    }
 
     if (format != FORMAT_XZ && check != -1 && check != LZMA_CHECK_NONE) {
         PyErr_SetString(PyExc_ValueError,
@@ -770,7 +824,8 @@ Compressor_init(Compressor *self, PyObject *args, PyObject *kwargs)
         case FORMAT_XZ:
             if (check == -1)
                 check = LZMA_CHECK_CRC64;
-            if (Compressor_init_xz(&self->lzs, check, preset, filterspecs) != 0)
+            if (Compressor_init_xz(&self->lzs, check, preset, filterspecs,
+                                   (uint32_t)threads) != 0)
                 break;
             return 0;
 
@@ -816,7 +871,8 @@ static PyMethodDef Compressor_methods[] = {
 };
 
 PyDoc_STRVAR(Compressor_doc,
-"LZMACompressor(format=FORMAT_XZ, check=-1, preset=None, filters=None)\n"
+"LZMACompressor(format=FORMAT_XZ, check=-1, preset=None, filters=None, *,\n"
+"               threads=1)\n"
 "\n"
 "Create a compressor object for compressing data incrementally.\n"
 "\n"
@@ -841,6 +897,11 @@ PyDoc_STRVAR(Compressor_doc,
 "have an entry for \"id\" indicating the ID of the filter, plus\n"
 "additional entries for options to the filter.\n"
 "\n"
+"threads specifies the number of threads compressing the data, 0 meaning\n"
+"the number of CPUs. With more than one, the data is split into blocks\n"
+"compressed independently, which can also be decompressed in parallel.\n"
+"Only FORMAT_XZ supports it.\n"
+"\n"
 "For one-shot compression, use the compress() function instead.\n");
 
 static PyTypeObject Compressor_type = {
@@ -0,0 +1,286 @@
+/* blob.c - the blob type
+ *
+ * A blob object gives incremental access to a single BLOB value, through
+ * sqlite3_blob_read() and sqlite3_blob_write(), without loading it whole.
+ */
+
+#include "blob.h"
+#include "util.h"
+
+static void pysqlite_blob_dealloc(pysqlite_Blob* self)
+{
+    pysqlite_blob_close_handle(self);
+    Py_XDECREF(self->connection);
+
+    if (self->in_weakreflist != NULL) {
+        PyObject_ClearWeakRefs((PyObject*)self);
+    }
+
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+/*
+ * Closes the SQLite blob handle, which the connection also does for all its
+ * blobs when it is closed.  The handle is always closed: the error code that
+ * sqlite3_blob_close() returns is the one of the last failed read or write,
+ * which has already been raised.
+ */
+void pysqlite_blob_close_handle(pysqlite_Blob* self)
+{
+    if (self->blob) {
+        Py_BEGIN_ALLOW_THREADS
+        sqlite3_blob_close(self->blob);
+        Py_END_ALLOW_THREADS
+        self->blob = NULL;
+    }
+}
+
+/*
+ * Checks if a blob object is usable (i. e. not closed).
+ *
+ * 0 => error; 1 => ok
+ */
+static int pysqlite_check_blob(pysqlite_Blob* self)
+{
+    if (!pysqlite_check_thread(self->connection)) {
+        return 0;
+    }
+    if (!self->blob) {
+        PyErr_SetString(pysqlite_ProgrammingError,
+                        "Cannot operate on a closed blob.");
+        return 0;
+    }
+    return 1;
+}
+
+static PyObject* pysqlite_blob_read(pysqlite_Blob* self, PyObject* args)
+{
+    Py_ssize_t length = -1;
+    PyObject* buffer;
+    int rc;
+
+    if (!PyArg_ParseTuple(args, "|n:read", &length)) {
+        return NULL;
+    }
+
+    if (!pysqlite_check_blob(self)) {
+        return NULL;
+    }
+
+    if (length < 0 || length > self->length - self->offset) {
+        length = self->length - self->offset;
+    }
+
+    buffer = PyBytes_FromStringAndSize(NULL, length);
+    if (!buffer) {
+        return NULL;
+    }
+
+    if (length > 0) {
+        Py_BEGIN_ALLOW_THREADS
+        rc = sqlite3_blob_read(self->blob, PyBytes_AS_STRING(buffer),
+                               (int)length, self->offset);
+        Py_END_ALLOW_THREADS
+
+        if (rc != SQLITE_OK) {
+            Py_DECREF(buffer);
+            _pysqlite_seterror(self->connection->db, NULL);
+            return NULL;
+        }
+        self->offset += (int)length;
+    }
+
+    return buffer;
+}
+
+static PyObject* pysqlite_blob_write(pysqlite_Blob* self, PyObject* args)
+{
+    Py_buffer data;
+    int rc;
+
+    if (!PyArg_ParseTuple(args, "y*:write", &data)) {
+        return NULL;
+    }
+
+    if (!pysqlite_check_blob(self)) {
+        PyBuffer_Release(&data);
+        return NULL;
+    }
+
+    /* A blob cannot change size, only the bytes it holds can be written. */
+    if (data.len > self->length - self->offset) {
+        PyErr_SetString(PyExc_ValueError, "data longer than blob length");
+        PyBuffer_Release(&data);
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    rc = sqlite3_blob_write(self->blob, data.buf, (int)data.len,
+                            self->offset);
+    Py_END_ALLOW_THREADS
+
+    if (rc != SQLITE_OK) {
+        PyBuffer_Release(&data);
+        _pysqlite_seterror(self->connection->db, NULL);
+        return NULL;
+    }
+
+    self->offset += (int)data.len;
+    PyBuffer_Release(&data);
+    Py_RETURN_NONE;
+}
+
+static PyObject* pysqlite_blob_seek(pysqlite_Blob* self, PyObject* args)
+{
+    Py_ssize_t offset;
+    int origin = 0;
+
+    if (!PyArg_ParseTuple(args, "n|i:seek", &offset, &origin)) {
+        return NULL;
+    }
+
+    if (!pysqlite_check_blob(self)) {
+        return NULL;
+    }
+
+    switch (origin) {
+        case 0:
+            break;
+        case 1:
+            offset += self->offset;
+            break;
+        case 2:
+            offset += self->length;
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError,
+                            "origin must be os.SEEK_SET, os.SEEK_CUR or "
+                            "os.SEEK_END");
+            return NULL;
+    }
+
+    if (offset < 0 || offset > self->length) {
+        PyErr_SetString(PyExc_ValueError, "offset out of blob range");
+        return NULL;
+    }
+
+    self->offset = (int)offset;
+    Py_RETURN_NONE;
+}
+
+static PyObject* pysqlite_blob_tell(pysqlite_Blob* self, PyObject* args)
+{
+    if (!pysqlite_check_blob(self)) {
+        return NULL;
+    }
+
+    return PyLong_FromLong(self->offset);
+}
+
+static PyObject* pysqlite_blob_close(pysqlite_Blob* self, PyObject* args)
+{
+    if (!pysqlite_check_thread(self->connection)) {
+        return NULL;
+    }
+
+    pysqlite_blob_close_handle(self);
+    Py_RETURN_NONE;
+}
+
+static PyObject* pysqlite_blob_enter(pysqlite_Blob* self, PyObject* args)
+{
+    if (!pysqlite_check_blob(self)) {
+        return NULL;
+    }
+
+    Py_INCREF(self);
+    return (PyObject*)self;
+}
+
+static PyObject* pysqlite_blob_exit(pysqlite_Blob* self, PyObject* args)
+{
+    return pysqlite_blob_close(self, NULL);
+}
+
+static Py_ssize_t pysqlite_blob_length(pysqlite_Blob* self)
+{
+    if (!pysqlite_check_blob(self)) {
+        return -1;
+    }
+
+    return self->length;
+}
+
+static PyMethodDef blob_methods[] = {
+    {"read", (PyCFunction)pysqlite_blob_read, METH_VARARGS,
+        PyDoc_STR("Read at most length bytes from the current position, "
+                  "or up to the end of the blob if length is negative.")},
+    {"write", (PyCFunction)pysqlite_blob_write, METH_VARARGS,
+        PyDoc_STR("Write data at the current position.  Blobs cannot be "
+                  "resized.")},
+    {"seek", (PyCFunction)pysqlite_blob_seek, METH_VARARGS,
+        PyDoc_STR("Change the current position of the blob.")},
+    {"tell", (PyCFunction)pysqlite_blob_tell, METH_NOARGS,
+        PyDoc_STR("Return the current position of the blob.")},
+    {"close", (PyCFunction)pysqlite_blob_close, METH_NOARGS,
+        PyDoc_STR("Close the blob.")},
+    {"__enter__", (PyCFunction)pysqlite_blob_enter, METH_NOARGS,
+        PyDoc_STR("For context manager.")},
+    {"__exit__", (PyCFunction)pysqlite_blob_exit, METH_VARARGS,
+        PyDoc_STR("For context manager.")},
+    {NULL, NULL}
+};
+
+static PySequenceMethods blob_sequence_methods = {
+    (lenfunc)pysqlite_blob_length,      /* sq_length */
+};
+
+static const char blob_doc[] =
+PyDoc_STR("SQLite blob object, created by Connection.blobopen().");
+
+PyTypeObject pysqlite_BlobType = {
+        PyVarObject_HEAD_INIT(NULL, 0)
+        MODULE_NAME ".Blob",                            /* tp_name */
+        sizeof(pysqlite_Blob),                          /* tp_basicsize */
+        0,                                              /* tp_itemsize */
+        (destructor)pysqlite_blob_dealloc,              /* tp_dealloc */
+        0,                                              /* tp_print */
+        0,                                              /* tp_getattr */
+        0,                                              /* tp_setattr */
+        0,                                              /* tp_reserved */
+        0,                                              /* tp_repr */
+        0,                                              /* tp_as_number */
+        &blob_sequence_methods,                         /* tp_as_sequence */
+        0,                                              /* tp_as_mapping */
+        0,                                              /* tp_hash */
+        0,                                              /* tp_call */
+        0,                                              /* tp_str */
+        0,                                              /* tp_getattro */
+        0,                                              /* tp_setattro */
+        0,                                              /* tp_as_buffer */
+        Py_TPFLAGS_DEFAULT,                             /* tp_flags */
+        blob_doc,                                       /* tp_doc */
+        0,                                              /* tp_traverse */
+        0,                                              /* tp_clear */
+        0,                                              /* tp_richcompare */
+        offsetof(pysqlite_Blob, in_weakreflist),        /* tp_weaklistoffset */
+        0,                                              /* tp_iter */
+        0,                                              /* tp_iternext */
+        blob_methods,                                   /* tp_methods */
+        0,                                              /* tp_members */
+        0,                                              /* tp_getset */
+        0,                                              /* tp_base */
+        0,                                              /* tp_dict */
+        0,                                              /* tp_descr_get */
+        0,                                              /* tp_descr_set */
+        0,                                              /* tp_dictoffset */
+        0,                                              /* tp_init */
+        0,                                              /* tp_alloc */
+        0,                                              /* tp_new */
+        0                                               /* tp_free */
+};
+
+extern int pysqlite_blob_setup_types(void)
+{
+    return PyType_Ready(&pysqlite_BlobType);
+}
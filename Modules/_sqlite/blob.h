@@ -0,0 +1,28 @@
+/* blob.h - definitions for the blob type */
+
+#ifndef PYSQLITE_BLOB_H
+#define PYSQLITE_BLOB_H
+#include "Python.h"
+#include "sqlite3.h"
+#include "connection.h"
+
+typedef struct
+{
+    PyObject_HEAD
+    pysqlite_Connection* connection;
+    sqlite3_blob* blob;
+
+    /* the current position and the size of the blob, in bytes */
+    int offset;
+    int length;
+
+    PyObject* in_weakreflist; /* List of weak references */
+} pysqlite_Blob;
+
+extern PyTypeObject pysqlite_BlobType;
+
+void pysqlite_blob_close_handle(pysqlite_Blob* self);
+
+int pysqlite_blob_setup_types(void);
+
+#endif
@@ -22,6 +22,7 @@
  */
 
 #include "cache.h"
+#include "structmember.h"
 #include <limits.h>
 
 /* only used internally */
@@ -72,6 +73,8 @@ int pysqlite_cache_init(pysqlite_Cache* self, PyObject* args, PyObject* kwargs)
     self->size = size;
     self->first = NULL;
     self->last = NULL;
+    self->hits = 0;
+    self->misses = 0;
 
     self->mapping = PyDict_New();
     if (!self->mapping) {
@@ -122,6 +125,9 @@ PyObject* pysqlite_cache_get(pysqlite_Cache* self, PyObject* args)
     node = (pysqlite_Node*)PyDict_GetItem(self->mapping, key);
     if (node) {
         /* an entry for this key already exists in the cache */
+        if (self->hits < LONG_MAX) {
+            self->hits++;
+        }
 
         /* increase usage counter of the node found */
         if (node->count < LONG_MAX) {
@@ -161,6 +167,9 @@ PyObject* pysqlite_cache_get(pysqlite_Cache* self, PyObject* args)
         /* There is no entry for this key in the cache, yet. We'll insert a new
          * entry in the cache, and make space if necessary by throwing the
          * least used item out of the cache. */
+        if (self->misses < LONG_MAX) {
+            self->misses++;
+        }
 
         if (PyDict_GET_SIZE(self->mapping) == self->size) {
             if (self->last) {
@@ -255,6 +264,14 @@ static PyMethodDef cache_methods[] = {
     {NULL, NULL}
 };
 
+static struct PyMemberDef cache_members[] =
+{
+    {"size", T_INT, offsetof(pysqlite_Cache, size), READONLY},
+    {"hits", T_LONG, offsetof(pysqlite_Cache, hits), READONLY},
+    {"misses", T_LONG, offsetof(pysqlite_Cache, misses), READONLY},
+    {NULL}
+};
+
 PyTypeObject pysqlite_NodeType = {
         PyVarObject_HEAD_INIT(NULL, 0)
         MODULE_NAME "Node",                             /* tp_name */
@@ -326,7 +343,7 @@ PyTypeObject pysqlite_CacheType = {
         0,                                              /* tp_iter */
         0,                                              /* tp_iternext */
         cache_methods,                                  /* tp_methods */
-        0,                                              /* tp_members */
+        cache_members,                                  /* tp_members */
         0,                                              /* tp_getset */
         0,                                              /* tp_base */
         0,                                              /* tp_dict */
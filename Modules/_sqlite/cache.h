@@ -56,6 +56,10 @@ typedef struct
     /* if set, decrement the factory function when the Cache is deallocated.
      * this is almost always desirable, but not in the pysqlite context */
     int decref_factory;
+
+    /* how many lookups found their key in the cache, and how many did not */
+    long hits;
+    long misses;
 } pysqlite_Cache;
 
 extern PyTypeObject pysqlite_NodeType;
@@ -27,6 +27,7 @@
 #include "connection.h"
 #include "statement.h"
 #include "cursor.h"
+#include "blob.h"
 #include "prepare_protocol.h"
 #include "util.h"
 
@@ -41,6 +42,10 @@
 #endif
 #endif
 
+#if SQLITE_VERSION_NUMBER >= 3006011
+#define HAVE_BACKUP_API
+#endif
+
 _Py_IDENTIFIER(cursor);
 
 static const char * const begin_statements[] = {
@@ -100,6 +105,7 @@ int pysqlite_connection_init(pysqlite_Connection* self, PyObject* args, PyObject
     self->statement_cache = NULL;
     self->statements = NULL;
     self->cursors = NULL;
+    self->blobs = NULL;
 
     Py_INCREF(Py_None);
     self->row_factory = Py_None;
@@ -150,10 +156,11 @@ int pysqlite_connection_init(pysqlite_Connection* self, PyObject* args, PyObject
     self->created_statements = 0;
     self->created_cursors = 0;
 
-    /* Create lists of weak references to statements/cursors */
+    /* Create lists of weak references to statements/cursors/blobs */
     self->statements = PyList_New(0);
     self->cursors = PyList_New(0);
-    if (!self->statements || !self->cursors) {
+    self->blobs = PyList_New(0);
+    if (!self->statements || !self->cursors || !self->blobs) {
         return -1;
     }
 
@@ -252,6 +259,7 @@ void pysqlite_connection_dealloc(pysqlite_Connection* self)
     Py_XDECREF(self->collations);
     Py_XDECREF(self->statements);
     Py_XDECREF(self->cursors);
+    Py_XDECREF(self->blobs);
 
     Py_TYPE(self)->tp_free((PyObject*)self);
 }
@@ -322,6 +330,31 @@ PyObject* pysqlite_connection_cursor(pysqlite_Connection* self, PyObject* args,
     return cursor;
 }
 
+/*
+ * Closes the handles of all the blobs of the connection, which would
+ * otherwise keep it from being closed.
+ *
+ * 0 => error; 1 => ok
+ */
+static int pysqlite_close_all_blobs(pysqlite_Connection* self)
+{
+    Py_ssize_t i;
+    PyObject* blob;
+
+    if (!self->blobs) {
+        return 1;
+    }
+
+    for (i = 0; i < PyList_GET_SIZE(self->blobs); i++) {
+        blob = PyWeakref_GetObject(PyList_GET_ITEM(self->blobs, i));
+        if (blob != Py_None) {
+            pysqlite_blob_close_handle((pysqlite_Blob*)blob);
+        }
+    }
+    return PyList_SetSlice(self->blobs, 0, PyList_GET_SIZE(self->blobs),
+                           NULL) == 0;
+}
+
 PyObject* pysqlite_connection_close(pysqlite_Connection* self, PyObject* args)
 {
     int rc;
@@ -330,6 +363,9 @@ PyObject* pysqlite_connection_close(pysqlite_Connection* self, PyObject* args)
         return NULL;
     }
 
+    if (!pysqlite_close_all_blobs(self)) {
+        return NULL;
+    }
     pysqlite_do_all_statements(self, ACTION_FINALIZE, 1);
 
     if (self->db) {
@@ -1233,6 +1269,7 @@ PyObject* pysqlite_connection_call(pysqlite_Connection* self, PyObject* args, Py
     statement->st = NULL;
     statement->sql = NULL;
     statement->in_use = 0;
+    statement->binding_names = NULL;
     statement->in_weakreflist = NULL;
 
     rc = pysqlite_statement_create(statement, self, sql);
@@ -1431,6 +1468,209 @@ finally:
     return retval;
 }
 
+static PyObject *
+pysqlite_connection_statement_cache_info(pysqlite_Connection* self, PyObject* args)
+{
+    pysqlite_Cache* cache = self->statement_cache;
+
+    if (!pysqlite_check_thread(self) || !pysqlite_check_connection(self)) {
+        return NULL;
+    }
+
+    return Py_BuildValue("llni", cache->hits, cache->misses,
+                         PyDict_GET_SIZE(cache->mapping), cache->size);
+}
+
+static PyObject *
+pysqlite_connection_blobopen(pysqlite_Connection* self, PyObject* args, PyObject* kwargs)
+{
+    static char *kwlist[] = {
+        "table", "column", "row", "readonly", "name", NULL
+    };
+    const char* table;
+    const char* column;
+    sqlite_int64 row;
+    int readonly = 0;
+    const char* name = "main";
+    sqlite3_blob* handle;
+    pysqlite_Blob* blob;
+    PyObject* weakref;
+    Py_ssize_t i;
+    int rc;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "ssL|$ps:blobopen", kwlist,
+                                     &table, &column, &row, &readonly,
+                                     &name)) {
+        return NULL;
+    }
+
+    if (!pysqlite_check_thread(self) || !pysqlite_check_connection(self)) {
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    rc = sqlite3_blob_open(self->db, name, table, column, row, !readonly,
+                           &handle);
+    Py_END_ALLOW_THREADS
+
+    if (rc != SQLITE_OK) {
+        _pysqlite_seterror(self->db, NULL);
+        return NULL;
+    }
+
+    blob = PyObject_New(pysqlite_Blob, &pysqlite_BlobType);
+    if (!blob) {
+        Py_BEGIN_ALLOW_THREADS
+        sqlite3_blob_close(handle);
+        Py_END_ALLOW_THREADS
+        return NULL;
+    }
+    Py_INCREF(self);
+    blob->connection = self;
+    blob->blob = handle;
+    blob->offset = 0;
+    blob->length = sqlite3_blob_bytes(handle);
+    blob->in_weakreflist = NULL;
+
+    /* Forget the blobs which are gone before registering this one. */
+    for (i = PyList_GET_SIZE(self->blobs) - 1; i >= 0; i--) {
+        if (PyWeakref_GetObject(PyList_GET_ITEM(self->blobs, i)) == Py_None) {
+            if (PyList_SetSlice(self->blobs, i, i + 1, NULL) < 0) {
+                Py_DECREF(blob);
+                return NULL;
+            }
+        }
+    }
+
+    weakref = PyWeakref_NewRef((PyObject*)blob, NULL);
+    if (!weakref) {
+        Py_DECREF(blob);
+        return NULL;
+    }
+    if (PyList_Append(self->blobs, weakref) < 0) {
+        Py_DECREF(weakref);
+        Py_DECREF(blob);
+        return NULL;
+    }
+    Py_DECREF(weakref);
+
+    return (PyObject*)blob;
+}
+
+#ifdef HAVE_BACKUP_API
+static PyObject *
+pysqlite_connection_backup(pysqlite_Connection* self, PyObject* args, PyObject* kwargs)
+{
+    static char *kwlist[] = {
+        "target", "pages", "progress", "name", "sleep", NULL
+    };
+    PyObject* target;
+    int pages = -1;
+    PyObject* progress = Py_None;
+    const char* name = "main";
+    double sleep_secs = 0.250;
+    sqlite3* target_db;
+    sqlite3_backup* handle;
+    PyObject* result;
+    int callback_error = 0;
+    int rc;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!|$iOsd:backup", kwlist,
+                                     &pysqlite_ConnectionType, &target,
+                                     &pages, &progress, &name, &sleep_secs)) {
+        return NULL;
+    }
+
+    if (!pysqlite_check_thread(self) || !pysqlite_check_connection(self)) {
+        return NULL;
+    }
+
+    if (!pysqlite_check_thread((pysqlite_Connection*)target) ||
+        !pysqlite_check_connection((pysqlite_Connection*)target)) {
+        return NULL;
+    }
+
+    if ((pysqlite_Connection*)target == self) {
+        PyErr_SetString(PyExc_ValueError,
+                        "target cannot be the same connection instance");
+        return NULL;
+    }
+
+    if (progress != Py_None && !PyCallable_Check(progress)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "progress argument must be a callable");
+        return NULL;
+    }
+
+    if (pages == 0) {
+        pages = -1;
+    }
+
+    target_db = ((pysqlite_Connection*)target)->db;
+
+#if SQLITE_VERSION_NUMBER < 3008008
+    /* Newer SQLite versions check this in sqlite3_backup_init(). */
+    if (!sqlite3_get_autocommit(target_db)) {
+        PyErr_SetString(pysqlite_OperationalError, "target is in transaction");
+        return NULL;
+    }
+#endif
+
+    Py_BEGIN_ALLOW_THREADS
+    handle = sqlite3_backup_init(target_db, "main", self->db, name);
+    Py_END_ALLOW_THREADS
+
+    if (!handle) {
+        _pysqlite_seterror(target_db, NULL);
+        return NULL;
+    }
+
+    /* Copy pages steps at a time.  The source database is only locked
+     * during each step, so that other connections can write to it between
+     * them, in which case the backup restarts. */
+    do {
+        Py_BEGIN_ALLOW_THREADS
+        rc = sqlite3_backup_step(handle, pages);
+        Py_END_ALLOW_THREADS
+
+        if (progress != Py_None) {
+            result = PyObject_CallFunction(progress, "iii", rc,
+                                           sqlite3_backup_remaining(handle),
+                                           sqlite3_backup_pagecount(handle));
+            if (!result) {
+                callback_error = 1;
+                break;
+            }
+            Py_DECREF(result);
+        }
+
+        /* Wait before retrying if the engine could not make any progress
+         * because the database was locked. */
+        if (rc == SQLITE_BUSY || rc == SQLITE_LOCKED) {
+            Py_BEGIN_ALLOW_THREADS
+            sqlite3_sleep((int)(sleep_secs * 1000.0));
+            Py_END_ALLOW_THREADS
+        }
+    } while (rc == SQLITE_OK || rc == SQLITE_BUSY || rc == SQLITE_LOCKED);
+
+    /* The error of the whole backup, if any, is set on the target
+     * connection by sqlite3_backup_finish(). */
+    Py_BEGIN_ALLOW_THREADS
+    rc = sqlite3_backup_finish(handle);
+    Py_END_ALLOW_THREADS
+
+    if (callback_error) {
+        return NULL;
+    }
+    if (rc != SQLITE_OK) {
+        _pysqlite_seterror(target_db, NULL);
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+#endif
+
 /* Function author: Paul Kippes <kippesp@gmail.com>
  * Class method of Connection to call the Python function _iterdump
  * of the sqlite3 module.
@@ -1649,6 +1889,14 @@ static PyMethodDef connection_methods[] = {
         PyDoc_STR("Abort any pending database operation. Non-standard.")},
     {"iterdump", (PyCFunction)pysqlite_connection_iterdump, METH_NOARGS,
         PyDoc_STR("Returns iterator to the dump of the database in an SQL text format. Non-standard.")},
+    {"_statement_cache_info", (PyCFunction)pysqlite_connection_statement_cache_info, METH_NOARGS,
+        PyDoc_STR("Returns the hits, misses, size and maximum size of the statement cache. Non-standard.")},
+    {"blobopen", (PyCFunction)pysqlite_connection_blobopen, METH_VARARGS|METH_KEYWORDS,
+        PyDoc_STR("Opens a blob for incremental I/O. Non-standard.")},
+    #ifdef HAVE_BACKUP_API
+    {"backup", (PyCFunction)pysqlite_connection_backup, METH_VARARGS|METH_KEYWORDS,
+        PyDoc_STR("Makes a backup of the database. Non-standard.")},
+    #endif
     {"__enter__", (PyCFunction)pysqlite_connection_enter, METH_NOARGS,
         PyDoc_STR("For context manager. Non-standard.")},
     {"__exit__", (PyCFunction)pysqlite_connection_exit, METH_VARARGS,
@@ -244,9 +244,10 @@ PyObject* _pysqlite_fetch_one_row(pysqlite_Cursor* self)
         return NULL;
     }
 
-    Py_BEGIN_ALLOW_THREADS
+    /* sqlite3_data_count() and the sqlite3_column_*() functions only read
+     * the current row, already in memory, so the GIL is kept: releasing and
+     * taking it for each column would cost more than the calls. */
     numcols = sqlite3_data_count(self->statement->st);
-    Py_END_ALLOW_THREADS
 
     row = PyTuple_New(numcols);
     if (!row)
@@ -278,9 +279,7 @@ PyObject* _pysqlite_fetch_one_row(pysqlite_Cursor* self)
                     break;
             }
         } else {
-            Py_BEGIN_ALLOW_THREADS
             coltype = sqlite3_column_type(self->statement->st, i);
-            Py_END_ALLOW_THREADS
             if (coltype == SQLITE_NULL) {
                 Py_INCREF(Py_None);
                 converted = Py_None;
@@ -584,9 +583,7 @@ PyObject* _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject*
         }
 
         if (rc == SQLITE_ROW || rc == SQLITE_DONE) {
-            Py_BEGIN_ALLOW_THREADS
             numcols = sqlite3_column_count(self->statement->st);
-            Py_END_ALLOW_THREADS
             if (self->description == Py_None && numcols > 0) {
                 Py_SETREF(self->description, PyTuple_New(numcols));
                 if (!self->description) {
@@ -617,9 +614,7 @@ PyObject* _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject*
 
         if (!multiple) {
             Py_DECREF(self->lastrowid);
-            Py_BEGIN_ALLOW_THREADS
             lastrowid = sqlite3_last_insert_rowid(self->connection->db);
-            Py_END_ALLOW_THREADS
             self->lastrowid = _pysqlite_long_from_int64(lastrowid);
         }
 
@@ -762,21 +757,55 @@ PyObject* pysqlite_cursor_getiter(pysqlite_Cursor *self)
     return (PyObject*)self;
 }
 
-PyObject* pysqlite_cursor_iternext(pysqlite_Cursor *self)
+/*
+ * Checks if rows can be fetched from a cursor.
+ *
+ * 0 => error; 1 => ok
+ */
+static int check_fetch(pysqlite_Cursor* self)
 {
-    PyObject* next_row_tuple;
-    PyObject* next_row;
-    int rc;
-
     if (!check_cursor(self)) {
-        return NULL;
+        return 0;
     }
 
     if (self->reset) {
         PyErr_SetString(pysqlite_InterfaceError, errmsg_fetch_across_rollback);
-        return NULL;
+        return 0;
     }
 
+    return 1;
+}
+
+/*
+ * Returns whether fetching a row may call back into Python code, which may
+ * use the cursor or its connection in the meantime: a row factory, a
+ * converter, a text factory, or a function, collation or handler registered
+ * with the connection, which are all kept in function_pinboard and
+ * collations.
+ */
+static int fetch_calls_python(pysqlite_Cursor* self)
+{
+    pysqlite_Connection* connection = self->connection;
+    PyObject* text_factory = connection->text_factory;
+
+    return self->row_factory != Py_None || connection->detect_types ||
+           (text_factory != (PyObject*)&PyUnicode_Type &&
+            text_factory != (PyObject*)&PyBytes_Type &&
+            text_factory != (PyObject*)&PyByteArray_Type) ||
+           PyDict_GET_SIZE(connection->function_pinboard) ||
+           PyDict_GET_SIZE(connection->collations);
+}
+
+/*
+ * Returns the next row of a cursor which has been checked by check_fetch(),
+ * or NULL without an exception when there are no more rows.
+ */
+static PyObject* _pysqlite_cursor_next_row(pysqlite_Cursor *self)
+{
+    PyObject* next_row_tuple;
+    PyObject* next_row;
+    int rc;
+
     if (!self->next_row) {
          if (self->statement) {
             (void)pysqlite_statement_reset(self->statement);
@@ -818,6 +847,7 @@ PyObject* pysqlite_cursor_iternext(pysqlite_Cursor *self)
             self->next_row = _pysqlite_fetch_one_row(self);
             if (self->next_row == NULL) {
                 (void)pysqlite_statement_reset(self->statement);
+                Py_DECREF(next_row);
                 return NULL;
             }
         }
@@ -826,88 +856,92 @@ PyObject* pysqlite_cursor_iternext(pysqlite_Cursor *self)
     return next_row;
 }
 
-PyObject* pysqlite_cursor_fetchone(pysqlite_Cursor* self, PyObject* args)
+PyObject* pysqlite_cursor_iternext(pysqlite_Cursor *self)
 {
-    PyObject* row;
-
-    row = pysqlite_cursor_iternext(self);
-    if (!row && !PyErr_Occurred()) {
-        Py_RETURN_NONE;
+    if (!check_fetch(self)) {
+        return NULL;
     }
 
-    return row;
+    return _pysqlite_cursor_next_row(self);
 }
 
-PyObject* pysqlite_cursor_fetchmany(pysqlite_Cursor* self, PyObject* args, PyObject* kwargs)
+/*
+ * Returns a list of the next maxrows rows of a cursor, or of all its
+ * remaining rows if maxrows is zero or negative.
+ *
+ * The cursor is only checked once for the whole batch, unless fetching a
+ * row may run Python code, which could close or reuse it.
+ */
+static PyObject* _pysqlite_cursor_fetch_rows(pysqlite_Cursor* self, int maxrows)
 {
-    static char *kwlist[] = {"size", NULL, NULL};
-
     PyObject* row;
     PyObject* list;
-    int maxrows = self->arraysize;
+    int check_each;
     int counter = 0;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|i:fetchmany", kwlist, &maxrows)) {
+    if (!check_fetch(self)) {
         return NULL;
     }
+    check_each = fetch_calls_python(self);
 
     list = PyList_New(0);
     if (!list) {
         return NULL;
     }
 
-    /* just make sure we enter the loop */
-    row = Py_None;
-
-    while (row) {
-        row = pysqlite_cursor_iternext(self);
-        if (row) {
-            PyList_Append(list, row);
-            Py_DECREF(row);
-        } else {
-            break;
+    while (maxrows <= 0 || counter < maxrows) {
+        if (check_each && counter > 0 && !check_fetch(self)) {
+            Py_DECREF(list);
+            return NULL;
         }
-
-        if (++counter == maxrows) {
+        row = _pysqlite_cursor_next_row(self);
+        if (!row) {
             break;
         }
+        if (PyList_Append(list, row) != 0) {
+            Py_DECREF(row);
+            Py_DECREF(list);
+            return NULL;
+        }
+        Py_DECREF(row);
+        counter++;
     }
 
     if (PyErr_Occurred()) {
         Py_DECREF(list);
         return NULL;
-    } else {
-        return list;
     }
+    return list;
 }
 
-PyObject* pysqlite_cursor_fetchall(pysqlite_Cursor* self, PyObject* args)
+PyObject* pysqlite_cursor_fetchone(pysqlite_Cursor* self, PyObject* args)
 {
     PyObject* row;
-    PyObject* list;
 
-    list = PyList_New(0);
-    if (!list) {
-        return NULL;
+    row = pysqlite_cursor_iternext(self);
+    if (!row && !PyErr_Occurred()) {
+        Py_RETURN_NONE;
     }
 
-    /* just make sure we enter the loop */
-    row = (PyObject*)Py_None;
+    return row;
+}
 
-    while (row) {
-        row = pysqlite_cursor_iternext(self);
-        if (row) {
-            PyList_Append(list, row);
-            Py_DECREF(row);
-        }
-    }
+PyObject* pysqlite_cursor_fetchmany(pysqlite_Cursor* self, PyObject* args, PyObject* kwargs)
+{
+    static char *kwlist[] = {"size", NULL, NULL};
 
-    if (PyErr_Occurred()) {
-        Py_DECREF(list);
+    int maxrows = self->arraysize;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|i:fetchmany", kwlist, &maxrows)) {
         return NULL;
-    } else {
-        return list;
     }
+
+    return _pysqlite_cursor_fetch_rows(self, maxrows);
+}
+
+PyObject* pysqlite_cursor_fetchall(pysqlite_Cursor* self, PyObject* args)
+{
+    return _pysqlite_cursor_fetch_rows(self, 0);
 }
 
 PyObject* pysqlite_noop(pysqlite_Connection* self, PyObject* args)
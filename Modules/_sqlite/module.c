@@ -24,6 +24,7 @@
 #include "connection.h"
 #include "statement.h"
 #include "cursor.h"
+#include "blob.h"
 #include "cache.h"
 #include "prepare_protocol.h"
 #include "microprotocols.h"
@@ -163,7 +164,8 @@ static PyObject* module_register_adapter(PyObject* self, PyObject* args)
     /* a basic type is adapted; there's a performance optimization if that's not the case
      * (99 % of all usages) */
     if (type == &PyLong_Type || type == &PyFloat_Type
-            || type == &PyUnicode_Type || type == &PyByteArray_Type) {
+            || type == &PyUnicode_Type || type == &PyBytes_Type
+            || type == &PyByteArray_Type) {
         pysqlite_BaseTypeAdapted = 1;
     }
 
@@ -269,6 +271,7 @@ static const IntConstantPair _int_constants[] = {
     {"PARSE_COLNAMES", PARSE_COLNAMES},
 
     {"SQLITE_OK", SQLITE_OK},
+    {"SQLITE_DONE", SQLITE_DONE},
     {"SQLITE_DENY", SQLITE_DENY},
     {"SQLITE_IGNORE", SQLITE_IGNORE},
     {"SQLITE_CREATE_INDEX", SQLITE_CREATE_INDEX},
@@ -343,6 +346,7 @@ PyMODINIT_FUNC PyInit__sqlite3(void)
     if (!module ||
         (pysqlite_row_setup_types() < 0) ||
         (pysqlite_cursor_setup_types() < 0) ||
+        (pysqlite_blob_setup_types() < 0) ||
         (pysqlite_connection_setup_types() < 0) ||
         (pysqlite_cache_setup_types() < 0) ||
         (pysqlite_statement_setup_types() < 0) ||
@@ -356,6 +360,8 @@ PyMODINIT_FUNC PyInit__sqlite3(void)
     PyModule_AddObject(module, "Connection", (PyObject*) &pysqlite_ConnectionType);
     Py_INCREF(&pysqlite_CursorType);
     PyModule_AddObject(module, "Cursor", (PyObject*) &pysqlite_CursorType);
+    Py_INCREF(&pysqlite_BlobType);
+    PyModule_AddObject(module, "Blob", (PyObject*) &pysqlite_BlobType);
     Py_INCREF(&pysqlite_CacheType);
     PyModule_AddObject(module, "Statement", (PyObject*)&pysqlite_StatementType);
     Py_INCREF(&pysqlite_StatementType);
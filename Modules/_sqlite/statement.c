@@ -58,6 +58,7 @@ int pysqlite_statement_create(pysqlite_Statement* self, pysqlite_Connection* con
 
     self->st = NULL;
     self->in_use = 0;
+    self->binding_names = NULL;
 
     sql_cstr = PyUnicode_AsUTF8AndSize(sql, &sql_cstr_len);
     if (sql_cstr == NULL) {
@@ -194,26 +195,65 @@ static int _need_adapt(PyObject* obj)
     }
 
     if (PyLong_CheckExact(obj) || PyFloat_CheckExact(obj)
-          || PyUnicode_CheckExact(obj) || PyByteArray_CheckExact(obj)) {
+          || PyUnicode_CheckExact(obj) || PyBytes_CheckExact(obj)
+          || PyByteArray_CheckExact(obj)) {
         return 0;
     } else {
         return 1;
     }
 }
 
+/* Returns the tuple of the names of the parameters of the statement, with
+ * None for the unnamed ones, computed once for all the rows bound to it. */
+static PyObject* _get_binding_names(pysqlite_Statement* self, int num_params)
+{
+    PyObject* names;
+    PyObject* name;
+    const char* binding_name;
+    int i;
+
+    if (self->binding_names) {
+        return self->binding_names;
+    }
+
+    names = PyTuple_New(num_params);
+    if (!names) {
+        return NULL;
+    }
+    for (i = 0; i < num_params; i++) {
+        binding_name = sqlite3_bind_parameter_name(self->st, i + 1);
+        if (binding_name) {
+            /* skip first char (the colon) */
+            name = PyUnicode_InternFromString(binding_name + 1);
+            if (!name) {
+                Py_DECREF(names);
+                return NULL;
+            }
+        } else {
+            Py_INCREF(Py_None);
+            name = Py_None;
+        }
+        PyTuple_SET_ITEM(names, i, name);
+    }
+
+    self->binding_names = names;
+    return names;
+}
+
 void pysqlite_statement_bind_parameters(pysqlite_Statement* self, PyObject* parameters)
 {
     PyObject* current_param;
     PyObject* adapted;
-    const char* binding_name;
+    PyObject* binding_names;
+    PyObject* binding_name;
     int i;
     int rc;
     int num_params_needed;
     Py_ssize_t num_params;
 
-    Py_BEGIN_ALLOW_THREADS
+    /* This and the other sqlite3_bind_*() calls only access the memory of
+     * the statement, so the GIL is kept. */
     num_params_needed = sqlite3_bind_parameter_count(self->st);
-    Py_END_ALLOW_THREADS
 
     if (PyTuple_CheckExact(parameters) || PyList_CheckExact(parameters) || (!PyDict_Check(parameters) && PySequence_Check(parameters))) {
         /* parameters passed as sequence */
@@ -269,21 +309,22 @@ void pysqlite_statement_bind_parameters(pysqlite_Statement* self, PyObject* para
         }
     } else if (PyDict_Check(parameters)) {
         /* parameters passed as dictionary */
+        binding_names = _get_binding_names(self, num_params_needed);
+        if (!binding_names) {
+            return;
+        }
         for (i = 1; i <= num_params_needed; i++) {
-            Py_BEGIN_ALLOW_THREADS
-            binding_name = sqlite3_bind_parameter_name(self->st, i);
-            Py_END_ALLOW_THREADS
-            if (!binding_name) {
+            binding_name = PyTuple_GET_ITEM(binding_names, i - 1);
+            if (binding_name == Py_None) {
                 PyErr_Format(pysqlite_ProgrammingError, "Binding %d has no name, but you supplied a dictionary (which has only names).", i);
                 return;
             }
 
-            binding_name++; /* skip first char (the colon) */
             if (PyDict_CheckExact(parameters)) {
-                current_param = PyDict_GetItemString(parameters, binding_name);
+                current_param = PyDict_GetItem(parameters, binding_name);
                 Py_XINCREF(current_param);
             } else {
-                current_param = PyMapping_GetItemString(parameters, binding_name);
+                current_param = PyObject_GetItem(parameters, binding_name);
             }
             if (!current_param) {
                 PyErr_Format(pysqlite_ProgrammingError, "You did not supply a value for binding %d.", i);
@@ -307,7 +348,7 @@ void pysqlite_statement_bind_parameters(pysqlite_Statement* self, PyObject* para
 
             if (rc != SQLITE_OK) {
                 if (!PyErr_Occurred()) {
-                    PyErr_Format(pysqlite_InterfaceError, "Error binding parameter :%s - probably unsupported type.", binding_name);
+                    PyErr_Format(pysqlite_InterfaceError, "Error binding parameter :%U - probably unsupported type.", binding_name);
                 }
                 return;
            }
@@ -415,6 +456,7 @@ void pysqlite_statement_dealloc(pysqlite_Statement* self)
     self->st = NULL;
 
     Py_XDECREF(self->sql);
+    Py_XDECREF(self->binding_names);
 
     if (self->in_weakreflist != NULL) {
         PyObject_ClearWeakRefs((PyObject*)self);
@@ -39,6 +39,9 @@ typedef struct
     PyObject* sql;
     int in_use;
     int is_ddl;
+    /* tuple of the names of the parameters, without their prefix, or NULL
+     * until the statement is first bound to a mapping */
+    PyObject* binding_names;
     PyObject* in_weakreflist; /* List of weak references */
 } pysqlite_Statement;
 
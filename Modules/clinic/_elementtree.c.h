@@ -693,7 +693,7 @@ exit:
 }
 
 PyDoc_STRVAR(_elementtree_XMLParser__setevents__doc__,
-"_setevents($self, events_queue, events_to_report=None, /)\n"
+"_setevents($self, events_queue, events_to_report=None, tags=None, /)\n"
 "--\n"
 "\n");
 
@@ -703,7 +703,8 @@ PyDoc_STRVAR(_elementtree_XMLParser__setevents__doc__,
 static PyObject *
 _elementtree_XMLParser__setevents_impl(XMLParserObject *self,
                                        PyObject *events_queue,
-                                       PyObject *events_to_report);
+                                       PyObject *events_to_report,
+                                       PyObject *tags);
 
 static PyObject *
 _elementtree_XMLParser__setevents(XMLParserObject *self, PyObject **args, Py_ssize_t nargs, PyObject *kwnames)
@@ -711,19 +712,20 @@ _elementtree_XMLParser__setevents(XMLParserObject *self, PyObject **args, Py_ssi
     PyObject *return_value = NULL;
     PyObject *events_queue;
     PyObject *events_to_report = Py_None;
+    PyObject *tags = Py_None;
 
     if (!_PyArg_UnpackStack(args, nargs, "_setevents",
-        1, 2,
-        &events_queue, &events_to_report)) {
+        1, 3,
+        &events_queue, &events_to_report, &tags)) {
         goto exit;
     }
 
     if (!_PyArg_NoStackKeywords("_setevents", kwnames)) {
         goto exit;
     }
-    return_value = _elementtree_XMLParser__setevents_impl(self, events_queue, events_to_report);
+    return_value = _elementtree_XMLParser__setevents_impl(self, events_queue, events_to_report, tags);
 
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=b69fa98c40917f58 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=6950a2805c8da301 input=a9049054013a1b77]*/
@@ -112,6 +112,7 @@
 static wchar_t prefix[MAXPATHLEN+1];
 static wchar_t exec_prefix[MAXPATHLEN+1];
 static wchar_t progpath[MAXPATHLEN+1];
+static wchar_t stdlib_dir[MAXPATHLEN+1];
 static wchar_t *module_search_path = NULL;
 
 /* Get file status. Encode the path to the locale encoding. */
@@ -674,6 +675,7 @@ calculate_path(void)
     }
     else
         reduce(prefix);
+    wcsncpy(stdlib_dir, prefix, MAXPATHLEN);
 
     wcsncpy(zip_path, prefix, MAXPATHLEN);
     zip_path[MAXPATHLEN] = L'\0';
@@ -873,6 +875,18 @@ Py_GetProgramFullPath(void)
     return progpath;
 }
 
+/* Return the directory of the platform independent library modules, e.g.
+   /usr/local/lib/python3.7 or Lib/ in the source tree.  The result is empty
+   if the module search path was set by Py_SetPath().  Used by
+   Python/import.c for the modules frozen by --with-frozen-stdlib. */
+wchar_t *
+_Py_GetStdlibDir(void)
+{
+    if (!module_search_path)
+        calculate_path();
+    return stdlib_dir;
+}
+
 
 #ifdef __cplusplus
 }
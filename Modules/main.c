@@ -97,7 +97,9 @@ static const char usage_5[] =
 "               The default module search path uses %s.\n"
 "PYTHONCASEOK : ignore case in 'import' statements (Windows).\n"
 "PYTHONIOENCODING: Encoding[:errors] used for stdin/stdout/stderr.\n"
-"PYTHONFAULTHANDLER: dump the Python traceback on fatal errors.\n";
+"PYTHONFAULTHANDLER: dump the Python traceback on fatal errors.\n"
+"PYTHONLAZYIMPORTS: defer the execution of imported modules until first use.\n"
+"PYTHONPROFILEIMPORTTIME: show how long each import takes.\n";
 static const char usage_6[] =
 "PYTHONHASHSEED: if this variable is set to 'random', a random value is used\n"
 "   to seed the hashes of str, bytes and datetime objects.  It can also be\n"
@@ -1377,6 +1377,30 @@ _PyDict_NewPresized(Py_ssize_t minused)
     return new_dict(new_keys, NULL);
 }
 
+/* Return a new empty dict sharing the keys table of the dict model, which
+   is converted to a split table if needed.  As for the __dict__ of
+   instances, dicts built by inserting string keys in the order of the model
+   keep sharing its keys and only store their values; inserting other keys
+   converts them back to a combined table.  If model cannot share its keys,
+   return a new dict presized for its number of items. */
+PyObject *
+_PyDict_NewSharingKeys(PyObject *model)
+{
+    PyDictObject *mp = (PyDictObject *)model;
+    PyDictKeysObject *keys;
+
+    assert(PyDict_Check(model));
+    if (mp->ma_used == 0 || mp->ma_keys == Py_EMPTY_KEYS)
+        return PyDict_New();
+    keys = make_keys_shared(model);
+    if (keys == NULL) {
+        if (PyErr_Occurred())
+            return NULL;
+        return _PyDict_NewPresized(mp->ma_used);
+    }
+    return new_dict_with_shared_keys(keys);
+}
+
 /* Note that, for historical reasons, PyDict_GetItem() suppresses all errors
  * that may occur (originally dicts supported only string keys, and exceptions
  * weren't possible).  So, while the original intent was that a NULL return
@@ -1,5 +1,9 @@
 /* This is built as a stand-alone executable by the Makefile, and helps turn
    Lib/importlib/_bootstrap.py into a frozen module in Python/importlib.h
+
+   When given a module name as an extra first argument, it freezes that
+   module instead; this is used for the standard library modules frozen by
+   --with-frozen-stdlib (see Python/frozen.c).
 */
 
 #include <Python.h>
@@ -25,6 +29,12 @@ static const struct _frozen _PyImport_FrozenModules[] = {
    from frozen.obj. In the Makefile, frozen.o is not linked into this executable,
    so we define the variable here. */
 const struct _frozen *PyImport_FrozenModules;
+
+/* Likewise for the table of frozen standard library modules, which is left
+   empty for the same reason as above. */
+const struct _frozen _PyImport_FrozenStdlibModules[] = {
+    {0, 0, 0} /* sentinel */
+};
 #endif
 
 const char header[] = "/* Auto-generated by Programs/_freeze_importlib.c */";
@@ -32,7 +42,8 @@ const char header[] = "/* Auto-generated by Programs/_freeze_importlib.c */";
 int
 main(int argc, char *argv[])
 {
-    char *inpath, *outpath, *code_name;
+    char *inpath, *outpath, *modname = NULL, *code_name = NULL;
+    char *array_name = NULL, *c;
     FILE *infile = NULL, *outfile = NULL;
     struct _Py_stat_struct status;
     size_t text_size, data_size, n;
@@ -43,6 +54,11 @@ main(int argc, char *argv[])
 
     PyImport_FrozenModules = _PyImport_FrozenModules;
 
+    if (argc == 4) {
+        modname = argv[1];
+        argv++;
+        argc--;
+    }
     if (argc != 3) {
         fprintf(stderr, "need to specify input and output paths\n");
         return 2;
@@ -83,14 +99,30 @@ main(int argc, char *argv[])
     /* Don't install importlib, since it could execute outdated bytecode. */
     _Py_InitializeEx_Private(1, 0);
 
-    if (strstr(inpath, "_external") != NULL) {
+    if (modname != NULL) {
+        /* "<frozen NAME>" and "_Py_M__NAME" with dots replaced */
+        code_name = malloc(strlen(modname) + 10);
+        array_name = malloc(strlen(modname) + 8);
+        if (code_name == NULL || array_name == NULL) {
+            fprintf(stderr, "could not allocate names for '%s'\n", modname);
+            goto error;
+        }
+        sprintf(code_name, "<frozen %s>", modname);
+        sprintf(array_name, "_Py_M__%s", modname);
+        for (c = array_name; *c != '\0'; c++) {
+            if (*c == '.')
+                *c = '_';
+        }
+    }
+    else if (strstr(inpath, "_external") != NULL) {
         is_bootstrap = 0;
     }
 
-    code_name = is_bootstrap ?
-        "<frozen importlib._bootstrap>" :
-        "<frozen importlib._bootstrap_external>";
-    code = Py_CompileStringExFlags(text, code_name, Py_file_input, NULL, 0);
+    code = Py_CompileStringExFlags(text,
+        code_name != NULL ? code_name :
+        is_bootstrap ? "<frozen importlib._bootstrap>" :
+                       "<frozen importlib._bootstrap_external>",
+        Py_file_input, NULL, 0);
     if (code == NULL)
         goto error;
     free(text);
@@ -113,7 +145,9 @@ main(int argc, char *argv[])
         goto error;
     }
     fprintf(outfile, "%s\n", header);
-    if (is_bootstrap)
+    if (array_name != NULL)
+        fprintf(outfile, "const unsigned char %s[] = {\n", array_name);
+    else if (is_bootstrap)
         fprintf(outfile, "const unsigned char _Py_M__importlib[] = {\n");
     else
         fprintf(outfile,
@@ -129,6 +163,8 @@ main(int argc, char *argv[])
     fprintf(outfile, "};\n");
 
     Py_CLEAR(marshalled);
+    free(code_name);
+    free(array_name);
 
     Py_Finalize();
     if (outfile) {
@@ -149,6 +185,8 @@ error:
         fclose(outfile);
     if (text)
         free(text);
+    free(code_name);
+    free(array_name);
     if (marshalled)
         Py_DECREF(marshalled);
     return 1;
@@ -264,6 +264,36 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_imp__frozen_stdlib_filename__doc__,
+"_frozen_stdlib_filename($module, name, /)\n"
+"--\n"
+"\n"
+"Return the source file name of a frozen standard library module.\n"
+"\n"
+"Return None if the module name does not correspond to a standard library\n"
+"module frozen by --with-frozen-stdlib.");
+
+#define _IMP__FROZEN_STDLIB_FILENAME_METHODDEF    \
+    {"_frozen_stdlib_filename", (PyCFunction)_imp__frozen_stdlib_filename, METH_O, _imp__frozen_stdlib_filename__doc__},
+
+static PyObject *
+_imp__frozen_stdlib_filename_impl(PyObject *module, PyObject *name);
+
+static PyObject *
+_imp__frozen_stdlib_filename(PyObject *module, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *name;
+
+    if (!PyArg_Parse(arg, "U:_frozen_stdlib_filename", &name)) {
+        goto exit;
+    }
+    return_value = _imp__frozen_stdlib_filename_impl(module, name);
+
+exit:
+    return return_value;
+}
+
 #if defined(HAVE_DYNAMIC_LOADING)
 
 PyDoc_STRVAR(_imp_create_dynamic__doc__,
@@ -369,4 +399,4 @@ exit:
 #ifndef _IMP_EXEC_DYNAMIC_METHODDEF
     #define _IMP_EXEC_DYNAMIC_METHODDEF
 #endif /* !defined(_IMP_EXEC_DYNAMIC_METHODDEF) */
-/*[clinic end generated code: output=c1d0e65d04114958 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=fae26bac9c990ce5 input=a9049054013a1b77]*/
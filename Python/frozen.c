@@ -44,3 +44,59 @@ static const struct _frozen _PyImport_FrozenModules[] = {
    collection of frozen modules: */
 
 const struct _frozen *PyImport_FrozenModules = _PyImport_FrozenModules;
+
+/* The standard library modules imported at startup, frozen when Python is
+   configured --with-frozen-stdlib.  They are only looked up by the import
+   system when the frozen_modules -X option is on, which is the default
+   unless Python runs from its build directory.  Negative sizes indicate
+   packages, as above. */
+
+#ifdef Py_FROZEN_STDLIB
+#include "frozen_modules/_bootlocale.h"
+#include "frozen_modules/_collections_abc.h"
+#include "frozen_modules/_sitebuiltins.h"
+#include "frozen_modules/_weakrefset.h"
+#include "frozen_modules/abc.h"
+#include "frozen_modules/codecs.h"
+#include "frozen_modules/encodings.h"
+#include "frozen_modules/encodings.aliases.h"
+#include "frozen_modules/encodings.ascii.h"
+#include "frozen_modules/encodings.latin_1.h"
+#include "frozen_modules/encodings.utf_8.h"
+#include "frozen_modules/genericpath.h"
+#include "frozen_modules/io.h"
+#include "frozen_modules/os.h"
+#include "frozen_modules/posixpath.h"
+#include "frozen_modules/site.h"
+#include "frozen_modules/stat.h"
+
+const struct _frozen _PyImport_FrozenStdlibModules[] = {
+    {"_bootlocale", _Py_M___bootlocale, (int)sizeof(_Py_M___bootlocale)},
+    {"_collections_abc", _Py_M___collections_abc,
+        (int)sizeof(_Py_M___collections_abc)},
+    {"_sitebuiltins", _Py_M___sitebuiltins, (int)sizeof(_Py_M___sitebuiltins)},
+    {"_weakrefset", _Py_M___weakrefset, (int)sizeof(_Py_M___weakrefset)},
+    {"abc", _Py_M__abc, (int)sizeof(_Py_M__abc)},
+    {"codecs", _Py_M__codecs, (int)sizeof(_Py_M__codecs)},
+    {"encodings", _Py_M__encodings, -(int)sizeof(_Py_M__encodings)},
+    {"encodings.aliases", _Py_M__encodings_aliases,
+        (int)sizeof(_Py_M__encodings_aliases)},
+    {"encodings.ascii", _Py_M__encodings_ascii,
+        (int)sizeof(_Py_M__encodings_ascii)},
+    {"encodings.latin_1", _Py_M__encodings_latin_1,
+        (int)sizeof(_Py_M__encodings_latin_1)},
+    {"encodings.utf_8", _Py_M__encodings_utf_8,
+        (int)sizeof(_Py_M__encodings_utf_8)},
+    {"genericpath", _Py_M__genericpath, (int)sizeof(_Py_M__genericpath)},
+    {"io", _Py_M__io, (int)sizeof(_Py_M__io)},
+    {"os", _Py_M__os, (int)sizeof(_Py_M__os)},
+    {"posixpath", _Py_M__posixpath, (int)sizeof(_Py_M__posixpath)},
+    {"site", _Py_M__site, (int)sizeof(_Py_M__site)},
+    {"stat", _Py_M__stat, (int)sizeof(_Py_M__stat)},
+    {0, 0, 0} /* sentinel */
+};
+#else
+const struct _frozen _PyImport_FrozenStdlibModules[] = {
+    {0, 0, 0} /* sentinel */
+};
+#endif
@@ -29,6 +29,23 @@ extern struct _inittab _PyImport_Inittab[];
 
 struct _inittab *PyImport_Inittab = _PyImport_Inittab;
 
+/* This table is defined in frozen.c; it is empty unless Python is
+   configured --with-frozen-stdlib. */
+extern const struct _frozen _PyImport_FrozenStdlibModules[];
+
+#ifdef Py_FROZEN_STDLIB
+/* This function is defined in Modules/getpath.c */
+extern wchar_t *_Py_GetStdlibDir(void);
+#endif
+
+/* 1 if the modules of _PyImport_FrozenStdlibModules are imported as frozen
+   modules, set by _PyImport_Init() from the frozen_modules -X option. */
+static int use_frozen_stdlib = 0;
+
+/* Set by the -X importtime option and the PYTHONPROFILEIMPORTTIME
+   environment variable: print the time spent importing each module. */
+static int import_time = 0;
+
 static PyObject *initstr = NULL;
 
 /*[clinic input]
@@ -40,6 +57,72 @@ module _imp
 
 /* Initialize things */
 
+/* Return 1 if "-X frozen_modules=on" is given, 0 if "-X frozen_modules=off"
+   is given and -1 for any other value.  By default, the frozen standard
+   library is used unless Python runs from its build directory, so that
+   changes made to the modules in a development checkout take effect. */
+
+static int
+frozen_stdlib_option(void)
+{
+#ifdef Py_FROZEN_STDLIB
+    PyObject *xoptions, *value;
+    const wchar_t *progpath, *sep;
+    wchar_t path[MAXPATHLEN+1];
+    char *cpath;
+    struct stat st;
+    int err;
+
+    xoptions = PySys_GetXOptions();
+    if (xoptions == NULL)
+        return -1;
+    value = PyDict_GetItemString(xoptions, "frozen_modules");
+    if (value == Py_True)
+        return 1;
+    if (value != NULL) {
+        if (!PyUnicode_Check(value))
+            return -1;
+        if (_PyUnicode_EqualToASCIIString(value, "on"))
+            return 1;
+        if (_PyUnicode_EqualToASCIIString(value, "off"))
+            return 0;
+        return -1;
+    }
+
+    /* Like Modules/getpath.c, look for the pybuilddir.txt file written in
+       the build directory next to the python executable. */
+    progpath = Py_GetProgramFullPath();
+    sep = wcsrchr(progpath, SEP);
+    if (sep == NULL || sep - progpath + 15 > MAXPATHLEN)
+        return 1;
+    wcsncpy(path, progpath, sep - progpath + 1);
+    wcscpy(path + (sep - progpath + 1), L"pybuilddir.txt");
+    cpath = Py_EncodeLocale(path, NULL);
+    if (cpath == NULL)
+        return 1;
+    err = stat(cpath, &st);
+    PyMem_Free(cpath);
+    return err != 0;
+#else
+    return 0;
+#endif
+}
+
+static int
+import_time_option(void)
+{
+    PyObject *xoptions;
+    char *envoption;
+
+    envoption = Py_GETENV("PYTHONPROFILEIMPORTTIME");
+    if (envoption != NULL && *envoption != '\0')
+        return 1;
+    xoptions = PySys_GetXOptions();
+    if (xoptions == NULL)
+        return -1;
+    return PyDict_GetItemString(xoptions, "importtime") != NULL;
+}
+
 void
 _PyImport_Init(void)
 {
@@ -50,6 +133,12 @@ _PyImport_Init(void)
     interp->builtins_copy = PyDict_Copy(interp->builtins);
     if (interp->builtins_copy == NULL)
         Py_FatalError("Can't backup builtins dict");
+    use_frozen_stdlib = frozen_stdlib_option();
+    if (use_frozen_stdlib < 0)
+        Py_FatalError("Py_Initialize: -X frozen_modules must be 'on' or 'off'");
+    import_time = import_time_option();
+    if (import_time < 0)
+        Py_FatalError("Py_Initialize: can't read the -X options");
 }
 
 void
@@ -1103,15 +1192,34 @@ find_frozen(PyObject *name)
     if (name == NULL)
         return NULL;
 
-    for (p = PyImport_FrozenModules; ; p++) {
-        if (p->name == NULL)
-            return NULL;
+    for (p = PyImport_FrozenModules; p->name != NULL; p++) {
         if (_PyUnicode_EqualToASCIIString(name, p->name))
-            break;
+            return p;
     }
-    return p;
+    if (use_frozen_stdlib) {
+        for (p = _PyImport_FrozenStdlibModules; p->name != NULL; p++) {
+            if (_PyUnicode_EqualToASCIIString(name, p->name))
+                return p;
+        }
+    }
+    return NULL;
 }
 
+#ifdef Py_FROZEN_STDLIB
+/* Return 1 if p is an entry of _PyImport_FrozenStdlibModules. */
+static int
+is_frozen_stdlib(const struct _frozen *p)
+{
+    const struct _frozen *q;
+
+    for (q = _PyImport_FrozenStdlibModules; q->name != NULL; q++) {
+        if (p == q)
+            return 1;
+    }
+    return 0;
+}
+#endif
+
 static PyObject *
 get_frozen_object(PyObject *name)
 {
@@ -1332,6 +1440,64 @@ done:
 }
 
 
+/* Call _bootstrap._find_and_load(abs_name).  With -X importtime, also print
+   the time spent loading the module, both excluding ("self") and including
+   ("cumulative") the time spent in the imports it triggers, indented by the
+   nesting level of the import. */
+static PyObject *
+import_find_and_load(PyObject *abs_name)
+{
+    _Py_IDENTIFIER(_find_and_load);
+    PyInterpreterState *interp = PyThreadState_GET()->interp;
+    PyObject *mod;
+    /* Nesting level of the current import and time spent in the imports
+       nested in it */
+    static int import_level;
+    static _PyTime_t accumulated;
+    _PyTime_t t1 = 0, accumulated_copy = accumulated;
+
+    if (import_time) {
+        static int header = 1;
+        if (header) {
+            fputs("import time: self [us] | cumulative | imported package\n",
+                  stderr);
+            header = 0;
+        }
+        import_level++;
+        t1 = _PyTime_GetMonotonicClock();
+        accumulated = 0;
+    }
+
+    /* _bootstrap._find_and_load() releases the import lock */
+    mod = _PyObject_CallMethodIdObjArgs(interp->importlib,
+                                        &PyId__find_and_load, abs_name,
+                                        interp->import_func, NULL);
+
+    if (import_time) {
+        _PyTime_t cum = _PyTime_GetMonotonicClock() - t1;
+        PyObject *type, *value, *tb;
+        const char *name;
+
+        import_level--;
+        /* Don't lose the exception raised by the import, if any */
+        PyErr_Fetch(&type, &value, &tb);
+        name = PyUnicode_AsUTF8(abs_name);
+        if (name == NULL) {
+            PyErr_Clear();
+            name = "?";
+        }
+        fprintf(stderr, "import time: %9ld | %10ld | %*s%s\n",
+                (long)_PyTime_AsMicroseconds(cum - accumulated,
+                                             _PyTime_ROUND_CEILING),
+                (long)_PyTime_AsMicroseconds(cum, _PyTime_ROUND_CEILING),
+                import_level*2, "", name);
+        PyErr_Restore(type, value, tb);
+        accumulated = accumulated_copy + cum;
+    }
+
+    return mod;
+}
+
 static PyObject *
 resolve_name(PyObject *name, PyObject *globals, int level)
 {
@@ -1487,7 +1653,6 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *globals,
                                  PyObject *locals, PyObject *fromlist,
                                  int level)
 {
-    _Py_IDENTIFIER(_find_and_load);
     _Py_IDENTIFIER(_handle_fromlist);
     PyObject *abs_name = NULL;
     PyObject *final_mod = NULL;
@@ -1556,7 +1721,16 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *globals,
            NOTE: because of this, initializing must be set *before*
            stuffing the new module in sys.modules.
          */
-        spec = _PyObject_GetAttrId(mod, &PyId___spec__);
+        if (PyModule_Check(mod)) {
+            /* Look __spec__ up in the module's namespace directly so that
+               importing a module which is still waiting to be loaded by
+               importlib.util.LazyLoader does not trigger its execution. */
+            spec = _PyDict_GetItemId(PyModule_GetDict(mod), &PyId___spec__);
+            Py_XINCREF(spec);
+        }
+        else {
+            spec = _PyObject_GetAttrId(mod, &PyId___spec__);
+        }
         if (spec != NULL) {
             value = _PyObject_GetAttrId(spec, &PyId__initializing);
             Py_DECREF(spec);
@@ -1586,10 +1760,7 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *globals,
 #ifdef WITH_THREAD
         _PyImport_AcquireLock();
 #endif
-        /* _bootstrap._find_and_load() releases the import lock */
-        mod = _PyObject_CallMethodIdObjArgs(interp->importlib,
-                                            &PyId__find_and_load, abs_name,
-                                            interp->import_func, NULL);
+        mod = import_find_and_load(abs_name);
         if (mod == NULL) {
             goto error;
         }
@@ -1925,6 +2096,57 @@ _imp_is_frozen_impl(PyObject *module, PyObject *name)
     return PyBool_FromLong((long) (p == NULL ? 0 : p->size));
 }
 
+/*[clinic input]
+_imp._frozen_stdlib_filename
+
+    name: unicode
+    /
+
+Return the source file name of a frozen standard library module.
+
+Return None if the module name does not correspond to a standard library
+module frozen by --with-frozen-stdlib.
+[clinic start generated code]*/
+
+static PyObject *
+_imp__frozen_stdlib_filename_impl(PyObject *module, PyObject *name)
+/*[clinic end generated code: output=8e21903d1d462519 input=c4c1b9d92a3a7327]*/
+{
+#ifdef Py_FROZEN_STDLIB
+    const struct _frozen *p;
+    const wchar_t *stdlib_dir;
+    PyObject *dirname, *relpath, *filename;
+    _Py_static_string(PyId_dot, ".");
+    _Py_static_string(PyId_slash, "/");
+    PyObject *dot, *slash;
+
+    p = find_frozen(name);
+    stdlib_dir = _Py_GetStdlibDir();
+    if (p == NULL || !is_frozen_stdlib(p) || stdlib_dir[0] == L'\0')
+        Py_RETURN_NONE;
+
+    dot = _PyUnicode_FromId(&PyId_dot);
+    slash = _PyUnicode_FromId(&PyId_slash);
+    if (dot == NULL || slash == NULL)
+        return NULL;
+    dirname = PyUnicode_FromWideChar(stdlib_dir, -1);
+    if (dirname == NULL)
+        return NULL;
+    relpath = PyUnicode_Replace(name, dot, slash, -1);
+    if (relpath == NULL) {
+        Py_DECREF(dirname);
+        return NULL;
+    }
+    filename = PyUnicode_FromFormat("%U/%U%s", dirname, relpath,
+                                    p->size < 0 ? "/__init__.py" : ".py");
+    Py_DECREF(dirname);
+    Py_DECREF(relpath);
+    return filename;
+#else
+    Py_RETURN_NONE;
+#endif
+}
+
 /* Common implementation for _imp.exec_dynamic and _imp.exec_builtin */
 static int
 exec_builtin_or_dynamic(PyObject *mod) {
@@ -2057,6 +2279,7 @@ static PyMethodDef imp_methods[] = {
     _IMP_INIT_FROZEN_METHODDEF
     _IMP_IS_BUILTIN_METHODDEF
     _IMP_IS_FROZEN_METHODDEF
+    _IMP__FROZEN_STDLIB_FILENAME_METHODDEF
     _IMP_CREATE_DYNAMIC_METHODDEF
     _IMP_EXEC_DYNAMIC_METHODDEF
     _IMP_EXEC_BUILTIN_METHODDEF
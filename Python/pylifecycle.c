@@ -54,6 +54,7 @@ extern grammar _PyParser_Grammar; /* From graminit.c */
 static void initmain(PyInterpreterState *interp);
 static int initfsencoding(PyInterpreterState *interp);
 static void initsite(void);
+static int initlazyimports(void);
 static int initstdio(void);
 static void initsigs(void);
 static void call_py_exitfuncs(void);
@@ -465,6 +466,9 @@ _Py_InitializeEx_Private(int install_sigs, int install_importlib)
         Py_XDECREF(warnings_module);
     }
 
+    if (initlazyimports() < 0)
+        Py_FatalError("Py_Initialize: can't enable lazy imports");
+
     if (!Py_NoSiteFlag)
         initsite(); /* Module site */
 }
@@ -1040,6 +1044,45 @@ initsite(void)
     }
 }
 
+/* Call importlib.util.enable_lazy_imports() if the PYTHONLAZYIMPORTS
+   environment variable is set to a non-empty string, or if sys._xoptions
+   has a 'lazy_imports' key. */
+
+static int
+initlazyimports(void)
+{
+    _Py_IDENTIFIER(enable_lazy_imports);
+    PyObject *xoptions, *key, *module, *res;
+    char *p;
+
+    if (!((p = Py_GETENV("PYTHONLAZYIMPORTS")) && *p != '\0')) {
+        int has_key;
+
+        xoptions = PySys_GetXOptions();
+        if (xoptions == NULL)
+            return -1;
+
+        key = PyUnicode_FromString("lazy_imports");
+        if (key == NULL)
+            return -1;
+
+        has_key = PyDict_Contains(xoptions, key);
+        Py_DECREF(key);
+        if (has_key <= 0)
+            return has_key;
+    }
+
+    module = PyImport_ImportModule("importlib.util");
+    if (module == NULL)
+        return -1;
+    res = _PyObject_CallMethodId(module, &PyId_enable_lazy_imports, NULL);
+    Py_DECREF(module);
+    if (res == NULL)
+        return -1;
+    Py_DECREF(res);
+    return 0;
+}
+
 /* Check if a file descriptor is valid or not.
    Return 0 if the file descriptor is invalid, return non-zero otherwise. */
 static int
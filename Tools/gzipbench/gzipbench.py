@@ -0,0 +1,112 @@
+"""Benchmark the compression and decompression throughput of the gzip module.
+
+The sources of the standard library are concatenated until they make the
+requested size, then compressed by gzip.compress() with an increasing
+number of threads.  The compressed data is then decompressed by
+gzip.decompress(), and read from a GzipFile at once, by chunks and by
+lines.  The best time of several runs is reported for each test, in MB of
+uncompressed data per second.
+"""
+
+import argparse
+import gzip
+import io
+import os
+import time
+
+
+def make_data(size):
+    libdir = os.path.dirname(os.__file__)
+    chunks = []
+    total = 0
+    while total < size:
+        for name in sorted(os.listdir(libdir)):
+            if name.endswith('.py'):
+                with open(os.path.join(libdir, name), 'rb') as f:
+                    chunk = f.read()
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= size:
+                    break
+    return b''.join(chunks)[:size]
+
+
+def best_time(func, repeat):
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def read_all(compressed):
+    with gzip.GzipFile(fileobj=io.BytesIO(compressed)) as f:
+        return len(f.read())
+
+
+def read_chunks(compressed):
+    buf = bytearray(1 << 20)
+    size = 0
+    with gzip.GzipFile(fileobj=io.BytesIO(compressed)) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                return size
+            size += n
+
+
+def read_lines(compressed):
+    size = 0
+    with gzip.GzipFile(fileobj=io.BytesIO(compressed)) as f:
+        for line in f:
+            size += len(line)
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-s', '--size', type=int, default=64,
+                        help='size of the data in MB (default: %(default)s)')
+    parser.add_argument('-l', '--level', type=int, default=6,
+                        help='compression level (default: %(default)s)')
+    parser.add_argument('-t', '--threads', type=int, nargs='+',
+                        help='numbers of threads (default: 1, 2, 4, ... '
+                             'up to the number of CPUs)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs (default: %(default)s)')
+    args = parser.parse_args()
+
+    threads = args.threads
+    if not threads:
+        cpus = os.cpu_count() or 1
+        threads = [1]
+        while threads[-1] * 2 <= cpus:
+            threads.append(threads[-1] * 2)
+        if threads[-1] != cpus:
+            threads.append(cpus)
+
+    data = make_data(args.size * 1000 * 1000)
+    print('%d bytes, level %d' % (len(data), args.level))
+    for n in threads:
+        elapsed, compressed = best_time(
+            lambda: gzip.compress(data, args.level, threads=n), args.repeat)
+        print('compress   %2d thread%s %8.1f MB/s  ratio %.3f' %
+              (n, 's' if n > 1 else ' ', len(data) / elapsed / 1e6,
+               len(compressed) / len(data)))
+
+    compressed = gzip.compress(data, args.level)
+    tests = [('decompress', lambda: len(gzip.decompress(compressed))),
+             ('read', lambda: read_all(compressed)),
+             ('readinto', lambda: read_chunks(compressed)),
+             ('lines', lambda: read_lines(compressed))]
+    for name, func in tests:
+        elapsed, size = best_time(func, args.repeat)
+        assert size == len(data)
+        print('%-21s %8.1f MB/s' % (name, size / elapsed / 1e6))
+
+
+if __name__ == '__main__':
+    main()
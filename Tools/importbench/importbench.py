@@ -12,7 +12,9 @@ import importlib.machinery
 import json
 import os
 import py_compile
+import subprocess
 import sys
+import sysconfig
 import tabnanny
 import timeit
 
@@ -21,7 +23,13 @@ def bench(name, cleanup=lambda: None, *, seconds=1, repeat=3):
     """Bench the given statement as many times as necessary until total
     executions take one second."""
     stmt = "__import__({!r})".format(name)
-    timer = timeit.Timer(stmt)
+    yield from bench_timer(timeit.Timer(stmt), cleanup, seconds=seconds,
+                           repeat=repeat)
+
+
+def bench_timer(timer, cleanup=lambda: None, *, seconds=1, repeat=3):
+    """Run the given timer as many times as necessary until total executions
+    take one second."""
     for x in range(repeat):
         total_time = 0
         count = 0
@@ -162,6 +170,24 @@ tabnanny_using_bytecode = _using_bytecode(tabnanny)
 decimal_using_bytecode = _using_bytecode(decimal)
 
 
+def _startup(frozen_modules):
+    def startup_benchmark(seconds, repeat):
+        """Startup: -X frozen_modules={}"""
+        # The modules imported at startup are only frozen when Python is
+        # configured --with-frozen-stdlib; compare both settings to measure
+        # the time saved by not importing them from the file system.
+        args = [sys.executable, '-X', 'frozen_modules=' + frozen_modules,
+                '-c', 'pass']
+        timer = timeit.Timer(lambda: subprocess.check_call(args))
+        yield from bench_timer(timer, seconds=seconds, repeat=repeat)
+
+    startup_benchmark.__doc__ = startup_benchmark.__doc__.format(frozen_modules)
+    return startup_benchmark
+
+startup_frozen_modules_off = _startup('off')
+startup_frozen_modules_on = _startup('on')
+
+
 def main(import_, options):
     if options.source_file:
         with options.source_file:
@@ -176,7 +202,10 @@ def main(import_, options):
                   tabnanny_wo_bytecode, tabnanny_using_bytecode,
                   decimal_writing_bytecode,
                   decimal_wo_bytecode, decimal_using_bytecode,
+                  startup_frozen_modules_off,
                 )
+    if sysconfig.get_config_var('Py_FROZEN_STDLIB'):
+        benchmarks += (startup_frozen_modules_on,)
     if options.benchmark:
         for b in benchmarks:
             if b.__doc__ == options.benchmark:
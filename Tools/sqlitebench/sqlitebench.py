@@ -0,0 +1,116 @@
+"""Benchmark the insert and scan throughput of the sqlite3 module.
+
+Rows of an integer, a float, a text and a blob column are inserted into an
+in-memory database with executemany(), then read back with fetchall(),
+fetchmany() and by iterating over the cursor.  The best time of several
+runs is reported for each test, in rows per second.
+"""
+
+import argparse
+import sqlite3
+import time
+
+
+def make_rows(count):
+    return [(i, i / 7, 'text %d' % i, b'\x00\x01\x02blob' * 4)
+            for i in range(count)]
+
+
+def create(rows):
+    cx = sqlite3.connect(':memory:')
+    cx.execute('create table t(i integer, f real, s text, b blob)')
+    cx.executemany('insert into t values (?, ?, ?, ?)', rows)
+    cx.commit()
+    return cx
+
+
+def insert_tuples(rows):
+    cx = sqlite3.connect(':memory:')
+    cx.execute('create table t(i integer, f real, s text, b blob)')
+    cx.executemany('insert into t values (?, ?, ?, ?)', rows)
+    cx.commit()
+    cx.close()
+
+
+def insert_named(rows, names=('i', 'f', 's', 'b')):
+    params = [dict(zip(names, row)) for row in rows]
+    cx = sqlite3.connect(':memory:')
+    cx.execute('create table t(i integer, f real, s text, b blob)')
+    start = time.perf_counter()
+    cx.executemany('insert into t values (:i, :f, :s, :b)', params)
+    cx.commit()
+    cx.close()
+    return time.perf_counter() - start
+
+
+def scan_fetchall(cx):
+    return len(cx.execute('select * from t').fetchall())
+
+
+def scan_fetchmany(cx, size=1000):
+    cursor = cx.execute('select * from t')
+    count = 0
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return count
+        count += len(rows)
+
+
+def scan_iterate(cx):
+    count = 0
+    for row in cx.execute('select * from t'):
+        count += 1
+    return count
+
+
+def scan_row_factory(cx):
+    cx.row_factory = sqlite3.Row
+    try:
+        return len(cx.execute('select * from t').fetchall())
+    finally:
+        cx.row_factory = None
+
+
+def best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        # Some tests only time a part of their work themselves.
+        elapsed = (result if isinstance(result, float)
+                   else time.perf_counter() - start)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--rows', type=int, default=200000,
+                        help='number of rows (default: %(default)s)')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='number of runs of each test '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print('SQLite %s, %d rows, best of %d runs'
+          % (sqlite3.sqlite_version, args.rows, args.repeat))
+    cx = create(rows)
+    tests = [
+        ('executemany (tuples)', insert_tuples, rows),
+        ('executemany (named)', insert_named, rows),
+        ('fetchall', scan_fetchall, cx),
+        ('fetchmany(1000)', scan_fetchmany, cx),
+        ('iteration', scan_iterate, cx),
+        ('fetchall (Row)', scan_row_factory, cx),
+    ]
+    for name, func, arg in tests:
+        elapsed = best_of(args.repeat, func, arg)
+        print('%-22s %8.1f ms %12.0f rows/s'
+              % (name, elapsed * 1e3, args.rows / elapsed))
+    cx.close()
+
+
+if __name__ == '__main__':
+    main()
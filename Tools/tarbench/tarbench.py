@@ -0,0 +1,117 @@
+"""Benchmark the member lookups of the tarfile module.
+
+An uncompressed archive of regular files, every other one followed by a
+hard link to it, is created in memory.  The archive is then opened and the
+time taken to read its headers, to look up every member with getmember()
+and to resolve every hard link, as extraction does, is reported.
+
+With --compress, an archive of a twentieth as many files of 16 KiB is
+compressed in streams of 1 MiB and written to a temporary file, and the
+time taken to extract ten members spread over the archive is reported with
+and without an index.
+"""
+
+import argparse
+import io
+import os
+import tarfile
+import tempfile
+import time
+
+
+def make_archive(count):
+    fileobj = io.BytesIO()
+    with tarfile.open(fileobj=fileobj, mode='w', format=tarfile.GNU_FORMAT) \
+            as tar:
+        for i in range(0, count, 2):
+            info = tarfile.TarInfo('dir%d/file%d' % (i % 100, i))
+            tar.addfile(info)
+            link = tarfile.TarInfo('dir%d/link%d' % (i % 100, i))
+            link.type = tarfile.LNKTYPE
+            link.linkname = info.name
+            tar.addfile(link)
+    return fileobj.getvalue()
+
+
+def load(tar):
+    tar.getmembers()
+
+
+def lookup_members(tar):
+    for name in tar.getnames():
+        tar.getmember(name)
+
+
+def resolve_links(tar):
+    for member in tar.getmembers():
+        if member.islnk():
+            tar._find_link_target(member)
+
+
+def make_data_archive(count, size=16384):
+    fileobj = io.BytesIO()
+    with tarfile.open(fileobj=fileobj, mode='w') as tar:
+        for i in range(count):
+            data = b''.join(b'%d %d\n' % (i, j) for j in range(size // 8))
+            info = tarfile.TarInfo('dir%d/file%d' % (i % 100, i))
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return fileobj.getvalue()
+
+
+def extract_members(path, compress, index=None):
+    with tarfile.open(path, 'r:' + compress, index=index) as tar:
+        members = tar.getmembers()
+        for member in members[::-(len(members) // 10)]:
+            tar.extractfile(member).read()
+
+
+def compressed(count, compress, stream_size=1 << 20):
+    module = {'gz': 'gzip', 'bz2': 'bz2', 'xz': 'lzma'}[compress]
+    module = __import__(module)
+    data = make_data_archive(count)
+    print('%d members, %d bytes, compressed in streams of %d bytes' %
+          (count, len(data), stream_size))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'archive.tar.' + compress)
+        with open(path, 'wb') as f:
+            for i in range(0, len(data), stream_size):
+                f.write(module.compress(data[i:i + stream_size]))
+        start = time.perf_counter()
+        extract_members(path, compress)
+        print('%-16s %8.3f s' % ('extract', time.perf_counter() - start))
+        index = os.path.join(tmpdir, 'archive.idx')
+        start = time.perf_counter()
+        with tarfile.open(path, 'r:' + compress) as tar:
+            tar.save_index(index)
+        print('%-16s %8.3f s' % ('save_index', time.perf_counter() - start))
+        start = time.perf_counter()
+        extract_members(path, compress, index)
+        print('%-16s %8.3f s' % ('extract_indexed',
+                                 time.perf_counter() - start))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--members', type=int, default=200000,
+                        help='number of members of the archive '
+                             '(default: %(default)s)')
+    parser.add_argument('--compress', choices=['gz', 'bz2', 'xz'],
+                        help='also time the extraction of members of the '
+                             'archive compressed with this method')
+    args = parser.parse_args()
+
+    data = make_archive(args.members)
+    print('%d members, %d bytes' % (args.members, len(data)))
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        for func in load, lookup_members, resolve_links:
+            start = time.perf_counter()
+            func(tar)
+            print('%-16s %8.3f s' % (func.__name__,
+                                     time.perf_counter() - start))
+    if args.compress:
+        compressed(args.members // 20, args.compress)
+
+
+if __name__ == '__main__':
+    main()